@@ -0,0 +1,38 @@
+"""add notification user feed index
+
+Revision ID: 3c7e2a91d4b8
+Revises: f9206b0d6531
+Create Date: 2026-10-16 09:20:11.482913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c7e2a91d4b8"
+down_revision: Union[str, Sequence[str], None] = "f9206b0d6531"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_notification_user_feed",
+        "notification",
+        [
+            "user_id",
+            sa.text("created_at DESC"),
+            sa.text("notification_id DESC"),
+        ],
+        postgresql_where=sa.text("dismissed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_notification_user_feed", table_name="notification")
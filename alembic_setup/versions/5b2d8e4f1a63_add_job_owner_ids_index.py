@@ -0,0 +1,55 @@
+"""add job owner ids index
+
+Revision ID: 5b2d8e4f1a63
+Revises: 3c7e2a91d4b8
+Create Date: 2026-10-16 14:05:37.219604
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2d8e4f1a63"
+down_revision: Union[str, Sequence[str], None] = "3c7e2a91d4b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "job",
+        sa.Column(
+            "owner_ids",
+            postgresql.JSONB(astext_type=sa.Text()),
+            sa.Computed(
+                "CASE"
+                " WHEN jsonb_typeof(pipeline_config -> 'ownerIds') = 'array'"
+                " AND pipeline_config -> 'ownerIds' <> '[]'::jsonb"
+                " THEN pipeline_config -> 'ownerIds'"
+                " WHEN jsonb_typeof(pipeline_config -> 'ownerId') <> 'null'"
+                " THEN '[]'::jsonb || (pipeline_config -> 'ownerId')"
+                " ELSE '[]'::jsonb"
+                " END",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "ix_job_owner_ids",
+        "job",
+        ["owner_ids"],
+        postgresql_using="gin",
+        postgresql_ops={"owner_ids": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_job_owner_ids", table_name="job")
+    op.drop_column("job", "owner_ids")
@@ -122,6 +122,8 @@ class PermissionAdminController:
         order: str = "asc",
         is_super_admin: bool | None = None,
         user_type: str | None = None,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ):
         """
         Paginated user list with optional email/name search, sorting, and
@@ -139,10 +141,17 @@ class PermissionAdminController:
             is_super_admin (bool | None): When not None, restricts to matching
                 super-admin flag.
             user_type (str | None): ``"internal"`` / ``"external"`` / None.
+            cursor (str | None): ``nextCursor`` of the previous page, sent
+                with the same sort and filters.
+            include_total (bool | None): Whether to count all matches.
+                Defaults to counting only for offset pages; cursor pages
+                reuse the total of the first page.
 
         Returns:
             A standardized API response wrapping a ``UserListDto``.
         """
+        if include_total is None:
+            include_total = cursor is None
         async with self._database.session() as session:
             view = await self._service.list_users(
                 session,
@@ -154,6 +163,8 @@ class PermissionAdminController:
                 order=order,
                 is_super_admin=is_super_admin,
                 user_type=user_type,
+                cursor=cursor,
+                include_total=include_total,
             )
         return api_response(message="Users", data=view)
 
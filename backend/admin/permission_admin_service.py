@@ -65,6 +65,8 @@ class PermissionAdminService:
         order: str = "asc",
         is_super_admin: bool | None = None,
         user_type: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> UserListDto:
         """
         Paginated user list for the admin UI.
@@ -83,11 +85,15 @@ class PermissionAdminService:
             is_super_admin (bool | None): When not None, restricts to matching
                 super-admin flag.
             user_type (str | None): ``"internal"`` / ``"external"`` / None.
+            cursor (str | None): ``next_cursor`` of the previous page; pages
+                by keyset instead of ``offset``.
+            include_total (bool): Whether to count all matches.
 
         Returns:
-            UserListDto: The page of users plus the total match count.
+            UserListDto: The page of users, the total match count (None when
+                not requested) and the cursor of the next page.
         """
-        rows, total = await self._users.list_users(
+        rows, total, next_cursor = await self._users.list_users(
             session,
             search=search,
             user_id=user_id,
@@ -97,6 +103,8 @@ class PermissionAdminService:
             order=order,
             is_super_admin=is_super_admin,
             user_type=user_type,
+            cursor=cursor,
+            include_total=include_total,
         )
         contact_by_user_id = await self._user_emails.get_contact_emails_by_user_ids(
             session, [u.user_id for u, _ in rows]
@@ -111,6 +119,7 @@ class PermissionAdminService:
                 for u, is_internal in rows
             ],
             total=total,
+            next_cursor=next_cursor,
         )
 
     async def get_user_permissions(
@@ -20,16 +20,26 @@ MICROSOFT_CHAT_SUBSCRIBE_ENDPOINT = "/microsoft/chat/subscribe"
 
 MICROSOFT_BACKFILL_LDAPS_ENDPOINT = "/microsoft/backfill/ldaps"
 MICROSOFT_BACKFILL_CHAT_MESSAGES_ENDPOINT = "/microsoft/backfill/chat/messages/{chatId}"
+MICROSOFT_BACKFILL_ALL_CHAT_MESSAGES_ENDPOINT = "/microsoft/backfill/chat/messages"
+MICROSOFT_BACKFILL_CHAT_DAILY_COUNTS_ENDPOINT = "/microsoft/backfill/chat/daily-counts"
 
 JIRA_SYNC_PROJECTS_ENDPOINT = "/jira/project"
 JIRA_BACKFILL_ISSUES_ENDPOINT = "/jira/backfill"
 JIRA_UPDATE_ISSUES_ENDPOINT = "/jira/update"
+JIRA_SYNC_ISSUES_ENDPOINT = "/jira/sync"
+JIRA_BACKFILL_STORY_POINTS_ENDPOINT = "/jira/backfill/story-points"
 
 GOOGLE_CALENDAR_PULL_HISTORY_ENDPOINT = "/google/calendar/history/pull"
+GOOGLE_CALENDAR_SYNC_ENDPOINT = "/google/calendar/sync"
+GOOGLE_CALENDAR_BACKFILL_MEETING_SECONDS_ENDPOINT = (
+    "/google/calendar/backfill/meeting-seconds"
+)
 GOOGLE_CHAT_SYNC_HISTORY_MESSAGES_ENDPOINT = "/google/chat/spaces/messages"
+GOOGLE_CHAT_BACKFILL_DAILY_COUNTS_ENDPOINT = "/google/chat/backfill/daily-counts"
 
 GERRIT_BACKFILL_CHANGES_ENDPOINT = "/gerrit/backfill"
 GERRIT_BACKFILL_PROJECTS_ENDPOINT = "/gerrit/projects/backfill"
+GERRIT_SYNC_CHANGES_ENDPOINT = "/gerrit/sync"
 
 PUBSUB_SYNC_PULL_ENDPOINT = "/pubsub/sync"
 
@@ -44,11 +44,36 @@ EXPIRATION_REMINDER_EVENT = "google.workspace.events.subscription.v1.expirationR
 # Constants for Redis keys
 CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY = "google:chat:created:{sender_ldap}:{space_id}"
 DELETED_GOOGLE_CHAT_MESSAGES_INDEX_KEY = "google:chat:deleted:{sender_ldap}:{space_id}"
+# Hash per UTC day: field "{sender_ldap}:{space_id}" -> created message count.
+GOOGLE_CHAT_DAILY_COUNT_KEY = "google:chat_daily:{day}"
+GOOGLE_CHAT_DAILY_COUNT_FIELD = "{sender_ldap}:{space_id}"
+GOOGLE_CHAT_DAILY_COUNT_READY_KEY = "google:chat_daily_ready"
+# Hash: Google sender ID -> LDAP, replaced from the People API directory.
+GOOGLE_CHAT_SENDER_LDAP_KEY = "google:chat_sender_ldap"
+# Hash of sender IDs known to have no workspace LDAP (external accounts).
+GOOGLE_CHAT_EXTERNAL_SENDERS_KEY = "google:chat_sender_external"
+# Hash per space: where the history sync stopped. "page_token" is the next
+# page of the pass in progress, which lists messages created after
+# "created_after"; "last_create_time" is the newest message stored.
+GOOGLE_CHAT_HISTORY_CURSOR_KEY = "google:chat:history_cursor:{space_id}"
+GOOGLE_CHAT_HISTORY_PAGE_TOKEN_FIELD = "page_token"
+GOOGLE_CHAT_HISTORY_CREATED_AFTER_FIELD = "created_after"
+GOOGLE_CHAT_HISTORY_LAST_CREATE_TIME_FIELD = "last_create_time"
 
 GOOGLE_CALENDAR_LIST_INDEX_KEY = "calendarlist"
 GOOGLE_CALENDAR_EVENT_DETAIL_KEY = "event:{event_id}"
 GOOGLE_EVENT_ATTENDANCE_KEY = "event:{event_id}:user:{ldap}:attendance"
 GOOGLE_CALENDAR_USER_EVENTS_KEY = "calendar:{calendar_id}:user:{ldap}:events"
+# Hash per UTC day of the event start: field "{calendar_id}:{ldap}" -> attended seconds.
+GOOGLE_CALENDAR_MEETING_SECONDS_KEY = "calendar:meeting_seconds:{day}"
+GOOGLE_CALENDAR_MEETING_SECONDS_FIELD = "{calendar_id}:{ldap}"
+GOOGLE_CALENDAR_MEETING_SECONDS_READY_KEY = "calendar:meeting_seconds_ready"
+# Calendar API sync token of every synced calendar (calendar ID field).
+GOOGLE_CALENDAR_SYNC_TOKEN_KEY = "calendar:sync_token"
+# Meet events whose attendance has not been fetched yet: the event payloads by
+# event ID, and the event IDs scored by their scheduled end time.
+GOOGLE_CALENDAR_PENDING_ATTENDANCE_KEY = "calendar:pending_attendance"
+GOOGLE_CALENDAR_PENDING_ATTENDANCE_BY_END_KEY = "calendar:pending_attendance:by_end"
 
 MICROSOFT_SUBSCRIPTION_CLIENT_STATE_SECRET_KEY = (
     "microsoft:client_state:{subscription_id}"
@@ -56,7 +81,23 @@ MICROSOFT_SUBSCRIPTION_CLIENT_STATE_SECRET_KEY = (
 LDAP_KEY_TEMPLATE = "ldap:{account_status}:{group}"
 MICROSOFT_CHAT_MESSAGES_INDEX_KEY = "microsoft:chat:{message_status}:{sender_ldap}"
 MICROSOFT_CHAT_MESSAGES_DETAILS_KEY = "microsoft:messages:{message_id}"
+# Hash per UTC day: field "{sender_ldap}" -> created message count.
+MICROSOFT_CHAT_DAILY_COUNT_KEY = "microsoft:chat_daily:{day}"
+MICROSOFT_CHAT_DAILY_COUNT_READY_KEY = "microsoft:chat_daily_ready"
 MICROSOFT_CHAT_TOPICS = "microsoft:chat:topics"
+# Hash: chat ID -> next Graph page link of the multi-chat history backfill, or
+# "done"; removed once every chat of a backfill run has been stored.
+MICROSOFT_CHAT_HISTORY_CHECKPOINT_KEY = "microsoft:chat:history_checkpoint"
+MICROSOFT_CHAT_HISTORY_CHECKPOINT_DONE = "done"
+# Hash: Microsoft Graph user ID -> LDAP, replaced on every member sync.
+MICROSOFT_USER_LDAP_KEY = "microsoft:user_ldap"
+# Hash of Graph user IDs with no workspace mail (guests, other tenants); deleted
+# together with MICROSOFT_USER_LDAP_KEY on every member sync.
+MICROSOFT_EXTERNAL_USERS_KEY = "microsoft:user_external"
+# Cached analytics results and the per-source generation counters that
+# invalidate them; every write path feeding a source bumps its counter.
+ANALYTICS_RESULT_CACHE_KEY = "analytics:result:{name}:{digest}"
+ANALYTICS_GENERATION_KEY = "analytics:generation:{source}"
 PUBSUB_PULL_MESSAGES_STATUS_KEY = "pull_status:{subscription_id}"
 
 INTERNAL_MICROSOFT_ACCOUNT_DOMAIN = "@u.circlecat.org"
@@ -153,6 +194,14 @@ class MicrosoftGroups(str, Enum):
     VOLUNTEERS = "volunteers"
 
 
+class AnalyticsSource(str, Enum):
+    GERRIT = "gerrit"
+    JIRA = "jira"
+    GOOGLE_CHAT = "google_chat"
+    MICROSOFT_CHAT = "microsoft_chat"
+    GOOGLE_CALENDAR = "google_calendar"
+
+
 class PullStatus(Enum):
     RUNNING = ("running", "Pulling started for {subscription_id}.")
     FAILED = ("failed", "Pulling failed for {subscription_id}: {error}.")
@@ -212,7 +261,15 @@ GERRIT_STATS_PROJECT_BUCKET_KEY = "gerrit:stats:{ldap}:{project}:{bucket}"
 GERRIT_CHANGE_STATUS_KEY = "gerrit:change_status"
 GERRIT_UNDER_REVIEWED_CL_INDEX_KEY = "gerrit:cl:under_reviewed"
 GERRIT_DEDUPE_REVIEWED_KEY = "gerrit:dedupe:reviewed:{change_number}"
+# Ledger of applied Gerrit events; outlives the Pub/Sub 7-day redelivery window.
+GERRIT_PROCESSED_EVENT_KEY = "gerrit:processed_event:{event_id}"
+GERRIT_PROCESSED_EVENT_TTL_SECONDS = 60 * 60 * 24 * 8
 GERRIT_PROJECTS_KEY = "gerrit:projects"
+# Latest Gerrit `updated` timestamp covered by the incremental sync.
+GERRIT_SYNC_HIGH_WATER_MARK_KEY = "gerrit:sync:high_water_mark"
+# Changes updated this long before the high-water mark are treated as changed
+# again, covering updates that landed while the previous sync was paging.
+GERRIT_SYNC_OVERLAP_SECONDS = 60 * 60
 GERRIT_UNMERGED_CL_KEY_BY_PROJECT = "gerrit:cl:{ldap}:{project}:{cl_status}"
 GERRIT_UNMERGED_CL_KEY_GLOBAL = "gerrit:cl:{ldap}:{cl_status}"
 
@@ -257,6 +314,19 @@ JIRA_ISSUE_DETAILS_KEY = "jira:issue:{issue_id}"
 JIRA_LDAP_PROJECT_STATUS_INDEX_KEY = (
     "jira:ldap:{ldap}:project:{project_id}:status:{status}"
 )
+# Hash of DONE story points summed per finish date (YYYYMMDD field)
+JIRA_STORY_POINTS_KEY = "jira:story_points:ldap:{ldap}:project:{project_id}"
+JIRA_STORY_POINTS_READY_KEY = "jira:story_points_ready"
+# Digest of the synced fields of every issue (issue ID field); issues whose
+# digest is unchanged are skipped by the incremental sync.
+JIRA_ISSUE_CONTENT_HASH_KEY = "jira:issue_content_hash"
+# Latest Jira `updated` timestamp covered by the incremental sync.
+JIRA_SYNC_WATERMARK_KEY = "jira:sync:updated_watermark"
+# Issues updated this long before the watermark are fetched again, covering
+# clock skew and updates that landed while the previous sync was paging.
+JIRA_SYNC_OVERLAP_MINUTES = 30
+# Look-back of the first incremental sync, before any watermark is stored.
+JIRA_SYNC_INITIAL_LOOKBACK_MINUTES = 24 * 60
 
 # Jira API configuration
 JIRA_MAX_RESULTS_DEFAULT = 1000
@@ -0,0 +1,167 @@
+"""Opaque cursors and predicates for keyset (seek) pagination.
+
+A keyset page is "the next ``limit`` rows after the last row the caller saw",
+expressed as a WHERE on the ORDER BY keys instead of an OFFSET, so a deep page
+costs the same index seek as the first one. The cursor handed to clients is
+the last row's sort-key values together with a tag of the query's sort and
+filters, JSON-encoded and base64url-wrapped: clients must treat it as opaque
+and only ever send back a value the API returned for the same query.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import and_, false, or_, tuple_
+
+_DATETIME_TAG = "$dt"
+
+
+@dataclass(frozen=True)
+class KeysetColumn:
+    """One ORDER BY key of a keyset-paginated query.
+
+    Attributes:
+        expression: The SQL expression the query orders by.
+        descending (bool): Whether the key is ordered DESC.
+        nulls_last (bool): Whether the key may be NULL and is ordered NULLS
+            LAST. Keys that are never NULL leave this False.
+    """
+
+    expression: object
+    descending: bool = False
+    nulls_last: bool = False
+
+    def order_by(self):
+        """Return the ORDER BY clause for this key."""
+        clause = self.expression.desc() if self.descending else self.expression.asc()
+        return clause.nulls_last() if self.nulls_last else clause
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value[_DATETIME_TAG])
+    return value
+
+
+def keyset_tag(columns: list[KeysetColumn], *filters) -> str:
+    """
+    Fingerprint a paginated query's ORDER BY keys and filters.
+
+    A cursor only makes sense for the query that issued it: seeking past its
+    values under another sort, direction or filter silently skips or repeats
+    rows. Cursors therefore carry this tag, and `decode_cursor` rejects one
+    sent back to a query with a different tag.
+
+    Args:
+        columns (list[KeysetColumn]): The query's ORDER BY keys.
+        *filters: The filter values selecting the paginated rows. Each must be
+            JSON-serializable or have a stable ``str()``.
+
+    Returns:
+        str: A short URL-safe tag.
+    """
+    spec = [[str(c.expression), c.descending, c.nulls_last] for c in columns]
+    payload = json.dumps([spec, filters], default=str, sort_keys=True)
+    digest = hashlib.sha256(payload.encode()).digest()
+    return base64.urlsafe_b64encode(digest[:9]).decode()
+
+
+def encode_cursor(tag: str, *values) -> str:
+    """
+    Encode the sort-key values of a page's last row as an opaque cursor.
+
+    Args:
+        tag (str): The paginated query's `keyset_tag`.
+        *values: The row's sort-key values, in ORDER BY order. Each must be
+            JSON-serializable or a datetime.
+
+    Returns:
+        str: A URL-safe cursor string.
+    """
+    payload = json.dumps(
+        {"t": tag, "v": [_encode_value(v) for v in values]}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, tag: str, arity: int) -> tuple:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor string a client sent back.
+        tag (str): The `keyset_tag` of the query being paginated.
+        arity (int): The number of sort keys the paginated query orders by.
+
+    Returns:
+        tuple: The sort-key values, in ORDER BY order.
+
+    Raises:
+        ValueError: If the cursor is malformed, was issued for a query with
+            another sort or filters, or has the wrong number of keys.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(payload, dict) or payload.get("t") != tag:
+            raise ValueError
+        values = payload["v"]
+        if not isinstance(values, list) or len(values) != arity:
+            raise ValueError
+        return tuple(_decode_value(v) for v in values)
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise ValueError("Invalid cursor.") from None
+
+
+def keyset_after(columns: list[KeysetColumn], values: tuple):
+    """
+    Build the WHERE condition selecting the rows that follow a cursor.
+
+    When every key is non-NULL and sorted in the same direction the condition
+    is a single row-value comparison, which Postgres answers with one seek on
+    a matching composite index. Otherwise it expands to the equivalent OR of
+    "equal on the leading keys, past the cursor on the next one", with NULLS
+    LAST keys treating NULL as greater than every value.
+
+    Args:
+        columns (list[KeysetColumn]): The query's ORDER BY keys, ending with a
+            unique tiebreaker.
+        values (tuple): The cursor's decoded sort-key values.
+
+    Returns:
+        ColumnElement[bool]: The condition to add to the query's WHERE.
+    """
+    directions = {c.descending for c in columns}
+    if len(directions) == 1 and not any(c.nulls_last for c in columns):
+        row = tuple_(*(c.expression for c in columns))
+        bound = tuple_(*values)
+        return row < bound if columns[0].descending else row > bound
+
+    branches = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        if value is None:
+            # Nothing sorts after NULL in a NULLS LAST key.
+            continue
+        past = (
+            column.expression < value
+            if column.descending
+            else column.expression > value
+        )
+        if column.nulls_last:
+            past = or_(past, column.expression.is_(None))
+        equal = [
+            c.expression.is_(None) if v is None else c.expression == v
+            for c, v in zip(columns[:i], values[:i])
+        ]
+        branches.append(and_(*equal, past))
+    return or_(*branches) if branches else false()
@@ -1,4 +1,9 @@
 from redis import Redis
+from redis.asyncio import (
+    BlockingConnectionPool,
+    Redis as AsyncRedis,
+    SSLConnection,
+)
 from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError
 from backend.common.environment_constants import (
     REDIS_HOST,
@@ -104,3 +109,90 @@ class RedisClient:
             Redis: Connected Redis client.
         """
         return self._redis_client
+
+
+class AsyncRedisClient:
+    """
+    An asyncio Redis client factory backed by a bounded connection pool.
+
+    The synchronous RedisClient blocks the event loop for the whole round-trip,
+    which stalls every other request on the worker while a large analytics
+    pipeline runs. This factory builds a single ``redis.asyncio.Redis`` on top
+    of a BlockingConnectionPool shared by every coroutine in the process:
+    callers wait for a free connection instead of failing once the pool is
+    exhausted.
+
+    Construction does not open a connection, so the factory can be built from
+    the synchronous AppDependencyBuilder. ``verify_connection`` pings the server
+    with the injected RetryUtils and is awaited once at application startup;
+    ``close`` releases the pool on shutdown.
+
+    Attributes:
+        _redis_client (redis.asyncio.Redis): Pooled asyncio Redis client.
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 50
+    DEFAULT_POOL_TIMEOUT_SECONDS = 20
+
+    def __init__(
+        self,
+        logger,
+        retry_utils,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        pool_timeout: int = DEFAULT_POOL_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize the asyncio Redis client factory.
+
+        Args:
+            logger: Logger instance for logging.
+            retry_utils: RetryUtils instance providing async retry logic.
+            max_connections (int): Upper bound on concurrently open connections.
+            pool_timeout (int): Seconds to wait for a free pooled connection
+                before raising a ConnectionError.
+        """
+        self.logger = logger
+        self.retry_utils = retry_utils
+        self._connection_pool = BlockingConnectionPool(
+            connection_class=SSLConnection,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            host=os.environ.get(REDIS_HOST),
+            port=os.environ.get(REDIS_PORT),
+            password=os.environ.get(REDIS_PASSWORD),
+            decode_responses=True,
+        )
+        self._redis_client = AsyncRedis(connection_pool=self._connection_pool)
+
+    async def verify_connection(self) -> None:
+        """
+        Ping the server, retrying transient errors with the injected RetryUtils.
+
+        Raises:
+            RedisClientError: If the server is still unreachable after retries.
+        """
+        try:
+            await self.retry_utils.get_async_retry_on_transient(self._redis_client.ping)
+            self.logger.info("Created async Redis client successfully.")
+        except (RedisConnectionError, TimeoutError) as e:
+            self.logger.error(
+                "Failed to connect to Redis server %s:%s after retries: %s",
+                os.environ.get(REDIS_HOST),
+                os.environ.get(REDIS_PORT),
+                e,
+            )
+            raise RedisClientError("Failed to create async Redis client.")
+
+    def get_redis_client(self) -> AsyncRedis:
+        """
+        Return the pooled asyncio Redis client.
+
+        Returns:
+            redis.asyncio.Redis: Client sharing this factory's connection pool.
+        """
+        return self._redis_client
+
+    async def close(self) -> None:
+        """Close the client and disconnect every pooled connection."""
+        await self._redis_client.aclose()
+        await self._connection_pool.disconnect()
@@ -1,7 +1,7 @@
 import asyncio
 from http import HTTPStatus
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
 from backend.common.api_endpoints import PUBSUB_SYNC_PULL_ENDPOINT
 from backend.common.fast_api_response_wrapper import api_response
@@ -30,16 +30,31 @@ class ConsumerController:
             response_model=dict,
         )
 
-    async def sync_pull_all(self):
+    async def sync_pull_all(
+        self,
+        concurrent: bool = Query(False),
+        max_messages: int = Query(10, ge=1, le=1000),
+        max_workers: int = Query(1, ge=1, le=32),
+    ):
         """
         One-shot synchronous pull from all three Pub/Sub subscriptions.
         Pulls pending messages, processes them, acks, and returns.
         Designed to be called periodically by a CronJob.
+
+        Args:
+            concurrent: Drain the subscriptions in parallel.
+            max_messages: Max messages to pull per batch.
+            max_workers: Messages processed in parallel per subscription batch.
         """
         # The pull loop is synchronous and bounded by a 50-minute deadline.
         # Run it on a worker thread so the event loop is free to serve
         # other requests while a backlog is being drained.
-        results = await asyncio.to_thread(self.pubsub_sync_pull_service.sync_pull_all)
+        results = await asyncio.to_thread(
+            self.pubsub_sync_pull_service.sync_pull_all,
+            max_messages=max_messages,
+            concurrent=concurrent,
+            max_workers=max_workers,
+        )
         return api_response(
             success=True,
             message="Sync pull completed.",
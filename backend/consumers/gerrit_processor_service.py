@@ -1,7 +1,10 @@
+import hashlib
 import json
 from backend.common.constants import (
     GERRIT_PROJECTS_KEY,
     GERRIT_DEDUPE_REVIEWED_KEY,
+    GERRIT_PROCESSED_EVENT_KEY,
+    GERRIT_PROCESSED_EVENT_TTL_SECONDS,
     GERRIT_UNMERGED_CL_KEY_BY_PROJECT,
     GERRIT_PERSUBMIT_BOT,
     GERRIT_CL_REVIEWED_FIELD,
@@ -12,7 +15,61 @@ from backend.common.constants import (
     GERRIT_LOC_MERGED_FIELD,
     GERRIT_STATS_BUCKET_KEY,  # Import the global key constant
     GERRIT_UNMERGED_CL_KEY_GLOBAL,  # Import the global unmerged CL key constant
+    AnalyticsSource,
 )
+from backend.utils.analytics_result_cache import bump_analytics_generation
+
+# Counts a review once per (change, reviewer): the stats are only incremented
+# when the reviewer is newly added to the change's dedupe set, so duplicate
+# comments in the same pulled batch or redelivered events are not counted twice.
+#   KEYS[1]: change dedupe set
+#   KEYS[2]: project-specific weekly stats hash
+#   KEYS[3]: global weekly stats hash
+#   ARGV[1]: reviewer LDAP
+#   ARGV[2]: stats hash field
+#   ARGV[3]: dedupe set TTL in seconds
+_COUNT_REVIEW_ONCE_SCRIPT = """
+if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+redis.call('HINCRBY', KEYS[3], ARGV[2], 1)
+return 1
+"""
+
+# Applies the merge counters of a change-merged event at most once: the
+# increments only run when the event is newly recorded in the ledger, so a
+# redelivered event cannot double-count cl_merged or loc_merged.
+#   KEYS[1]: processed-event ledger key
+#   KEYS[2]: project-specific weekly stats hash
+#   KEYS[3]: global weekly stats hash
+#   ARGV[1]: ledger TTL in seconds
+#   ARGV[2]: merged LOC field
+#   ARGV[3]: inserted lines
+#   ARGV[4]: merged CL count field
+_APPLY_MERGE_ONCE_SCRIPT = """
+if not redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+for i = 2, 3 do
+    redis.call('HINCRBY', KEYS[i], ARGV[2], ARGV[3])
+    redis.call('HINCRBY', KEYS[i], ARGV[4], 1)
+end
+return 1
+"""
+
+
+def gerrit_event_id(payload: dict) -> str:
+    """
+    Return a stable ID for a Gerrit event payload.
+
+    Gerrit stream events carry no ID of their own; a redelivered or
+    re-published event has the same content, so the digest of its canonical
+    JSON identifies it.
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
 class GerritProcessorService:
@@ -51,6 +108,18 @@ class GerritProcessorService:
         """Generate Redis sorted set key for unmerged CLs (global)"""
         return GERRIT_UNMERGED_CL_KEY_GLOBAL.format(ldap=owner_ldap, cl_status=status)
 
+    def _open_pipeline(self, pipeline):
+        """Return (pipeline, owned): the caller's pipeline, or a new one to execute here."""
+        if pipeline is not None:
+            return pipeline, False
+        return self.redis_client.pipeline(), True
+
+    def _close_pipeline(self, pipeline, owned: bool) -> None:
+        """Queue the analytics generation bump and execute the pipeline if owned."""
+        bump_analytics_generation(pipeline, AnalyticsSource.GERRIT)
+        if owned:
+            self.retry_utils.get_retry_on_transient(pipeline.execute)
+
     def _extract_and_validate_change_data(
         self, payload: dict, required_fields: list
     ) -> dict | None:
@@ -138,7 +207,7 @@ class GerritProcessorService:
             score,
         )
 
-    def _handle_comment_added(self, payload: dict) -> None:
+    def _handle_comment_added(self, payload: dict, pipeline=None) -> None:
         """
         Process "comment-added" Pub/Sub events to track reviewer contributions.
         Increments the weekly "cl_reviewed" statistic for the commenter in Redis,
@@ -161,40 +230,30 @@ class GerritProcessorService:
         project = data["project"]
         event_unix_timestamp = data["event_unix_timestamp"]
         dedupe_key = GERRIT_DEDUPE_REVIEWED_KEY.format(change_number=change_number)
-
-        # Check for deduplication before performing any Redis operations
-        has_reviewed = self.redis_client.sismember(dedupe_key, commenter)
-        if has_reviewed:
-            self.logger.info(
-                "[GerritProcessorService] Skipping duplicate count for CL %s, user %s has already reviewed it",
-                change_number,
-                commenter,
-            )
-            return
-
         bucket = self.date_time_util.compute_buckets_weekly(event_unix_timestamp)
-
-        pipeline = self.redis_client.pipeline()
-
-        # Update project-specific weekly stats
         user_weekly_stats_key_project = GERRIT_STATS_PROJECT_BUCKET_KEY.format(
             ldap=commenter, project=project, bucket=bucket
         )
-        pipeline.hincrby(user_weekly_stats_key_project, GERRIT_CL_REVIEWED_FIELD, 1)
-
-        # Update global weekly stats
         user_weekly_stats_key_global = GERRIT_STATS_BUCKET_KEY.format(
             ldap=commenter, bucket=bucket
         )
-        pipeline.hincrby(user_weekly_stats_key_global, GERRIT_CL_REVIEWED_FIELD, 1)
 
-        # Add to deduplication set
-        pipeline.sadd(dedupe_key, commenter)
-        pipeline.expire(dedupe_key, THREE_MONTHS_IN_SECONDS)
-
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        pipeline, owned = self._open_pipeline(pipeline)
+        # Deduplication happens inside the script, so the review is counted
+        # once per user even if the user has already reviewed the CL.
+        pipeline.eval(
+            _COUNT_REVIEW_ONCE_SCRIPT,
+            3,
+            dedupe_key,
+            user_weekly_stats_key_project,
+            user_weekly_stats_key_global,
+            commenter,
+            GERRIT_CL_REVIEWED_FIELD,
+            THREE_MONTHS_IN_SECONDS,
+        )
+        self._close_pipeline(pipeline, owned)
         self.logger.info(
-            "[GerritProcessorService] Updated review stats: user %s reviewed CL %s (project: %s), incremented '%s' in %s and %s",
+            "[GerritProcessorService] Counted review stats once: user %s reviewed CL %s (project: %s), '%s' in %s and %s",
             commenter,
             change_number,
             project,
@@ -203,7 +262,7 @@ class GerritProcessorService:
             user_weekly_stats_key_global,
         )
 
-    def store_payload(self, payload: dict):
+    def store_payload(self, payload: dict, pipeline=None):
         """
         Processes Gerrit Pub/Sub events and updates Redis storage accordingly.
 
@@ -225,6 +284,9 @@ class GerritProcessorService:
                 - "type": e.g. "comment-added" or "change-merged" etc.
                 - "change": Gerrit change dict (with owner, number, project, created).
                 - For comment events: top-level "author" field with "username".
+            pipeline: Optional pipeline to queue the writes on. When given, the
+                caller executes it (e.g. once per pulled Pub/Sub batch);
+                otherwise each event is written in its own pipeline.
         Raises:
             ValueError: if Redis client is unavailable.
 
@@ -234,36 +296,43 @@ class GerritProcessorService:
         event_type = payload.get("type")
 
         if event_type == "comment-added":
-            self._handle_comment_added(payload)
+            self._handle_comment_added(payload, pipeline)
         elif event_type == "project-created":
             project_name = payload.get("projectName")
             if project_name:
-                self.retry_utils.get_retry_on_transient(
-                    lambda: self.redis_client.sadd(GERRIT_PROJECTS_KEY, project_name)
-                )
+                if pipeline is not None:
+                    pipeline.sadd(GERRIT_PROJECTS_KEY, project_name)
+                else:
+                    self.retry_utils.get_retry_on_transient(
+                        lambda: self.redis_client.sadd(
+                            GERRIT_PROJECTS_KEY, project_name
+                        )
+                    )
                 self.logger.info(
                     "[GerritProcessorService] Added new project to set: %s",
                     project_name,
                 )
 
         elif event_type == "patchset-created":
-            self._handle_patchset_created(payload)
+            self._handle_patchset_created(payload, pipeline)
         elif event_type == "change-merged":
-            self._handle_change_merged(payload)
+            self._handle_change_merged(payload, pipeline)
         elif event_type == "change-abandoned":
-            self._handle_change_abandoned(payload)
+            self._handle_change_abandoned(payload, pipeline)
         elif event_type == "change-restored":
-            self._handle_change_restored(payload)
+            self._handle_change_restored(payload, pipeline)
         elif event_type == "change-deleted":
-            self._handle_change_deleted(payload)
+            self._handle_change_deleted(payload, pipeline)
         elif event_type in ["private-state-changed", "wip-state-changed"]:
-            self._handle_private_and_wip_states_changed(payload)
+            self._handle_private_and_wip_states_changed(payload, pipeline)
         else:
             self.logger.warning(
                 "[GerritProcessorService] Unsupported Gerrit event type: %s", event_type
             )
 
-    def _handle_private_and_wip_states_changed(self, payload: dict) -> None:
+    def _handle_private_and_wip_states_changed(
+        self, payload: dict, pipeline=None
+    ) -> None:
         """
         Handle "private-state-changed" or "wip-state-changed" events.
 
@@ -293,7 +362,7 @@ class GerritProcessorService:
         is_private = data["is_private"]
         is_wip = data["is_wip"]
 
-        pipeline = self.redis_client.pipeline()
+        pipeline, owned = self._open_pipeline(pipeline)
 
         if is_private or is_wip:
             # The CL became private or WIP — remove it from review tracking sets.
@@ -321,9 +390,9 @@ class GerritProcessorService:
                 cl_created_unix_timestamp,
             )
 
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self._close_pipeline(pipeline, owned)
 
-    def _handle_change_deleted(self, payload: dict) -> None:
+    def _handle_change_deleted(self, payload: dict, pipeline=None) -> None:
         """
         Handle "change-deleted" events to remove the CL from all unmerged tracking sets.
         """
@@ -338,16 +407,16 @@ class GerritProcessorService:
         owner_ldap = data["owner_ldap"]
         original_change_status = data["change_status"]
 
-        pipeline = self.redis_client.pipeline()
+        pipeline, owned = self._open_pipeline(pipeline)
 
         self._remove_cl_from_unmerged_sets(
             pipeline, owner_ldap, project, change_number, original_change_status
         )
 
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self._close_pipeline(pipeline, owned)
         self.logger.info("[GerritProcessorService] Deleted CL: %s ", change_number)
 
-    def _handle_patchset_created(self, payload: dict) -> None:
+    def _handle_patchset_created(self, payload: dict, pipeline=None) -> None:
         """
         Handle "patchset-created" events to track new changes under review.
 
@@ -392,7 +461,7 @@ class GerritProcessorService:
             )
             return
 
-        pipeline = self.redis_client.pipeline()
+        pipeline, owned = self._open_pipeline(pipeline)
 
         self._add_cl_to_unmerged_sets(
             pipeline,
@@ -402,7 +471,7 @@ class GerritProcessorService:
             GerritChangeStatus.NEW,
             cl_created_unix_timestamp,
         )
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self._close_pipeline(pipeline, owned)
         self.logger.info(
             "[GerritProcessorService] Tracked new under-review CL: %s (project: %s) as NEW (score: %s).",
             change_number,
@@ -410,13 +479,15 @@ class GerritProcessorService:
             cl_created_unix_timestamp,
         )
 
-    def _handle_change_merged(self, payload: dict) -> None:
+    def _handle_change_merged(self, payload: dict, pipeline=None) -> None:
         """
         Handle "change-merged" events to update CL status, merge metrics, and clean up tracking data.
 
         Core Logic:
         1. Calculates the weekly stats bucket using the merge timestamp.
-        2. Updates four key metrics in the owner's weekly stats (via Redis Hash):
+        2. Updates four key metrics in the owner's weekly stats (via Redis Hash),
+           once per event: the increments are skipped when the event is already
+           in the processed-event ledger (e.g. a Pub/Sub redelivery):
            - Increment merged lines of code (LOC) by the patchset's insertion count (project-specific and global).
            - Increment merged CL count for the weekly bucket (project-specific and global).
         3. Removes the CL from the "NEW" status tracking sets (project-specific and global) since it's now merged.
@@ -457,32 +528,38 @@ class GerritProcessorService:
             status=GerritChangeStatus.MERGED.value
         )
 
-        pipeline = self.redis_client.pipeline()
-
-        # Update project-specific weekly stats
         user_weekly_stats_key_project = GERRIT_STATS_PROJECT_BUCKET_KEY.format(
             ldap=owner_ldap, project=project, bucket=bucket
         )
-        pipeline.hincrby(
-            user_weekly_stats_key_project, GERRIT_LOC_MERGED_FIELD, insertions
-        )
-        pipeline.hincrby(user_weekly_stats_key_project, cl_merged_field, 1)
-
-        # Update global weekly stats
         user_weekly_stats_key_global = GERRIT_STATS_BUCKET_KEY.format(
             ldap=owner_ldap, bucket=bucket
         )
-        pipeline.hincrby(
-            user_weekly_stats_key_global, GERRIT_LOC_MERGED_FIELD, insertions
+        ledger_key = GERRIT_PROCESSED_EVENT_KEY.format(
+            event_id=gerrit_event_id(payload)
+        )
+
+        pipeline, owned = self._open_pipeline(pipeline)
+
+        # Update project-specific and global weekly stats, unless this event
+        # has already been applied
+        pipeline.eval(
+            _APPLY_MERGE_ONCE_SCRIPT,
+            3,
+            ledger_key,
+            user_weekly_stats_key_project,
+            user_weekly_stats_key_global,
+            GERRIT_PROCESSED_EVENT_TTL_SECONDS,
+            GERRIT_LOC_MERGED_FIELD,
+            insertions,
+            cl_merged_field,
         )
-        pipeline.hincrby(user_weekly_stats_key_global, cl_merged_field, 1)
 
         # Remove CL from "NEW" status tracking sets (project-specific and global)
         self._remove_cl_from_unmerged_sets(
             pipeline, owner_ldap, project, change_number, GerritChangeStatus.NEW
         )
 
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self._close_pipeline(pipeline, owned)
         self.logger.info(
             "[GerritProcessorService] Merged CL %s: updated stats (LOC: +%d, merged count: +1) in %s and %s; removed from NEW status tracking sets",
             change_number,
@@ -491,7 +568,7 @@ class GerritProcessorService:
             user_weekly_stats_key_global,
         )
 
-    def _handle_change_abandoned(self, payload: dict) -> None:
+    def _handle_change_abandoned(self, payload: dict, pipeline=None) -> None:
         """
         Handle "change-abandoned" events to update CL status from "NEW" to "ABANDONED" in tracking storage.
 
@@ -522,7 +599,7 @@ class GerritProcessorService:
         owner_ldap = data["owner_ldap"]
         abandoned_unix_timestamp = data["event_unix_timestamp"]
 
-        pipeline = self.redis_client.pipeline()
+        pipeline, owned = self._open_pipeline(pipeline)
 
         self._remove_cl_from_unmerged_sets(
             pipeline, owner_ldap, project, change_number, GerritChangeStatus.NEW
@@ -535,7 +612,7 @@ class GerritProcessorService:
             GerritChangeStatus.ABANDONED,
             abandoned_unix_timestamp,
         )
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self._close_pipeline(pipeline, owned)
         self.logger.info(
             "[GerritProcessorService] Abandoned CL %s (project: %s) at %s: moved from NEW to ABANDONED; cleared dedupe key.",
             change_number,
@@ -543,7 +620,7 @@ class GerritProcessorService:
             abandoned_unix_timestamp,
         )
 
-    def _handle_change_restored(self, payload: dict) -> None:
+    def _handle_change_restored(self, payload: dict, pipeline=None) -> None:
         """
         Handle "change-restored" events to update CL status from "ABANDONED" to "NEW" and refresh reviewer tracking.
 
@@ -578,7 +655,7 @@ class GerritProcessorService:
         cl_created_unix_timestamp = data["cl_created_unix_timestamp"]
         restored_unix_timestamp = data["event_unix_timestamp"]
 
-        pipeline = self.redis_client.pipeline()
+        pipeline, owned = self._open_pipeline(pipeline)
 
         self._remove_cl_from_unmerged_sets(
             pipeline, owner_ldap, project, change_number, GerritChangeStatus.ABANDONED
@@ -592,7 +669,7 @@ class GerritProcessorService:
             cl_created_unix_timestamp,
         )
 
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self._close_pipeline(pipeline, owned)
         self.logger.info(
             "[GerritProcessorService] Restored CL %s (project: %s) at %s: moved from ABANDONED to NEW (score: %s).",
             change_number,
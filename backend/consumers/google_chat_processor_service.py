@@ -21,16 +21,23 @@ class GoogleChatProcessorService:
         pubsub_puller_factory: A PubSubPullerFactory instance.
         google_chat_message_util: A GoogleChatMessageUtil instance.
         google_service: A GoogleService instance.
+        sender_ldap_cache: A GoogleChatSenderLdapCache instance.
     """
 
     def __init__(
-        self, logger, pubsub_puller_factory, google_chat_messages_utils, google_service
+        self,
+        logger,
+        pubsub_puller_factory,
+        google_chat_messages_utils,
+        google_service,
+        sender_ldap_cache,
     ):
         """Initialize the GoogleChatProcessorService."""
         self.logger = logger
         self.pubsub_puller_factory = pubsub_puller_factory
         self.google_chat_messages_utils = google_chat_messages_utils
         self.google_service = google_service
+        self.sender_ldap_cache = sender_ldap_cache
 
     def pull_messages(self, project_id, subscription_id):
         """
@@ -154,13 +161,15 @@ class GoogleChatProcessorService:
 
         message.ack()
 
-    def process_event(self, data: dict, attributes: dict):
+    def process_event(self, data: dict, attributes: dict, pipeline=None):
         """
         Process a single Google Chat event (pure business logic, no ack/nack).
 
         Args:
             data: Decoded JSON payload from the Pub/Sub message.
             attributes: Message attributes dict (contains CloudEvent metadata like `ce-type`).
+            pipeline: Optional staged pipeline the message writes are queued on;
+                the caller executes it with the rest of the pulled batch.
 
         Raises:
             ValueError: If the event type is unsupported or required fields are missing.
@@ -193,18 +202,16 @@ class GoogleChatProcessorService:
                     sender_name = chat_message.get("sender", {}).get("name", "")
                     sender_id = sender_name.split("/")[1] if sender_name else ""
                     sender_ldap = (
-                        self.google_service.get_ldap_by_id(sender_id)
-                        if sender_id
-                        else ""
+                        self.sender_ldap_cache.get_ldap(sender_id) if sender_id else ""
                     )
                     ldaps_dict = {sender_name: sender_ldap}
             else:
                 messages_list = data.get("messages")
                 if GoogleChatEventType.BATCH_CREATED == message_enum:
-                    ldaps_dict = self.google_service.list_directory_all_people_ldap()
+                    ldaps_dict = self.sender_ldap_cache.get_directory()
 
             self.google_chat_messages_utils.store_messages(
-                ldaps_dict, messages_list, message_enum
+                ldaps_dict, messages_list, message_enum, pipeline=pipeline
             )
             self.logger.info(
                 "[GoogleChatProcessorService] Google Chat message processed."
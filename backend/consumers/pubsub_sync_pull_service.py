@@ -1,6 +1,7 @@
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from backend.common.constants import (
     ALL_GOOGLE_CHAT_EVENT_TYPES,
@@ -12,11 +13,22 @@ from backend.common.environment_constants import (
     GOOGLE_CHAT_SUBSCRIPTION_ID,
     GERRIT_SUBSCRIPTION_ID,
 )
+from backend.utils.redis_write_batch import RedisWriteBatch
 
 # Idempotency note: messages may be redelivered if `acknowledge()` itself fails
 # after `process_fn` succeeds, or if a sibling message's nack causes an early
 # break. All registered processors (store_payload, process_event,
 # sync_near_real_time_message_to_redis) MUST be idempotent on retry.
+#
+# Concurrency note: with max_workers > 1 the messages of a batch are processed
+# in parallel and may complete out of publish order. Pub/Sub already makes no
+# ordering guarantee for these subscriptions, so processors must not rely on it.
+#
+# Batching note: with a redis_client configured, every processor receives a
+# staged `pipeline` and only queues its writes on it; the writes of the whole
+# pulled batch are executed in one pipeline before the batch is acked. A
+# processor that reads state an earlier message of the batch may have written
+# must call `pipeline.flush_batch()` before that read.
 
 
 class PubSubSyncPullService:
@@ -24,6 +36,10 @@ class PubSubSyncPullService:
     Synchronous pull from Pub/Sub subscriptions.
     Loops until the subscription is drained, processing and acknowledging
     each batch before pulling the next.
+
+    In concurrent mode the subscriptions are drained in parallel, each batch is
+    processed by a bounded worker pool, and the ack for one batch overlaps the
+    pull of the next.
     """
 
     def __init__(
@@ -34,13 +50,44 @@ class PubSubSyncPullService:
         google_chat_processor_service,
         gerrit_processor_service,
         asyncio_event_loop_manager,
+        redis_client=None,
+        retry_utils=None,
     ):
+        """
+        Args:
+            logger: Logger instance.
+            subscriber_client: A Pub/Sub SubscriberClient.
+            microsoft_chat_message_util: A MicrosoftChatMessageUtil instance.
+            google_chat_processor_service: A GoogleChatProcessorService instance.
+            gerrit_processor_service: A GerritProcessorService instance.
+            asyncio_event_loop_manager: Runs the async Microsoft processor.
+            redis_client: Optional Redis client. When set, the Redis writes of
+                each pulled batch are executed in a single pipeline.
+            retry_utils: A RetryUtils used to execute the batch pipeline.
+        """
         self.logger = logger
         self.subscriber_client = subscriber_client
         self.microsoft_chat_message_util = microsoft_chat_message_util
         self.google_chat_processor_service = google_chat_processor_service
         self.gerrit_processor_service = gerrit_processor_service
         self.asyncio_event_loop_manager = asyncio_event_loop_manager
+        self.redis_client = redis_client
+        self.retry_utils = retry_utils
+
+    def _settle_batch(self, subscription_path, ack_ids, nack_ids):
+        """Acknowledge processed messages and nack failed ones for immediate redelivery."""
+        if ack_ids:
+            self.subscriber_client.acknowledge(
+                subscription=subscription_path, ack_ids=ack_ids
+            )
+        if nack_ids:
+            # Deadline=0 triggers immediate redelivery. Poison pills are
+            # handled by the subscription's Dead Letter Topic configuration.
+            self.subscriber_client.modify_ack_deadline(
+                subscription=subscription_path,
+                ack_ids=nack_ids,
+                ack_deadline_seconds=0,
+            )
 
     def _pull_and_process(
         self,
@@ -50,6 +97,7 @@ class PubSubSyncPullService:
         max_messages=10,
         max_iterations=100,
         deadline_seconds=3000,
+        max_workers=1,
     ):
         """
         Pull messages from a subscription and process them.
@@ -58,7 +106,9 @@ class PubSubSyncPullService:
             project_id: GCP project ID.
             subscription_id: Pub/Sub subscription ID.
             process_fn: Callable that takes (data_bytes, attributes) and processes one message.
-                        Should raise on failure (message will not be acked).
+                        Should raise on failure (message will not be acked). With a
+                        redis_client configured it also receives a staged pipeline
+                        to queue its Redis writes on.
             max_messages: Max messages to pull per call.
             max_iterations: Hard cap on pull batches to prevent unbounded loops on
                             high-traffic subscriptions. Remaining messages are picked
@@ -68,6 +118,10 @@ class PubSubSyncPullService:
             deadline_seconds: Wall-clock budget for this call. Defaults to 50 minutes
                               so an hourly cron tick cannot overrun the next one even
                               if pull() stalls under a regional incident.
+            max_workers: Number of messages of a batch processed in parallel. Above
+                         1, the ack of each batch is also sent on a background
+                         thread while the next batch is pulled; at most one ack
+                         is in flight, and its errors surface before the next one.
 
         Returns:
             dict with processed/failed counts.
@@ -84,81 +138,151 @@ class PubSubSyncPullService:
         iterations = 0
         deadline = time.monotonic() + deadline_seconds
 
-        while iterations < max_iterations:
-            if time.monotonic() >= deadline:
-                self.logger.warning(
-                    "[PubSubSyncPullService] Hit deadline=%ds for %s/%s; remaining messages will be picked up next run.",
-                    deadline_seconds,
-                    project_id,
-                    subscription_id,
-                )
-                break
-            iterations += 1
+        concurrent = max_workers > 1
+        process_pool = (
+            ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"pubsub-process-{subscription_id}",
+            )
+            if concurrent
+            else None
+        )
+        ack_pool = (
+            ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"pubsub-ack-{subscription_id}"
+            )
+            if concurrent
+            else None
+        )
+        pending_ack = None
+
+        def process_received(received, batch):
+            msg = received.message
             try:
-                response = self.subscriber_client.pull(
-                    subscription=subscription_path,
-                    max_messages=max_messages,
-                    timeout=60,
-                )
+                if batch is None:
+                    process_fn(msg.data, dict(msg.attributes))
+                else:
+                    staged = batch.stage()
+                    process_fn(msg.data, dict(msg.attributes), staged)
+                    batch.commit(staged, received.ack_id)
+                return True
             except Exception as e:
                 self.logger.error(
-                    "[PubSubSyncPullService] Pull failed for %s/%s: %s",
+                    "[PubSubSyncPullService] Failed to process message %s in %s/%s: %s",
+                    msg.message_id,
                     project_id,
                     subscription_id,
                     e,
                     exc_info=True,
                 )
-                break
+                return False
 
-            if not response.received_messages:
-                self.logger.debug(
-                    "[PubSubSyncPullService] No messages in %s/%s",
-                    project_id,
-                    subscription_id,
-                )
-                break
-
-            ack_ids = []
-            nack_ids = []
-            for received in response.received_messages:
-                msg = received.message
+        try:
+            while iterations < max_iterations:
+                if time.monotonic() >= deadline:
+                    self.logger.warning(
+                        "[PubSubSyncPullService] Hit deadline=%ds for %s/%s; remaining messages will be picked up next run.",
+                        deadline_seconds,
+                        project_id,
+                        subscription_id,
+                    )
+                    break
+                iterations += 1
                 try:
-                    process_fn(msg.data, dict(msg.attributes))
-                    ack_ids.append(received.ack_id)
-                    processed_ids.add(msg.message_id)
+                    response = self.subscriber_client.pull(
+                        subscription=subscription_path,
+                        max_messages=max_messages,
+                        timeout=60,
+                    )
                 except Exception as e:
                     self.logger.error(
-                        "[PubSubSyncPullService] Failed to process message %s in %s/%s: %s",
-                        msg.message_id,
+                        "[PubSubSyncPullService] Pull failed for %s/%s: %s",
                         project_id,
                         subscription_id,
                         e,
                         exc_info=True,
                     )
-                    nack_ids.append(received.ack_id)
-                    failed_ids.add(msg.message_id)
+                    break
+
+                if pending_ack is not None:
+                    pending_ack.result()
+                    pending_ack = None
 
-            if ack_ids:
-                self.subscriber_client.acknowledge(
-                    subscription=subscription_path, ack_ids=ack_ids
+                if not response.received_messages:
+                    self.logger.debug(
+                        "[PubSubSyncPullService] No messages in %s/%s",
+                        project_id,
+                        subscription_id,
+                    )
+                    break
+
+                received_messages = list(response.received_messages)
+                batch = (
+                    RedisWriteBatch(self.redis_client, self.retry_utils)
+                    if self.redis_client is not None
+                    else None
                 )
-            if nack_ids:
-                # Deadline=0 triggers immediate redelivery. Poison pills are
-                # handled by the subscription's Dead Letter Topic configuration.
-                self.subscriber_client.modify_ack_deadline(
-                    subscription=subscription_path,
-                    ack_ids=nack_ids,
-                    ack_deadline_seconds=0,
+                if process_pool:
+                    outcomes = list(
+                        process_pool.map(
+                            lambda r: process_received(r, batch), received_messages
+                        )
+                    )
+                else:
+                    outcomes = [process_received(r, batch) for r in received_messages]
+
+                if batch is not None:
+                    try:
+                        batch.flush()
+                    except Exception as e:
+                        self.logger.error(
+                            "[PubSubSyncPullService] Batch write failed for %s/%s: %s",
+                            project_id,
+                            subscription_id,
+                            e,
+                            exc_info=True,
+                        )
+                    # Only messages whose writes reached Redis are acked; the
+                    # rest are nacked and redelivered.
+                    written = set(batch.written)
+                    outcomes = [
+                        succeeded and received.ack_id in written
+                        for received, succeeded in zip(received_messages, outcomes)
+                    ]
+
+                ack_ids = []
+                nack_ids = []
+                for received, succeeded in zip(received_messages, outcomes):
+                    if succeeded:
+                        ack_ids.append(received.ack_id)
+                        processed_ids.add(received.message.message_id)
+                    else:
+                        nack_ids.append(received.ack_id)
+                        failed_ids.add(received.message.message_id)
+
+                if ack_pool:
+                    pending_ack = ack_pool.submit(
+                        self._settle_batch, subscription_path, ack_ids, nack_ids
+                    )
+                else:
+                    self._settle_batch(subscription_path, ack_ids, nack_ids)
+            else:
+                # while/else fires only when the loop condition becomes false (no break).
+                # That's exactly the iteration-cap case; deadline/empty/error all break.
+                self.logger.warning(
+                    "[PubSubSyncPullService] Hit max_iterations=%d for %s/%s; remaining messages will be picked up next run.",
+                    max_iterations,
+                    project_id,
+                    subscription_id,
                 )
-        else:
-            # while/else fires only when the loop condition becomes false (no break).
-            # That's exactly the iteration-cap case; deadline/empty/error all break.
-            self.logger.warning(
-                "[PubSubSyncPullService] Hit max_iterations=%d for %s/%s; remaining messages will be picked up next run.",
-                max_iterations,
-                project_id,
-                subscription_id,
-            )
+
+            if pending_ack is not None:
+                pending_ack.result()
+        finally:
+            if process_pool:
+                process_pool.shutdown()
+            if ack_pool:
+                ack_pool.shutdown()
 
         processed = len(processed_ids)
         failed = len(failed_ids - processed_ids)
@@ -173,31 +297,46 @@ class PubSubSyncPullService:
         return {"processed": processed, "failed": failed}
 
     def sync_pull_microsoft(
-        self, project_id, subscription_id, max_messages=10, max_iterations=100
+        self,
+        project_id,
+        subscription_id,
+        max_messages=10,
+        max_iterations=100,
+        max_workers=1,
     ):
         """Sync pull and process Microsoft Teams messages."""
 
-        def process_fn(data_bytes, attributes):
+        def process_fn(data_bytes, attributes, pipeline=None):
             data = json.loads(data_bytes.decode("utf-8"))
             change_type = data.get("changeType")
             resource = data.get("resource")
             self.asyncio_event_loop_manager.run_async_in_background_loop(
                 self.microsoft_chat_message_util.sync_near_real_time_message_to_redis(
-                    change_type, resource
+                    change_type, resource, pipeline=pipeline
                 ),
                 timeout=60,
             )
 
         return self._pull_and_process(
-            project_id, subscription_id, process_fn, max_messages, max_iterations
+            project_id,
+            subscription_id,
+            process_fn,
+            max_messages,
+            max_iterations,
+            max_workers=max_workers,
         )
 
     def sync_pull_google_chat(
-        self, project_id, subscription_id, max_messages=10, max_iterations=100
+        self,
+        project_id,
+        subscription_id,
+        max_messages=10,
+        max_iterations=100,
+        max_workers=1,
     ):
         """Sync pull and process Google Chat messages."""
 
-        def process_fn(data_bytes, attributes):
+        def process_fn(data_bytes, attributes, pipeline=None):
             # Pre-filter unsupported events: returning normally → message is
             # acked. Otherwise the sync loop would nack-and-redeliver this
             # poison pill on every iteration up to max_iterations.
@@ -212,30 +351,56 @@ class PubSubSyncPullService:
                 )
                 return
             data = json.loads(data_bytes.decode("utf-8"))
-            self.google_chat_processor_service.process_event(data, attributes)
+            self.google_chat_processor_service.process_event(
+                data, attributes, pipeline=pipeline
+            )
 
         return self._pull_and_process(
-            project_id, subscription_id, process_fn, max_messages, max_iterations
+            project_id,
+            subscription_id,
+            process_fn,
+            max_messages,
+            max_iterations,
+            max_workers=max_workers,
         )
 
     def sync_pull_gerrit(
-        self, project_id, subscription_id, max_messages=10, max_iterations=100
+        self,
+        project_id,
+        subscription_id,
+        max_messages=10,
+        max_iterations=100,
+        max_workers=1,
     ):
         """Sync pull and process Gerrit events."""
 
-        def process_fn(data_bytes, attributes):
+        def process_fn(data_bytes, attributes, pipeline=None):
             payload = json.loads(data_bytes.decode("utf-8"))
-            self.gerrit_processor_service.store_payload(payload)
+            self.gerrit_processor_service.store_payload(payload, pipeline=pipeline)
 
         return self._pull_and_process(
-            project_id, subscription_id, process_fn, max_messages, max_iterations
+            project_id,
+            subscription_id,
+            process_fn,
+            max_messages,
+            max_iterations,
+            max_workers=max_workers,
         )
 
-    def sync_pull_all(self, max_messages=10, max_iterations=100):
+    def sync_pull_all(
+        self, max_messages=10, max_iterations=100, concurrent=False, max_workers=1
+    ):
         """
         Pull and process messages from all three subscriptions.
         Uses environment variables for project_id and subscription_ids.
 
+        Args:
+            max_messages: Max messages to pull per call.
+            max_iterations: Hard cap on pull batches per subscription.
+            concurrent: Drain the subscriptions in parallel instead of one
+                        after another.
+            max_workers: Messages processed in parallel per subscription batch.
+
         Returns:
             dict with results per subscription.
         """
@@ -246,22 +411,25 @@ class PubSubSyncPullService:
             )
             return {}
 
-        results = {}
-
-        # Each subscription is isolated: an unexpected failure in one (e.g. a
-        # setup-time error before _pull_and_process can catch it) must not
-        # starve the remaining subscriptions.
         sources = (
             ("microsoft", MICROSOFT_SUBSCRIPTION_ID, self.sync_pull_microsoft),
             ("google_chat", GOOGLE_CHAT_SUBSCRIPTION_ID, self.sync_pull_google_chat),
             ("gerrit", GERRIT_SUBSCRIPTION_ID, self.sync_pull_gerrit),
         )
-        for name, env_var, sync_fn in sources:
-            sub = os.getenv(env_var)
-            if not sub:
-                continue
+        subscriptions = [
+            (name, os.getenv(env_var), sync_fn)
+            for name, env_var, sync_fn in sources
+            if os.getenv(env_var)
+        ]
+
+        # Each subscription is isolated: an unexpected failure in one (e.g. a
+        # setup-time error before _pull_and_process can catch it) must not
+        # starve the remaining subscriptions.
+        def drain(name, sub, sync_fn):
             try:
-                results[name] = sync_fn(project_id, sub, max_messages, max_iterations)
+                return sync_fn(
+                    project_id, sub, max_messages, max_iterations, max_workers
+                )
             except Exception as e:
                 self.logger.error(
                     "[PubSubSyncPullService] %s sync pull aborted: %s",
@@ -269,6 +437,16 @@ class PubSubSyncPullService:
                     e,
                     exc_info=True,
                 )
-                results[name] = {"processed": 0, "failed": 0}
+                return {"processed": 0, "failed": 0}
+
+        if concurrent and len(subscriptions) > 1:
+            with ThreadPoolExecutor(
+                max_workers=len(subscriptions), thread_name_prefix="pubsub-sync"
+            ) as executor:
+                futures = {
+                    name: executor.submit(drain, name, sub, sync_fn)
+                    for name, sub, sync_fn in subscriptions
+                }
+            return {name: future.result() for name, future in futures.items()}
 
-        return results
+        return {name: drain(name, sub, sync_fn) for name, sub, sync_fn in subscriptions}
@@ -16,7 +16,8 @@ class AdminUserDto(BaseDto):
 
 class UserListDto(BaseDto):
     users: list[AdminUserDto]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
 
 
 class GrantDto(BaseDto):
@@ -24,6 +24,7 @@ class CalendarEventDTO(BaseInternalDTO):
     calendar_id: str
     summary: str = ""
     start: datetime
+    end: datetime | None = None
     is_recurring: bool = False
     meeting_code: str
 
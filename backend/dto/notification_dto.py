@@ -31,10 +31,15 @@ class NotificationDto(BaseDto):
 
 
 class NotificationListDto(BaseDto):
-    """A page of one user's notifications plus their total pending count."""
+    """A page of one user's notifications plus their total pending count.
+
+    ``next_cursor`` resumes the list after this page's last row; None when
+    this is the last page.
+    """
 
     notifications: list[NotificationDto]
     unread_count: int
+    next_cursor: str | None = None
 
 
 class UnreadCountDto(BaseDto):
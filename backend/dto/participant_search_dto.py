@@ -28,4 +28,5 @@ class ParticipantRowDto(BaseDto):
 
 class ParticipantSearchDto(BaseDto):
     participant_rows: list[ParticipantRowDto]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
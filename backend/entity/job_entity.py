@@ -1,16 +1,48 @@
 from datetime import datetime
-from sqlalchemy import Boolean, String, Integer, Enum, DateTime, func, text
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    String,
+    Integer,
+    Enum,
+    DateTime,
+    Index,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from backend.common.base import Base
 from backend.common.recruiting_enums import JobKind, JobStatus
 from backend.common.mentorship_enums import ParticipantRole
 
+OWNER_IDS_EXPRESSION = (
+    "CASE"
+    " WHEN jsonb_typeof(pipeline_config -> 'ownerIds') = 'array'"
+    " AND pipeline_config -> 'ownerIds' <> '[]'::jsonb"
+    " THEN pipeline_config -> 'ownerIds'"
+    " WHEN jsonb_typeof(pipeline_config -> 'ownerId') <> 'null'"
+    " THEN '[]'::jsonb || (pipeline_config -> 'ownerId')"
+    " ELSE '[]'::jsonb"
+    " END"
+)
+
 
 class JobEntity(Base):
     """A recruiting posting. MVP creates two ACTIVITY postings (mentor, mentee)."""
 
     __tablename__ = "job"
+    # Owner lookups for the board switcher and applicant search. Kept in sync
+    # with migration 5b2d8e4f1a63 so create_all-based DB bootstraps
+    # (tools/init_db, used by CI) materialize it too.
+    __table_args__ = (
+        Index(
+            "ix_job_owner_ids",
+            "owner_ids",
+            postgresql_using="gin",
+            postgresql_ops={"owner_ids": "jsonb_path_ops"},
+        ),
+    )
 
     job_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     kind: Mapped[JobKind] = mapped_column(
@@ -41,6 +73,14 @@ class JobEntity(Base):
     description: Mapped[str | None] = mapped_column(String)
     form_schema: Mapped[dict | None] = mapped_column(JSONB)
     pipeline_config: Mapped[dict | None] = mapped_column(JSONB)
+    # pipeline_config's owner ids as a JSONB array, generated by Postgres on
+    # every write so it can never drift from the config. Mirrors
+    # pipeline_owners.normalized_owner_ids: a non-empty "ownerIds" wins,
+    # otherwise the legacy single "ownerId", otherwise [].
+    owner_ids: Mapped[list[int]] = mapped_column(
+        JSONB,
+        Computed(OWNER_IDS_EXPRESSION, persisted=True),
+    )
     pending_payload: Mapped[dict | None] = mapped_column(JSONB)
     screen_rules: Mapped[dict | None] = mapped_column(JSONB)
     profile_config: Mapped[dict | None] = mapped_column(JSONB)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.common.base import Base
@@ -27,6 +27,15 @@ class NotificationEntity(Base):
     __table_args__ = (
         Index("ix_notification_user_undismissed", "user_id", "dismissed_at"),
         Index("ix_notification_pending", "status", "created_at"),
+        # The bell's newest-first keyset pages. Kept in sync with migration
+        # 3c7e2a91d4b8 so create_all-based DB bootstraps materialize it too.
+        Index(
+            "ix_notification_user_feed",
+            "user_id",
+            text("created_at DESC"),
+            text("notification_id DESC"),
+            postgresql_where=text("dismissed_at IS NULL"),
+        ),
     )
 
     notification_id: Mapped[int] = mapped_column(
@@ -1,5 +1,8 @@
 import calendar
-from datetime import datetime
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Generator
 from backend.common.constants import (
     GerritChangeStatus,
@@ -22,7 +25,14 @@ from backend.common.constants import (
     GERRIT_STATUS_TO_FIELD_TEMPLATE,
     THREE_MONTHS_IN_SECONDS,
     GERRIT_UNMERGED_CL_KEY_GLOBAL,
+    GERRIT_SYNC_HIGH_WATER_MARK_KEY,
+    GERRIT_SYNC_OVERLAP_SECONDS,
+    AnalyticsSource,
 )
+from backend.utils.analytics_result_cache import bump_analytics_generation
+
+# Marks the end of one query stream in the concurrent page queue.
+_STREAM_DONE = object()
 
 
 class GerritSyncService:
@@ -48,6 +58,7 @@ class GerritSyncService:
         projects: list[str] | None = None,
         max_changes: int | None = None,
         page_size: int = 500,
+        updated_after: str | None = None,
     ) -> Generator[list[dict], None, None]:
         """
         Generator that pages through Gerrit changes using the Gerrit REST API.
@@ -58,6 +69,8 @@ class GerritSyncService:
             projects (list[str] | None): Optional list of project names to filter by. If None, all projects are considered.
             max_changes (int | None): Maximum number of changes to return. If None, fetches all matching changes.
             page_size (int): Number of results to fetch per API request. Defaults to 500.
+            updated_after (str | None): Optional UTC time ("YYYY-MM-DD HH:MM:SS"); only changes
+                updated after it are returned.
 
         Yields:
             list[dict]: A list of Gerrit change records for each fetched page.
@@ -87,6 +100,10 @@ class GerritSyncService:
         else:
             queries = [f"({status_clause}) project:{p}" for p in projects]
 
+        if updated_after:
+            after_clause = f'after:"{updated_after}"'
+            queries = [f"({q}) {after_clause}" for q in queries] or [after_clause]
+
         while True:
             current_page_limit = page_size
             if max_changes is not None:
@@ -211,6 +228,7 @@ class GerritSyncService:
             self.bump_cl_reviewed(pipe, user, project, bucket)
 
         pipe.expire(review_dedupe_key, 60 * 60 * 24 * 90)
+        bump_analytics_generation(pipe, AnalyticsSource.GERRIT)
         pipe.execute()
 
         prev_tab = self.redis_client.hget(GERRIT_CHANGE_STATUS_KEY, change_number)
@@ -238,6 +256,7 @@ class GerritSyncService:
 
         pipe.hset(GERRIT_CHANGE_STATUS_KEY, change_number, new_tab)
 
+        bump_analytics_generation(pipe, AnalyticsSource.GERRIT)
         pipe.execute()
 
     def bump_cl_reviewed(self, pipe, user: str, project: str, bucket: str) -> None:
@@ -449,47 +468,45 @@ class GerritSyncService:
                 sorted_set_score
             )
 
-    def _batch_store_changes(self, all_changes: list[dict]) -> None:
+    def _write_aggregates(
+        self,
+        user_weekly_stats: dict,
+        global_unmerged_cl_data: dict,
+        under_review_dedupe_data: dict,
+        stale_unmerged_cl_data: dict | None = None,
+        high_water_mark: str | None = None,
+    ) -> None:
         """
-        Batch process and store Gerrit changes into Redis.
+        Store aggregated Gerrit statistics into Redis.
 
-        This method performs in-memory aggregation of statistics for all provided Gerrit changes,
-        including:
+        The aggregates are built in memory by `_aggregate_single_change` for all
+        fetched changes, including:
         - Weekly stats per user (owners and reviewers) for both project-specific and global keys.
         - Deduplicated sets of reviewers for under-review CLs.
         - Global sorted sets of unmerged CLs keyed by owner and status for both project-specific and global keys.
 
-        After aggregation, the data is written to Redis using a single pipeline:
+        The data is written to Redis using a single pipeline:
         - HSET for all user weekly statistics
         - SADD + EXPIRE for under-review reviewer deduplication sets
         - ZADD for global unmerged CL data
+        - ZREM for CLs that left an unmerged status, and SET of the sync high-water
+          mark, when given by the incremental sync
 
         Parameters:
-            all_changes : list[dict]
-                List of Gerrit changes (CLs), where each dict contains fields such as:
-                "owner", "status", "project", "virtual_id_number", "messages", "submitted", "updated", "insertions".
+            user_weekly_stats : dict
+                Weekly stats hashes to HSET, keyed by Redis key.
+            global_unmerged_cl_data : dict
+                Unmerged CL sorted sets to ZADD, keyed by Redis key.
+            under_review_dedupe_data : dict
+                Reviewer sets to SADD, keyed by change number.
+            stale_unmerged_cl_data : dict | None
+                Change numbers to ZREM, keyed by unmerged CL sorted set key.
+            high_water_mark : str | None
+                Latest `updated` timestamp covered by this write.
 
         Returns: None
             The method updates Redis in-place using a pipeline. No value is returned.
         """
-        if not all_changes:
-            self.logger.info("No Gerrit changes to process for batch store.")
-            return
-
-        user_weekly_stats: dict = {}
-        global_unmerged_cl_data: dict = {}
-
-        # Mapping of under-review CLs to their reviewers for deduplication
-        under_review_dedupe_data: dict[int, set[str]] = {}
-
-        for change in all_changes:
-            self._aggregate_single_change(
-                change,
-                user_weekly_stats,
-                global_unmerged_cl_data,
-                under_review_dedupe_data,
-            )
-
         write_pipe = self.redis_client.pipeline()
 
         # Queue HSET for all aggregated statistics keys (includes both project-specific and global)
@@ -512,6 +529,13 @@ class GerritSyncService:
             if cl_data:
                 write_pipe.zadd(sorted_set_key, cl_data)
 
+        for sorted_set_key, change_numbers in (stale_unmerged_cl_data or {}).items():
+            write_pipe.zrem(sorted_set_key, *change_numbers)
+
+        if high_water_mark:
+            write_pipe.set(GERRIT_SYNC_HIGH_WATER_MARK_KEY, high_water_mark)
+
+        bump_analytics_generation(write_pipe, AnalyticsSource.GERRIT)
         self.retry_utils.get_retry_on_transient(write_pipe.execute)
         self.logger.info(
             "Successfully wrote all aggregated data to Redis in a single pipeline."
@@ -523,28 +547,49 @@ class GerritSyncService:
         projects: list[str] | None = None,
         max_changes: int | None = None,
         page_size: int = 500,
+        max_workers: int = 1,
     ) -> None:
         """
         Orchestrator function that fetches Gerrit changes and stores them in Redis.
-        Combines `fetch_changes` and `_batch_store_changes`, logging progress and any errors encountered.
+        Combines `fetch_changes`, `_aggregate_single_change` and `_write_aggregates`, logging progress and any errors encountered.
+
+        Pages are aggregated in memory as they arrive and the aggregates are
+        written once at the end, so stats spread over several pages (or query
+        streams) are stored as totals rather than overwritten page by page.
 
         Args:
             statuses (list[str] | None): Optional list of change statuses to filter by (e.g., ["merged", "abandoned", "open"]). If None, all statuses are included.
             projects (list[str] | None): Optional list of project names to filter by. If None, all projects are included.
             max_changes (int | None): Maximum number of changes to fetch and store. If None, all matching changes are processed.
             page_size (int): Number of results to fetch per API request to Gerrit. Defaults to 500.
+            max_workers (int): Number of query streams (one per project, or one per
+                status when no projects are given) fetched in parallel. Each stream
+                prefetches its next page while earlier pages are aggregated. Ignored
+                when `max_changes` is set, since the cap spans all streams.
 
         Raises:
             Exception: Propagates any exception encountered during processing after logging.
         """
         if not statuses:
             statuses = ALL_GERRIT_STATUSES
+        if max_changes is not None:
+            max_workers = 1
+
+        user_weekly_stats: dict = {}
+        global_unmerged_cl_data: dict = {}
+        under_review_dedupe_data: dict[int, set[str]] = {}
         total = 0
         try:
-            for changes_batch in self.fetch_changes(
-                statuses, projects, max_changes, page_size
+            for changes_batch in self._fetch_pages(
+                statuses, projects, max_changes, page_size, max_workers
             ):
-                self._batch_store_changes(changes_batch)
+                for change in changes_batch:
+                    self._aggregate_single_change(
+                        change,
+                        user_weekly_stats,
+                        global_unmerged_cl_data,
+                        under_review_dedupe_data,
+                    )
                 batch_count = len(changes_batch)
                 total += batch_count
                 self.logger.info(
@@ -553,11 +598,204 @@ class GerritSyncService:
                     total,
                 )
 
+            if not total:
+                self.logger.info("No Gerrit changes to process for batch store.")
+                return
+            self._write_aggregates(
+                user_weekly_stats, global_unmerged_cl_data, under_review_dedupe_data
+            )
             self.logger.info("Finished processing %d Gerrit changes", total)
         except Exception as e:
             self.logger.error("Error after processing %d changes: %s", total, e)
             raise
 
+    def sync_changes_incrementally(self, page_size: int = 500) -> int:
+        """
+        Re-aggregate the Gerrit stats touched by changes updated since the last sync.
+
+        The latest `updated` timestamp seen is persisted as a high-water mark.
+        A change only adds to weekly buckets at or before the week of its
+        latest update, so every change counted in a bucket from the high-water
+        mark's week on was updated since that week started, and those buckets
+        can be recomputed exactly from the changes updated in that window.
+        Only the stats keys that changes updated after the high-water mark
+        contribute to are rewritten; the HSET of their recomputed totals also
+        repairs any drift left by the real-time event counters.
+
+        Without a high-water mark (first run) all changes are fetched and every
+        key is written, as in `fetch_and_store_changes`.
+
+        Args:
+            page_size (int): Number of results to fetch per API request to Gerrit. Defaults to 500.
+
+        Returns:
+            int: The number of changes updated since the last sync.
+        """
+        high_water_mark = self.retry_utils.get_retry_on_transient(
+            self.redis_client.get, GERRIT_SYNC_HIGH_WATER_MARK_KEY
+        )
+        changed_since = window_start = None
+        if high_water_mark:
+            changed_since = self.date_time_util.parse_timestamp_without_microseconds(
+                high_water_mark
+            ) - timedelta(seconds=GERRIT_SYNC_OVERLAP_SECONDS)
+            window_start = self.date_time_util.compute_buckets_weekly(
+                changed_since
+            ).split("_")[0]
+
+        window_stats: dict = {}
+        changed_stats: dict = {}
+        unmerged_cl_data: dict = {}
+        under_review_dedupe_data: dict[int, set[str]] = {}
+        stale_unmerged_cl_data: dict[str, set[int]] = {}
+        changed = 0
+        for changes_batch in self.fetch_changes(
+            ALL_GERRIT_STATUSES,
+            page_size=page_size,
+            updated_after=f"{window_start} 00:00:00" if window_start else None,
+        ):
+            for change in changes_batch:
+                updated = change["updated"]
+                if high_water_mark is None or updated > high_water_mark:
+                    high_water_mark = updated
+
+                is_changed = (
+                    changed_since is None
+                    or self.date_time_util.parse_timestamp_without_microseconds(updated)
+                    >= changed_since
+                )
+                if is_changed:
+                    changed += 1
+                    self._aggregate_single_change(
+                        change,
+                        changed_stats,
+                        unmerged_cl_data,
+                        under_review_dedupe_data,
+                    )
+                    self._collect_stale_unmerged_cl(change, stale_unmerged_cl_data)
+                if changed_since is not None:
+                    # Unchanged changes still count towards the totals of the
+                    # buckets being rewritten.
+                    self._aggregate_single_change(change, window_stats, {}, {})
+
+        if not changed:
+            self.logger.info("No Gerrit changes updated since %s.", changed_since)
+            return 0
+
+        if changed_since is None:
+            stats_to_write = changed_stats
+        else:
+            # Buckets before the window only hold part of their changes.
+            stats_to_write = {
+                key: window_stats[key]
+                for key in changed_stats
+                if key.rsplit(":", 1)[1].split("_")[0] >= window_start
+            }
+        self._write_aggregates(
+            stats_to_write,
+            unmerged_cl_data,
+            under_review_dedupe_data,
+            stale_unmerged_cl_data,
+            high_water_mark,
+        )
+        self.logger.info(
+            "Incremental Gerrit sync rewrote %d stats keys for %d changed changes.",
+            len(stats_to_write),
+            changed,
+        )
+        return changed
+
+    def _collect_stale_unmerged_cl(self, change: dict, stale_unmerged_cl_data: dict):
+        """
+        Record the unmerged CL sorted sets a change must be removed from.
+
+        A change is only listed under its current status, so it is removed from
+        the sets of every other unmerged status it may have been stored under.
+        """
+        owner_ldap = change.get("owner", {}).get("username")
+        cl_status = change.get("status", "").lower()
+        project = change.get("project")
+        change_number = change.get("virtual_id_number")
+        if not owner_ldap or not change_number or not project:
+            return
+
+        for status in ALL_GERRIT_STATUSES:
+            if status in (cl_status, GerritChangeStatus.MERGED.value):
+                continue
+            for key in (
+                GERRIT_UNMERGED_CL_KEY_BY_PROJECT.format(
+                    ldap=owner_ldap, project=project, cl_status=status
+                ),
+                GERRIT_UNMERGED_CL_KEY_GLOBAL.format(ldap=owner_ldap, cl_status=status),
+            ):
+                stale_unmerged_cl_data.setdefault(key, set()).add(change_number)
+
+    def _fetch_pages(
+        self,
+        statuses: list[str],
+        projects: list[str] | None,
+        max_changes: int | None,
+        page_size: int,
+        max_workers: int,
+    ) -> Generator[list[dict], None, None]:
+        """
+        Yield pages of changes, fetching independent query streams in parallel.
+
+        With `max_workers` <= 1 this is a single `fetch_changes` stream. Otherwise
+        the query is split into one stream per project (or per status when no
+        projects are given), at most `max_workers` of which are paged through at
+        once. Pages are yielded in arrival order.
+
+        Raises:
+            Exception: The first error raised by any stream; the remaining
+                streams stop after their current page.
+        """
+        if max_workers <= 1:
+            yield from self.fetch_changes(statuses, projects, max_changes, page_size)
+            return
+
+        if projects:
+            streams = [(statuses, [project]) for project in projects]
+        else:
+            streams = [([status], None) for status in statuses]
+
+        pages: queue.Queue = queue.Queue()
+        stop = threading.Event()
+
+        def drain(stream_statuses, stream_projects):
+            try:
+                for page in self.fetch_changes(
+                    stream_statuses, stream_projects, None, page_size
+                ):
+                    if stop.is_set():
+                        break
+                    pages.put(page)
+            except Exception as e:
+                pages.put(e)
+            finally:
+                pages.put(_STREAM_DONE)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(streams)),
+            thread_name_prefix="gerrit-fetch",
+        )
+        try:
+            for stream_statuses, stream_projects in streams:
+                executor.submit(drain, stream_statuses, stream_projects)
+
+            remaining = len(streams)
+            while remaining:
+                item = pages.get()
+                if item is _STREAM_DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def sync_gerrit_projects(self) -> int:
         """
         Fetches all project names from Gerrit and stores them in a Redis set.
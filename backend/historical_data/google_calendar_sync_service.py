@@ -2,15 +2,25 @@ import json
 import re
 import uuid
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
 
 from backend.common.constants import (
     GOOGLE_CALENDAR_LIST_INDEX_KEY,
     GOOGLE_CALENDAR_EVENT_DETAIL_KEY,
     GOOGLE_EVENT_ATTENDANCE_KEY,
     GOOGLE_CALENDAR_USER_EVENTS_KEY,
+    GOOGLE_CALENDAR_MEETING_SECONDS_KEY,
+    GOOGLE_CALENDAR_MEETING_SECONDS_FIELD,
+    GOOGLE_CALENDAR_MEETING_SECONDS_READY_KEY,
+    GOOGLE_CALENDAR_PENDING_ATTENDANCE_BY_END_KEY,
+    GOOGLE_CALENDAR_PENDING_ATTENDANCE_KEY,
+    GOOGLE_CALENDAR_SYNC_TOKEN_KEY,
+    AnalyticsSource,
 )
+from backend.utils.analytics_result_cache import bump_analytics_generation
 from backend.dto.calendar_dto import CalendarDTO, AttendanceDTO, CalendarEventDTO
+from backend.utils.chat_daily_count import daily_bucket
 
 # Google Reports API rate limits:
 # - Batch requests can include at most 10 calls.
@@ -21,6 +31,28 @@ BATCH_SIZE = 10
 SLEEP_BETWEEN_BATCHES = 2.5
 # Define the matching window: the join time must be within ±2 hours of the scheduled start time
 MATCH_WINDOW_SECONDS = 7200
+# Calendars without a sync token are fully synced from this many days back.
+INITIAL_SYNC_LOOKBACK_DAYS = 1
+# Meet `call_ended` audit records appear some time after a call ends, so the
+# attendance of an event is only fetched once it ended this long ago.
+ATTENDANCE_REPORT_DELAY_SECONDS = 3600
+# Admin Reports API audit log retention.
+REPORTS_RETENTION_DAYS = 180
+
+# Stores an attendance record and, only when the record is new to the set,
+# credits its duration to the per-day meeting seconds rollup. Re-running a sync
+# over the same window therefore never counts a record twice.
+#   KEYS[1]: per-event, per-user attendance set
+#   KEYS[2]: per-day meeting seconds hash
+#   ARGV[1]: JSON attendance record
+#   ARGV[2]: rollup hash field ("{calendar_id}:{ldap}")
+#   ARGV[3]: attended seconds
+_ADD_ATTENDANCE_SCRIPT = """
+if redis.call('SADD', KEYS[1], ARGV[1]) == 1 then
+    return redis.call('HINCRBY', KEYS[2], ARGV[2], ARGV[3])
+end
+return false
+"""
 
 
 class GoogleCalendarSyncService:
@@ -73,6 +105,7 @@ class GoogleCalendarSyncService:
     - Event metadata (summary, calendar_id, recurrence flag)
     - Attendance records (per event, per user)
     - User-to-event indices for efficient lookup
+    - Per-day attended seconds per (calendar, user) for meeting-hour totals
 
     This class is designed to be idempotent, resilient to transient API failures,
     and safe to run repeatedly within the supported time window.
@@ -268,6 +301,44 @@ class GoogleCalendarSyncService:
             )
             return []
 
+    def _collect_event(
+        self, events_dict: dict[str, CalendarEventDTO], calendar_id: str, event: dict
+    ) -> None:
+        """
+        Add a Google Meet calendar event to `events_dict`.
+
+        Events without a meeting code or a timed start are ignored. An event
+        already collected from another calendar (shared or recurring events) is
+        kept once, preferring non-personal calendar ownership.
+
+        Args:
+            events_dict: Mapping from event_id to CalendarEventDTO to add to.
+            calendar_id: The calendar the event was listed in.
+            event: A Google Calendar event resource.
+        """
+        meeting_code = self._get_meeting_code_from_event(event)
+        start_str = event.get("start", {}).get("dateTime")
+        if not meeting_code or not start_str:
+            return
+
+        eid = event.get("id")
+        if eid in events_dict:
+            # Deduplication rule:
+            # Prefer non-personal calendar ownership over personal calendars
+            if not self._is_circlecat_email(calendar_id):
+                events_dict[eid].calendar_id = calendar_id
+            return
+
+        events_dict[eid] = CalendarEventDTO(
+            event_id=eid,
+            calendar_id=calendar_id,
+            summary=event.get("summary", ""),
+            start=start_str,
+            end=event.get("end", {}).get("dateTime"),
+            is_recurring="recurringEventId" in event,
+            meeting_code=meeting_code,
+        )
+
     def _get_calendars_events(
         self, calendar_ids: list[str], start_time: str, end_time: str
     ) -> dict[str, CalendarEventDTO]:
@@ -339,35 +410,108 @@ class GoogleCalendarSyncService:
                 # Skip cancelled events explicitly
                 if event.get("status") == "cancelled":
                     continue
+                self._collect_event(events_dict, calendar_id, event)
 
-                meeting_code = self._get_meeting_code_from_event(event)
-                start_str = event.get("start", {}).get("dateTime")
-                if not meeting_code or not start_str:
-                    continue
+            next_token = response.get("nextPageToken")
+            if next_token:
+                _enqueue_page(calendar_id, next_token)
+
+        # Execute batched requests until all pages are processed
+        while requests:
+            current_batch = [
+                requests.pop(0) for _ in range(min(BATCH_SIZE, len(requests)))
+            ]
+            batch = self.google_calendar_client.new_batch_http_request(
+                callback=_callback
+            )
+            for req_obj, cid in current_batch:
+                batch.add(req_obj, request_id=f"{cid}:{uuid.uuid4()}")
+            self.retry_utils.get_retry_on_transient(batch.execute)
+
+        return events_dict
+
+    def _get_calendars_event_changes(
+        self,
+        calendar_ids: list[str],
+        sync_tokens: dict[str, str | None],
+        time_min: str,
+    ) -> tuple[dict[str, CalendarEventDTO], dict[str, str]]:
+        """
+        Fetch the events changed in each calendar since its last sync, in batches.
+
+        Calendars with a sync token only list the events changed since the
+        token was issued. Calendars without one, or whose token expired (HTTP
+        410), are fully synced from `time_min`. Cancelled events are skipped;
+        their pending attendance lookup finds no call.
+
+        Args:
+            calendar_ids: The calendar IDs to sync.
+            sync_tokens: The stored sync token of each calendar, if any.
+            time_min: RFC3339 start of the full sync of calendars without a token.
+
+        Returns:
+            tuple[dict[str, CalendarEventDTO], dict[str, str]]:
+                - The changed Google Meet events by event ID, deduplicated as
+                  in `_get_calendars_events`.
+                - The next sync token of every calendar whose pages were all
+                  fetched; calendars that failed keep their stored token.
+        """
+        events_dict: dict[str, CalendarEventDTO] = {}
+        next_sync_tokens: dict[str, str] = {}
+        sync_tokens = dict(sync_tokens)
+        requests: list[tuple] = []
+
+        def _enqueue_page(calendar_id: str, page_token: str | None = None):
+            """Enqueue a single incremental or full events.list request."""
+            params = {
+                "calendarId": calendar_id,
+                "singleEvents": True,
+                "eventTypes": "default",
+                "timeZone": "UTC",
+                "pageToken": page_token,
+            }
+            if sync_tokens.get(calendar_id):
+                params["syncToken"] = sync_tokens[calendar_id]
+            else:
+                params["timeMin"] = time_min
+            req = self.google_calendar_client.events().list(**params)
+            requests.append((req, calendar_id))
+
+        for cid in calendar_ids:
+            _enqueue_page(cid)
 
-                eid = event.get("id")
-                dto = CalendarEventDTO(
-                    event_id=eid,
-                    calendar_id=calendar_id,
-                    summary=event.get("summary", ""),
-                    start=start_str,
-                    is_recurring="recurringEventId" in event,
-                    meeting_code=meeting_code,
+        def _callback(request_id, response, exception):
+            """Batch callback for processing calendar event changes."""
+            calendar_id = request_id.split(":", 1)[0]
+            if exception:
+                status = getattr(getattr(exception, "resp", None), "status", None)
+                if status == HTTPStatus.GONE and sync_tokens.get(calendar_id):
+                    self.logger.info(
+                        "[GoogleCalendarSyncService] sync token expired for calendar_id=%s; running a full sync",
+                        calendar_id,
+                    )
+                    sync_tokens[calendar_id] = None
+                    _enqueue_page(calendar_id)
+                    return
+                self.logger.warning(
+                    "[GoogleCalendarSyncService] batch request failed: request_id=%s, calendar_id=%s, error=%s",
+                    request_id,
+                    calendar_id,
+                    exception,
                 )
+                return
 
-                if eid in events_dict:
-                    # Deduplication rule:
-                    # Prefer non-personal calendar ownership over personal calendars
-                    if not self._is_circlecat_email(calendar_id):
-                        events_dict[eid].calendar_id = calendar_id
-                else:
-                    events_dict[eid] = dto
+            for event in response.get("items", []):
+                if event.get("status") == "cancelled":
+                    continue
+                self._collect_event(events_dict, calendar_id, event)
 
             next_token = response.get("nextPageToken")
             if next_token:
                 _enqueue_page(calendar_id, next_token)
+            elif response.get("nextSyncToken"):
+                next_sync_tokens[calendar_id] = response["nextSyncToken"]
 
-        # Execute batched requests until all pages are processed
         while requests:
             current_batch = [
                 requests.pop(0) for _ in range(min(BATCH_SIZE, len(requests)))
@@ -379,11 +523,11 @@ class GoogleCalendarSyncService:
                 batch.add(req_obj, request_id=f"{cid}:{uuid.uuid4()}")
             self.retry_utils.get_retry_on_transient(batch.execute)
 
-        return events_dict
+        return events_dict, next_sync_tokens
 
     def _get_events_attendees(
         self, events: dict[str, CalendarEventDTO], time_min: str, time_max: str
-    ) -> dict[str, list[AttendanceDTO]]:
+    ) -> tuple[dict[str, list[AttendanceDTO]], set[str]]:
         """
         Fetch Google Meet attendance records and map them to calendar event instances.
 
@@ -413,8 +557,10 @@ class GoogleCalendarSyncService:
                 RFC3339 end time (exclusive).
 
         Returns:
-            dict[str, list[AttendanceDTO]]:
-                Mapping from event_id to a list of AttendanceDTO records.
+            tuple[dict[str, list[AttendanceDTO]], set[str]]:
+                Mapping from event_id to a list of AttendanceDTO records, and
+                the meeting codes whose audit log request failed (their
+                events have no records because none could be read).
         """
         # Build meeting_code -> event_id(s) mapping (one code may map to multiple instances)
         code_to_event_ids: dict[str, list[str]] = {}
@@ -423,6 +569,7 @@ class GoogleCalendarSyncService:
 
         results: dict[str, list[AttendanceDTO]] = {eid: [] for eid in events.keys()}
         meeting_codes = list(code_to_event_ids.keys())
+        failed_codes: set[str] = set()
 
         def _callback(request_id, response, exception):
             """Batch callback for processing Meet audit log responses."""
@@ -432,6 +579,7 @@ class GoogleCalendarSyncService:
                     request_id,
                     exception,
                 )
+                failed_codes.add(request_id)
                 return
             code = request_id
 
@@ -504,7 +652,7 @@ class GoogleCalendarSyncService:
             self.retry_utils.get_retry_on_transient(batch.execute)
             time.sleep(SLEEP_BETWEEN_BATCHES)
 
-        return results
+        return results, failed_codes
 
     def _cache_calendars(self) -> list[str]:
         """
@@ -558,6 +706,7 @@ class GoogleCalendarSyncService:
             pipeline.hset(GOOGLE_CALENDAR_LIST_INDEX_KEY, cid, cal.summary)
             filtered_ids.append(cid)
 
+        bump_analytics_generation(pipeline, AnalyticsSource.GOOGLE_CALENDAR)
         self.retry_utils.get_retry_on_transient(pipeline.execute)
         return filtered_ids
 
@@ -587,8 +736,25 @@ class GoogleCalendarSyncService:
         """
         all_events = self._get_calendars_events(calendar_ids, time_min, time_max)
         pipeline = self.redis_client.pipeline()
+        self._queue_event_details(pipeline, all_events)
+        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        return all_events
 
-        for eid, dto in all_events.items():
+    def _queue_event_details(
+        self, pipeline, events: dict[str, CalendarEventDTO]
+    ) -> None:
+        """
+        Queue the lightweight event metadata of calendar events into a pipeline.
+
+        Recurring event IDs are normalized by stripping instance suffixes and
+        personal calendars are mapped to the unified "personal" alias.
+
+        Args:
+            pipeline: A Redis pipeline object to batch commands for efficiency.
+            events (dict[str, CalendarEventDTO]):
+                Mapping from event_id to CalendarEventDTO.
+        """
+        for eid, dto in events.items():
             base_event_id = eid.split("_")[0]
             calendar_alias = (
                 "personal"
@@ -605,18 +771,17 @@ class GoogleCalendarSyncService:
                 }),
             )
 
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
-        return all_events
-
     def _cache_events_attendees(
         self, events: dict[str, CalendarEventDTO], time_min: str, time_max: str
-    ):
+    ) -> set[str]:
         """
         Cache Google Meet attendance records for calendar events into Redis.
 
         This method:
         - Fetches attendance records for the given events within the time window.
         - Stores per-event attendance details (join/leave times) in Redis sets.
+        - Credits newly stored records to the per-user, per-day meeting seconds
+            rollup, bucketed by the event's scheduled start day.
         - Indexes user participation using sorted sets for efficient queries.
 
         Design notes:
@@ -632,12 +797,22 @@ class GoogleCalendarSyncService:
                 RFC3339 start time (inclusive).
             time_max (str):
                 RFC3339 end time (exclusive).
+
+        Returns:
+            set[str]: IDs of the events whose attendance could not be fetched
+                because their audit log request failed; nothing is cached
+                for them.
         """
 
         if not events:
-            return
+            return set()
 
-        attendance_map = self._get_events_attendees(events, time_min, time_max)
+        attendance_map, failed_codes = self._get_events_attendees(
+            events, time_min, time_max
+        )
+        failed_event_ids = {
+            eid for eid, dto in events.items() if dto.meeting_code in failed_codes
+        }
 
         pipeline = self.redis_client.pipeline()
 
@@ -645,6 +820,15 @@ class GoogleCalendarSyncService:
             attendees = attendance_map.get(eid, [])
             score = dto.start_ts
 
+            alias = (
+                "personal"
+                if self._is_circlecat_email(dto.calendar_id)
+                else dto.calendar_id
+            )
+            seconds_key = GOOGLE_CALENDAR_MEETING_SECONDS_KEY.format(
+                day=daily_bucket(score)
+            )
+
             for att in attendees:
                 if not att.ldap:
                     continue
@@ -652,16 +836,19 @@ class GoogleCalendarSyncService:
                     "join_time": att.join_time.isoformat().replace("+00:00", "Z"),
                     "leave_time": att.leave_time.isoformat().replace("+00:00", "Z"),
                 })
-                pipeline.sadd(
+                attended_seconds = int((att.leave_time - att.join_time).total_seconds())
+                pipeline.eval(
+                    _ADD_ATTENDANCE_SCRIPT,
+                    2,
                     GOOGLE_EVENT_ATTENDANCE_KEY.format(event_id=eid, ldap=att.ldap),
+                    seconds_key,
                     record_str,
+                    GOOGLE_CALENDAR_MEETING_SECONDS_FIELD.format(
+                        calendar_id=alias, ldap=att.ldap
+                    ),
+                    attended_seconds,
                 )
 
-                alias = (
-                    "personal"
-                    if self._is_circlecat_email(dto.calendar_id)
-                    else dto.calendar_id
-                )
                 pipeline.zadd(
                     GOOGLE_CALENDAR_USER_EVENTS_KEY.format(
                         calendar_id=alias, ldap=att.ldap
@@ -669,8 +856,92 @@ class GoogleCalendarSyncService:
                     {eid: score},
                 )
 
+        bump_analytics_generation(pipeline, AnalyticsSource.GOOGLE_CALENDAR)
+        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        return failed_event_ids
+
+    def rebuild_meeting_seconds(self) -> int:
+        """
+        Rebuild the per-day meeting seconds rollups from the cached attendance data.
+
+        Walks every user event index, sums the stored attendance records of each
+        indexed event, then replaces all existing rollup hashes with the
+        recomputed totals and sets the ready marker so readers switch to them.
+
+        Attendance cached while the rebuild is running may be missed by the
+        totals; run it again if the rollups drift.
+
+        Returns:
+            int: The number of daily rollup hashes written.
+        """
+        totals: dict[str, dict[str, int]] = {}
+        events_key_pattern = GOOGLE_CALENDAR_USER_EVENTS_KEY.format(
+            calendar_id="*", ldap="*"
+        )
+        events_key_prefix, events_key_suffix = events_key_pattern.split("*:user:*")
+
+        for events_key in self.redis_client.scan_iter(match=events_key_pattern):
+            calendar_id, ldap = events_key[
+                len(events_key_prefix) : -len(events_key_suffix)
+            ].rsplit(":user:", 1)
+            scored_events = self.retry_utils.get_retry_on_transient(
+                self.redis_client.zrange, events_key, 0, -1, withscores=True
+            )
+            if not scored_events:
+                continue
+
+            pipeline = self.redis_client.pipeline()
+            for eid, _ in scored_events:
+                pipeline.smembers(
+                    GOOGLE_EVENT_ATTENDANCE_KEY.format(event_id=eid, ldap=ldap)
+                )
+            attendance_sets = self.retry_utils.get_retry_on_transient(pipeline.execute)
+
+            field = GOOGLE_CALENDAR_MEETING_SECONDS_FIELD.format(
+                calendar_id=calendar_id, ldap=ldap
+            )
+            for (_, score), records in zip(scored_events, attendance_sets):
+                seconds = 0
+                for record in records:
+                    try:
+                        times = json.loads(record)
+                        seconds += int(
+                            (
+                                datetime.fromisoformat(times["leave_time"])
+                                - datetime.fromisoformat(times["join_time"])
+                            ).total_seconds()
+                        )
+                    except (json.JSONDecodeError, KeyError, ValueError):
+                        self.logger.warning(
+                            "[GoogleCalendarSyncService] skipping malformed attendance record for %s",
+                            ldap,
+                        )
+                if seconds:
+                    day_totals = totals.setdefault(daily_bucket(score), {})
+                    day_totals[field] = day_totals.get(field, 0) + seconds
+
+        stale_keys = list(
+            self.redis_client.scan_iter(
+                match=GOOGLE_CALENDAR_MEETING_SECONDS_KEY.format(day="*")
+            )
+        )
+
+        pipeline = self.redis_client.pipeline()
+        if stale_keys:
+            pipeline.delete(*stale_keys)
+        for day, day_totals in totals.items():
+            pipeline.hset(
+                GOOGLE_CALENDAR_MEETING_SECONDS_KEY.format(day=day), mapping=day_totals
+            )
+        pipeline.set(
+            GOOGLE_CALENDAR_MEETING_SECONDS_READY_KEY,
+            datetime.now(timezone.utc).isoformat(),
+        )
+        bump_analytics_generation(pipeline, AnalyticsSource.GOOGLE_CALENDAR)
         self.retry_utils.get_retry_on_transient(pipeline.execute)
 
+        return len(totals)
+
     def pull_calendar_history(self, time_min: str = None, time_max: str = None):
         """
         Pulls and caches historical calendar event data for all calendars.
@@ -688,6 +959,140 @@ class GoogleCalendarSyncService:
             time_min (str): ISO 8601 start time (inclusive).
             time_max (str): ISO 8601 end time (exclusive).
         """
+        all_calendar_ids = self._get_all_calendar_ids()
+
+        events_dict = self._cache_calendar_events(all_calendar_ids, time_min, time_max)
+
+        self._cache_events_attendees(events_dict, time_min, time_max)
+
+    def sync_calendar_events(self) -> dict[str, int]:
+        """
+        Incrementally sync calendar events and Meet attendance since the last run.
+
+        Every calendar is synced from its stored Calendar API sync token, so
+        only events created or changed since the previous run are fetched; the
+        first run of a calendar fully syncs the last `INITIAL_SYNC_LOOKBACK_DAYS`
+        day(s) (and every later event). Changed Meet events are cached and
+        queued for attendance, scored by their scheduled end time. The Admin
+        Reports API is then only queried for queued events that have ended, so
+        a run scales with the day's activity rather than with a fixed window.
+
+        Sync tokens are stored together with the queued events, and queued
+        events are only dropped once their attendance is cached -- an event
+        whose audit log request failed stays queued -- so a failed run or
+        lookup is simply picked up by the next one.
+
+        Returns:
+            dict[str, int]: The number of changed events (`event_count`) and of
+                events whose attendance was fetched (`attendance_event_count`).
+        """
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        calendar_ids = self._get_all_calendar_ids()
+
+        changed_events = {}
+        if calendar_ids:
+            stored_tokens = self.retry_utils.get_retry_on_transient(
+                self.redis_client.hmget, GOOGLE_CALENDAR_SYNC_TOKEN_KEY, calendar_ids
+            )
+            changed_events, next_sync_tokens = self._get_calendars_event_changes(
+                calendar_ids,
+                dict(zip(calendar_ids, stored_tokens)),
+                self._format_rfc3339(now - timedelta(days=INITIAL_SYNC_LOOKBACK_DAYS)),
+            )
+
+            pipeline = self.redis_client.pipeline()
+            self._queue_event_details(pipeline, changed_events)
+            if changed_events:
+                pipeline.hset(
+                    GOOGLE_CALENDAR_PENDING_ATTENDANCE_KEY,
+                    mapping={
+                        eid: dto.model_dump_json()
+                        for eid, dto in changed_events.items()
+                    },
+                )
+                pipeline.zadd(
+                    GOOGLE_CALENDAR_PENDING_ATTENDANCE_BY_END_KEY,
+                    {
+                        eid: int((dto.end or dto.start).timestamp())
+                        for eid, dto in changed_events.items()
+                    },
+                )
+            if next_sync_tokens:
+                pipeline.hset(GOOGLE_CALENDAR_SYNC_TOKEN_KEY, mapping=next_sync_tokens)
+            self.retry_utils.get_retry_on_transient(pipeline.execute)
+
+        due_event_ids = self.retry_utils.get_retry_on_transient(
+            self.redis_client.zrangebyscore,
+            GOOGLE_CALENDAR_PENDING_ATTENDANCE_BY_END_KEY,
+            "-inf",
+            int(now.timestamp()) - ATTENDANCE_REPORT_DELAY_SECONDS,
+        )
+        due_events = {}
+        if due_event_ids:
+            payloads = self.retry_utils.get_retry_on_transient(
+                self.redis_client.hmget,
+                GOOGLE_CALENDAR_PENDING_ATTENDANCE_KEY,
+                due_event_ids,
+            )
+            due_events = {
+                eid: CalendarEventDTO.model_validate_json(payload)
+                for eid, payload in zip(due_event_ids, payloads)
+                if payload
+            }
+
+            # Attendance older than the audit log retention is unrecoverable.
+            time_min = max(
+                datetime.fromtimestamp(
+                    min((dto.start_ts for dto in due_events.values()), default=0)
+                    - MATCH_WINDOW_SECONDS,
+                    tz=timezone.utc,
+                ),
+                now - timedelta(days=REPORTS_RETENTION_DAYS),
+            )
+            failed_event_ids = self._cache_events_attendees(
+                due_events, self._format_rfc3339(time_min), self._format_rfc3339(now)
+            )
+            if failed_event_ids:
+                self.logger.warning(
+                    "[GoogleCalendarSyncService] keeping %d events queued after failed attendance lookups",
+                    len(failed_event_ids),
+                )
+                due_events = {
+                    eid: dto
+                    for eid, dto in due_events.items()
+                    if eid not in failed_event_ids
+                }
+
+            done_event_ids = [
+                eid for eid in due_event_ids if eid not in failed_event_ids
+            ]
+            if done_event_ids:
+                pipeline = self.redis_client.pipeline()
+                pipeline.zrem(
+                    GOOGLE_CALENDAR_PENDING_ATTENDANCE_BY_END_KEY, *done_event_ids
+                )
+                pipeline.hdel(GOOGLE_CALENDAR_PENDING_ATTENDANCE_KEY, *done_event_ids)
+                self.retry_utils.get_retry_on_transient(pipeline.execute)
+
+        self.logger.info(
+            "[GoogleCalendarSyncService] synced %d changed events from %d calendars; fetched attendance of %d events",
+            len(changed_events),
+            len(calendar_ids),
+            len(due_events),
+        )
+        return {
+            "event_count": len(changed_events),
+            "attendance_event_count": len(due_events),
+        }
+
+    def _get_all_calendar_ids(self) -> list[str]:
+        """
+        Cache the organizational calendars and return them with every person's calendar.
+
+        Returns:
+            list[str]: The cached calendar IDs followed by the personal calendar
+                IDs of the domain directory, excluding this bot account's.
+        """
         calendar_ids = self._cache_calendars()
 
         ldaps = self.google_service.list_directory_all_people_ldap().values()
@@ -699,8 +1104,8 @@ class GoogleCalendarSyncService:
             for ldap in ldaps
             if f"{ldap}@circlecat.org".lower() != bot_calendar
         ]
-        all_calendar_ids = calendar_ids + personal_calendar_ids
-
-        events_dict = self._cache_calendar_events(all_calendar_ids, time_min, time_max)
+        return calendar_ids + personal_calendar_ids
 
-        self._cache_events_attendees(events_dict, time_min, time_max)
+    def _format_rfc3339(self, dt: datetime) -> str:
+        """Format a UTC datetime as an RFC3339 timestamp with a 'Z' suffix."""
+        return dt.isoformat().replace("+00:00", "Z")
@@ -1,15 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from backend.common.constants import (
+    GOOGLE_CHAT_HISTORY_CREATED_AFTER_FIELD,
+    GOOGLE_CHAT_HISTORY_CURSOR_KEY,
+    GOOGLE_CHAT_HISTORY_LAST_CREATE_TIME_FIELD,
+    GOOGLE_CHAT_HISTORY_PAGE_TOKEN_FIELD,
+)
+
+# Spaces synchronized at once; each one pages through its own messages.
+DEFAULT_MAX_WORKERS = 4
+
+
 class GoogleChatHistorySyncService:
-    def __init__(self, logger, google_service, google_chat_message_utils):
+    def __init__(
+        self,
+        logger,
+        google_service,
+        google_chat_message_utils,
+        redis_client,
+        retry_utils,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
         """
         Initializes the GoogleChatHistorySyncService class.
         Args:
             logger: The logger instance for logging messages.
             google_service: The GoogleService instance.
             google_chat_message_utils: The GoogleChatMessageUtils instance.
+            redis_client: The Redis client instance, used to store sync cursors.
+            retry_utils: A RetryUtils for handling retries on transient errors.
+            max_workers: The number of spaces synchronized concurrently.
         """
         self.logger = logger
         self.google_service = google_service
         self.google_chat_message_utils = google_chat_message_utils
+        self.redis_client = redis_client
+        self.retry_utils = retry_utils
+        self.max_workers = max_workers
 
     def sync_history_messages(self) -> int:
         """
@@ -18,12 +45,11 @@ class GoogleChatHistorySyncService:
         Workflow:
             1. Retrieves all Google Chat spaces of type "SPACE".
             2. Fetches LDAP identifiers for all directory people.
-            3. Iterates through each chat space:
-                - Retrieves messages in batches using a paginated generator.
-                - Stores each batch of messages into Redis via utility helpers.
-                - Logs progress and message counts.
+            3. Synchronizes up to `max_workers` chat spaces concurrently, each
+               with `_sync_space`, which resumes from the space's stored cursor.
             4. Aggregates totals for both processed spaces and processed messages.
-            5. Handles and logs unexpected errors.
+            5. Handles and logs unexpected errors. A failing space does not stop
+               the others; its progress is kept and the next run resumes it.
 
         Returns:
             int: The total number of chat messages successfully processed.
@@ -31,6 +57,7 @@ class GoogleChatHistorySyncService:
         Raises:
             ValueError: If no Google Chat spaces of type "SPACE" are found,
                         or if no LDAP mappings are available.
+            RuntimeError: If any space failed to synchronize.
             Exception: Any unexpected error during synchronization is logged
                     and re-raised for higher-level handling.
         """
@@ -46,53 +73,37 @@ class GoogleChatHistorySyncService:
                 raise ValueError("No LDAP mappings found for directory people.")
 
             total_messages_processed_count = 0
-            total_spaces_processed = 0
-
-            for space_id, space_name in space_display_names.items():
-                total_spaces_processed += 1
-                self.logger.info(
-                    "Processing messages for Google Chat space %d/%d: '%s' (ID: %s)",
-                    total_spaces_processed,
-                    len(space_display_names),
-                    space_name,
-                    space_id,
-                )
-                messages_in_current_space = 0
-
-                for (
-                    message_batch
-                ) in self.google_service.fetch_messages_by_spaces_id_paginated(
-                    space_id
-                ):
-                    if message_batch:
-                        self.logger.debug(
-                            "Fetched %d messages from space '%s' (ID: %s) for batch processing.",
-                            len(message_batch),
-                            space_name,
-                            space_id,
-                        )
-                        messages_in_current_space += len(message_batch)
-                        total_messages_processed_count += len(message_batch)
-
-                        self.google_chat_message_utils.sync_batch_created_messages(
-                            message_batch, all_ldaps_dict
-                        )
-                    else:
-                        self.logger.debug(
-                            "No messages found in the current batch for space '%s' (ID: %s).",
-                            space_name,
-                            space_id,
+            failed_spaces = []
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(space_display_names)),
+                thread_name_prefix="google-chat-history",
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._sync_space, space_id, space_name, all_ldaps_dict
+                    ): space_id
+                    for space_id, space_name in space_display_names.items()
+                }
+                for future in as_completed(futures):
+                    try:
+                        total_messages_processed_count += future.result()
+                    except Exception as e:
+                        self.logger.error(
+                            "Failed to sync Google Chat space %s: %s",
+                            futures[future],
+                            e,
+                            exc_info=True,
                         )
+                        failed_spaces.append(futures[future])
 
-                self.logger.info(
-                    "Finished processing %d messages from space '%s' (ID: %s).",
-                    messages_in_current_space,
-                    space_name,
-                    space_id,
+            if failed_spaces:
+                raise RuntimeError(
+                    f"Failed to sync {len(failed_spaces)} Google Chat space(s): "
+                    f"{', '.join(sorted(failed_spaces))}"
                 )
             self.logger.info(
                 "Completed Google Chat history synchronization for %d spaces. Total messages processed (sent for batching): %d.",
-                total_spaces_processed,
+                len(space_display_names),
                 total_messages_processed_count,
             )
 
@@ -104,3 +115,124 @@ class GoogleChatHistorySyncService:
             )
             raise
         return total_messages_processed_count
+
+    def _sync_space(self, space_id: str, space_name: str, all_ldaps_dict: dict) -> int:
+        """
+        Synchronizes the messages of one space, resuming from its stored cursor.
+
+        The cursor is saved after every stored page. A run that stopped part-way
+        through a pass continues from the saved page token; once a pass is
+        complete, the next run lists only messages created after the newest
+        stored one.
+
+        Args:
+            space_id (str): The ID of the Google Chat space.
+            space_name (str): The display name of the space, for logging.
+            all_ldaps_dict (dict): Google user ID to LDAP mapping.
+
+        Returns:
+            int: The number of messages processed for the space.
+        """
+        cursor_key = GOOGLE_CHAT_HISTORY_CURSOR_KEY.format(space_id=space_id)
+        cursor = (
+            self.retry_utils.get_retry_on_transient(
+                self.redis_client.hgetall, cursor_key
+            )
+            or {}
+        )
+        page_token = cursor.get(GOOGLE_CHAT_HISTORY_PAGE_TOKEN_FIELD) or None
+        last_create_time = (
+            cursor.get(GOOGLE_CHAT_HISTORY_LAST_CREATE_TIME_FIELD) or None
+        )
+        if page_token:
+            created_after = cursor.get(GOOGLE_CHAT_HISTORY_CREATED_AFTER_FIELD) or None
+        else:
+            created_after = last_create_time
+        self.logger.info(
+            "Processing messages for Google Chat space '%s' (ID: %s), created after %s%s.",
+            space_name,
+            space_id,
+            created_after or "the beginning",
+            ", resuming a previous run" if page_token else "",
+        )
+
+        messages_in_current_space = 0
+        resuming = bool(page_token)
+        while True:
+            try:
+                response = self.google_service.fetch_messages_page(
+                    space_id, page_token=page_token, created_after=created_after
+                )
+            except RuntimeError:
+                if not resuming:
+                    raise
+                # Page tokens expire; restart the pass, whose messages are
+                # stored idempotently.
+                self.logger.warning(
+                    "Stored page token for space %s was rejected; restarting its pass.",
+                    space_id,
+                )
+                page_token = None
+                resuming = False
+                continue
+            resuming = False
+
+            message_batch = response.get("messages", [])
+            if message_batch:
+                self.logger.debug(
+                    "Fetched %d messages from space '%s' (ID: %s) for batch processing.",
+                    len(message_batch),
+                    space_name,
+                    space_id,
+                )
+                self.google_chat_message_utils.sync_batch_created_messages(
+                    message_batch, all_ldaps_dict
+                )
+                messages_in_current_space += len(message_batch)
+                # Messages are listed oldest first.
+                last_create_time = message_batch[-1].get("createTime", last_create_time)
+
+            page_token = response.get("nextPageToken")
+            self._save_cursor(cursor_key, page_token, created_after, last_create_time)
+            if not page_token:
+                break
+
+        self.logger.info(
+            "Finished processing %d messages from space '%s' (ID: %s).",
+            messages_in_current_space,
+            space_name,
+            space_id,
+        )
+        return messages_in_current_space
+
+    def _save_cursor(
+        self,
+        cursor_key: str,
+        page_token: str | None,
+        created_after: str | None,
+        last_create_time: str | None,
+    ) -> None:
+        """Stores a space's sync cursor; without a page token, its pass is complete."""
+        pipeline = self.redis_client.pipeline()
+        pipeline.hset(
+            cursor_key,
+            mapping={
+                GOOGLE_CHAT_HISTORY_CREATED_AFTER_FIELD: created_after or "",
+                GOOGLE_CHAT_HISTORY_LAST_CREATE_TIME_FIELD: last_create_time or "",
+            },
+        )
+        if page_token:
+            pipeline.hset(cursor_key, GOOGLE_CHAT_HISTORY_PAGE_TOKEN_FIELD, page_token)
+        else:
+            pipeline.hdel(cursor_key, GOOGLE_CHAT_HISTORY_PAGE_TOKEN_FIELD)
+        self.retry_utils.get_retry_on_transient(pipeline.execute)
+
+    def backfill_daily_counts(self) -> int:
+        """
+        Rebuild the daily Google Chat message count rollups from the stored indexes.
+
+        Returns:
+            int: The number of daily rollups written.
+        """
+        self.logger.info("Starting Google Chat daily count rollup backfill.")
+        return self.google_chat_message_utils.rebuild_daily_counts()
@@ -2,7 +2,7 @@ import asyncio
 from http import HTTPStatus
 
 from fastapi import APIRouter, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from backend.common.fast_api_response_wrapper import api_response
 from backend.common.permissions import Permission
@@ -10,13 +10,21 @@ from backend.utils.permission_decorators import authenticate
 from backend.common.api_endpoints import (
     MICROSOFT_BACKFILL_LDAPS_ENDPOINT,
     MICROSOFT_BACKFILL_CHAT_MESSAGES_ENDPOINT,
+    MICROSOFT_BACKFILL_ALL_CHAT_MESSAGES_ENDPOINT,
     JIRA_SYNC_PROJECTS_ENDPOINT,
     JIRA_BACKFILL_ISSUES_ENDPOINT,
     JIRA_UPDATE_ISSUES_ENDPOINT,
+    JIRA_SYNC_ISSUES_ENDPOINT,
+    JIRA_BACKFILL_STORY_POINTS_ENDPOINT,
     GOOGLE_CALENDAR_PULL_HISTORY_ENDPOINT,
+    GOOGLE_CALENDAR_SYNC_ENDPOINT,
+    GOOGLE_CALENDAR_BACKFILL_MEETING_SECONDS_ENDPOINT,
     GERRIT_BACKFILL_CHANGES_ENDPOINT,
     GERRIT_BACKFILL_PROJECTS_ENDPOINT,
+    GERRIT_SYNC_CHANGES_ENDPOINT,
     GOOGLE_CHAT_SYNC_HISTORY_MESSAGES_ENDPOINT,
+    GOOGLE_CHAT_BACKFILL_DAILY_COUNTS_ENDPOINT,
+    MICROSOFT_BACKFILL_CHAT_DAILY_COUNTS_ENDPOINT,
 )
 
 
@@ -25,8 +33,14 @@ class GoogleCalendarPullRequest(BaseModel):
     end_date: str | None = None
 
 
+class MicrosoftChatBackfillRequest(BaseModel):
+    chat_ids: list[str] | None = None
+    max_concurrency: int = Field(default=4, ge=1, le=16)
+
+
 class GerritBackfillRequest(BaseModel):
     statuses: list[str] | None = None
+    max_workers: int = Field(default=1, ge=1, le=8)
 
 
 class HistoricalController:
@@ -82,6 +96,13 @@ class HistoricalController:
             ),
             methods=["POST"],
         )
+        self.router.add_api_route(
+            MICROSOFT_BACKFILL_ALL_CHAT_MESSAGES_ENDPOINT,
+            endpoint=authenticate(permissions=[Permission.SYSTEM_BACKFILL])(
+                self.backfill_all_microsoft_chat_messages
+            ),
+            methods=["POST"],
+        )
         self.router.add_api_route(
             JIRA_SYNC_PROJECTS_ENDPOINT,
             endpoint=authenticate(permissions=[Permission.SYSTEM_BACKFILL_SCHEDULED])(
@@ -103,6 +124,20 @@ class HistoricalController:
             ),
             methods=["POST"],
         )
+        self.router.add_api_route(
+            JIRA_SYNC_ISSUES_ENDPOINT,
+            endpoint=authenticate(permissions=[Permission.SYSTEM_SYNC])(
+                self.sync_jira_issues
+            ),
+            methods=["POST"],
+        )
+        self.router.add_api_route(
+            JIRA_BACKFILL_STORY_POINTS_ENDPOINT,
+            endpoint=authenticate(permissions=[Permission.SYSTEM_BACKFILL])(
+                self.backfill_jira_story_points
+            ),
+            methods=["POST"],
+        )
         self.router.add_api_route(
             GOOGLE_CALENDAR_PULL_HISTORY_ENDPOINT,
             endpoint=authenticate(permissions=[Permission.SYSTEM_SYNC])(
@@ -110,6 +145,20 @@ class HistoricalController:
             ),
             methods=["POST"],
         )
+        self.router.add_api_route(
+            GOOGLE_CALENDAR_SYNC_ENDPOINT,
+            endpoint=authenticate(permissions=[Permission.SYSTEM_SYNC])(
+                self.sync_calendar_events
+            ),
+            methods=["POST"],
+        )
+        self.router.add_api_route(
+            GOOGLE_CALENDAR_BACKFILL_MEETING_SECONDS_ENDPOINT,
+            endpoint=authenticate(permissions=[Permission.SYSTEM_BACKFILL])(
+                self.backfill_calendar_meeting_seconds
+            ),
+            methods=["POST"],
+        )
         self.router.add_api_route(
             GERRIT_BACKFILL_CHANGES_ENDPOINT,
             endpoint=authenticate(permissions=[Permission.SYSTEM_BACKFILL])(
@@ -124,6 +173,13 @@ class HistoricalController:
             ),
             methods=["POST"],
         )
+        self.router.add_api_route(
+            GERRIT_SYNC_CHANGES_ENDPOINT,
+            endpoint=authenticate(permissions=[Permission.SYSTEM_SYNC])(
+                self.sync_gerrit_changes
+            ),
+            methods=["POST"],
+        )
         self.router.add_api_route(
             GOOGLE_CHAT_SYNC_HISTORY_MESSAGES_ENDPOINT,
             endpoint=authenticate(permissions=[Permission.SYSTEM_BACKFILL])(
@@ -131,6 +187,20 @@ class HistoricalController:
             ),
             methods=["POST"],
         )
+        self.router.add_api_route(
+            GOOGLE_CHAT_BACKFILL_DAILY_COUNTS_ENDPOINT,
+            endpoint=authenticate(permissions=[Permission.SYSTEM_BACKFILL])(
+                self.backfill_google_chat_daily_counts
+            ),
+            methods=["POST"],
+        )
+        self.router.add_api_route(
+            MICROSOFT_BACKFILL_CHAT_DAILY_COUNTS_ENDPOINT,
+            endpoint=authenticate(permissions=[Permission.SYSTEM_BACKFILL])(
+                self.backfill_microsoft_chat_daily_counts
+            ),
+            methods=["POST"],
+        )
 
     async def sync_google_chat_history_messages(self):
         """API endpoint to trigger the fetching of messages for all SPACE type Google chat spaces."""
@@ -144,6 +214,30 @@ class HistoricalController:
             status_code=HTTPStatus.OK,
         )
 
+    async def backfill_google_chat_daily_counts(self):
+        """API endpoint to rebuild the daily Google Chat message count rollups."""
+        days = await asyncio.to_thread(
+            self.google_chat_history_sync_service.backfill_daily_counts
+        )
+        return api_response(
+            success=True,
+            message="Google Chat daily message counts backfilled successfully.",
+            data={"day_count": days},
+            status_code=HTTPStatus.OK,
+        )
+
+    async def backfill_microsoft_chat_daily_counts(self):
+        """API endpoint to rebuild the daily Microsoft chat message count rollups."""
+        days = await asyncio.to_thread(
+            self.microsoft_chat_history_sync_service.backfill_daily_counts
+        )
+        return api_response(
+            success=True,
+            message="Microsoft chat daily message counts backfilled successfully.",
+            data={"day_count": days},
+            status_code=HTTPStatus.OK,
+        )
+
     async def update_jira_issues(self, hours: int = Query(None)):
         """
         Incrementally update Jira issues in Redis.
@@ -167,6 +261,18 @@ class HistoricalController:
             status_code=HTTPStatus.OK,
         )
 
+    async def sync_jira_issues(self):
+        """Incrementally update the Jira issues changed since the last sync."""
+        result = await asyncio.to_thread(
+            self.jira_history_sync_service.sync_updated_jira_issues
+        )
+        return api_response(
+            success=True,
+            message="Jira issues synced successfully.",
+            data={"updated_issues": result},
+            status_code=HTTPStatus.OK,
+        )
+
     async def backfill_jira_issues(self):
         """Backfill all Jira issues into Redis."""
         result = await asyncio.to_thread(
@@ -179,6 +285,18 @@ class HistoricalController:
             status_code=HTTPStatus.OK,
         )
 
+    async def backfill_jira_story_points(self):
+        """API endpoint to rebuild the per-(ldap, project) Jira story points totals."""
+        index_count = await asyncio.to_thread(
+            self.jira_history_sync_service.rebuild_story_points_index
+        )
+        return api_response(
+            success=True,
+            message="Jira story points backfilled successfully.",
+            data={"index_count": index_count},
+            status_code=HTTPStatus.OK,
+        )
+
     async def backfill_microsoft_ldaps(self):
         """API endpoint to backfill Microsoft 365 user LDAP information into Redis.
 
@@ -219,6 +337,21 @@ class HistoricalController:
             status_code=HTTPStatus.OK,
         )
 
+    async def backfill_all_microsoft_chat_messages(
+        self, request_body: MicrosoftChatBackfillRequest
+    ):
+        """API endpoint to backfill the messages of many Microsoft Teams chats into Redis."""
+        result = await self.microsoft_chat_history_sync_service.backfill_chat_messages(
+            chat_ids=request_body.chat_ids,
+            max_concurrency=request_body.max_concurrency,
+        )
+        return api_response(
+            success=True,
+            message="Microsoft Teams chat messages backfilled successfully.",
+            data=result,
+            status_code=HTTPStatus.OK,
+        )
+
     async def sync_jira_projects(self):
         """Import all Jira project IDs and their display names into Redis."""
         result = await asyncio.to_thread(
@@ -254,11 +387,36 @@ class HistoricalController:
             status_code=HTTPStatus.OK,
         )
 
+    async def sync_calendar_events(self):
+        """Incrementally sync Google Calendar events and attendance since the last sync."""
+        counts = await asyncio.to_thread(
+            self.google_calendar_sync_service.sync_calendar_events
+        )
+        return api_response(
+            success=True,
+            message="Google Calendar events synced successfully.",
+            data=counts,
+            status_code=HTTPStatus.OK,
+        )
+
+    async def backfill_calendar_meeting_seconds(self):
+        """API endpoint to rebuild the per-day Google Calendar meeting seconds rollups."""
+        days = await asyncio.to_thread(
+            self.google_calendar_sync_service.rebuild_meeting_seconds
+        )
+        return api_response(
+            success=True,
+            message="Google Calendar meeting seconds backfilled successfully.",
+            data={"day_count": days},
+            status_code=HTTPStatus.OK,
+        )
+
     async def backfill_gerrit_changes(self, request_body: GerritBackfillRequest):
         """API endpoint to backfill Gerrit changes into Redis."""
         await asyncio.to_thread(
             self.gerrit_sync_service.fetch_and_store_changes,
             statuses=request_body.statuses,
+            max_workers=request_body.max_workers,
         )
 
         return api_response(
@@ -268,6 +426,19 @@ class HistoricalController:
             status_code=HTTPStatus.OK,
         )
 
+    async def sync_gerrit_changes(self):
+        """Incrementally re-aggregate Gerrit changes updated since the last sync."""
+        count = await asyncio.to_thread(
+            self.gerrit_sync_service.sync_changes_incrementally
+        )
+
+        return api_response(
+            success=True,
+            message="Gerrit changes synced successfully.",
+            data={"change_count": count},
+            status_code=HTTPStatus.OK,
+        )
+
     async def backfill_gerrit_projects(self):
         """API endpoint to backfill Gerrit projects into Redis."""
         count = await asyncio.to_thread(self.gerrit_sync_service.sync_gerrit_projects)
@@ -1,12 +1,63 @@
+import hashlib
+import json
+import math
+from datetime import datetime, timezone
+
 from backend.common.constants import (
+    DATETIME_ISO8601_FORMAT,
     JiraIssueStatus,
     JIRA_STATUS_ID_MAP,
     JIRA_EXCLUDED_STATUS_ID,
+    JIRA_ISSUE_CONTENT_HASH_KEY,
     JIRA_ISSUE_DETAILS_KEY,
     JIRA_LDAP_PROJECT_STATUS_INDEX_KEY,
     JIRA_PROJECTS_KEY,
     JIRA_STORY_POINT_FIELD,
+    JIRA_STORY_POINTS_KEY,
+    JIRA_STORY_POINTS_READY_KEY,
+    JIRA_SYNC_INITIAL_LOOKBACK_MINUTES,
+    JIRA_SYNC_OVERLAP_MINUTES,
+    JIRA_SYNC_WATERMARK_KEY,
+    AnalyticsSource,
 )
+from backend.utils.analytics_result_cache import bump_analytics_generation
+
+# Indexes a DONE issue and moves its story points into the per-finish-date
+# totals. When the issue is already indexed, the points it was credited with
+# (read from the issue hash, which must not have been overwritten yet) are
+# taken back from its old finish date first, so re-syncs never double count.
+#   KEYS[1]: DONE status index sorted set
+#   KEYS[2]: story points hash for the same ldap and project
+#   KEYS[3]: issue details hash
+#   ARGV[1]: issue ID
+#   ARGV[2]: finish date (YYYYMMDD)
+#   ARGV[3]: story points
+_INDEX_DONE_ISSUE_SCRIPT = """
+local old_date = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if old_date then
+    local old_points = tonumber(redis.call('HGET', KEYS[3], 'story_point')) or 0
+    redis.call('HINCRBYFLOAT', KEYS[2], old_date, -old_points)
+end
+redis.call('HINCRBYFLOAT', KEYS[2], ARGV[2], ARGV[3])
+return redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+"""
+
+# Removes a DONE issue from its index and takes its story points back from the
+# per-finish-date totals. Must run before the issue hash is deleted or
+# overwritten.
+#   KEYS[1]: DONE status index sorted set
+#   KEYS[2]: story points hash for the same ldap and project
+#   KEYS[3]: issue details hash
+#   ARGV[1]: issue ID
+_UNINDEX_DONE_ISSUE_SCRIPT = """
+local old_date = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not old_date then
+    return 0
+end
+local old_points = tonumber(redis.call('HGET', KEYS[3], 'story_point')) or 0
+redis.call('HINCRBYFLOAT', KEYS[2], old_date, -old_points)
+return redis.call('ZREM', KEYS[1], ARGV[1])
+"""
 
 
 class JiraHistorySyncService:
@@ -173,6 +224,73 @@ class JiraHistorySyncService:
                         break
         return finish_date
 
+    def _queue_index_done_issue(
+        self,
+        pipeline,
+        ldap: str,
+        project_id: str,
+        issue_id: str,
+        finish_date: int,
+        story_point: float,
+    ) -> None:
+        """
+        Queue adding a DONE issue to its index and story points totals.
+
+        Must be queued before the issue details hash is overwritten.
+
+        Args:
+            pipeline: A Redis pipeline used for batched operations.
+            ldap (str): The assignee LDAP.
+            project_id (str): The Jira project ID.
+            issue_id (str): The Jira issue ID.
+            finish_date (int): The finish date in YYYYMMDD format.
+            story_point (float): The issue's story points.
+        """
+        pipeline.eval(
+            _INDEX_DONE_ISSUE_SCRIPT,
+            3,
+            JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
+                ldap=ldap, project_id=project_id, status=JiraIssueStatus.DONE.value
+            ),
+            JIRA_STORY_POINTS_KEY.format(ldap=ldap, project_id=project_id),
+            JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id),
+            issue_id,
+            finish_date,
+            story_point,
+        )
+
+    def _queue_unindex_issue(
+        self, pipeline, ldap: str, project_id: str, status: str, issue_id: str
+    ) -> None:
+        """
+        Queue removing an issue from the index it was stored under.
+
+        DONE issues also have their story points taken back from the totals, so
+        this must be queued before the issue details hash is deleted or
+        overwritten.
+
+        Args:
+            pipeline: A Redis pipeline used for batched operations.
+            ldap (str): The previously stored assignee LDAP.
+            project_id (str): The previously stored Jira project ID.
+            status (str): The previously stored standardized status value.
+            issue_id (str): The Jira issue ID.
+        """
+        index_key = JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
+            ldap=ldap, project_id=project_id, status=status
+        )
+        if JiraIssueStatus.DONE.value == status:
+            pipeline.eval(
+                _UNINDEX_DONE_ISSUE_SCRIPT,
+                3,
+                index_key,
+                JIRA_STORY_POINTS_KEY.format(ldap=ldap, project_id=project_id),
+                JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id),
+                issue_id,
+            )
+        else:
+            pipeline.srem(index_key, issue_id)
+
     def _queue_issues_in_redis_pipeline(self, issues: list, pipeline) -> int:
         """
         Prepare Redis commands to store a batch of Jira issues, including their details and index keys.
@@ -184,7 +302,8 @@ class JiraHistorySyncService:
         Each issue is validated, transformed, and queued in the pipeline:
             - Issue details are stored as Hash under a key formatted by JIRA_ISSUE_DETAILS_KEY.
             - Index keys are updated:
-                - DONE issues are added to a sorted set (ZADD) with finish_date as the score.
+                - DONE issues are added to a sorted set (ZADD) with finish_date as the score,
+                  and their story points are added to the per-finish-date totals.
                 - Non-DONE issues are added to a set (SADD).
 
         Args:
@@ -201,7 +320,7 @@ class JiraHistorySyncService:
                 - Skips issues if the status is excluded or unrecognized.
             4. For DONE issues, determines `finish_date` using `_get_finish_date_for_done_status`.
             5. Adds Redis commands to the pipeline:
-                - DONE → ZADD with finish_date as score.
+                - DONE → ZADD with finish_date as score, plus the story points total update.
                 - Non-DONE → SADD.
             6. Logs debug messages for each queued operation.
         """
@@ -271,25 +390,23 @@ class JiraHistorySyncService:
                 )
                 issue_detail_info["finish_date"] = finish_date
 
-            issue_detail_info_redis_key = JIRA_ISSUE_DETAILS_KEY.format(
-                issue_id=issue_id
-            )
-            pipeline.hset(issue_detail_info_redis_key, mapping=issue_detail_info)
-            self.logger.debug(
-                "Pipeline: Added hash for issue '%s' (ID: %s) under key '%s'.",
-                issue_key,
-                issue_id,
-                issue_detail_info_redis_key,
-            )
-
             index_key = JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
                 ldap=ldap,
                 project_id=project_id,
                 status=standard_status.value,
             )
 
+            # The DONE index script reads the previously stored story points,
+            # so it is queued before the issue hash is overwritten.
             if JiraIssueStatus.DONE == standard_status:
-                pipeline.zadd(index_key, {issue_id: finish_date})
+                self._queue_index_done_issue(
+                    pipeline,
+                    ldap,
+                    project_id,
+                    issue_id,
+                    finish_date,
+                    issue_detail_info["story_point"],
+                )
                 self.logger.debug(
                     "Pipeline: Added ZADD for DONE issue '%s' (ID: %s) with finish_date %s to index '%s'.",
                     issue_key,
@@ -306,6 +423,17 @@ class JiraHistorySyncService:
                     index_key,
                 )
 
+            issue_detail_info_redis_key = JIRA_ISSUE_DETAILS_KEY.format(
+                issue_id=issue_id
+            )
+            pipeline.hset(issue_detail_info_redis_key, mapping=issue_detail_info)
+            self.logger.debug(
+                "Pipeline: Added hash for issue '%s' (ID: %s) under key '%s'.",
+                issue_key,
+                issue_id,
+                issue_detail_info_redis_key,
+            )
+
             stored_count += 1
         return stored_count
 
@@ -324,6 +452,7 @@ class JiraHistorySyncService:
             2. For each batch:
                 - Creates a Redis pipeline.
                 - Queues the batch into the pipeline (commands are prepared but not yet executed).
+                - Records the content digest of every issue for `sync_updated_jira_issues`.
                 - Executes the pipeline to actually write to Redis.
                 - Logs the number of issues stored for the batch.
             3. Logs the total number of issues stored after all batches are processed.
@@ -332,15 +461,108 @@ class JiraHistorySyncService:
         for issues_batch in self.jira_search_service.fetch_assigned_issues_paginated():
             pipeline = self.redis_client.pipeline()
             stored_count = self._queue_issues_in_redis_pipeline(issues_batch, pipeline)
+            content_hashes = {
+                issue.raw.get("id"): self._issue_content_hash(issue.raw)
+                for issue in issues_batch
+                if issue.raw.get("id")
+            }
+            if content_hashes:
+                pipeline.hset(JIRA_ISSUE_CONTENT_HASH_KEY, mapping=content_hashes)
             self.logger.info(
                 f"Stored {stored_count} issues (batch size: {len(issues_batch)})"
             )
+            bump_analytics_generation(pipeline, AnalyticsSource.JIRA)
             self.retry_utils.get_retry_on_transient(pipeline.execute)
             total_stored += stored_count
 
         self.logger.info(f"Backfill complete. Total issues stored: {total_stored}")
         return total_stored
 
+    def _queue_issue_updates(
+        self, issues: list, old_issue_details: list, pipeline
+    ) -> int:
+        """
+        Queue the Redis commands moving updated Jira issues to their new state.
+
+        Note:
+            This method **only adds commands to the provided Redis pipeline**.
+            It does not execute them.
+
+        Args:
+            issues (list): The updated Jira issue objects.
+            old_issue_details (list): The stored details of each issue (a dict
+                with at least `ldap`, `project_id` and `issue_status`), or an
+                empty value for issues that are not stored.
+            pipeline: A Redis pipeline object to batch commands for efficiency.
+
+        Returns:
+            int: The number of issues queued to be stored or re-stored.
+        """
+        issues_to_store = []
+
+        for issue, old_raw_data in zip(issues, old_issue_details):
+            issue_raw_data = issue.raw
+            issue_id = issue_raw_data.get("id")
+            fields = issue_raw_data.get("fields", {})
+            new_ldap = None
+            assignee_info = fields.get("assignee", {})
+            if assignee_info:
+                new_ldap = assignee_info.get("name")
+
+            if not old_raw_data:
+                if new_ldap:
+                    self.logger.info(
+                        "Issue '%s' was recently assigned and will be stored.",
+                        issue_id,
+                    )
+                    issues_to_store.append(issue)
+                else:
+                    self.logger.info(
+                        "Issue '%s' remains unassigned; skipping.", issue_id
+                    )
+                continue
+
+            old_ldap = old_raw_data.get("ldap")
+            old_project_id = old_raw_data.get("project_id")
+            old_status = old_raw_data.get("issue_status")
+
+            if new_ldap is None and old_ldap:
+                self.logger.info(
+                    "Assignee for issue '%s' was removed. Deleting from Redis.",
+                    issue_id,
+                )
+                self._queue_unindex_issue(
+                    pipeline,
+                    old_ldap,
+                    old_project_id,
+                    old_status,
+                    issue_id,
+                )
+                pipeline.delete(JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id))
+                continue
+
+            if new_ldap:
+                self._queue_unindex_issue(
+                    pipeline,
+                    old_ldap,
+                    old_project_id,
+                    old_status,
+                    issue_id,
+                )
+
+                self.logger.info(
+                    "Content for issue '%s' has been updated; will re-store.",
+                    issue_id,
+                )
+                issues_to_store.append(issue)
+
+        if issues_to_store:
+            self.logger.info(
+                "Storing/updating %d issues in Redis.", len(issues_to_store)
+            )
+            self._queue_issues_in_redis_pipeline(issues_to_store, pipeline)
+        return len(issues_to_store)
+
     def process_update_jira_issues(self, hours: int) -> int:
         """
         Processes Jira issues updated within a specified number of hours.
@@ -379,77 +601,214 @@ class JiraHistorySyncService:
             )
 
             updated_pipeline = self.redis_client.pipeline()
-            issues_to_store = []
-
-            for i, issue in enumerate(issues_batch):
-                issue_raw_data = issue.raw
-                issue_id = issue_raw_data.get("id")
-                fields = issue_raw_data.get("fields", {})
-                new_ldap = None
-                assignee_info = fields.get("assignee", {})
-                if assignee_info:
-                    new_ldap = assignee_info.get("name")
-
-                old_raw_data = old_issue_detail_raw[i]
-                if old_raw_data is None:
-                    if new_ldap:
-                        self.logger.info(
-                            "Issue '%s' was recently assigned and will be stored.",
-                            issue_id,
-                        )
-                        issues_to_store.append(issue)
-                    else:
-                        self.logger.info(
-                            "Issue '%s' remains unassigned; skipping.", issue_id
-                        )
-                    continue
+            stored_count = self._queue_issue_updates(
+                issues_batch, old_issue_detail_raw, updated_pipeline
+            )
+            bump_analytics_generation(updated_pipeline, AnalyticsSource.JIRA)
+            self.retry_utils.get_retry_on_transient(updated_pipeline.execute)
+            total_processed += stored_count
 
-                old_ldap = old_raw_data.get("ldap")
-                old_project_id = old_raw_data.get("project_id")
-                old_status = old_raw_data.get("issue_status")
+        self.logger.info(
+            "Processing complete. Total issues stored/updated: %s", total_processed
+        )
+        return total_processed
 
-                if new_ldap is None and old_ldap:
-                    self.logger.info(
-                        "Assignee for issue '%s' was removed. Deleting from Redis.",
-                        issue_id,
-                    )
-                    updated_pipeline.delete(
-                        JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id)
-                    )
-                    index_key = JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
-                        ldap=old_ldap, project_id=old_project_id, status=old_status
-                    )
-                    if JiraIssueStatus.DONE.value == old_status:
-                        updated_pipeline.zrem(index_key, issue_id)
-                    else:
-                        updated_pipeline.srem(index_key, issue_id)
-                    continue
+    def _issue_content_hash(self, issue_raw_data: dict) -> str:
+        """
+        Digest the fields of a Jira issue that the sync stores or indexes.
 
-                if new_ldap:
-                    index_key = JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
-                        ldap=old_ldap, project_id=old_project_id, status=old_status
-                    )
-                    if JiraIssueStatus.DONE.value == old_status:
-                        updated_pipeline.zrem(index_key, issue_id)
-                    else:
-                        updated_pipeline.srem(index_key, issue_id)
+        `updated` only takes part for DONE issues without a resolution date,
+        whose finish date falls back to it; any other edit leaves the digest
+        unchanged.
 
-                    self.logger.info(
-                        "Content for issue '%s' has been updated; will re-store.",
-                        issue_id,
-                    )
-                    issues_to_store.append(issue)
+        Args:
+            issue_raw_data (dict): The raw data of the Jira issue.
 
-            if issues_to_store:
-                self.logger.info(
-                    "Storing/updating %d issues in Redis.", len(issues_to_store)
+        Returns:
+            str: The hex digest of the issue content.
+        """
+        fields = issue_raw_data.get("fields") or {}
+        status_id = (fields.get("status") or {}).get("id")
+        content = [
+            issue_raw_data.get("key"),
+            fields.get("summary"),
+            (fields.get("project") or {}).get("id"),
+            status_id,
+            (fields.get("assignee") or {}).get("name"),
+            fields.get(JIRA_STORY_POINT_FIELD),
+            fields.get("resolutiondate"),
+        ]
+        if JIRA_STATUS_ID_MAP.get(status_id) == JiraIssueStatus.DONE and not fields.get(
+            "resolutiondate"
+        ):
+            content.append(fields.get("updated"))
+        return hashlib.sha1(
+            json.dumps(content, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def sync_updated_jira_issues(self) -> int:
+        """
+        Incrementally sync the Jira issues updated since the last sync.
+
+        Issues are fetched from the stored watermark (the latest `updated`
+        timestamp seen, minus an overlap), or from the initial look-back on the
+        first run. Only issues whose content digest differs from the stored one
+        are diffed against and re-stored in Redis, so the cost of a run follows
+        the number of issues that actually changed. The watermark only advances
+        once every page has been written, so a failed run is repeated in full.
+
+        Returns:
+            int: The total number of issues stored/updated in Redis.
+        """
+        now = datetime.now(timezone.utc)
+        watermark = self.retry_utils.get_retry_on_transient(
+            self.redis_client.get, JIRA_SYNC_WATERMARK_KEY
+        )
+        if watermark:
+            since = datetime.strptime(watermark, DATETIME_ISO8601_FORMAT)
+            minutes = max(
+                math.ceil((now - since).total_seconds() / 60)
+                + JIRA_SYNC_OVERLAP_MINUTES,
+                1,
+            )
+        else:
+            minutes = JIRA_SYNC_INITIAL_LOOKBACK_MINUTES
+        self.logger.info(
+            "Syncing Jira issues updated within the last %s minutes (watermark: %s)",
+            minutes,
+            watermark,
+        )
+
+        total_processed = 0
+        total_unchanged = 0
+        latest_updated = None
+        for (
+            issues_batch
+        ) in self.jira_search_service.fetch_issues_updated_within_minutes_paginated(
+            minutes
+        ):
+            for issue in issues_batch:
+                updated_str = issue.raw.get("fields", {}).get("updated")
+                try:
+                    updated = datetime.strptime(updated_str, DATETIME_ISO8601_FORMAT)
+                except (TypeError, ValueError):
+                    continue
+                if latest_updated is None or updated > latest_updated[0]:
+                    latest_updated = (updated, updated_str)
+
+            issue_ids = [issue.raw.get("id") for issue in issues_batch]
+            stored_hashes = self.retry_utils.get_retry_on_transient(
+                self.redis_client.hmget, JIRA_ISSUE_CONTENT_HASH_KEY, issue_ids
+            )
+            changed_issues = []
+            content_hashes = {}
+            for issue_id, issue, stored_hash in zip(
+                issue_ids, issues_batch, stored_hashes
+            ):
+                content_hash = self._issue_content_hash(issue.raw)
+                if issue_id and content_hash != stored_hash:
+                    changed_issues.append(issue)
+                    content_hashes[issue_id] = content_hash
+            total_unchanged += len(issues_batch) - len(changed_issues)
+            if not changed_issues:
+                continue
+
+            search_pipeline = self.redis_client.pipeline()
+            for issue_id in content_hashes:
+                search_pipeline.hmget(
+                    JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id),
+                    ["ldap", "project_id", "issue_status"],
+                )
+            old_issue_details = [
+                dict(zip(("ldap", "project_id", "issue_status"), values))
+                if any(values)
+                else None
+                for values in self.retry_utils.get_retry_on_transient(
+                    search_pipeline.execute
                 )
-                self._queue_issues_in_redis_pipeline(issues_to_store, updated_pipeline)
+            ]
 
+            updated_pipeline = self.redis_client.pipeline()
+            total_processed += self._queue_issue_updates(
+                changed_issues, old_issue_details, updated_pipeline
+            )
+            updated_pipeline.hset(JIRA_ISSUE_CONTENT_HASH_KEY, mapping=content_hashes)
+            bump_analytics_generation(updated_pipeline, AnalyticsSource.JIRA)
             self.retry_utils.get_retry_on_transient(updated_pipeline.execute)
-            total_processed += len(issues_to_store)
 
+        if latest_updated is not None:
+            self.retry_utils.get_retry_on_transient(
+                self.redis_client.set, JIRA_SYNC_WATERMARK_KEY, latest_updated[1]
+            )
         self.logger.info(
-            "Processing complete. Total issues stored/updated: %s", total_processed
+            "Jira sync complete. Issues stored/updated: %s, unchanged: %s",
+            total_processed,
+            total_unchanged,
         )
         return total_processed
+
+    def rebuild_story_points_index(self) -> int:
+        """
+        Rebuild the per-(ldap, project) DONE story points totals from Redis.
+
+        Walks every DONE status index, sums the stored story points of each
+        indexed issue by finish date, then replaces all existing totals and
+        sets the ready marker so readers switch to them.
+
+        Issues synced while the rebuild is running may be missed by the totals;
+        run it again if they drift.
+
+        Returns:
+            int: The number of story points hashes written.
+        """
+        totals: dict[str, dict[str, float]] = {}
+        index_key_pattern = JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
+            ldap="*", project_id="*", status=JiraIssueStatus.DONE.value
+        )
+        index_key_prefix, index_key_suffix = index_key_pattern.split("*:project:*")
+
+        for index_key in self.redis_client.scan_iter(match=index_key_pattern):
+            ldap, project_id = index_key[
+                len(index_key_prefix) : -len(index_key_suffix)
+            ].rsplit(":project:", 1)
+            scored_issues = self.retry_utils.get_retry_on_transient(
+                self.redis_client.zrange, index_key, 0, -1, withscores=True
+            )
+            if not scored_issues:
+                continue
+
+            pipeline = self.redis_client.pipeline()
+            for issue_id, _ in scored_issues:
+                pipeline.hget(
+                    JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id), "story_point"
+                )
+            story_points = self.retry_utils.get_retry_on_transient(pipeline.execute)
+
+            day_totals = totals.setdefault(
+                JIRA_STORY_POINTS_KEY.format(ldap=ldap, project_id=project_id), {}
+            )
+            for (_, finish_date), story_point in zip(scored_issues, story_points):
+                day = str(int(finish_date))
+                day_totals[day] = day_totals.get(day, 0.0) + float(story_point or 0)
+
+        stale_keys = list(
+            self.redis_client.scan_iter(
+                match=JIRA_STORY_POINTS_KEY.format(ldap="*", project_id="*")
+            )
+        )
+
+        pipeline = self.redis_client.pipeline()
+        if stale_keys:
+            pipeline.delete(*stale_keys)
+        for story_points_key, day_totals in totals.items():
+            pipeline.hset(story_points_key, mapping=day_totals)
+        pipeline.set(
+            JIRA_STORY_POINTS_READY_KEY, datetime.now(timezone.utc).isoformat()
+        )
+        bump_analytics_generation(pipeline, AnalyticsSource.JIRA)
+        self.retry_utils.get_retry_on_transient(pipeline.execute)
+
+        self.logger.info(
+            "Rebuilt Jira story points totals for %d ldap/project pairs", len(totals)
+        )
+        return len(totals)
@@ -1,15 +1,53 @@
+import asyncio
+from collections import deque
+
+from backend.common.constants import (
+    MICROSOFT_CHAT_HISTORY_CHECKPOINT_DONE,
+    MICROSOFT_CHAT_HISTORY_CHECKPOINT_KEY,
+)
+
+# Chats paged through at once by the multi-chat backfill.
+DEFAULT_MAX_CONCURRENCY = 4
+# Messages written to Redis per pipeline.
+DEFAULT_CHUNK_SIZE = 500
+# Fetched pages waiting to be written. Fetchers block once it is full, which
+# bounds memory to this many pages plus one chunk, however many chats there are.
+PAGE_QUEUE_SIZE = 16
+
+# Tells the backfill writer that every fetcher has finished.
+_FETCHERS_DONE = object()
+
+
 class MicrosoftChatHistorySyncService:
-    def __init__(self, logger, microsoft_service, microsoft_chat_message_util):
+    def __init__(
+        self,
+        logger,
+        microsoft_service,
+        microsoft_chat_message_util,
+        redis_client=None,
+        retry_utils=None,
+        microsoft_meeting_chat_topic_cache_service=None,
+    ):
         """
         Initializes the MicrosoftChatHistorySyncService class.
         Args:
             logger: The logger instance for logging messages.
             microsoft_service: The MicrosoftService instance.
             microsoft_chat_message_util: The MicrosoftChatMessageUtil instance.
+            redis_client: The asyncio Redis client instance, used to store the
+                multi-chat backfill checkpoints.
+            retry_utils: A RetryUtils for handling retries on transient errors.
+            microsoft_meeting_chat_topic_cache_service: The
+                MicrosoftMeetingChatTopicCacheService listing the chats to backfill.
         """
         self.logger = logger
         self.microsoft_service = microsoft_service
         self.microsoft_chat_message_util = microsoft_chat_message_util
+        self.redis_client = redis_client
+        self.retry_utils = retry_utils
+        self.microsoft_meeting_chat_topic_cache_service = (
+            microsoft_meeting_chat_topic_cache_service
+        )
 
     async def get_microsoft_chat_messages_by_chat_id(self, chat_id: str):
         """
@@ -21,14 +59,35 @@ class MicrosoftChatHistorySyncService:
         Yields:
             list: A list of message objects from the current page.
         """
-        current_page = await self.microsoft_service.fetch_initial_chat_messages_page(
-            chat_id=chat_id
-        )
-        while current_page:
-            messages = current_page.value or []
+        async for messages, _ in self._iter_chat_pages(chat_id):
             if messages:
                 yield messages
+
+    async def _iter_chat_pages(self, chat_id: str, next_link: str | None = None):
+        """
+        Asynchronously pages through a chat, starting at `next_link` when given.
+
+        Args:
+            chat_id (str): The unique identifier of the Microsoft chat.
+            next_link (str | None): A page link returned by a previous page.
+
+        Yields:
+            tuple[list, str | None]: The messages of each page, which may be empty,
+                and the link of the following page (None on the last page).
+        """
+        if next_link:
+            current_page = await self.microsoft_service.fetch_chat_messages_by_url(
+                chat_id=chat_id, url=next_link
+            )
+        else:
+            current_page = (
+                await self.microsoft_service.fetch_initial_chat_messages_page(
+                    chat_id=chat_id
+                )
+            )
+        while current_page:
             next_link = current_page.odata_next_link
+            yield current_page.value or [], next_link
             if not next_link:
                 break
             current_page = await self.microsoft_service.fetch_chat_messages_by_url(
@@ -88,3 +147,197 @@ class MicrosoftChatHistorySyncService:
         self.logger.info(
             f"Completed syncing for chat ID: {chat_id}. Total processed: {overall_total_processed}, total skipped: {overall_total_skipped}."
         )
+
+    async def backfill_chat_messages(
+        self,
+        chat_ids: list[str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> dict:
+        """
+        Backfills the history of many Microsoft chats with bounded memory.
+
+        Up to `max_concurrency` chats are paged through at once. Their pages are
+        streamed through a bounded queue to a single writer, which stores the
+        messages in pipelines of `chunk_size` messages. Once all messages of a
+        page are written, the chat's checkpoint advances to the next page link,
+        so a rerun after a failure skips finished chats and resumes the others
+        where they stopped. Once every chat is stored, the checkpoints of these
+        chats are cleared; those of other runs' chats are kept.
+
+        Args:
+            chat_ids (list[str] | None): The chats to backfill. Defaults to the
+                cached meeting chats of `MicrosoftMeetingChatTopicCacheService`.
+            max_concurrency (int): The number of chats fetched concurrently.
+            chunk_size (int): The number of messages written per Redis pipeline.
+
+        Returns:
+            dict: The number of chats, processed messages and skipped messages.
+
+        Raises:
+            ValueError: If there are no chats to backfill.
+            RuntimeError: If any chat failed to backfill; the others are stored.
+        """
+        if chat_ids is None:
+            chat_topics = await self.microsoft_meeting_chat_topic_cache_service.get_microsoft_chat_topics()
+            chat_ids = list(chat_topics)
+        if not chat_ids:
+            raise ValueError("No Microsoft chats to backfill.")
+
+        all_ldaps = await self.microsoft_service.list_all_id_ldap_mapping()
+        checkpoints = (
+            await self.retry_utils.get_async_retry_on_transient(
+                self.redis_client.hgetall, MICROSOFT_CHAT_HISTORY_CHECKPOINT_KEY
+            )
+            or {}
+        )
+
+        page_queue: asyncio.Queue = asyncio.Queue(maxsize=PAGE_QUEUE_SIZE)
+        pending_chats = deque(chat_ids)
+        failed_chats = []
+        totals = {"chats": len(chat_ids), "processed": 0, "skipped": 0}
+
+        async def fetch_chats():
+            while pending_chats:
+                chat_id = pending_chats.popleft()
+                checkpoint = checkpoints.get(chat_id)
+                if checkpoint == MICROSOFT_CHAT_HISTORY_CHECKPOINT_DONE:
+                    continue
+                try:
+                    await self._fetch_chat_pages(chat_id, checkpoint, page_queue)
+                except Exception as e:
+                    self.logger.error(
+                        "Failed to backfill Microsoft chat %s: %s",
+                        chat_id,
+                        e,
+                        exc_info=True,
+                    )
+                    failed_chats.append(chat_id)
+
+        async def fetch_all():
+            await asyncio.gather(
+                *(fetch_chats() for _ in range(min(max_concurrency, len(chat_ids))))
+            )
+            await page_queue.put(_FETCHERS_DONE)
+
+        fetchers = asyncio.create_task(fetch_all())
+        writer = asyncio.create_task(
+            self._write_chat_pages(page_queue, all_ldaps, chunk_size, totals)
+        )
+        try:
+            # The writer only finishes first when it failed; fetchers blocked
+            # on the full queue would otherwise wait for it forever.
+            await asyncio.wait({fetchers, writer}, return_when=asyncio.FIRST_COMPLETED)
+            if writer.done():
+                writer.result()
+            await writer
+        finally:
+            fetchers.cancel()
+            writer.cancel()
+
+        if failed_chats:
+            raise RuntimeError(
+                f"Failed to backfill {len(failed_chats)} Microsoft chat(s): "
+                f"{', '.join(sorted(failed_chats))}"
+            )
+        await self.retry_utils.get_async_retry_on_transient(
+            self.redis_client.hdel, MICROSOFT_CHAT_HISTORY_CHECKPOINT_KEY, *chat_ids
+        )
+        self.logger.info(
+            "Completed backfill of %d Microsoft chats. Total processed: %d, total skipped: %d.",
+            totals["chats"],
+            totals["processed"],
+            totals["skipped"],
+        )
+        return totals
+
+    async def _fetch_chat_pages(
+        self, chat_id: str, checkpoint: str | None, page_queue: asyncio.Queue
+    ) -> None:
+        """
+        Streams the pages of one chat into the backfill queue.
+
+        Starts at the checkpointed page link when there is one. A link Graph
+        no longer accepts restarts the chat from its first page; messages are
+        stored idempotently.
+        """
+        resuming = bool(checkpoint)
+        try:
+            async for messages, next_link in self._iter_chat_pages(chat_id, checkpoint):
+                resuming = False
+                await page_queue.put((chat_id, messages, next_link))
+        except Exception:
+            if not resuming:
+                raise
+            self.logger.warning(
+                "Checkpoint of Microsoft chat %s was rejected; restarting the chat.",
+                chat_id,
+            )
+            async for messages, next_link in self._iter_chat_pages(chat_id):
+                await page_queue.put((chat_id, messages, next_link))
+
+    async def _write_chat_pages(
+        self, page_queue: asyncio.Queue, all_ldaps: dict, chunk_size: int, totals: dict
+    ) -> None:
+        """
+        Writes queued pages to Redis in chunks and advances the chat checkpoints.
+
+        Each page is remembered with the buffer offset its last message ends at;
+        once a write covers that offset, the page's chat checkpoint moves to the
+        page's next link, or to "done" after the chat's last page.
+        """
+        buffer = []
+        written_pages = deque()
+
+        async def write(count):
+            nonlocal written_pages
+            chunk = buffer[:count]
+            del buffer[:count]
+            if chunk:
+                processed, skipped = await asyncio.to_thread(
+                    self.microsoft_chat_message_util.sync_history_chat_messages_to_redis,
+                    chunk,
+                    all_ldaps,
+                )
+                totals["processed"] += processed
+                totals["skipped"] += skipped
+
+            checkpoints = {}
+            while written_pages and written_pages[0][0] <= count:
+                _, chat_id, checkpoint = written_pages.popleft()
+                checkpoints[chat_id] = checkpoint
+            written_pages = deque(
+                (end - count, chat_id, checkpoint)
+                for end, chat_id, checkpoint in written_pages
+            )
+            if checkpoints:
+                await self.retry_utils.get_async_retry_on_transient(
+                    self.redis_client.hset,
+                    MICROSOFT_CHAT_HISTORY_CHECKPOINT_KEY,
+                    mapping=checkpoints,
+                )
+
+        while True:
+            item = await page_queue.get()
+            if item is _FETCHERS_DONE:
+                break
+            chat_id, messages, next_link = item
+            buffer.extend(messages)
+            written_pages.append((
+                len(buffer),
+                chat_id,
+                next_link or MICROSOFT_CHAT_HISTORY_CHECKPOINT_DONE,
+            ))
+            while len(buffer) >= chunk_size:
+                await write(chunk_size)
+        await write(len(buffer))
+
+    def backfill_daily_counts(self) -> int:
+        """
+        Rebuild the daily Microsoft chat message count rollups from the stored indexes.
+
+        Returns:
+            int: The number of daily rollups written.
+        """
+        self.logger.info("Starting Microsoft chat daily count rollup backfill.")
+        return self.microsoft_chat_message_util.rebuild_daily_counts()
@@ -15,7 +15,15 @@ class MicrosoftMemberSyncService:
     ensures Redis is updated incrementally (add, update, delete).
     """
 
-    def __init__(self, logger, redis_client, microsoft_service, retry_utils):
+    def __init__(
+        self,
+        logger,
+        redis_client,
+        microsoft_service,
+        retry_utils,
+        ldap_service=None,
+        user_ldap_cache=None,
+    ):
         """
         Initializes the MicrosoftMemberService with necessary clients and logger.
 
@@ -24,11 +32,17 @@ class MicrosoftMemberSyncService:
             redis_client: The Redis client instance.
             microsoft_service: The MicrosoftService instance.
             retry_utils: A RetryUtils for handling retries on transient errors.
+            ldap_service: Optional LdapService whose directory cache is
+                invalidated whenever a sync changes the stored members.
+            user_ldap_cache: Optional MicrosoftUserLdapCache refreshed on every
+                sync, so message ingestion can resolve senders without Graph.
         """
         self.logger = logger
         self.redis_client = redis_client
         self.microsoft_service = microsoft_service
         self.retry_utils = retry_utils
+        self.ldap_service = ldap_service
+        self.user_ldap_cache = user_ldap_cache
         self.storage_groups = [group.value for group in MicrosoftGroups]
         self.storage_statuses = [
             MicrosoftAccountStatus.ACTIVE.value,
@@ -189,6 +203,9 @@ class MicrosoftMemberSyncService:
         Notes:
             - Redis updates are pipelined for efficiency.
             - No changes are committed if nothing differs.
+            - The LDAP directory cache is invalidated after changes are committed.
+            - The Graph user ID cache is refreshed on every run; a failure there
+              is logged and does not fail the member sync.
         """
         current_redis_saved_members = (
             self.get_current_redis_members_by_group_and_status()
@@ -243,6 +260,14 @@ class MicrosoftMemberSyncService:
 
         if changes_made:
             self.retry_utils.get_retry_on_transient(pipe.execute)
+            if self.ldap_service:
+                self.ldap_service.invalidate_cache()
             self.logger.info("Redis sync complete.")
         else:
             self.logger.info("Nothing changed in Redis, skipping sync.")
+
+        if self.user_ldap_cache:
+            try:
+                await self.user_ldap_cache.refresh()
+            except Exception as e:
+                self.logger.warning(f"Failed to refresh Graph user ID cache: {e}")
@@ -1,5 +1,8 @@
 import re
 from datetime import datetime, timezone
+
+from redis.exceptions import ResponseError
+
 from backend.common.constants import (
     GERRIT_STATS_BUCKET_KEY,
     GERRIT_STATS_PROJECT_BUCKET_KEY,
@@ -13,8 +16,41 @@ from backend.common.constants import (
     GERRIT_CL_UNDER_REVIEW_FIELD,
     GERRIT_CL_REVIEWED_FIELD,
     GERRIT_LOC_MERGED_FIELD,
+    AnalyticsSource,
 )
 
+# Sums the merged/reviewed/LOC fields of every weekly stats hash passed in KEYS
+# and returns {cl_merged, cl_reviewed, loc_merged}, so a whole LDAP's range
+# costs one reply instead of one HGETALL per (project x week bucket).
+#   ARGV[1..3]: the merged, reviewed and LOC field names, in that order.
+_SUM_STATS_BUCKETS_SCRIPT = """
+local merged, reviewed, loc = 0, 0, 0
+for _, key in ipairs(KEYS) do
+    local values = redis.call('HMGET', key, ARGV[1], ARGV[2], ARGV[3])
+    merged = merged + (tonumber(values[1]) or 0)
+    reviewed = reviewed + (tonumber(values[2]) or 0)
+    loc = loc + (tonumber(values[3]) or 0)
+end
+return {merged, reviewed, loc}
+"""
+_SUM_STATS_BUCKETS_FIELDS = (
+    GERRIT_CL_MERGED_FIELD,
+    GERRIT_CL_REVIEWED_FIELD,
+    GERRIT_LOC_MERGED_FIELD,
+)
+# How servers that do not serve Lua scripts answer EVALSHA or SCRIPT LOAD:
+# unknown (renamed or unsupported), disabled by config, or denied by ACL.
+_SCRIPTING_COMMANDS = ("eval", "script")
+_SCRIPTING_REJECTIONS = ("unknown command", "disabled", "not allowed", "noperm")
+
+
+def _is_scripting_unavailable(error: ResponseError) -> bool:
+    """Whether a Redis error means the server does not run Lua scripts at all."""
+    message = str(error).lower()
+    return any(command in message for command in _SCRIPTING_COMMANDS) and any(
+        rejection in message for rejection in _SCRIPTING_REJECTIONS
+    )
+
 
 class GerritAnalyticsService:
     def __init__(
@@ -25,17 +61,23 @@ class GerritAnalyticsService:
         ldap_service,
         date_time_util,
         gerrit_client,
+        use_script_aggregation: bool = True,
+        result_cache=None,
     ):
         """
         Gerrit Analytics Service to aggregate stats from Redis.
 
         Args:
             logger: Logger instance.
-            redis_client: The Redis client instance.
+            redis_client: The asyncio Redis client instance.
             retry_utils: A RetryUtils for handling retries on transient errors.
             ldap_service: Service that can provide active LDAP users.
             date_time_util: A DateTimeUtil instance for handling date and time operations.
             gerrit_client: A Gerrit Client instance.
+            use_script_aggregation: Sum weekly buckets inside Redis with a Lua
+                script. Turned off automatically if the server rejects scripting.
+            result_cache: Optional AnalyticsResultCache serving repeated queries
+                over closed date ranges.
         """
         self.logger = logger
         self.redis_client = redis_client
@@ -44,20 +86,44 @@ class GerritAnalyticsService:
         self.date_time_util = date_time_util
         self.gerrit_client = gerrit_client
         self.LDAP_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+        self.use_script_aggregation = use_script_aggregation
+        # Queued on each stats pipeline with client=pipeline, so redis-py
+        # loads it on the pipeline's server right before EXEC: a script cache
+        # flushed by a restart or failover never surfaces as NOSCRIPT.
+        self._sum_buckets_script = redis_client.register_script(
+            _SUM_STATS_BUCKETS_SCRIPT
+        )
+        self.result_cache = result_cache
+
+    def _stats_bucket_keys(
+        self, ldap: str, project: str | None, week_buckets: list[str]
+    ) -> list[str]:
+        """Weekly stats hash keys for one LDAP, project-specific or global."""
+        if project:
+            return [
+                GERRIT_STATS_PROJECT_BUCKET_KEY.format(
+                    ldap=ldap, project=project, bucket=bucket
+                )
+                for bucket in week_buckets
+            ]
+        return [
+            GERRIT_STATS_BUCKET_KEY.format(ldap=ldap, bucket=bucket)
+            for bucket in week_buckets
+        ]
 
-    def get_gerrit_projects(self) -> list[str]:
+    async def get_gerrit_projects(self) -> list[str]:
         """
         Retrieve all Gerrit project names stored in Redis set 'gerrit:projects'.
 
         Returns:
             list[str]: A list of project names.
         """
-        projects = self.retry_utils.get_retry_on_transient(
+        projects = await self.retry_utils.get_async_retry_on_transient(
             self.redis_client.smembers, GERRIT_PROJECTS_KEY
         )
         return sorted(list(projects))
 
-    def get_gerrit_stats(
+    async def get_gerrit_stats(
         self,
         ldap_list: list[str] | None = None,
         start_date_str: str | None = None,
@@ -97,7 +163,9 @@ class GerritAnalyticsService:
                 and end_date matches today's UTC date; otherwise None)
         """
         if not ldap_list:
-            ldap_list = self.ldap_service.get_all_active_interns_and_employees_ldaps()
+            ldap_list = (
+                await self.ldap_service.get_all_active_interns_and_employees_ldaps()
+            )
             if not ldap_list:
                 self.logger.warning("No active LDAP users found.")
                 return {}
@@ -141,19 +209,216 @@ class GerritAnalyticsService:
                 projects,
             )
 
-        pipeline = self.redis_client.pipeline()
+        def compute():
+            return self._aggregate_gerrit_stats(
+                ldap_list,
+                projects,
+                week_buckets,
+                start_date_time,
+                end_date_time,
+                include_full_stats,
+                include_under_review,
+            )
+
+        if not self.result_cache:
+            return await compute()
+        return await self.result_cache.get_or_compute(
+            "gerrit_stats",
+            {
+                "ldaps": sorted(ldap_list),
+                "projects": sorted(p or "" for p in projects),
+                "start": start_date,
+                "end": end_date,
+                "include_full_stats": include_full_stats,
+            },
+            [AnalyticsSource.GERRIT],
+            end_date_time,
+            compute,
+        )
+
+    async def _aggregate_gerrit_stats(
+        self,
+        ldap_list: list[str],
+        projects: list[str | None],
+        week_buckets: list[str],
+        start_date_time: datetime,
+        end_date_time: datetime,
+        include_full_stats: bool,
+        include_under_review: bool,
+    ) -> dict[str, dict]:
+        """Read and sum the Gerrit stats for resolved LDAPs, projects and buckets."""
+        use_script = self.use_script_aggregation
+        try:
+            results = await self._execute_stats_pipeline(
+                ldap_list,
+                projects,
+                week_buckets,
+                start_date_time,
+                end_date_time,
+                include_full_stats,
+                include_under_review,
+                use_script,
+            )
+        except ResponseError as e:
+            # The pipeline reloads a flushed script by itself. Any other error
+            # (WRONGTYPE, OOM, BUSY, a failing script) is not about scripting
+            # and would fail the HGETALLs too, so only a server rejecting the
+            # scripting commands turns the script off, for every later call.
+            if not use_script or not _is_scripting_unavailable(e):
+                raise
+            self.logger.warning(
+                "[get_gerrit_stats] Redis scripting unavailable, falling back to pipelined HGETALL: %s",
+                e,
+            )
+            self.use_script_aggregation = False
+            use_script = False
+            results = await self._execute_stats_pipeline(
+                ldap_list,
+                projects,
+                week_buckets,
+                start_date_time,
+                end_date_time,
+                include_full_stats,
+                include_under_review,
+                use_script,
+            )
+        self.logger.debug(
+            "[get_gerrit_stats] Pipeline executed, got %d results.", len(results)
+        )
+
+        stats = {}
+
+        idx = 0
         for ldap in ldap_list:
+            stats[ldap] = {
+                GERRIT_CL_MERGED_FIELD: 0,
+                GERRIT_CL_ABANDONED_FIELD: 0,
+                GERRIT_CL_UNDER_REVIEW_FIELD: 0,
+                GERRIT_CL_REVIEWED_FIELD: 0,
+                GERRIT_LOC_MERGED_FIELD: 0,
+            }
+            if use_script:
+                # one {cl_merged, cl_reviewed, loc_merged} reply for every project
+                for field, total in zip(_SUM_STATS_BUCKETS_FIELDS, results[idx]):
+                    stats[ldap][field] += int(total)
+                idx += 1
+
             for project in projects:
-                # weekly stats key
-                for bucket in week_buckets:
-                    stats_key = (
-                        GERRIT_STATS_PROJECT_BUCKET_KEY.format(
-                            ldap=ldap, project=project, bucket=bucket
+                # weekly stats hgetall
+                if not use_script:
+                    for _ in week_buckets:
+                        bucket_data = results[idx]
+                        idx += 1
+                        stats[ldap][GERRIT_CL_MERGED_FIELD] += int(
+                            bucket_data.get(GERRIT_CL_MERGED_FIELD, 0)
+                        )
+                        stats[ldap][GERRIT_CL_REVIEWED_FIELD] += int(
+                            bucket_data.get(GERRIT_CL_REVIEWED_FIELD, 0)
+                        )
+                        stats[ldap][GERRIT_LOC_MERGED_FIELD] += int(
+                            bucket_data.get(GERRIT_LOC_MERGED_FIELD, 0)
                         )
-                        if project
-                        else GERRIT_STATS_BUCKET_KEY.format(ldap=ldap, bucket=bucket)
-                    )
-                    pipeline.hgetall(stats_key)
+
+                if not include_full_stats:
+                    continue
+
+                abandoned_count = results[idx]
+                idx += 1
+                stats[ldap][GERRIT_CL_ABANDONED_FIELD] += abandoned_count
+
+                if include_under_review:
+                    under_review_count = results[idx]
+                    idx += 1
+                    stats[ldap][GERRIT_CL_UNDER_REVIEW_FIELD] += under_review_count
+                else:
+                    stats[ldap][GERRIT_CL_UNDER_REVIEW_FIELD] = None
+
+        self.logger.debug(
+            "[get_gerrit_stats] Aggregation complete. Returning stats for %d LDAPs: %s",
+            len(stats),
+            list(stats.keys()),
+        )
+        return stats
+
+    async def _execute_stats_pipeline(
+        self,
+        ldap_list: list[str],
+        projects: list[str | None],
+        week_buckets: list[str],
+        start_date_time: datetime,
+        end_date_time: datetime,
+        include_full_stats: bool,
+        include_under_review: bool,
+        use_script: bool,
+    ) -> list:
+        """
+        Queue and execute every Redis command `get_gerrit_stats` needs.
+
+        Per LDAP, the weekly stats are either one EVALSHA over all of its
+        bucket keys (when `use_script` is set) or one HGETALL per
+        (project x week bucket). Each project then adds its abandoned and
+        under-review ZCOUNTs as requested.
+
+        Each retry attempt queues the commands on a new pipeline: redis-py
+        resets a pipeline once `execute` returns or raises, so executing the
+        same one again would send nothing.
+
+        Returns:
+            list: The pipeline results, in the order they were queued.
+        """
+
+        async def execute() -> list:
+            pipeline = self.redis_client.pipeline()
+            await self._queue_stats_commands(
+                pipeline,
+                ldap_list,
+                projects,
+                week_buckets,
+                start_date_time,
+                end_date_time,
+                include_full_stats,
+                include_under_review,
+                use_script,
+            )
+            return await pipeline.execute()
+
+        return await self.retry_utils.get_async_retry_on_transient(execute)
+
+    async def _queue_stats_commands(
+        self,
+        pipeline,
+        ldap_list: list[str],
+        projects: list[str | None],
+        week_buckets: list[str],
+        start_date_time: datetime,
+        end_date_time: datetime,
+        include_full_stats: bool,
+        include_under_review: bool,
+        use_script: bool,
+    ) -> None:
+        """Queue the commands of `_execute_stats_pipeline` on `pipeline`."""
+        for ldap in ldap_list:
+            if use_script:
+                bucket_keys = [
+                    key
+                    for project in projects
+                    for key in self._stats_bucket_keys(ldap, project, week_buckets)
+                ]
+                # client=pipeline registers the script on the pipeline, which
+                # loads it into the server before EXEC if it is missing.
+                await self._sum_buckets_script(
+                    keys=bucket_keys,
+                    args=_SUM_STATS_BUCKETS_FIELDS,
+                    client=pipeline,
+                )
+
+            for project in projects:
+                # weekly stats key
+                if not use_script:
+                    for stats_key in self._stats_bucket_keys(
+                        ldap, project, week_buckets
+                    ):
+                        pipeline.hgetall(stats_key)
 
                 if not include_full_stats:
                     continue
@@ -195,55 +460,3 @@ class GerritAnalyticsService:
                     ZSET_MIN_SCORE,
                     end_date_time.timestamp(),
                 )
-
-        results = self.retry_utils.get_retry_on_transient(pipeline.execute)
-        self.logger.debug(
-            "[get_gerrit_stats] Pipeline executed, got %d results.", len(results)
-        )
-
-        stats = {}
-
-        idx = 0
-        for ldap in ldap_list:
-            stats[ldap] = {
-                GERRIT_CL_MERGED_FIELD: 0,
-                GERRIT_CL_ABANDONED_FIELD: 0,
-                GERRIT_CL_UNDER_REVIEW_FIELD: 0,
-                GERRIT_CL_REVIEWED_FIELD: 0,
-                GERRIT_LOC_MERGED_FIELD: 0,
-            }
-            for project in projects:
-                # weekly stats hgetall
-                for _ in week_buckets:
-                    bucket_data = results[idx]
-                    idx += 1
-                    stats[ldap][GERRIT_CL_MERGED_FIELD] += int(
-                        bucket_data.get(GERRIT_CL_MERGED_FIELD, 0)
-                    )
-                    stats[ldap][GERRIT_CL_REVIEWED_FIELD] += int(
-                        bucket_data.get(GERRIT_CL_REVIEWED_FIELD, 0)
-                    )
-                    stats[ldap][GERRIT_LOC_MERGED_FIELD] += int(
-                        bucket_data.get(GERRIT_LOC_MERGED_FIELD, 0)
-                    )
-
-                if not include_full_stats:
-                    continue
-
-                abandoned_count = results[idx]
-                idx += 1
-                stats[ldap][GERRIT_CL_ABANDONED_FIELD] += abandoned_count
-
-                if include_under_review:
-                    under_review_count = results[idx]
-                    idx += 1
-                    stats[ldap][GERRIT_CL_UNDER_REVIEW_FIELD] += under_review_count
-                else:
-                    stats[ldap][GERRIT_CL_UNDER_REVIEW_FIELD] = None
-
-        self.logger.debug(
-            "[get_gerrit_stats] Aggregation complete. Returning stats for %d LDAPs: %s",
-            len(stats),
-            list(stats.keys()),
-        )
-        return stats
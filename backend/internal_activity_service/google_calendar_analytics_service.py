@@ -3,27 +3,31 @@ from backend.common.constants import (
     GOOGLE_CALENDAR_USER_EVENTS_KEY,
     GOOGLE_EVENT_ATTENDANCE_KEY,
     GOOGLE_CALENDAR_EVENT_DETAIL_KEY,
+    GOOGLE_CALENDAR_MEETING_SECONDS_KEY,
+    GOOGLE_CALENDAR_MEETING_SECONDS_READY_KEY,
 )
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class GoogleCalendarAnalyticsService:
-    def __init__(self, logger, redis_client, retry_utils, ldap_service):
+    def __init__(self, logger, redis_client, retry_utils, ldap_service, date_time_util):
         """
         Initialize the GoogleCalendarAnalyticsService with necessary clients and logger.
 
         Args:
             logger: The logger instance for logging messages.
-            redis_client: The Redis client instance.
+            redis_client: The asyncio Redis client instance.
             retry_utils: A RetryUtils for handling retries on transient errors.
             ldap_service: The LDAP service instance for retrieving LDAP data.
               Missing LDAP data will be backfilled.
+            date_time_util: A DateTimeUtil instance for date and time manipulations.
         """
         self.logger = logger
         self.redis_client = redis_client
         self.retry_utils = retry_utils
         self.ldap_service = ldap_service
+        self.date_time_util = date_time_util
 
         if not logger:
             raise ValueError("Logger not provided.")
@@ -32,24 +36,7 @@ class GoogleCalendarAnalyticsService:
         if not self.retry_utils:
             raise ValueError("Retry utils not provided.")
 
-    def _get_calendar_name(self, calendar_id: str) -> str:
-        """
-        Retrieve the calendar's display name from the Redis hash that stores all calendars.
-
-        Args:
-            calendar_id (str): Google Calendar ID.
-
-        Returns:
-            str: Calendar name.
-        """
-        name = self.retry_utils.get_retry_on_transient(
-            self.redis_client.hget,
-            GOOGLE_CALENDAR_LIST_INDEX_KEY,
-            calendar_id,
-        )
-        return name
-
-    def get_all_calendars(self) -> list[dict[str, str]]:
+    async def get_all_calendars(self) -> list[dict[str, str]]:
         """
         Retrieve the calendar list from Redis.
 
@@ -59,13 +46,13 @@ class GoogleCalendarAnalyticsService:
         Raises:
             ValueError: If Redis client is not created or LDAP is missing.
         """
-        calendar_data = self.retry_utils.get_retry_on_transient(
+        calendar_data = await self.retry_utils.get_async_retry_on_transient(
             self.redis_client.hgetall, GOOGLE_CALENDAR_LIST_INDEX_KEY
         )
         calendars = [{"id": key, "name": value} for key, value in calendar_data.items()]
         return calendars
 
-    def get_all_events(
+    async def get_all_events(
         self,
         calendar_id: str,
         ldaps: list[str] | None,
@@ -84,110 +71,143 @@ class GoogleCalendarAnalyticsService:
         Returns:
             dict[str, list[dict]]: Each LDAP maps to a list of event dicts with id, date, join/leave times.
         """
-
         if not ldaps:
-            ldaps = self.ldap_service.get_all_active_interns_and_employees_ldaps()
+            ldaps = await self.ldap_service.get_all_active_interns_and_employees_ldaps()
+
+        events_by_calendar = await self._get_events_by_calendar(
+            [calendar_id], ldaps, start_date, end_date
+        )
+        return events_by_calendar[calendar_id]
+
+    async def _get_events_by_calendar(
+        self,
+        calendar_ids: list[str],
+        ldaps: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, dict[str, list[dict[str, any]]]]:
+        """
+        Fetch events with attendance info for every calendar and LDAP at once.
 
-        result: dict[str, list[dict[str, any]]] = {}
+        Runs one pipeline per stage regardless of how many calendars are
+        requested: event IDs for every (calendar, LDAP) pair together with the
+        calendar names, then every attendance set, then the event details, each
+        base event fetched once even when it appears on several calendars.
 
+        Args:
+            calendar_ids (list[str]): Calendar IDs to fetch.
+            ldaps (list[str]): LDAP usernames to fetch.
+            start_date (datetime): Start date (inclusive).
+            end_date (datetime): End date (inclusive).
+
+        Returns:
+            dict[str, dict[str, list[dict]]]: Calendar ID -> LDAP -> event dicts.
+        """
         start_ts = int(start_date.timestamp())
         end_ts = int(end_date.timestamp())
 
+        pairs = [(cal_id, ldap) for cal_id in calendar_ids for ldap in ldaps]
+
         pipeline = self.redis_client.pipeline()
-        events_key_by_ldap = {
-            ldap: GOOGLE_CALENDAR_USER_EVENTS_KEY.format(
-                calendar_id=calendar_id, ldap=ldap
+        for cal_id, ldap in pairs:
+            pipeline.zrange(
+                GOOGLE_CALENDAR_USER_EVENTS_KEY.format(calendar_id=cal_id, ldap=ldap),
+                start_ts,
+                end_ts,
+                byscore=True,
             )
-            for ldap in ldaps
-        }
-
-        for events_key in events_key_by_ldap.values():
-            pipeline.zrange(events_key, start_ts, end_ts, byscore=True)
-
-        ldap_event_id_lists = self.retry_utils.get_retry_on_transient(pipeline.execute)
-        ldap_event_ids_map = dict(zip(ldaps, ldap_event_id_lists))
-
-        attendance_keys = []
-        attendance_key_to_ldap_event = {}
+        pipeline.hmget(GOOGLE_CALENDAR_LIST_INDEX_KEY, calendar_ids)
+        (
+            *event_id_lists,
+            calendar_names,
+        ) = await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
+        event_ids_by_pair = dict(zip(pairs, event_id_lists))
+        calendar_name_map = dict(zip(calendar_ids, calendar_names))
+
+        attendance_lookups = []  # (cal_id, ldap, event_id)
         all_base_event_ids = set()
-
-        for ldap, event_ids in ldap_event_ids_map.items():
+        for (cal_id, ldap), event_ids in event_ids_by_pair.items():
             for event_id in event_ids:
-                key = GOOGLE_EVENT_ATTENDANCE_KEY.format(event_id=event_id, ldap=ldap)
-                attendance_keys.append(key)
-                attendance_key_to_ldap_event[key] = (ldap, event_id)
-                base_event_id = event_id.split("_")[0]
-                all_base_event_ids.add(base_event_id)
-
-        pipeline = self.redis_client.pipeline()
-        for key in attendance_keys:
-            pipeline.smembers(key)
-
-        attendance_results = self.retry_utils.get_retry_on_transient(pipeline.execute)
-        attendance_data_map = {}  # (ldap, event_id) -> attendance_record
+                attendance_lookups.append((cal_id, ldap, event_id))
+                all_base_event_ids.add(event_id.split("_")[0])
+
+        attendance_data_map = {}  # (cal_id, ldap, event_id) -> attendance records
+        if attendance_lookups:
+            pipeline = self.redis_client.pipeline()
+            for _, ldap, event_id in attendance_lookups:
+                pipeline.smembers(
+                    GOOGLE_EVENT_ATTENDANCE_KEY.format(event_id=event_id, ldap=ldap)
+                )
+            attendance_results = await self.retry_utils.get_async_retry_on_transient(
+                pipeline.execute
+            )
 
-        for key, raw_members in zip(attendance_keys, attendance_results):
-            ldap, event_id = attendance_key_to_ldap_event[key]
-            if raw_members:
+            for lookup, raw_members in zip(attendance_lookups, attendance_results):
+                if not raw_members:
+                    continue
                 records: list[dict[str, any]] = []
                 for member in raw_members:
                     try:
                         records.append(json.loads(member))
                     except json.JSONDecodeError:
+                        _, ldap, event_id = lookup
                         self.logger.warning(
-                            f"Failed to decode attendance data for {key}"
+                            "Failed to decode attendance data for %s",
+                            GOOGLE_EVENT_ATTENDANCE_KEY.format(
+                                event_id=event_id, ldap=ldap
+                            ),
                         )
-                        continue
                 if records:
-                    attendance_data_map[(ldap, event_id)] = records
+                    attendance_data_map[lookup] = records
 
-        event_detail_keys = [
-            GOOGLE_CALENDAR_EVENT_DETAIL_KEY.format(event_id=base_id)
-            for base_id in all_base_event_ids
-        ]
-
-        pipeline = self.redis_client.pipeline()
-        for key in event_detail_keys:
-            pipeline.get(key)
-
-        event_detail_results = self.retry_utils.get_retry_on_transient(pipeline.execute)
         base_event_detail_map = {}
+        base_event_ids = list(all_base_event_ids)
+        if base_event_ids:
+            pipeline = self.redis_client.pipeline()
+            for base_id in base_event_ids:
+                pipeline.get(GOOGLE_CALENDAR_EVENT_DETAIL_KEY.format(event_id=base_id))
+            event_detail_results = await self.retry_utils.get_async_retry_on_transient(
+                pipeline.execute
+            )
 
-        for base_id, raw_data in zip(all_base_event_ids, event_detail_results):
-            if raw_data:
-                try:
-                    base_event_detail_map[base_id] = json.loads(raw_data)
-                except json.JSONDecodeError:
-                    self.logger.warning(f"Failed to decode event detail for {base_id}")
-                    continue
-
-        calendar_name = self._get_calendar_name(calendar_id)
+            for base_id, raw_data in zip(base_event_ids, event_detail_results):
+                if raw_data:
+                    try:
+                        base_event_detail_map[base_id] = json.loads(raw_data)
+                    except json.JSONDecodeError:
+                        self.logger.warning(
+                            "Failed to decode event detail for %s", base_id
+                        )
 
-        for ldap in ldaps:
-            user_events = []
-            for event_id in ldap_event_ids_map.get(ldap, []):
-                attendance = attendance_data_map.get((ldap, event_id))
-                if not attendance:
-                    continue
+        result: dict[str, dict[str, list[dict[str, any]]]] = {}
+        for cal_id in calendar_ids:
+            calendar_name = calendar_name_map.get(cal_id)
+            events_by_ldap: dict[str, list[dict[str, any]]] = {}
+            for ldap in ldaps:
+                user_events = []
+                for event_id in event_ids_by_pair.get((cal_id, ldap), []):
+                    attendance = attendance_data_map.get((cal_id, ldap, event_id))
+                    if not attendance:
+                        continue
 
-                base_event_id = event_id.split("_")[0]
-                event_detail = base_event_detail_map.get(base_event_id)
-                if not event_detail:
-                    continue
+                    event_detail = base_event_detail_map.get(event_id.split("_")[0])
+                    if not event_detail:
+                        continue
 
-                user_events.append({
-                    "event_id": event_id,
-                    "summary": event_detail.get("summary", ""),
-                    "calendar_name": calendar_name,
-                    "is_recurring": event_detail.get("is_recurring", False),
-                    "attendance": attendance,
-                })
+                    user_events.append({
+                        "event_id": event_id,
+                        "summary": event_detail.get("summary", ""),
+                        "calendar_name": calendar_name,
+                        "is_recurring": event_detail.get("is_recurring", False),
+                        "attendance": attendance,
+                    })
 
-            result[ldap] = user_events
+                events_by_ldap[ldap] = user_events
+            result[cal_id] = events_by_ldap
 
         return result
 
-    def get_all_events_from_calendars(
+    async def get_all_events_from_calendars(
         self,
         calendar_ids: list[str],
         ldaps: list[str] | None,
@@ -197,6 +217,9 @@ class GoogleCalendarAnalyticsService:
         """
         Fetch all events (with attendance info) for multiple calendars.
 
+        All calendars are fetched together, so the number of Redis round trips
+        does not grow with the number of calendars.
+
         Args:
             calendar_id (list[str]): List of calendar ID.
             ldaps (list[str] | None): List of LDAP usernames.
@@ -207,22 +230,21 @@ class GoogleCalendarAnalyticsService:
             Dict[str, list[Dict]]: Each LDAP maps to a list of event dicts.
         """
         if not ldaps:
-            ldaps = self.ldap_service.get_all_active_interns_and_employees_ldaps()
+            ldaps = await self.ldap_service.get_all_active_interns_and_employees_ldaps()
         combined_result: dict[str, list[dict[str, any]]] = {ldap: [] for ldap in ldaps}
+        if not calendar_ids:
+            return combined_result
 
+        events_by_calendar = await self._get_events_by_calendar(
+            calendar_ids, ldaps, start_date, end_date
+        )
         for cal_id in calendar_ids:
-            single_result = self.get_all_events(
-                cal_id,
-                ldaps,
-                start_date,
-                end_date,
-            )
-            for ldap, events in single_result.items():
+            for ldap, events in events_by_calendar[cal_id].items():
                 combined_result[ldap].extend(events)
 
         return combined_result
 
-    def get_meeting_hours_for_user(
+    async def get_meeting_hours_for_user(
         self,
         calendar_ids: list[str],
         ldap_list: list[str],
@@ -232,6 +254,13 @@ class GoogleCalendarAnalyticsService:
         """
         Compute total meeting hours for each LDAP user across multiple calendars.
 
+        Sums the per-day meeting seconds rollups maintained by the calendar sync,
+        reading one hash per day in a single pipeline. Until the rollups have
+        been backfilled, falls back to summing the cached attendance records.
+
+        Days are whole UTC days: an event counts towards the range when its
+        scheduled start falls on a day between start_date and end_date.
+
         Args:
             calendar_ids (List[str]): List of calendar IDs to include.
             ldap_list (List[str]): List of LDAP usernames.
@@ -241,9 +270,49 @@ class GoogleCalendarAnalyticsService:
         Returns:
             Dict[str, float]: Mapping of LDAP -> total meeting hours.
         """
+        days = self.date_time_util.get_day_buckets(
+            start_date.astimezone(timezone.utc).date(),
+            end_date.astimezone(timezone.utc).date(),
+        )
+
+        pipeline = self.redis_client.pipeline()
+        pipeline.exists(GOOGLE_CALENDAR_MEETING_SECONDS_READY_KEY)
+        for day in days:
+            pipeline.hgetall(GOOGLE_CALENDAR_MEETING_SECONDS_KEY.format(day=day))
+        (
+            rollups_ready,
+            *day_totals,
+        ) = await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
+
+        if not rollups_ready:
+            return await self._sum_meeting_hours_from_events(
+                calendar_ids, ldap_list, start_date, end_date
+            )
+
+        calendar_id_set = set(calendar_ids)
+        seconds_by_user = {ldap: 0 for ldap in ldap_list}
+        for totals in day_totals:
+            for field, seconds in totals.items():
+                calendar_id, ldap = field.rsplit(":", 1)
+                if ldap in seconds_by_user and calendar_id in calendar_id_set:
+                    seconds_by_user[ldap] += int(seconds)
+
+        return {
+            ldap: round(seconds / 3600.0, 2)
+            for ldap, seconds in seconds_by_user.items()
+        }
+
+    async def _sum_meeting_hours_from_events(
+        self,
+        calendar_ids: list[str],
+        ldap_list: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, float]:
+        """Compute meeting hours by loading and summing every attendance record."""
         meeting_hours_by_user = {ldap: 0.0 for ldap in ldap_list}
 
-        all_events = self.get_all_events_from_calendars(
+        all_events = await self.get_all_events_from_calendars(
             calendar_ids=calendar_ids,
             ldaps=ldap_list,
             start_date=start_date,
@@ -1,4 +1,10 @@
-from backend.common.constants import CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY
+import asyncio
+
+from backend.common.constants import (
+    CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY,
+    GOOGLE_CHAT_DAILY_COUNT_KEY,
+    GOOGLE_CHAT_DAILY_COUNT_READY_KEY,
+)
 
 
 class GoogleChatAnalyticsService:
@@ -16,7 +22,7 @@ class GoogleChatAnalyticsService:
 
         Args:
             logger: The logger instance for logging messages.
-            redis_client: The Redis client instance.
+            redis_client: The asyncio Redis client instance.
             retry_utils: A RetryUtils for handling retries on transient errors.
             date_time_util: A DateTimeUtil instance for date and time manipulations.
             google_service: A GoogleService instance for interacting with Google APIs (e.g., Google Chat).
@@ -29,7 +35,7 @@ class GoogleChatAnalyticsService:
         self.google_service = google_service
         self.ldap_service = ldap_service
 
-    def get_chat_spaces_by_type(self, space_type):
+    async def get_chat_spaces_by_type(self, space_type):
         """
         Retrieve Google Chat spaces filtered by type.
 
@@ -44,10 +50,12 @@ class GoogleChatAnalyticsService:
         """
         if not space_type:
             raise ValueError("space_type must be provided and cannot be empty.")
-        space_dict = self.google_service.get_chat_spaces(space_type=space_type)
+        space_dict = await asyncio.to_thread(
+            self.google_service.get_chat_spaces, space_type=space_type
+        )
         return space_dict
 
-    def count_messages(
+    async def count_messages(
         self,
         space_ids: list[str] | None = None,
         sender_ldaps: list[str] | None = None,
@@ -55,12 +63,14 @@ class GoogleChatAnalyticsService:
         end_date: str | None = None,
     ) -> dict[str, dict[str, int]]:
         """
-        Count the number of messages in Redis sorted sets for each sender/space
-        pair within a specified date range.
+        Count the number of messages for each sender/space pair within a
+        specified date range.
 
-        Each Redis key is formatted as CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY, representing a
-        sorted set where each element corresponds to a message with a UNIX
-        timestamp as its score.
+        Counts are summed from the daily rollup hashes (GOOGLE_CHAT_DAILY_COUNT_KEY),
+        one per day in the range, so the cost does not grow with the number of
+        spaces and senders. Until the rollups have been backfilled, each pair
+        falls back to a ZCOUNT on its CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY
+        sorted set, where each element is a message scored by its UNIX timestamp.
 
         Args:
             space_ids (list[str] | None): List of space IDs whose messages
@@ -109,7 +119,9 @@ class GoogleChatAnalyticsService:
 
         if not space_ids:
             self.logger.info("[API] Fetching all space IDs via get_chat_spaces()...")
-            space_dict = self.google_service.get_chat_spaces(space_type="SPACE")
+            space_dict = await asyncio.to_thread(
+                self.google_service.get_chat_spaces, space_type="SPACE"
+            )
             space_ids = list(space_dict.keys())
 
         if not sender_ldaps:
@@ -117,9 +129,78 @@ class GoogleChatAnalyticsService:
                 "[API] Fetching active interns LDAP as default sender list..."
             )
             sender_ldaps = (
-                self.ldap_service.get_all_active_interns_and_employees_ldaps()
+                await self.ldap_service.get_all_active_interns_and_employees_ldaps()
             )
 
+        days = self.date_time_util.get_day_buckets(start_dt.date(), end_dt.date())
+        pipeline = self.redis_client.pipeline()
+        pipeline.exists(GOOGLE_CHAT_DAILY_COUNT_READY_KEY)
+        for day in days:
+            pipeline.hgetall(GOOGLE_CHAT_DAILY_COUNT_KEY.format(day=day))
+        (
+            rollups_ready,
+            *daily_counts,
+        ) = await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
+
+        if rollups_ready:
+            result = self._sum_daily_counts(daily_counts, space_ids, sender_ldaps)
+        else:
+            self.logger.info(
+                "[API] Daily chat count rollups not backfilled, counting from indexes."
+            )
+            result = await self._count_messages_from_index(
+                space_ids, sender_ldaps, start_dt, end_dt
+            )
+        self.logger.info(
+            f"[API] Finished processing chat message counts. Returning result with {len(result)} sender entries."
+        )
+
+        return {
+            "start_date": start_dt.isoformat(),
+            "end_date": end_dt.isoformat(),
+            "result": result,
+        }
+
+    def _sum_daily_counts(
+        self,
+        daily_counts: list[dict[str, str]],
+        space_ids: list[str],
+        sender_ldaps: list[str],
+    ) -> dict[str, dict[str, int]]:
+        """
+        Sum daily rollup hashes into per-sender, per-space message counts.
+
+        Args:
+            daily_counts (list[dict[str, str]]): One HGETALL result per day, each
+                mapping "{sender_ldap}:{space_id}" to that day's message count.
+            space_ids (list[str]): Space IDs to include.
+            sender_ldaps (list[str]): Sender LDAPs to include.
+
+        Returns:
+            dict[str, dict[str, int]]: Counts for every requested sender/space
+                pair, zero when the pair has no messages in the range.
+        """
+        if not space_ids:
+            return {}
+        result = {
+            sender_ldap: dict.fromkeys(space_ids, 0) for sender_ldap in sender_ldaps
+        }
+        for day_counts in daily_counts:
+            for field, count in day_counts.items():
+                sender_ldap, _, space_id = field.partition(":")
+                sender_counts = result.get(sender_ldap)
+                if sender_counts is not None and space_id in sender_counts:
+                    sender_counts[space_id] += int(count)
+        return result
+
+    async def _count_messages_from_index(
+        self,
+        space_ids: list[str],
+        sender_ldaps: list[str],
+        start_dt,
+        end_dt,
+    ) -> dict[str, dict[str, int]]:
+        """Count messages with one ZCOUNT per sender/space pair on the CREATED indexes."""
         pipeline = self.redis_client.pipeline()
         query_keys: list[tuple[str, str]] = []
 
@@ -131,7 +212,9 @@ class GoogleChatAnalyticsService:
                 pipeline.zcount(redis_key, start_dt.timestamp(), end_dt.timestamp())
                 query_keys.append((space_id, sender_ldap))
 
-        pipeline_results = self.retry_utils.get_retry_on_transient(pipeline.execute)
+        pipeline_results = await self.retry_utils.get_async_retry_on_transient(
+            pipeline.execute
+        )
         self.logger.debug(
             f"[API] Redis pipeline executed, received {len(pipeline_results)} results."
         )
@@ -143,12 +226,4 @@ class GoogleChatAnalyticsService:
                 result[sender_ldap] = {}
 
             result[sender_ldap][space_id] = count
-        self.logger.info(
-            f"[API] Finished processing chat message counts. Returning result with {len(result)} sender entries."
-        )
-
-        return {
-            "start_date": start_dt.isoformat(),
-            "end_date": end_dt.isoformat(),
-            "result": result,
-        }
+        return result
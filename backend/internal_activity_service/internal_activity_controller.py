@@ -73,6 +73,16 @@ class GoogleChatCountRequest(BaseModel):
     endDate: str | None = None
 
 
+def _summary_message(subject: str, unavailable_sources: list[str]) -> str:
+    """Build the summary response message, naming any sources left out."""
+    if not unavailable_sources:
+        return f"{subject} fetched successfully"
+    return (
+        f"{subject} fetched with partial results; "
+        f"unavailable sources: {', '.join(unavailable_sources)}"
+    )
+
+
 class SummaryRequest(BaseModel):
     startDate: str | None = None
     endDate: str | None = None
@@ -224,7 +234,9 @@ class InternalActivityController:
 
     async def get_chat_spaces_route(self, spaceType: str = "SPACE"):
         """API endpoint to retrieve chat spaces of a specified type."""
-        spaces = self.google_chat_analytics_service.get_chat_spaces_by_type(spaceType)
+        spaces = await self.google_chat_analytics_service.get_chat_spaces_by_type(
+            spaceType
+        )
         return api_response(
             success=True,
             message="Successfully.",
@@ -234,7 +246,7 @@ class InternalActivityController:
 
     async def get_google_chat_messages_count(self, body: GoogleChatCountRequest):
         """Count chat messages in Redis within a specified date range."""
-        result = self.google_chat_analytics_service.count_messages(
+        result = await self.google_chat_analytics_service.count_messages(
             space_ids=body.spaceIds,
             sender_ldaps=body.ldaps,
             start_date=body.startDate,
@@ -249,7 +261,7 @@ class InternalActivityController:
 
     async def get_issue_detail_batch(self, body: JiraDetailBatchRequest):
         """Get Jira issue details in batch from Redis."""
-        result = self.jira_analytics_service.process_get_issue_detail_batch(
+        result = await self.jira_analytics_service.process_get_issue_detail_batch(
             body.issueIds
         )
         return api_response(
@@ -261,7 +273,7 @@ class InternalActivityController:
 
     async def get_jira_brief(self, body: JiraBriefRequest):
         """Get Jira issue IDs in Redis by status."""
-        result = self.jira_analytics_service.get_issues_summary(
+        result = await self.jira_analytics_service.get_issues_summary(
             status_list=body.statusList,
             ldaps=body.ldaps,
             project_ids=body.projectIds,
@@ -295,7 +307,7 @@ class InternalActivityController:
         ),
     ):
         """Retrieve Microsoft 365 user LDAP information."""
-        data = self.ldap_service.get_ldaps_by_status_and_group(
+        data = await self.ldap_service.get_ldaps_by_status_and_group(
             status=status,
             groups=groups,
         )
@@ -308,7 +320,7 @@ class InternalActivityController:
 
     async def count_microsoft_chat_messages(self, body: MicrosoftChatCountRequest):
         """Count Microsoft chat messages in Redis by sender."""
-        response = self.microsoft_chat_analytics_service.count_microsoft_chat_messages_in_date_range(
+        response = await self.microsoft_chat_analytics_service.count_microsoft_chat_messages_in_date_range(
             ldap_list=body.ldaps,
             start_date=body.startDate,
             end_date=body.endDate,
@@ -322,7 +334,7 @@ class InternalActivityController:
 
     async def get_all_jira_projects_api(self):
         """API endpoint to get a mapping of all project IDs to their names."""
-        jira_data = self.jira_analytics_service.get_all_jira_projects()
+        jira_data = await self.jira_analytics_service.get_all_jira_projects()
         return api_response(
             success=True,
             message="Fetch jira projects successful",
@@ -332,7 +344,7 @@ class InternalActivityController:
 
     async def get_all_calendars_api(self):
         """API endpoint to get Google Calendar list from Redis."""
-        calendar_data = self.google_calendar_analytics_service.get_all_calendars()
+        calendar_data = await self.google_calendar_analytics_service.get_all_calendars()
         return api_response(
             success=True,
             message="Calendar list fetched successfully.",
@@ -356,7 +368,7 @@ class InternalActivityController:
         ldaps = body.ldaps or []
 
         calendar_data = (
-            self.google_calendar_analytics_service.get_all_events_from_calendars(
+            await self.google_calendar_analytics_service.get_all_events_from_calendars(
                 body.calendarIds,
                 ldaps,
                 start_dt,
@@ -372,7 +384,7 @@ class InternalActivityController:
 
     async def get_gerrit_stats(self, body: GerritStatsRequest):
         """API endpoint to retrieve aggregated Gerrit stats."""
-        response = self.gerrit_analytics_service.get_gerrit_stats(
+        response = await self.gerrit_analytics_service.get_gerrit_stats(
             ldap_list=body.ldaps,
             start_date_str=body.startDate,
             end_date_str=body.endDate,
@@ -389,7 +401,7 @@ class InternalActivityController:
 
     async def get_gerrit_projects(self):
         """API endpoint to retrieve the list of Gerrit projects."""
-        projects = self.gerrit_analytics_service.get_gerrit_projects()
+        projects = await self.gerrit_analytics_service.get_gerrit_projects()
         return api_response(
             success=True,
             message="Successfully retrieved Gerrit projects.",
@@ -399,12 +411,12 @@ class InternalActivityController:
 
     async def get_summary(self, body: SummaryRequest):
         """API endpoint to retrieve the summary on the dashboard."""
-        summary_data = self.summary_service.get_summary(
+        summary_data, unavailable_sources = await self.summary_service.get_summary(
             body.startDate, body.endDate, body.groups, body.includeTerminated
         )
         return api_response(
             success=True,
-            message="Summary fetched successfully",
+            message=_summary_message("Summary", unavailable_sources),
             data=summary_data,
             status_code=HTTPStatus.OK,
         )
@@ -431,14 +443,17 @@ class InternalActivityController:
             PermissionError: When the view_personal_summary LaunchDarkly flag is disabled for the user.
         """
         if self.launchdarkly_service.is_view_personal_summary_enabled(current_user):
-            summary_data = self.summary_service.get_my_summary(
+            (
+                summary_data,
+                unavailable_sources,
+            ) = await self.summary_service.get_my_summary(
                 user=current_user,
                 start_date=body.start_date,
                 end_date=body.end_date,
             )
             return api_response(
                 success=True,
-                message="My summary fetched successfully",
+                message=_summary_message("My summary", unavailable_sources),
                 data=summary_data,
                 status_code=HTTPStatus.OK,
             )
@@ -3,28 +3,42 @@ from backend.common.constants import (
     JIRA_PROJECTS_KEY,
     JiraIssueStatus,
     JIRA_LDAP_PROJECT_STATUS_INDEX_KEY,
+    JIRA_STORY_POINTS_KEY,
+    JIRA_STORY_POINTS_READY_KEY,
+    AnalyticsSource,
 )
 from itertools import product
 from collections import defaultdict
 
 
 class JiraAnalyticsService:
-    def __init__(self, logger, redis_client, date_time_util, ldap_service, retry_utils):
+    def __init__(
+        self,
+        logger,
+        redis_client,
+        date_time_util,
+        ldap_service,
+        retry_utils,
+        result_cache=None,
+    ):
         """
         Initializes the MicrosoftChatAnalyticsService.
 
         Args:
             logger: The logger instance for logging messages.
-            redis_client: The Redis client instance.
+            redis_client: The asyncio Redis client instance.
             date_time_util: A DateTimeUtil instance for handling date and time operations.
             ldap_service: A LdapService instance for performing LDAP lookups.
             retry_utils: A RetryUtils for handling retries on transient errors.
+            result_cache: Optional AnalyticsResultCache serving repeated queries
+                over closed date ranges.
         """
         self.logger = logger
         self.redis_client = redis_client
         self.date_time_util = date_time_util
         self.ldap_service = ldap_service
         self.retry_utils = retry_utils
+        self.result_cache = result_cache
 
         if not self.logger:
             raise ValueError("Logger not provided.")
@@ -37,19 +51,19 @@ class JiraAnalyticsService:
         if not self.ldap_service:
             raise ValueError("Ldap service not provided.")
 
-    def get_all_jira_projects(self) -> dict[str, str]:
+    async def get_all_jira_projects(self) -> dict[str, str]:
         """
         Retrieve all Jira project names stored in Redis hash 'jira:project'.
 
         Returns:
             dict[str, str]: Mapping of project_id (as str) to project_name
         """
-        project_data = self.retry_utils.get_retry_on_transient(
+        project_data = await self.retry_utils.get_async_retry_on_transient(
             self.redis_client.hgetall, JIRA_PROJECTS_KEY
         )
         return project_data
 
-    def get_issues_summary(
+    async def get_issues_summary(
         self,
         status_list: list[JiraIssueStatus] | None,
         ldaps: list[str] | None,
@@ -114,8 +128,11 @@ class JiraAnalyticsService:
             JiraIssueStatus.IN_PROGRESS,
             JiraIssueStatus.TODO,
         ]
-        ldaps = ldaps or self.ldap_service.get_all_active_interns_and_employees_ldaps()
-        project_ids = project_ids or self.get_all_jira_projects()
+        ldaps = (
+            ldaps
+            or await self.ldap_service.get_all_active_interns_and_employees_ldaps()
+        )
+        project_ids = project_ids or await self.get_all_jira_projects()
 
         self.logger.info(
             "Get jira issues summary with status_list=%s, ldaps=%s, project_ids=%s, start_date=%s, end_date=%s",
@@ -126,6 +143,44 @@ class JiraAnalyticsService:
             end_date,
         )
 
+        def compute():
+            return self._aggregate_issues_summary(
+                status_list,
+                ldaps,
+                project_ids,
+                start_dt,
+                end_dt,
+                start_score,
+                end_score,
+            )
+
+        if not self.result_cache:
+            return await compute()
+        return await self.result_cache.get_or_compute(
+            "jira_issues_summary",
+            {
+                "statuses": sorted(status.value for status in status_list),
+                "ldaps": sorted(ldaps),
+                "project_ids": sorted(project_ids),
+                "start": start_score,
+                "end": end_score,
+            },
+            [AnalyticsSource.JIRA],
+            end_dt,
+            compute,
+        )
+
+    async def _aggregate_issues_summary(
+        self,
+        status_list: list[JiraIssueStatus],
+        ldaps: list[str],
+        project_ids,
+        start_dt,
+        end_dt,
+        start_score: int,
+        end_score: int,
+    ) -> dict[str, any]:
+        """Read the issue indexes and story points for resolved filters."""
         final_result: dict[str, dict[str, list[str] | float]] = defaultdict(
             lambda: defaultdict(list)
         )
@@ -156,59 +211,88 @@ class JiraAnalyticsService:
                 first_pipeline.smembers(redis_key)
             request_keys_and_info.append((ldap, status))
 
-        first_results = self.retry_utils.get_retry_on_transient(first_pipeline.execute)
-
-        if not should_calculate_story_points:
-            for (ldap, status), result in zip(request_keys_and_info, first_results):
-                if result:
-                    final_result[ldap][status.value].extend(list(result))
-                    self.logger.debug(
-                        "Redis result for ldap=%s, status=%s: %s", ldap, status, result
-                    )
+        story_point_ldaps = []
+        if should_calculate_story_points:
+            first_pipeline.exists(JIRA_STORY_POINTS_READY_KEY)
+            for ldap, project_id in product(ldaps, project_ids):
+                first_pipeline.hgetall(
+                    JIRA_STORY_POINTS_KEY.format(ldap=ldap, project_id=project_id)
+                )
+                story_point_ldaps.append(ldap)
 
-            return final_result
-        else:
-            story_point_pipeline = self.redis_client.pipeline()
+        pipeline_results = await self.retry_utils.get_async_retry_on_transient(
+            first_pipeline.execute
+        )
+        first_results = pipeline_results[: len(request_keys_and_info)]
 
-            issue_info_for_story_point_retrieval = []
-            for (ldap, status), result in zip(request_keys_and_info, first_results):
+        for (ldap, status), result in zip(request_keys_and_info, first_results):
+            if result:
+                final_result[ldap][status.value].extend(list(result))
                 self.logger.debug(
                     "Redis result for ldap=%s, status=%s: %s", ldap, status, result
                 )
 
-                if JiraIssueStatus.DONE != status:
-                    final_result[ldap][status.value].extend(list(result))
-                else:
-                    final_result[ldap][status.value].extend(result)
+        if not should_calculate_story_points:
+            return final_result
 
-                    for issue_id in result:
-                        story_point_pipeline.hget(
-                            JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id),
-                            "story_point",
+        story_points_ready = pipeline_results[len(request_keys_and_info)]
+        story_point_totals = pipeline_results[len(request_keys_and_info) + 1 :]
+        if story_points_ready:
+            for ldap, day_totals in zip(story_point_ldaps, story_point_totals):
+                for finish_date, story_point in day_totals.items():
+                    if start_score <= int(finish_date) <= end_score:
+                        final_result[ldap]["done_story_points_total"] += float(
+                            story_point
                         )
-                        issue_info_for_story_point_retrieval.append((issue_id, ldap))
-
-            story_point_results = self.retry_utils.get_retry_on_transient(
-                story_point_pipeline.execute
+        else:
+            self.logger.warning(
+                "Jira story points totals are not built yet; reading story points per issue."
             )
+            await self._sum_story_points_per_issue(final_result, ldaps)
+
+        return dict(final_result)
+
+    async def _sum_story_points_per_issue(
+        self, final_result: dict, ldaps: list[str]
+    ) -> None:
+        """
+        Add up story points of the DONE issues already collected in `final_result`
+        by reading each issue's hash. Used until the story points totals are built.
+
+        Args:
+            final_result (dict): Per-ldap summary whose DONE issue lists are read
+                and whose "done_story_points_total" entries are updated in place.
+            ldaps (list[str]): The ldaps to sum story points for.
+        """
+        story_point_pipeline = self.redis_client.pipeline()
+        issue_info_for_story_point_retrieval = []
+        for ldap in ldaps:
+            for issue_id in final_result[ldap][JiraIssueStatus.DONE.value]:
+                story_point_pipeline.hget(
+                    JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id),
+                    "story_point",
+                )
+                issue_info_for_story_point_retrieval.append((issue_id, ldap))
 
-            for story_point_data, (issue_id, ldap) in zip(
-                story_point_results, issue_info_for_story_point_retrieval
-            ):
-                if story_point_data:
-                    story_point = float(story_point_data)
-                    final_result[ldap]["done_story_points_total"] += story_point
+        story_point_results = await self.retry_utils.get_async_retry_on_transient(
+            story_point_pipeline.execute
+        )
 
-                    self.logger.debug(
-                        "Added story_point=%s to ldap=%s, total now=%s",
-                        story_point,
-                        ldap,
-                        final_result[ldap]["done_story_points_total"],
-                    )
+        for story_point_data, (issue_id, ldap) in zip(
+            story_point_results, issue_info_for_story_point_retrieval
+        ):
+            if story_point_data:
+                story_point = float(story_point_data)
+                final_result[ldap]["done_story_points_total"] += story_point
 
-            return dict(final_result)
+                self.logger.debug(
+                    "Added story_point=%s to ldap=%s, total now=%s",
+                    story_point,
+                    ldap,
+                    final_result[ldap]["done_story_points_total"],
+                )
 
-    def process_get_issue_detail_batch(self, issue_ids: list[str]) -> list[dict]:
+    async def process_get_issue_detail_batch(self, issue_ids: list[str]) -> list[dict]:
         """
         Fetch issue details from Redis and return as a list of dicts.
 
@@ -236,7 +320,9 @@ class JiraAnalyticsService:
             redis_key = JIRA_ISSUE_DETAILS_KEY.format(issue_id=issue_id)
             pipeline.hgetall(redis_key)
 
-        pipeline_results = self.retry_utils.get_retry_on_transient(pipeline.execute)
+        pipeline_results = await self.retry_utils.get_async_retry_on_transient(
+            pipeline.execute
+        )
 
         all_fields = {
             field
@@ -1,4 +1,6 @@
+import copy
 import itertools
+import time
 
 from backend.common.constants import (
     MicrosoftAccountStatus,
@@ -6,22 +8,81 @@ from backend.common.constants import (
     LDAP_KEY_TEMPLATE,
 )
 
+# The directory only changes when the Microsoft member sync runs, which
+# invalidates this process's cache directly; the TTL bounds how stale other
+# worker processes can be.
+DEFAULT_LDAP_CACHE_TTL_SECONDS = 60
+
 
 class LdapService:
-    def __init__(self, logger, redis_client, retry_utils):
+    def __init__(
+        self,
+        logger,
+        redis_client,
+        retry_utils,
+        cache_ttl_seconds: float = DEFAULT_LDAP_CACHE_TTL_SECONDS,
+    ):
         """
         Initializes the LdapService with necessary clients and logger.
 
         Args:
             logger: The logger instance for logging messages.
-            redis_client: The Redis client instance.
+            redis_client: The asyncio Redis client instance.
             retry_utils: A RetryUtils for handling retries on transient errors.
+            cache_ttl_seconds: How long directory lookups are served from the
+                in-process cache before Redis is read again. 0 disables caching.
         """
         self.logger = logger
         self.redis_client = redis_client
         self.retry_utils = retry_utils
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cache = {}  # cache key -> (expires_at, value)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached directory lookup so the next call reads Redis."""
+        self._cache.clear()
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Report how effective the directory cache has been.
+
+        Returns:
+            dict[str, int]: Hit and miss counts and the number of cached lookups.
+        """
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+        }
+
+    async def _get_cached(self, cache_key: tuple, loader):
+        """
+        Serve a directory lookup from the cache, loading it on a miss or expiry.
+
+        A copy is returned each time so callers cannot mutate the cached value.
+
+        Args:
+            cache_key (tuple): Identifies the lookup and its arguments.
+            loader: Coroutine function reading the lookup from Redis.
 
-    def get_ldaps_by_status_and_group(
+        Returns:
+            The cached or freshly loaded lookup result.
+        """
+        now = time.monotonic()
+        entry = self._cache.get(cache_key)
+        if entry and entry[0] > now:
+            self.cache_hits += 1
+            return copy.deepcopy(entry[1])
+
+        self.cache_misses += 1
+        value = await loader()
+        if self.cache_ttl_seconds > 0:
+            self._cache[cache_key] = (now + self.cache_ttl_seconds, value)
+        return copy.deepcopy(value)
+
+    async def get_ldaps_by_status_and_group(
         self,
         status: MicrosoftAccountStatus,
         groups: list[MicrosoftGroups],
@@ -54,7 +115,7 @@ class LdapService:
                 }
 
         Example:
-            >>> service.get_ldaps_by_status_and_group(
+            >>> await service.get_ldaps_by_status_and_group(
                     status=MicrosoftAccountStatus.ACTIVE,
                     groups=[MicrosoftGroups.EMPLOYEES, MicrosoftGroups.INTERNS]
                 )
@@ -81,6 +142,21 @@ class LdapService:
             ]
         )
 
+        return await self._get_cached(
+            (
+                "ldaps_by_status_and_group",
+                status.value,
+                tuple(g.value for g in groups),
+            ),
+            lambda: self._load_ldaps_by_status_and_group(status_list, groups),
+        )
+
+    async def _load_ldaps_by_status_and_group(
+        self,
+        status_list: list[MicrosoftAccountStatus],
+        groups: list[MicrosoftGroups],
+    ) -> dict[str, dict[str, dict[str, str]]]:
+        """Read the LDAP hashes for every group and status combination from Redis."""
         self.logger.debug(f"Resolved groups: {[g.value for g in groups]}")
         self.logger.debug(f"Resolved status_list: {[s.value for s in status_list]}")
 
@@ -94,7 +170,7 @@ class LdapService:
             pipeline.hgetall(key)
             key_map[key] = (group.value, status.value)
 
-        results = self.retry_utils.get_retry_on_transient(pipeline.execute)
+        results = await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
 
         organized_results = {}
         for key, hash_dict in zip(key_map.keys(), results):
@@ -107,13 +183,17 @@ class LdapService:
 
         return organized_results
 
-    def get_all_ldaps(self) -> list[str]:
+    async def get_all_ldaps(self) -> list[str]:
         """
         Retrieve all LDAPs across all Microsoft groups and both ACTIVE and TERMINATED statuses.
 
         Returns:
             list[str]: Unique list of LDAP identifiers.
         """
+        return await self._get_cached(("all_ldaps",), self._load_all_ldaps)
+
+    async def _load_all_ldaps(self) -> list[str]:
+        """Read every LDAP across all groups and statuses from Redis."""
         keys: list[str] = []
         for group in MicrosoftGroups:
             for status in (
@@ -131,7 +211,7 @@ class LdapService:
         for k in keys:
             pipeline.hkeys(k)
 
-        results = self.retry_utils.get_retry_on_transient(pipeline.execute)
+        results = await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
 
         ldap_set: set[str] = set()
         if results:
@@ -141,29 +221,42 @@ class LdapService:
 
         return list(ldap_set)
 
-    def get_active_interns_ldaps(self) -> list[str]:
+    async def get_active_interns_ldaps(self) -> list[str]:
         """
         Retrieve all LDAPs for active interns directly from Redis.
 
         Returns:
             list[str]: List of LDAP identifiers for active interns.
         """
+        return await self._get_cached(
+            ("active_interns_ldaps",), self._load_active_interns_ldaps
+        )
+
+    async def _load_active_interns_ldaps(self) -> list[str]:
+        """Read the active intern LDAPs from Redis."""
         redis_key = LDAP_KEY_TEMPLATE.format(
             account_status=MicrosoftAccountStatus.ACTIVE.value,
             group=MicrosoftGroups.INTERNS.value,
         )
-        ldaps = self.retry_utils.get_retry_on_transient(
+        ldaps = await self.retry_utils.get_async_retry_on_transient(
             self.redis_client.hkeys, redis_key
         )
         return ldaps if ldaps else []
 
-    def get_all_active_interns_and_employees_ldaps(self) -> list[str]:
+    async def get_all_active_interns_and_employees_ldaps(self) -> list[str]:
         """
         Retrieve all LDAPs for active interns and employees directly from Redis.
 
         Returns:
             list[str]: List of LDAP identifiers for active interns and employees.
         """
+        return await self._get_cached(
+            ("active_interns_and_employees_ldaps",),
+            self._load_active_interns_and_employees_ldaps,
+        )
+
+    async def _load_active_interns_and_employees_ldaps(self) -> list[str]:
+        """Read the active intern and employee LDAPs from Redis."""
         keys: list[str] = []
         for group in [MicrosoftGroups.INTERNS, MicrosoftGroups.EMPLOYEES]:
             keys.append(
@@ -177,7 +270,7 @@ class LdapService:
         for k in keys:
             pipeline.hkeys(k)
 
-        results = self.retry_utils.get_retry_on_transient(pipeline.execute)
+        results = await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
 
         ldap_set: set[str] = set()
         if results:
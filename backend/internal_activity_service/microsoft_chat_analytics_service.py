@@ -1,5 +1,7 @@
 from backend.common.constants import (
     MICROSOFT_CHAT_MESSAGES_INDEX_KEY,
+    MICROSOFT_CHAT_DAILY_COUNT_KEY,
+    MICROSOFT_CHAT_DAILY_COUNT_READY_KEY,
     MicrosoftChatMessagesChangeType,
 )
 
@@ -11,7 +13,7 @@ class MicrosoftChatAnalyticsService:
 
         Args:
             logger: The logger instance for logging messages.
-            redis_client: The Redis client instance.
+            redis_client: The asyncio Redis client instance.
             date_time_util: A DateTimeUtil instance for handling date and time operations.
             ldap_service: A LdapService instance for performing LDAP lookups.
             retry_utils: A RetryUtils for handling retries on transient errors.
@@ -22,7 +24,7 @@ class MicrosoftChatAnalyticsService:
         self.ldap_service = ldap_service
         self.retry_utils = retry_utils
 
-    def count_microsoft_chat_messages_in_date_range(
+    async def count_microsoft_chat_messages_in_date_range(
         self,
         ldap_list: list[str] | None = None,
         start_date: str | None = None,
@@ -38,8 +40,10 @@ class MicrosoftChatAnalyticsService:
         `date_time_util.get_start_end_timestamps`, which falls back to the default
         time range configured in the utility.
 
-        The method counts messages by querying Redis sorted sets (ZCOUNT) for each
-        LDAP in the date range. The Redis keys are formatted using
+        The method sums the daily rollup hashes (`MICROSOFT_CHAT_DAILY_COUNT_KEY`),
+        one per day in the range. Until the rollups have been backfilled, it falls
+        back to querying Redis sorted sets (ZCOUNT) for each LDAP in the date range.
+        The Redis keys are formatted using
 
         `MICROSOFT_CHAT_MESSAGES_INDEX_KEY` with:
             - message_status = MicrosoftChatMessagesChangeType.CREATED
@@ -69,7 +73,7 @@ class MicrosoftChatAnalyticsService:
                 }
 
         Example:
-            >>> count_microsoft_chat_messages_in_date_range(
+            >>> await count_microsoft_chat_messages_in_date_range(
             ...     ldap_list=["alice", "bob"],
             ...     start_date="2024-06-01",
             ...     end_date="2024-06-28T"
@@ -91,10 +95,52 @@ class MicrosoftChatAnalyticsService:
         self.logger.info(f"Date range from {start_dt_utc} to {end_dt_utc}")
 
         if not ldap_list:
-            ldap_list = self.ldap_service.get_all_active_interns_and_employees_ldaps()
+            ldap_list = (
+                await self.ldap_service.get_all_active_interns_and_employees_ldaps()
+            )
             self.logger.info(
                 f"Fetched all active interns and employees LDAP, count = {len(ldap_list)}."
             )
+        days = self.date_time_util.get_day_buckets(
+            start_dt_utc.date(), end_dt_utc.date()
+        )
+        pipeline = self.redis_client.pipeline()
+        pipeline.exists(MICROSOFT_CHAT_DAILY_COUNT_READY_KEY)
+        if ldap_list:
+            for day in days:
+                pipeline.hmget(
+                    MICROSOFT_CHAT_DAILY_COUNT_KEY.format(day=day), ldap_list
+                )
+        (
+            rollups_ready,
+            *daily_counts,
+        ) = await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
+
+        if rollups_ready:
+            result_by_ldap = dict.fromkeys(ldap_list, 0)
+            for day_counts in daily_counts:
+                for ldap, count in zip(ldap_list, day_counts):
+                    if count:
+                        result_by_ldap[ldap] += int(count)
+        else:
+            self.logger.info(
+                "Daily chat count rollups not backfilled, counting from indexes."
+            )
+            result_by_ldap = await self._count_messages_from_index(
+                ldap_list, start_timestamp, end_timestamp
+            )
+        self.logger.debug(f"Final count result: {result_by_ldap}")
+
+        return {
+            "start_date": start_dt_utc.isoformat(),
+            "end_date": end_dt_utc.isoformat(),
+            "result": result_by_ldap,
+        }
+
+    async def _count_messages_from_index(
+        self, ldap_list: list[str], start_timestamp: float, end_timestamp: float
+    ) -> dict[str, int]:
+        """Count messages with one ZCOUNT per LDAP on the CREATED indexes."""
         pipeline = self.redis_client.pipeline()
         for ldap in ldap_list:
             redis_key = MICROSOFT_CHAT_MESSAGES_INDEX_KEY.format(
@@ -106,14 +152,7 @@ class MicrosoftChatAnalyticsService:
                 f"ZCOUNT key: {redis_key} for timestamp range: {start_timestamp} - {end_timestamp}"
             )
 
-        counts = self.retry_utils.get_retry_on_transient(pipeline.execute)
+        counts = await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
         self.logger.debug(f"Redis pipeline zcount results: {counts}")
 
-        result_by_ldap = dict(zip(ldap_list, counts))
-        self.logger.debug(f"Final count result: {result_by_ldap}")
-
-        return {
-            "start_date": start_dt_utc.isoformat(),
-            "end_date": end_dt_utc.isoformat(),
-            "result": result_by_ldap,
-        }
+        return dict(zip(ldap_list, counts))
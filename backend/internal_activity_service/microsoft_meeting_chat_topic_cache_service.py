@@ -15,7 +15,7 @@ class MicrosoftMeetingChatTopicCacheService:
         """
         Args:
             logger: The logger instance for logging messages.
-            redis_client: The Redis client instance.
+            redis_client: The asyncio Redis client instance.
             microsoft_service: The MicrosoftService instance.
             retry_utils: A RetryUtils for handling retries on transient errors.
         """
@@ -32,7 +32,7 @@ class MicrosoftMeetingChatTopicCacheService:
         Raises:
             ValueError: If Redis client creation fails.
         """
-        chat_topics = self.retry_utils.get_retry_on_transient(
+        chat_topics = await self.retry_utils.get_async_retry_on_transient(
             self.redis_client.hgetall, MICROSOFT_CHAT_TOPICS
         )
         if chat_topics:
@@ -98,7 +98,7 @@ class MicrosoftMeetingChatTopicCacheService:
                 topics_to_cache[chat.id] = chat.topic
                 pipeline.hset(MICROSOFT_CHAT_TOPICS, chat.id, chat.topic)
 
-        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        await self.retry_utils.get_async_retry_on_transient(pipeline.execute)
 
         self.logger.info(f"Cached {len(topics_to_cache)} chat topics to Redis.")
 
@@ -1,12 +1,25 @@
+import asyncio
+
 from backend.common.constants import MicrosoftAccountStatus, MicrosoftGroups
-from backend.common.constants import JiraIssueStatus
+from backend.common.constants import AnalyticsSource, JiraIssueStatus
 from backend.dto.user_context_dto import UserContextDto
 from backend.dto.internal_activity_summary_response_dto import ActivitySummaryDto
 
+SUMMARY_SOURCE_MICROSOFT_CHAT = "microsoft_chat"
+SUMMARY_SOURCE_GOOGLE_CHAT = "google_chat"
+SUMMARY_SOURCE_MEETING_HOURS = "meeting_hours"
+SUMMARY_SOURCE_GERRIT = "gerrit"
+SUMMARY_SOURCE_JIRA = "jira"
+
+# Upper bound on any single source. A slow source degrades the summary to a
+# partial one instead of holding the whole request past the client's timeout.
+DEFAULT_SUMMARY_SOURCE_TIMEOUT_SECONDS = 30
+
 
 class SummaryService:
     def __init__(
         self,
+        logger,
         ldap_service,
         microsoft_chat_analytics_service,
         google_calendar_analytics_service,
@@ -14,11 +27,14 @@ class SummaryService:
         gerrit_analytics_service,
         jira_analytics_service,
         date_time_util,
+        source_timeout_seconds: float = DEFAULT_SUMMARY_SOURCE_TIMEOUT_SECONDS,
+        result_cache=None,
     ):
         """
         Initialize the SummaryService with required dependencies.
 
         Args:
+            logger: The logger instance for logging messages.
             ldap_service: LdapService instance.
             microsoft_chat_analytics_service: MicrosoftChatAnalyticsService instance.
             google_calendar_analytics_service: GoogleCalendarAnalyticsService instance.
@@ -26,7 +42,11 @@ class SummaryService:
             date_time_util: DateTimeUtil instance.
             gerrit_analytics_service: GerritAnalyticsService instance.
             date_time_util: DateTimeUtil instance.
+            source_timeout_seconds: Timeout applied to each summary source.
+            result_cache: Optional AnalyticsResultCache serving repeated summaries
+                over closed date ranges.
         """
+        self.logger = logger
         self.ldap_service = ldap_service
         self.microsoft_chat_analytics_service = microsoft_chat_analytics_service
         self.google_calendar_analytics_service = google_calendar_analytics_service
@@ -34,54 +54,121 @@ class SummaryService:
         self.gerrit_analytics_service = gerrit_analytics_service
         self.jira_analytics_service = jira_analytics_service
         self.date_time_util = date_time_util
+        self.source_timeout_seconds = source_timeout_seconds
+        self.result_cache = result_cache
 
-    def _search_summary_data(self, ldaps: list[str], start_date, end_date) -> list:
-        """Private method to fetch summary data for given LDAPs"""
-        if not ldaps:
-            return []
+    async def _fetch_source(self, source: str, awaitable, default):
+        """
+        Await one summary source under the per-source timeout.
 
-        start_dt, end_dt = self.date_time_util.get_start_end_timestamps(
-            start_date, end_date
-        )
+        A source that times out or raises is logged and replaced by ``default``
+        so the remaining sources still make it into the summary.
 
-        ms_chat_data = self.microsoft_chat_analytics_service.count_microsoft_chat_messages_in_date_range(
-            ldap_list=ldaps,
-            start_date=start_date,
-            end_date=end_date,
-        ).get("result", {})
+        Args:
+            source (str): Source name used in logs and in the unavailable list.
+            awaitable: Coroutine producing the source's data.
+            default: Value substituted when the source is unavailable.
 
-        google_chat_data = self.google_chat_analytics_service.count_messages(
-            sender_ldaps=ldaps,
-            start_date=start_date,
-            end_date=end_date,
-        ).get("result", {})
+        Returns:
+            tuple: ``(data, available)`` where ``available`` is False when
+                ``default`` was substituted.
+        """
+        try:
+            data = await asyncio.wait_for(
+                awaitable, timeout=self.source_timeout_seconds
+            )
+            return data, True
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                "[SummaryService] Source %s timed out after %ss; returning partial summary.",
+                source,
+                self.source_timeout_seconds,
+            )
+        except Exception as e:
+            self.logger.error(
+                "[SummaryService] Source %s failed; returning partial summary: %s",
+                source,
+                e,
+                exc_info=True,
+            )
+        return default, False
 
-        calendars = self.google_calendar_analytics_service.get_all_calendars()
+    async def _get_meeting_hours(self, ldaps: list[str], start_dt, end_dt) -> dict:
+        """Resolve every calendar, then total meeting hours across them."""
+        calendars = await self.google_calendar_analytics_service.get_all_calendars()
         calendar_ids = [c["id"] for c in calendars]
 
-        meeting_hours_data = (
-            self.google_calendar_analytics_service.get_meeting_hours_for_user(
-                calendar_ids=calendar_ids,
-                ldap_list=ldaps,
-                start_date=start_dt,
-                end_date=end_dt,
-            )
-        )
-
-        gerrit_stats = self.gerrit_analytics_service.get_gerrit_stats(
+        return await self.google_calendar_analytics_service.get_meeting_hours_for_user(
+            calendar_ids=calendar_ids,
             ldap_list=ldaps,
-            start_date_str=start_date,
-            end_date_str=end_date,
+            start_date=start_dt,
+            end_date=end_dt,
         )
 
-        jira_summary = self.jira_analytics_service.get_issues_summary(
-            status_list=[JiraIssueStatus.DONE],
-            ldaps=ldaps,
-            project_ids=None,
-            start_date=start_date,
-            end_date=end_date,
+    async def _search_summary_data(
+        self, ldaps: list[str], start_date, end_date
+    ) -> tuple[list, list[str]]:
+        """
+        Private method to fetch summary data for given LDAPs.
+
+        The five sources are independent, so they are awaited concurrently and
+        the summary costs about as much as its slowest source. Each source runs
+        under its own timeout; one that times out or fails contributes zeros and
+        is reported back instead of failing the whole summary.
+
+        Returns:
+            tuple[list, list[str]]: The per-LDAP summary rows, and the names of
+                the sources that were unavailable (empty when complete).
+        """
+        if not ldaps:
+            return [], []
+
+        start_dt, end_dt = self.date_time_util.get_start_end_timestamps(
+            start_date, end_date
         )
 
+        sources = {
+            SUMMARY_SOURCE_MICROSOFT_CHAT: self.microsoft_chat_analytics_service.count_microsoft_chat_messages_in_date_range(
+                ldap_list=ldaps,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+            SUMMARY_SOURCE_GOOGLE_CHAT: self.google_chat_analytics_service.count_messages(
+                sender_ldaps=ldaps,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+            SUMMARY_SOURCE_MEETING_HOURS: self._get_meeting_hours(
+                ldaps, start_dt, end_dt
+            ),
+            SUMMARY_SOURCE_GERRIT: self.gerrit_analytics_service.get_gerrit_stats(
+                ldap_list=ldaps,
+                start_date_str=start_date,
+                end_date_str=end_date,
+            ),
+            SUMMARY_SOURCE_JIRA: self.jira_analytics_service.get_issues_summary(
+                status_list=[JiraIssueStatus.DONE],
+                ldaps=ldaps,
+                project_ids=None,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+        }
+        results = await asyncio.gather(*[
+            self._fetch_source(source, awaitable, {})
+            for source, awaitable in sources.items()
+        ])
+        data_by_source = {source: data for source, (data, _) in zip(sources, results)}
+        unavailable_sources = [
+            source for source, (_, available) in zip(sources, results) if not available
+        ]
+
+        ms_chat_data = data_by_source[SUMMARY_SOURCE_MICROSOFT_CHAT].get("result", {})
+        google_chat_data = data_by_source[SUMMARY_SOURCE_GOOGLE_CHAT].get("result", {})
+        meeting_hours_data = data_by_source[SUMMARY_SOURCE_MEETING_HOURS]
+        gerrit_stats = data_by_source[SUMMARY_SOURCE_GERRIT]
+        jira_summary = data_by_source[SUMMARY_SOURCE_JIRA]
+
         summary_data = []
         for ldap_user in ldaps:
             ms_chat_count = ms_chat_data.get(ldap_user, 0)
@@ -117,7 +204,7 @@ class SummaryService:
                 "jira_issue_done": jira_done_count,
             })
 
-        return summary_data
+        return summary_data, unavailable_sources
 
     def _summary_mapper(self, summary_dict: dict) -> ActivitySummaryDto:
         """
@@ -135,10 +222,13 @@ class SummaryService:
             jira_issue_done=summary_dict.get("jira_issue_done", 0),
         )
 
-    def get_summary(self, start_date, end_date, groups_list, include_terminated):
+    async def get_summary(self, start_date, end_date, groups_list, include_terminated):
         """
         Get summary data for a list of groups, optionally including terminated users.
         Delegates actual data aggregation to _search_summary_data.
+
+        Returns:
+            tuple[list, list[str]]: The summary rows and the unavailable sources.
         """
         status = (
             MicrosoftAccountStatus.ALL
@@ -146,7 +236,7 @@ class SummaryService:
             else MicrosoftAccountStatus.ACTIVE
         )
 
-        ldap_mapping = self.ldap_service.get_ldaps_by_status_and_group(
+        ldap_mapping = await self.ldap_service.get_ldaps_by_status_and_group(
             status=status,
             groups=[MicrosoftGroups(g) for g in groups_list],
         )
@@ -156,12 +246,34 @@ class SummaryService:
             for status_data in group_data.values():
                 user_ldaps.extend(status_data.keys())
 
-        # Call private method to aggregate summary data
-        return self._search_summary_data(user_ldaps, start_date, end_date)
+        def compute():
+            # Call private method to aggregate summary data
+            return self._search_summary_data(user_ldaps, start_date, end_date)
+
+        if not self.result_cache or not user_ldaps:
+            return await compute()
+
+        start_dt, end_dt = self.date_time_util.get_start_end_timestamps(
+            start_date, end_date
+        )
+        # Partial summaries are returned but never cached.
+        summary_data, unavailable_sources = await self.result_cache.get_or_compute(
+            "summary",
+            {
+                "ldaps": sorted(user_ldaps),
+                "start": start_dt.date(),
+                "end": end_dt.date(),
+            },
+            list(AnalyticsSource),
+            end_dt,
+            compute,
+            should_cache=lambda result: not result[1],
+        )
+        return summary_data, unavailable_sources
 
-    def get_my_summary(
+    async def get_my_summary(
         self, user: UserContextDto, start_date=None, end_date=None
-    ) -> ActivitySummaryDto:
+    ) -> tuple[ActivitySummaryDto, list[str]]:
         """
         Get summary data for the current user based on their primary email.
 
@@ -171,7 +283,9 @@ class SummaryService:
             end_date (str | None): Optional end date.
 
         Returns:
-            ActivitySummaryDto: Activity summary for the current user. Metrics default to zero when no activity data is found.
+            tuple[ActivitySummaryDto, list[str]]: Activity summary for the current user,
+                and the sources that were unavailable. Metrics default to zero when no
+                activity data is found.
         """
         primary_email = getattr(user, "primary_email", None)
         if not primary_email:
@@ -179,9 +293,11 @@ class SummaryService:
 
         ldap = primary_email.split("@")[0]
 
-        data = self._search_summary_data([ldap], start_date, end_date)
+        data, unavailable_sources = await self._search_summary_data(
+            [ldap], start_date, end_date
+        )
 
         if not data:
-            return ActivitySummaryDto(ldap=ldap)
+            return ActivitySummaryDto(ldap=ldap), unavailable_sources
 
-        return self._summary_mapper(data[0])
+        return self._summary_mapper(data[0]), unavailable_sources
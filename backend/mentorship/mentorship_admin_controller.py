@@ -63,6 +63,8 @@ class MentorshipAdminController:
         offset: int = 0,
         sort_by: str | None = None,
         order: str = "asc",
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ):
         """
         Search mentorship participants and non-participants.
@@ -73,13 +75,27 @@ class MentorshipAdminController:
             offset (int): Pagination offset.
             sort_by (str | None): Column to sort by.
             order (str): Sort direction ("asc" or "desc").
+            cursor (str | None): ``nextCursor`` of the previous page, sent
+                with the same filters and sort.
+            include_total (bool | None): Whether to count all matches.
+                Defaults to counting only for offset pages; cursor pages
+                reuse the total of the first page.
 
         Returns:
             API response containing matching participant records.
         """
+        if include_total is None:
+            include_total = cursor is None
         async with self.database.session() as session:
             result = await self.mentorship_admin_service.search_participants(
-                session, filters, limit, offset, sort_by, order
+                session,
+                filters,
+                limit,
+                offset,
+                sort_by,
+                order,
+                cursor=cursor,
+                include_total=include_total,
             )
         return api_response(
             message="Successfully retrieved participant search results.",
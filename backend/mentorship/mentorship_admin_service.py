@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import csv
 import io
 from collections.abc import AsyncIterator
@@ -365,6 +367,8 @@ class MentorshipAdminService:
         offset: int = 0,
         sort_by: str | None = None,
         order: str = "asc",
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> ParticipantSearchDto:
         """
         Search mentorship participants and non-participants for admin with pagination.
@@ -380,12 +384,27 @@ class MentorshipAdminService:
             sort_by (str | None): Column to sort by (whitelisted in the repo).
                 Unknown values fall back to the deterministic default order.
             order (str): "asc" or "desc" (default "asc").
+            cursor (str | None): ``next_cursor`` of the previous page; pages
+                by keyset instead of ``offset``.
+            include_total (bool): Whether to count all matches.
 
         Returns:
-            ParticipantSearchDto: Assembled participant rows and total count.
+            ParticipantSearchDto: Assembled participant rows, total count
+                (None when not requested) and the cursor of the next page.
         """
-        rows, total = await self.participants_repository.search_participants_for_admin(
-            session, filters, limit, offset, sort_by, order
+        (
+            rows,
+            total,
+            next_cursor,
+        ) = await self.participants_repository.search_participants_for_admin(
+            session,
+            filters,
+            limit,
+            offset,
+            sort_by,
+            order,
+            cursor=cursor,
+            include_total=include_total,
         )
         if not rows:
             return ParticipantSearchDto(participant_rows=[], total=total)
@@ -444,7 +463,9 @@ class MentorshipAdminService:
                 )
             )
 
-        return ParticipantSearchDto(participant_rows=participant_rows, total=total)
+        return ParticipantSearchDto(
+            participant_rows=participant_rows, total=total, next_cursor=next_cursor
+        )
 
     def _resolve_meeting_notes(
         self, meeting: dict, mentor_id: int, mentee_id: int
@@ -817,6 +838,59 @@ class MentorshipAdminService:
 
         return await self._build_meeting_log_dto(session, pair)
 
+    async def _load_export_page(
+        self,
+        session: AsyncSession,
+        filters: ParticipantSearchFilterDto,
+        cursor: str | None,
+        need_meetings: bool,
+    ) -> tuple:
+        """
+        Load one CSV export page and everything its rows reference.
+
+        Args:
+            session (AsyncSession): The export's database session.
+            filters (ParticipantSearchFilterDto): The export filters.
+            cursor (str | None): The previous page's cursor; None for the first.
+            need_meetings (bool): Whether to load the page's meetings.
+
+        Returns:
+            tuple: (rows, next_cursor, users_map, emails_map, trainings_map,
+            meetings_by_pair). The maps are empty when the page has no rows.
+        """
+        (
+            rows,
+            next_cursor,
+        ) = await self.participants_repository.iter_search_participants_for_admin(
+            session, filters, limit=_EXPORT_BATCH_SIZE, cursor=cursor
+        )
+        if not rows:
+            return rows, None, {}, {}, {}, {}
+
+        users_map, emails_map, trainings_map = await self._fetch_batch_relations(
+            session, rows
+        )
+
+        # One batched call for the whole page instead of a per-row query --
+        # get_meetings_by_pairs excludes LEGACY rows (NULL times) by default,
+        # which must never reach a meeting column that expects a real datetime.
+        meetings_by_pair: dict[int, list[MentorshipMeetingEntity]] = {}
+        if need_meetings:
+            pair_ids = [row.pair_id for row in rows if row.pair_id is not None]
+            meetings_by_pair = (
+                await self.mentorship_meeting_repository.get_meetings_by_pairs(
+                    session=session, pair_ids=pair_ids
+                )
+            )
+        return (
+            rows,
+            next_cursor,
+            users_map,
+            emails_map,
+            trainings_map,
+            meetings_by_pair,
+        )
+
     async def stream_export_csv(
         self,
         filters: ParticipantSearchFilterDto,
@@ -826,7 +900,10 @@ class MentorshipAdminService:
         Stream participant search results as BOM-prefixed UTF-8 CSV data chunks.
 
         Uses its own database session because StreamingResponse consumes
-        this generator after the controller returns.
+        this generator after the controller returns. Pages are read by keyset
+        inside one REPEATABLE READ transaction, so every page costs the same
+        and the export is a consistent snapshot; each next page (with its
+        relations) is loaded while the previous one is being streamed.
 
         An export row that fails to build is logged and skipped instead of
         aborting the stream. When expanding meetings, a pair's meeting rows
@@ -883,104 +960,116 @@ class MentorshipAdminService:
         yield _UTF8_BOM + drain_buffer()
 
         async with self.database.session() as session:
+            # One REPEATABLE READ snapshot for the whole export, so keyset
+            # pages neither skip nor repeat rows that change mid-stream.
+            await session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
             rounds = await self.rounds_repository.get_all_rounds(session)
             rounds_map = {r.round_id: r for r in rounds}
 
-            offset = 0
-            while True:
-                rows = await self.participants_repository.iter_search_participants_for_admin(
-                    session,
-                    filters,
-                    limit=_EXPORT_BATCH_SIZE,
-                    offset=offset,
-                )
-                if not rows:
-                    break
-
-                (
-                    users_map,
-                    emails_map,
-                    trainings_map,
-                ) = await self._fetch_batch_relations(session, rows)
-
-                # One batched call for the whole page instead of a per-row
-                # query -- get_meetings_by_pairs excludes LEGACY rows (NULL
-                # times) by default, which must never reach a meeting column
-                # that expects a real datetime.
-                meetings_by_pair: dict[int, list[MentorshipMeetingEntity]] = {}
-                if need_meetings:
-                    pair_ids = [row.pair_id for row in rows if row.pair_id is not None]
-                    meetings_by_pair = (
-                        await self.mentorship_meeting_repository.get_meetings_by_pairs(
-                            session=session, pair_ids=pair_ids
+            page = await self._load_export_page(session, filters, None, need_meetings)
+            next_page = None
+            try:
+                while page[0]:
+                    (
+                        rows,
+                        next_cursor,
+                        users_map,
+                        emails_map,
+                        trainings_map,
+                        meetings_by_pair,
+                    ) = page
+                    # The next page loads while this one is written out and
+                    # consumed by the client; this page's queries are done, so
+                    # the session still runs one query at a time.
+                    next_page = (
+                        asyncio.create_task(
+                            self._load_export_page(
+                                session, filters, next_cursor, need_meetings
+                            )
                         )
+                        if next_cursor
+                        else None
                     )
 
-                for row in rows:
-                    try:
-                        common = self._build_common_export_columns(
-                            row, users_map, emails_map
-                        )
-                        if is_participant:
-                            participant = self._build_participant_export_columns(
-                                row, users_map, trainings_map, rounds_map
+                    for row in rows:
+                        try:
+                            common = self._build_common_export_columns(
+                                row, users_map, emails_map
                             )
-                            if not expand_meetings:
-                                csv_rows = [
-                                    common
-                                    + participant
-                                    + [
-                                        row.completed_count,
-                                        self._get_required_meetings(row, rounds_map),
-                                    ]
-                                ]
-                            else:
-                                meetings = self._extract_meetings_for_row(
-                                    row, meetings_by_pair.get(row.pair_id, [])
+                            if is_participant:
+                                participant = self._build_participant_export_columns(
+                                    row, users_map, trainings_map, rounds_map
                                 )
-                                if meetings:
+                                if not expand_meetings:
                                     csv_rows = [
                                         common
                                         + participant
                                         + [
-                                            "Completed"
-                                            if meeting.is_completed
-                                            else "Incomplete",
-                                            self.date_time_util.format_iso_utc_to_pt(
-                                                meeting.start_datetime,
-                                                fmt="%Y-%m-%d %H:%M %Z",
-                                            ),
-                                            self.date_time_util.format_iso_utc_to_pt(
-                                                meeting.end_datetime,
-                                                fmt="%Y-%m-%d %H:%M %Z",
-                                            ),
-                                            "; ".join(
-                                                tag.value for tag in meeting.note
+                                            row.completed_count,
+                                            self._get_required_meetings(
+                                                row, rounds_map
                                             ),
                                         ]
-                                        for meeting in meetings
                                     ]
                                 else:
-                                    csv_rows = [common + participant + ["", "", "", ""]]
-                        else:
-                            non_participant = (
-                                self._build_non_participant_export_columns(
-                                    row, trainings_map
+                                    meetings = self._extract_meetings_for_row(
+                                        row, meetings_by_pair.get(row.pair_id, [])
+                                    )
+                                    if meetings:
+                                        csv_rows = [
+                                            common
+                                            + participant
+                                            + [
+                                                "Completed"
+                                                if meeting.is_completed
+                                                else "Incomplete",
+                                                self.date_time_util.format_iso_utc_to_pt(
+                                                    meeting.start_datetime,
+                                                    fmt="%Y-%m-%d %H:%M %Z",
+                                                ),
+                                                self.date_time_util.format_iso_utc_to_pt(
+                                                    meeting.end_datetime,
+                                                    fmt="%Y-%m-%d %H:%M %Z",
+                                                ),
+                                                "; ".join(
+                                                    tag.value for tag in meeting.note
+                                                ),
+                                            ]
+                                            for meeting in meetings
+                                        ]
+                                    else:
+                                        csv_rows = [
+                                            common + participant + ["", "", "", ""]
+                                        ]
+                            else:
+                                non_participant = (
+                                    self._build_non_participant_export_columns(
+                                        row, trainings_map
+                                    )
                                 )
+                                csv_rows = [common + non_participant]
+                        except Exception:
+                            self.logger.exception(
+                                "Failed to build CSV row during export, "
+                                "skipping row: user_id=%s, pair_id=%s, "
+                                "round_id=%s",
+                                row.user_id,
+                                row.pair_id,
+                                row.round_id,
                             )
-                            csv_rows = [common + non_participant]
-                    except Exception:
-                        self.logger.exception(
-                            "Failed to build CSV row during export, "
-                            "skipping row: user_id=%s, pair_id=%s, "
-                            "round_id=%s",
-                            row.user_id,
-                            row.pair_id,
-                            row.round_id,
-                        )
-                        continue
-
-                    for csv_row in csv_rows:
-                        writer.writerow(csv_row)
-                yield drain_buffer()
-                offset += _EXPORT_BATCH_SIZE
+                            continue
+
+                        for csv_row in csv_rows:
+                            writer.writerow(csv_row)
+                    yield drain_buffer()
+                    if next_page is None:
+                        break
+                    page = await next_page
+                    next_page = None
+            finally:
+                if next_page is not None:
+                    next_page.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await next_page
@@ -271,8 +271,16 @@ class BoardController:
         stage: str,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ):
-        """One page of a terminal lane's applications (offset/limit)."""
+        """One page of a terminal lane's applications.
+
+        Pages by ``cursor`` (the previous page's ``next_cursor``) or by
+        offset/limit. The lane total is counted for offset pages and left
+        out of cursor pages unless ``include_total`` asks for it, since the
+        board load already returned it.
+        """
         try:
             stage_enum = ApplicationStage(stage)
         except ValueError:
@@ -280,9 +288,18 @@ class BoardController:
         if offset < 0:
             raise HTTPException(status_code=400, detail="offset must be >= 0.")
         limit = max(1, min(limit, 100))
+        if include_total is None:
+            include_total = cursor is None
         async with self.database.session() as session:
             result = await self.board_service.get_board_stage_page(
-                session, current_user, job_id, stage_enum, limit, offset
+                session,
+                current_user,
+                job_id,
+                stage_enum,
+                limit,
+                offset,
+                cursor=cursor,
+                include_total=include_total,
             )
         return api_response(message="Board page fetched.", data=result)
 
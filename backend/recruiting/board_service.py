@@ -36,6 +36,7 @@ from backend.dto.evaluation_dto import EvaluationDto
 from backend.dto.interview_dto import InterviewDto
 from backend.dto.user_context_dto import UserContextDto
 from backend.common.communication_enums import ContextType
+from backend.common.keyset_cursor import encode_cursor
 from backend.common.permissions import Permission
 from backend.common.recruiting_enums import ApplicationStage, RecruitingEvent
 from backend.notification_management.event_recorder import record_event
@@ -43,6 +44,7 @@ from backend.entity.application_entity import ApplicationEntity
 from backend.entity.job_entity import JobEntity
 from backend.recruiting import stage_machine
 from backend.recruiting.pipeline_owners import normalized_owner_ids
+from backend.repository.application_repository import stage_page_cursor_tag
 
 _MENTION_TOKEN_RE = re.compile(r"@\[(\d+)\]")
 
@@ -287,12 +289,12 @@ class BoardService:
         (``search_applicants``). Keeping one definition is the point: if the
         two drifted, search could surface a job the switcher cannot select.
 
-        Fetches every job via the same list-all repository call
-        ``JobService.list_all_jobs`` uses and filters in Python: a caller who
-        holds ``Permission.RECRUITING_APPLICATION_READ_ALL`` gets every job;
-        everyone else gets only the jobs they're a configured owner of.
-        That's fine at dogfood scale (a handful of postings); an
-        owner-indexed query would be worth adding if the job table grows.
+        A caller who holds ``Permission.RECRUITING_APPLICATION_READ_ALL``
+        gets every job, via the same list-all repository call
+        ``JobService.list_all_jobs`` uses; everyone else gets only the jobs
+        they're a configured owner of, via the owner-indexed
+        ``list_by_owner`` lookup, so the cost follows the caller's own jobs
+        rather than the size of the job table.
 
         Args:
             session (AsyncSession): Active database async session.
@@ -302,16 +304,9 @@ class BoardService:
             list[JobEntity]: Jobs the caller may open the board for, in the
                 repository's order.
         """
-        jobs = await self.job_repository.list_all(session)
-        has_read_all = current_user.has_permission(
-            Permission.RECRUITING_APPLICATION_READ_ALL
-        )
-        return [
-            job
-            for job in jobs
-            if has_read_all
-            or current_user.user_id in normalized_owner_ids(job.pipeline_config)
-        ]
+        if current_user.has_permission(Permission.RECRUITING_APPLICATION_READ_ALL):
+            return await self.job_repository.list_all(session)
+        return await self.job_repository.list_by_owner(session, current_user.user_id)
 
     async def list_my_jobs(
         self, session: AsyncSession, current_user: UserContextDto
@@ -924,7 +919,8 @@ class BoardService:
         Returns:
             dict: ``{"stages": {stage_value: {"items": [BoardCardDto],
                 "total": int, "has_more": bool}}}``. Active stages always
-                have ``total == len(items)`` and ``has_more=False``. Stages
+                have ``total == len(items)`` and ``has_more=False``; terminal
+                stages also carry the ``next_cursor`` to page on with. Stages
                 with zero cards are absent keys — the frontend must
                 ``.get(stage, {"items": [], "total": 0, "has_more": False})``.
 
@@ -935,32 +931,43 @@ class BoardService:
             session, current_user, job_id, allow_read_all=True
         )
 
-        active_rows = await self.application_repository.list_by_job(
-            session, job_id, exclude_stages=set(TERMINAL_STAGES)
+        # One query returns every lane (terminal lanes cut to their first
+        # page plus one look-ahead row, each row carrying its lane total), and
+        # one _cards_for_rows call resolves reviewers and contacts for all of
+        # them, so the query count stays fixed however many applicants.
+        board_rows = await self.application_repository.list_board_rows(
+            session,
+            job_id,
+            paged_stages=set(TERMINAL_STAGES),
+            paged_limit=TERMINAL_PAGE_SIZE + 1,
         )
-        stages: dict[str, dict] = {}
-        for card in await self._cards_for_rows(session, job, active_rows):
-            bucket = stages.setdefault(
-                card.stage.value, {"items": [], "total": 0, "has_more": False}
-            )
-            bucket["items"].append(card)
-        for bucket in stages.values():
-            bucket["total"] = len(bucket["items"])
+        rows_by_stage: dict[ApplicationStage, list] = {}
+        total_by_stage: dict[ApplicationStage, int] = {}
+        for application, user, total in board_rows:
+            rows_by_stage.setdefault(application.stage, []).append((application, user))
+            total_by_stage[application.stage] = total
 
+        terminal_pages: dict[ApplicationStage, tuple[bool, str | None]] = {}
         for stage in TERMINAL_STAGES:
-            total = await self.application_repository.count_latest_by_job_and_stage(
-                session, job_id, stage
-            )
-            rows = await self.application_repository.list_by_job_and_stage(
-                session, job_id, stage, limit=TERMINAL_PAGE_SIZE, offset=0
-            )
-            items = await self._cards_for_rows(session, job, rows)
-            if items or total:
-                stages[stage.value] = {
-                    "items": items,
-                    "total": total,
-                    "has_more": total > len(items),
-                }
+            if stage in rows_by_stage:
+                rows, has_more, next_cursor = self._slice_lane(
+                    rows_by_stage[stage], TERMINAL_PAGE_SIZE
+                )
+                rows_by_stage[stage] = rows
+                terminal_pages[stage] = (has_more, next_cursor)
+
+        all_rows = [row for rows in rows_by_stage.values() for row in rows]
+        cards = iter(await self._cards_for_rows(session, job, all_rows))
+        stages: dict[str, dict] = {}
+        for stage, rows in rows_by_stage.items():
+            bucket = {
+                "items": [next(cards) for _ in rows],
+                "total": total_by_stage[stage],
+                "has_more": False,
+            }
+            if stage in terminal_pages:
+                bucket["has_more"], bucket["next_cursor"] = terminal_pages[stage]
+            stages[stage.value] = bucket
         return {"stages": stages}
 
     async def get_board_stage_page(
@@ -971,10 +978,18 @@ class BoardService:
         stage: ApplicationStage,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         """Return one page of a single stage's applications, for paging a
         terminal board lane (rejected/hired) past its first page.
 
+        Pages resume from ``cursor`` (the previous page's ``next_cursor``)
+        by index seek, so scrolling deep into a lane costs the same as its
+        first page. The lane total is a separate COUNT over the whole lane;
+        callers that already hold it (from ``get_board``) pass
+        ``include_total=False`` to skip it.
+
         Args:
             session (AsyncSession): Active database async session.
             current_user (UserContextDto): The authenticated caller.
@@ -982,24 +997,76 @@ class BoardService:
             stage (ApplicationStage): The stage to page.
             limit (int): Max rows to return.
             offset (int): Rows to skip, for paging.
+            cursor (str | None): ``next_cursor`` of the previous page.
+            include_total (bool): Whether to count the whole lane.
 
         Returns:
-            dict: ``{"items": [BoardCardDto], "total": int, "has_more": bool}``.
+            dict: ``{"items": [BoardCardDto], "total": int | None,
+                "has_more": bool, "next_cursor": str | None}``; ``total`` is
+                None when not requested.
 
         Raises:
-            ValueError: If the caller is not an owner of the job.
+            ValueError: If the caller is not an owner of the job, or the
+                cursor is malformed.
         """
         job = await self._require_owner(
             session, current_user, job_id, allow_read_all=True
         )
-        total = await self.application_repository.count_latest_by_job_and_stage(
-            session, job_id, stage
-        )
+        total = None
+        if include_total:
+            total = await self.application_repository.count_latest_by_job_and_stage(
+                session, job_id, stage
+            )
         rows = await self.application_repository.list_by_job_and_stage(
-            session, job_id, stage, limit=limit, offset=offset
+            session, job_id, stage, limit=limit + 1, offset=offset, cursor=cursor
         )
+        page = await self._stage_page(session, job, rows, limit)
+        return {**page, "total": total}
+
+    async def _stage_page(self, session, job, rows, limit: int) -> dict:
+        """Build a lane page from up to ``limit + 1`` rows of
+        ``list_by_job_and_stage``; the extra row only signals another page.
+
+        Args:
+            session (AsyncSession): Active database async session.
+            job (JobEntity): The job the rows belong to.
+            rows (list[tuple[ApplicationEntity, UsersEntity]]): The
+                (application, user) rows, newest-entry first.
+            limit (int): The page size.
+
+        Returns:
+            dict: ``{"items": [BoardCardDto], "has_more": bool,
+                "next_cursor": str | None}``.
+        """
+        rows, has_more, next_cursor = self._slice_lane(rows, limit)
         items = await self._cards_for_rows(session, job, rows)
-        return {"items": items, "total": total, "has_more": offset + len(items) < total}
+        return {"items": items, "has_more": has_more, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _slice_lane(rows, limit: int) -> tuple[list, bool, str | None]:
+        """Cut a lane's up to ``limit + 1`` newest-entry-first rows to one
+        page; the extra row only signals another page.
+
+        Args:
+            rows (list[tuple[ApplicationEntity, UsersEntity]]): The
+                (application, user) rows, newest-entry first.
+            limit (int): The page size.
+
+        Returns:
+            tuple[list, bool, str | None]: The page's rows, whether another
+                page follows, and the cursor to fetch it with.
+        """
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more:
+            last = rows[-1][0]
+            next_cursor = encode_cursor(
+                stage_page_cursor_tag(last.job_id, last.stage),
+                last.stage_entered_at,
+                last.application_id,
+            )
+        return rows, has_more, next_cursor
 
     async def _load_owned_application(
         self,
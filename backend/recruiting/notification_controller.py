@@ -49,12 +49,23 @@ class RecruitingNotificationController:
         )
 
     async def list_notifications(
-        self, current_user: UserContextDto, limit: int = 20, offset: int = 0
+        self,
+        current_user: UserContextDto,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str | None = None,
     ):
-        """List the caller's notifications (newest first) plus pending count."""
+        """List the caller's notifications (newest first) plus pending count.
+
+        Pass the previous page's ``next_cursor`` as ``cursor`` to page on.
+        """
         async with self.database.session() as session:
             result = await self.notification_service.list_for_user(
-                session, current_user.user_id, limit=limit, offset=offset
+                session,
+                current_user.user_id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
             )
         return api_response(message="Notifications fetched.", data=result)
 
@@ -1,11 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.entity.event_entity import EventEntity
+from backend.common.keyset_cursor import encode_cursor
 from backend.dto.notification_dto import (
     NotificationDto,
     NotificationListDto,
     UnreadCountDto,
 )
+from backend.repository.notification_repository import notification_page_cursor_tag
 
 
 class RecruitingNotificationService:
@@ -31,8 +32,8 @@ class RecruitingNotificationService:
         """
         Args:
             notification_repository (NotificationRepository): Notification data access.
-            application_repository (ApplicationRepository): Resolves an
-                application-scoped notification's job/applicant labels.
+            application_repository (ApplicationRepository): Resolves
+                application-scoped notifications' job/applicant labels.
             job_repository (JobRepository): Resolves job titles for both
                 application-scoped and job-review-scoped notifications.
             users_repository (UsersRepository): Resolves applicant/actor
@@ -43,68 +44,107 @@ class RecruitingNotificationService:
         self.job_repository = job_repository
         self.users_repository = users_repository
 
-    async def _display_name(self, session: AsyncSession, user_id: int | None) -> str:
-        """Resolve a user id to "First Last", or "" if missing/None."""
-        if user_id is None:
-            return ""
-        user = await self.users_repository.get_user_by_user_id(session, user_id)
+    def _display_name(self, users_by_id: dict, user_id: int | None) -> str:
+        """Resolve a user id to "First Last" from the loaded users, or "" if missing/None."""
+        user = users_by_id.get(user_id) if user_id is not None else None
         return f"{user.first_name} {user.last_name}".strip() if user is not None else ""
 
-    async def _to_dto(self, session: AsyncSession, row) -> NotificationDto:
-        """Resolve one notification row into what the bell renders.
+    async def _to_dtos(self, session: AsyncSession, rows) -> list[NotificationDto]:
+        """Resolve a page of notification rows into what the bell renders.
 
-        What happened is read from the event the row points at, not from the
+        What happened is read from the event each row points at, not from the
         row: the row is only "user U needs to know about event E". Display
         names are resolved now rather than stored, so a renamed user reads
         correctly on the next open.
 
+        The applications, jobs and users the page refers to are loaded with
+        one query each, whatever the page length, and the DTOs are assembled
+        in memory.
+
         Args:
             session (AsyncSession): Active database async session.
-            row (NotificationEntity): The notification to resolve.
+            rows (list[tuple[NotificationEntity, EventEntity | None]]): The
+                notifications with their events.
 
         Returns:
-            NotificationDto: Empty display fields where the referenced rows
-                are gone, and a null actor_name where nobody acted.
+            list[NotificationDto]: In row order. Empty display fields where the
+                referenced rows are gone, and a null actor_name where nobody
+                acted.
         """
-        event = await session.get(EventEntity, row.event_id)
-        job_title = ""
-        job_kind = None
-        applicant_name = ""
-        if event is not None and event.subject_type == "application":
-            application = await self.application_repository.get_by_id(
-                session, event.subject_id
+        events = [event for _, event in rows if event is not None]
+        application_ids = {
+            event.subject_id for event in events if event.subject_type == "application"
+        }
+        applications_by_id = {
+            application.application_id: application
+            for application in await self.application_repository.get_by_ids(
+                session, list(application_ids)
+            )
+        }
+        job_ids = {
+            event.subject_id for event in events if event.subject_type == "job"
+        } | {
+            application.job_id
+            for application in applications_by_id.values()
+            if application.job_id
+        }
+        jobs_by_id = {
+            job.job_id: job
+            for job in await self.job_repository.get_by_job_ids(session, list(job_ids))
+        }
+        user_ids = {
+            application.user_id
+            for application in applications_by_id.values()
+            if application.user_id is not None
+        } | {event.actor_id for event in events if event.actor_id is not None}
+        users_by_id = {
+            user.user_id: user
+            for user in await self.users_repository.get_all_by_ids(
+                session, list(user_ids)
+            )
+        }
+
+        items = []
+        for row, event in rows:
+            job = None
+            applicant_name = ""
+            if event is not None and event.subject_type == "application":
+                application = applications_by_id.get(event.subject_id)
+                if application is not None:
+                    job = jobs_by_id.get(application.job_id)
+                    applicant_name = self._display_name(
+                        users_by_id, application.user_id
+                    )
+            elif event is not None and event.subject_type == "job":
+                job = jobs_by_id.get(event.subject_id)
+
+            actor_name = (
+                self._display_name(users_by_id, event.actor_id)
+                if event is not None and event.actor_id is not None
+                else None
             )
-            if application is not None:
-                job = await self.job_repository.get_by_job_id(
-                    session, application.job_id
-                )
-                job_title = job.title if job is not None else ""
-                job_kind = job.kind if job is not None else None
-                applicant_name = await self._display_name(session, application.user_id)
-        elif event is not None and event.subject_type == "job":
-            job = await self.job_repository.get_by_job_id(session, event.subject_id)
-            job_title = job.title if job is not None else ""
-            job_kind = job.kind if job is not None else None
-
-        actor_name = (
-            await self._display_name(session, event.actor_id)
-            if event is not None and event.actor_id is not None
-            else None
-        )
 
-        return NotificationDto(
-            id=row.notification_id,
-            event_type=event.event_type if event is not None else "",
-            details=event.details if event is not None else {},
-            job_title=job_title,
-            job_kind=job_kind,
-            applicant_name=applicant_name,
-            actor_name=actor_name,
-            created_at=row.created_at,
-        )
+            items.append(
+                NotificationDto(
+                    id=row.notification_id,
+                    event_type=event.event_type if event is not None else "",
+                    details=event.details if event is not None else {},
+                    job_title=job.title if job is not None else "",
+                    job_kind=job.kind if job is not None else None,
+                    applicant_name=applicant_name,
+                    actor_name=actor_name,
+                    created_at=row.created_at,
+                )
+            )
+        return items
 
     async def list_for_user(
-        self, session: AsyncSession, user_id: int, limit: int = 20, offset: int = 0
+        self,
+        session: AsyncSession,
+        user_id: int,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> NotificationListDto:
         """List one user's notifications (newest first) plus their pending count.
 
@@ -113,19 +153,37 @@ class RecruitingNotificationService:
             user_id (int): The authenticated caller.
             limit (int): Page size.
             offset (int): Page offset.
+            cursor (str | None): ``next_cursor`` of the previous page. Deep
+                pages cost the same as the first one, unlike ``offset``.
 
         Returns:
-            NotificationListDto: The page of notifications and the total
-                pending count (independent of `limit`/`offset`).
+            NotificationListDto: The page of notifications, the total
+                pending count (independent of `limit`/`offset`) and the
+                cursor of the next page.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed.
         """
-        rows = await self.notification_repository.list_by_user(
-            session, user_id, limit, offset
+        # One row past the page tells whether another page follows.
+        rows = await self.notification_repository.list_with_events_by_user(
+            session, user_id, limit + 1, offset, cursor=cursor
         )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1][0]
+            next_cursor = encode_cursor(
+                notification_page_cursor_tag(user_id),
+                last.created_at,
+                last.notification_id,
+            )
         unread_count = await self.notification_repository.count_by_user(
             session, user_id
         )
-        items = [await self._to_dto(session, row) for row in rows]
-        return NotificationListDto(notifications=items, unread_count=unread_count)
+        items = await self._to_dtos(session, rows)
+        return NotificationListDto(
+            notifications=items, unread_count=unread_count, next_cursor=next_cursor
+        )
 
     async def dismiss(
         self, session: AsyncSession, user_id: int, notification_id: int
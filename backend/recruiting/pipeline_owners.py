@@ -3,7 +3,9 @@ def normalized_owner_ids(pipeline_config: dict | None) -> list[int]:
 
     Configs saved before multi-owner carry ``{"ownerId": 5}``; new ones carry
     ``{"ownerIds": [5, 6]}``. Every consumer of the stored JSONB goes through
-    this helper so both shapes keep working without a data migration.
+    this helper so both shapes keep working without a data migration. The
+    generated ``job.owner_ids`` column (``JobEntity.owner_ids``) applies the
+    same rule in SQL for owner-indexed lookups; change the two together.
 
     Args:
         pipeline_config (dict | None): The job's stored pipeline_config JSONB.
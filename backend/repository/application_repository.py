@@ -1,6 +1,12 @@
 from datetime import date, datetime
 
 from backend.common.communication_enums import ContextType
+from backend.common.keyset_cursor import (
+    KeysetColumn,
+    decode_cursor,
+    keyset_after,
+    keyset_tag,
+)
 from backend.common.mentorship_enums import ParticipantRole
 from backend.common.recruiting_enums import ApplicationStage, JobKind
 from backend.entity.application_entity import ApplicationEntity
@@ -8,9 +14,22 @@ from backend.entity.email_thread_entity import EmailThreadEntity
 from backend.entity.job_entity import JobEntity
 from backend.entity.user_emails_entity import UserEmailsEntity
 from backend.entity.users_entity import UsersEntity
-from sqlalchemy import Date, and_, cast, func, or_, select
+from sqlalchemy import Date, and_, case, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# A stage lane's newest-entry-first order, served by
+# ix_application_job_stage_entered; a page cursor encodes the last row's
+# (stage_entered_at, application_id).
+_STAGE_PAGE_ORDER = [
+    KeysetColumn(ApplicationEntity.stage_entered_at, descending=True),
+    KeysetColumn(ApplicationEntity.application_id, descending=True),
+]
+
+
+def stage_page_cursor_tag(job_id: int, stage: ApplicationStage) -> str:
+    """Return the cursor tag of one job's stage lane, newest entry first."""
+    return keyset_tag(_STAGE_PAGE_ORDER, job_id, stage)
+
 
 class ApplicationRepository:
     """Database operations for ApplicationEntity.
@@ -63,6 +82,73 @@ class ApplicationRepository:
         result = await session.execute(stmt)
         return [tuple(row) for row in result.all()]
 
+    async def list_board_rows(
+        self,
+        session: AsyncSession,
+        job_id: int,
+        paged_stages: set[ApplicationStage],
+        paged_limit: int,
+    ) -> list[tuple[ApplicationEntity, UsersEntity, int]]:
+        """Load a whole board in one query: every latest-per-user row of the
+        unpaged stages, plus the first ``paged_limit`` rows of each paged
+        stage, each row carrying its stage's latest-per-user total.
+
+        Window functions over the latest rows rank each stage's rows in
+        ``list_by_job_and_stage`` order and count them, so a paged lane's
+        first page and its ``count_latest_by_job_and_stage`` total come back
+        together with the unpaged lanes instead of as per-lane queries.
+
+        Args:
+            session (AsyncSession): The active DB session.
+            job_id (int): The job whose board to load.
+            paged_stages (set[ApplicationStage]): Stages cut off after
+                ``paged_limit`` rows (the terminal lanes).
+            paged_limit (int): Max rows to return per paged stage.
+
+        Returns:
+            list[tuple[ApplicationEntity, UsersEntity, int]]: (application,
+                user, stage_total) triples. Within an unpaged stage rows are
+                ordered by application_id (as ``list_by_job``); within a
+                paged stage by stage_entered_at desc, application_id desc
+                (as ``list_by_job_and_stage``).
+        """
+        latest_ids = (
+            select(func.max(ApplicationEntity.application_id))
+            .where(ApplicationEntity.job_id == job_id)
+            .group_by(ApplicationEntity.user_id)
+        )
+        lanes = (
+            select(
+                ApplicationEntity.application_id,
+                func.row_number()
+                .over(
+                    partition_by=ApplicationEntity.stage,
+                    order_by=[c.order_by() for c in _STAGE_PAGE_ORDER],
+                )
+                .label("lane_rank"),
+                func.count()
+                .over(partition_by=ApplicationEntity.stage)
+                .label("lane_total"),
+            )
+            .where(
+                ApplicationEntity.job_id == job_id,
+                ApplicationEntity.application_id.in_(latest_ids),
+            )
+            .subquery()
+        )
+        is_paged = ApplicationEntity.stage.in_(paged_stages)
+        result = await session.execute(
+            select(ApplicationEntity, UsersEntity, lanes.c.lane_total)
+            .join(lanes, lanes.c.application_id == ApplicationEntity.application_id)
+            .join(UsersEntity, ApplicationEntity.user_id == UsersEntity.user_id)
+            .where(or_(~is_paged, lanes.c.lane_rank <= paged_limit))
+            .order_by(
+                case((is_paged, lanes.c.lane_rank), else_=0),
+                ApplicationEntity.application_id,
+            )
+        )
+        return [tuple(row) for row in result.all()]
+
     async def list_by_job_and_stage(
         self,
         session: AsyncSession,
@@ -70,6 +156,7 @@ class ApplicationRepository:
         stage: ApplicationStage,
         limit: int,
         offset: int,
+        cursor: str | None = None,
     ) -> list[tuple[ApplicationEntity, UsersEntity]]:
         """One page of a single stage's latest-per-user applications,
         newest-entry first. The stage filter is applied to the LATEST row
@@ -82,28 +169,45 @@ class ApplicationRepository:
             stage (ApplicationStage): The terminal (or any) stage to page.
             limit (int): Max rows to return.
             offset (int): Rows to skip, for paging.
+            cursor (str | None): ``encode_cursor(stage_page_cursor_tag(job_id,
+                stage), stage_entered_at, application_id)`` of the last row
+                already seen; resumes after it by index seek, so deep pages
+                cost the same as the first one.
 
         Returns:
             list[tuple[ApplicationEntity, UsersEntity]]: (application, user)
                 pairs ordered by stage_entered_at desc, application_id desc.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed or was issued for another
+                job or stage.
         """
         latest_ids = (
             select(func.max(ApplicationEntity.application_id))
             .where(ApplicationEntity.job_id == job_id)
             .group_by(ApplicationEntity.user_id)
         )
+        filters = [
+            ApplicationEntity.job_id == job_id,
+            ApplicationEntity.stage == stage,
+            ApplicationEntity.application_id.in_(latest_ids),
+        ]
+        if cursor is not None:
+            filters.append(
+                keyset_after(
+                    _STAGE_PAGE_ORDER,
+                    decode_cursor(
+                        cursor,
+                        stage_page_cursor_tag(job_id, stage),
+                        len(_STAGE_PAGE_ORDER),
+                    ),
+                )
+            )
         result = await session.execute(
             select(ApplicationEntity, UsersEntity)
             .join(UsersEntity, ApplicationEntity.user_id == UsersEntity.user_id)
-            .where(
-                ApplicationEntity.job_id == job_id,
-                ApplicationEntity.stage == stage,
-                ApplicationEntity.application_id.in_(latest_ids),
-            )
-            .order_by(
-                ApplicationEntity.stage_entered_at.desc(),
-                ApplicationEntity.application_id.desc(),
-            )
+            .where(*filters)
+            .order_by(*(c.order_by() for c in _STAGE_PAGE_ORDER))
             .limit(limit)
             .offset(offset)
         )
@@ -428,6 +532,23 @@ class ApplicationRepository:
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_ids(
+        self, session: AsyncSession, application_ids: list[int]
+    ) -> list[ApplicationEntity]:
+        """Return the applications with these application_ids, in no particular order.
+
+        Ids without an application are skipped; an empty list returns
+        without querying.
+        """
+        if not application_ids:
+            return []
+        result = await session.execute(
+            select(ApplicationEntity).where(
+                ApplicationEntity.application_id.in_(application_ids)
+            )
+        )
+        return list(result.scalars().all())
+
     async def create(
         self, session: AsyncSession, entity: ApplicationEntity
     ) -> ApplicationEntity:
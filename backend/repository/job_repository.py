@@ -27,6 +27,20 @@ class JobRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_job_ids(
+        self, session: AsyncSession, job_ids: list[int]
+    ) -> list[JobEntity]:
+        """Return the jobs with the given ids, in no particular order.
+
+        Ids without a job are skipped; an empty list returns without querying.
+        """
+        if not job_ids:
+            return []
+        result = await session.execute(
+            select(JobEntity).where(JobEntity.job_id.in_(job_ids))
+        )
+        return list(result.scalars().all())
+
     async def list_published(self, session: AsyncSession) -> list[JobEntity]:
         """Return jobs whose status is exactly PUBLISHED.
 
@@ -55,6 +69,28 @@ class JobRepository:
         result = await session.execute(select(JobEntity))
         return list(result.scalars().all())
 
+    async def list_by_owner(
+        self, session: AsyncSession, user_id: int
+    ) -> list[JobEntity]:
+        """Return every job the user is a configured pipeline owner of.
+
+        Matches the generated ``owner_ids`` column through its GIN index, so
+        the cost follows the user's own jobs rather than the whole table.
+
+        Args:
+            session (AsyncSession): Active database async session.
+            user_id (int): The owner to look up.
+
+        Returns:
+            list[JobEntity]: The user's jobs, ordered by job_id.
+        """
+        result = await session.execute(
+            select(JobEntity)
+            .where(JobEntity.owner_ids.contains([user_id]))
+            .order_by(JobEntity.job_id)
+        )
+        return list(result.scalars().all())
+
     async def update_job(self, session: AsyncSession, entity: JobEntity) -> JobEntity:
         """Persist mutations to an attached/merged job entity."""
         merged = await session.merge(entity)
@@ -14,6 +14,13 @@ from backend.common.mentorship_enums import (
     TrainingCategory,
     TrainingStatus,
 )
+from backend.common.keyset_cursor import (
+    KeysetColumn,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_tag,
+)
 from backend.common.recruiting_enums import ApplicationStage, JobKind
 from backend.dto.participant_search_row_dto import ParticipantSearchRow
 from backend.dto.participant_search_filter_dto import ParticipantSearchFilterDto
@@ -424,20 +431,24 @@ class MentorshipRoundParticipantsRepository:
         "user_id": UsersEntity.user_id,
     }
 
-    def _build_default_order(self) -> list:
+    def _build_default_keyset(self) -> list[KeysetColumn]:
         """
         Return the shared deterministic default ordering for the admin
         participant search: last_name, first_name, round_id, pair_id,
         user_id — all ascending, nulls last.
         """
         return [
-            func.lower(UsersEntity.last_name).asc().nulls_last(),
-            func.lower(UsersEntity.first_name).asc().nulls_last(),
-            MentorshipRoundParticipantsEntity.round_id.asc().nulls_last(),
-            MentorshipPairsEntity.pair_id.asc().nulls_last(),
-            UsersEntity.user_id.asc(),
+            KeysetColumn(func.lower(UsersEntity.last_name), nulls_last=True),
+            KeysetColumn(func.lower(UsersEntity.first_name), nulls_last=True),
+            KeysetColumn(MentorshipRoundParticipantsEntity.round_id, nulls_last=True),
+            KeysetColumn(MentorshipPairsEntity.pair_id, nulls_last=True),
+            KeysetColumn(UsersEntity.user_id),
         ]
 
+    def _build_default_order(self) -> list:
+        """Return the ORDER BY clauses of `_build_default_keyset`."""
+        return [key.order_by() for key in self._build_default_keyset()]
+
     async def search_participants_for_admin(
         self,
         session: AsyncSession,
@@ -446,12 +457,17 @@ class MentorshipRoundParticipantsRepository:
         offset: int,
         sort_by: str | None = None,
         order: str = "asc",
-    ) -> tuple[list[ParticipantSearchRow], int]:
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[ParticipantSearchRow], int | None, str | None]:
         """
         Run the admin participant search and return paginated results.
 
         The same base query is reused for both the COUNT(*) query and the
-        paginated data query to ensure consistent filtering.
+        paginated data query to ensure consistent filtering. Pages either by
+        ``offset`` or by ``cursor``, the ``next_cursor`` returned for the
+        previous page with the same filters and sort; a cursor page seeks
+        past the previous page's last sort key instead of skipping rows.
 
         Args:
             session (AsyncSession): Active database session.
@@ -464,34 +480,70 @@ class MentorshipRoundParticipantsRepository:
                 order.
             order (str): "asc" (default) or "desc". Only applied when
                 `sort_by` resolves to a whitelisted column.
+            cursor (str | None): Resume after the row this cursor was issued
+                for.
+            include_total (bool): Whether to run the COUNT(*) query.
 
         Returns:
-            tuple[list[ParticipantSearchRow], int]:
-                Matching participant rows and the total number of matches
-                before pagination.
+            tuple[list[ParticipantSearchRow], int | None, str | None]:
+                Matching participant rows, the total number of matches
+                before pagination (None when not requested), and the cursor
+                of the next page (None on the last page).
+
+        Raises:
+            ValueError: If ``cursor`` is malformed or was issued for another
+                sort or other filters.
         """
         base_stmt = self._build_admin_search_stmt(filters)
 
-        total = (
-            await session.scalar(select(func.count()).select_from(base_stmt.subquery()))
-            or 0
-        )
+        total = None
+        if include_total:
+            total = int(
+                await session.scalar(
+                    select(func.count()).select_from(base_stmt.subquery())
+                )
+                or 0
+            )
 
         sort_col = self._SORT_WHITELIST.get(sort_by) if sort_by else None
         if sort_col is not None:
-            primary_order = sort_col.desc() if order == "desc" else sort_col.asc()
             # Rows are keyed by (user_id, round_id, pair_id), round_id/pair_id
             # can break ties for deterministic pagination.
-            order_clauses = [
-                primary_order,
-                MentorshipRoundParticipantsEntity.round_id.asc().nulls_last(),
-                MentorshipPairsEntity.pair_id.asc().nulls_last(),
+            keys = [
+                KeysetColumn(sort_col, descending=order == "desc"),
+                KeysetColumn(
+                    MentorshipRoundParticipantsEntity.round_id, nulls_last=True
+                ),
+                KeysetColumn(MentorshipPairsEntity.pair_id, nulls_last=True),
             ]
         else:
-            order_clauses = self._build_default_order()
+            keys = self._build_default_keyset()
 
-        data_stmt = base_stmt.order_by(*order_clauses).limit(limit).offset(offset)
+        tag = keyset_tag(keys, filters.model_dump(mode="json"))
+        if cursor is not None:
+            base_stmt = base_stmt.where(
+                keyset_after(keys, decode_cursor(cursor, tag, len(keys)))
+            )
+        # The sort keys are selected alongside the row so the next cursor
+        # holds exactly the values the database compared (e.g. lower(name)).
+        sort_key_labels = [f"sort_key_{i}" for i in range(len(keys))]
+        data_stmt = (
+            base_stmt.add_columns(
+                *(k.expression.label(n) for k, n in zip(keys, sort_key_labels))
+            )
+            .order_by(*(k.order_by() for k in keys))
+            .limit(limit + 1)
+            .offset(offset)
+        )
         result = await session.execute(data_stmt)
+        records = result.all()
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = records[-1]
+            next_cursor = encode_cursor(
+                tag, *(getattr(last, n) for n in sort_key_labels)
+            )
         rows = [
             ParticipantSearchRow(
                 user_id=row.user_id,
@@ -503,9 +555,9 @@ class MentorshipRoundParticipantsRepository:
                 mentor_id=row.mentor_id,
                 mentee_id=row.mentee_id,
             )
-            for row in result.all()
+            for row in records
         ]
-        return rows, int(total)
+        return rows, total, next_cursor
 
     async def iter_search_participants_for_admin(
         self,
@@ -513,41 +565,33 @@ class MentorshipRoundParticipantsRepository:
         filters: ParticipantSearchFilterDto,
         *,
         limit: int = 500,
-        offset: int = 0,
-    ) -> list[ParticipantSearchRow]:
+        cursor: str | None = None,
+    ) -> tuple[list[ParticipantSearchRow], str | None]:
         """
         Fetch one page of admin participant search results for CSV export.
 
-        Shares the same base query construction as search_participants_for_admin
-        but skips the COUNT(*) query (the caller streams until an empty page
-        comes back, it never needs a total).
+        Shares the same base query and default order as
+        search_participants_for_admin but skips the COUNT(*) query (the
+        caller streams until no next cursor comes back, it never needs a
+        total). Pages continue by keyset from ``cursor``, so each page costs
+        one index seek however far into the export it is.
 
         Args:
             session (AsyncSession): Active database session.
             filters (ParticipantSearchFilterDto): Filter parameters.
             limit (int): Maximum number of rows to return. Defaults to 500.
-            offset (int): Number of rows to skip. Defaults to 0.
+            cursor (str | None): The cursor returned with the previous page;
+                None for the first page.
 
         Returns:
-            list[ParticipantSearchRow]: Matching rows for this page.
+            tuple[list[ParticipantSearchRow], str | None]: Matching rows for
+                this page and the cursor of the next page (None on the last
+                page).
         """
-        base_stmt = self._build_admin_search_stmt(filters)
-        order_clauses = self._build_default_order()
-        data_stmt = base_stmt.order_by(*order_clauses).limit(limit).offset(offset)
-        result = await session.execute(data_stmt)
-        return [
-            ParticipantSearchRow(
-                user_id=row.user_id,
-                round_id=row.round_id,
-                pair_id=row.pair_id,
-                participant_role=row.participant_role,
-                approval_status=row.approval_status,
-                completed_count=row.completed_count,
-                mentor_id=row.mentor_id,
-                mentee_id=row.mentee_id,
-            )
-            for row in result.all()
-        ]
+        rows, _, next_cursor = await self.search_participants_for_admin(
+            session, filters, limit, 0, cursor=cursor, include_total=False
+        )
+        return rows, next_cursor
 
     async def upsert_participant(
         self, session: AsyncSession, entity: MentorshipRoundParticipantsEntity
@@ -1,8 +1,27 @@
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.common.keyset_cursor import (
+    KeysetColumn,
+    decode_cursor,
+    keyset_after,
+    keyset_tag,
+)
+from backend.entity.event_entity import EventEntity
 from backend.entity.notification_entity import NotificationEntity
 
+# The bell's newest-first order; a page cursor encodes the last row's
+# (created_at, notification_id).
+_PAGE_ORDER = [
+    KeysetColumn(NotificationEntity.created_at, descending=True),
+    KeysetColumn(NotificationEntity.notification_id, descending=True),
+]
+
+
+def notification_page_cursor_tag(user_id: int) -> str:
+    """Return the cursor tag of one user's bell, newest first."""
+    return keyset_tag(_PAGE_ORDER, user_id)
+
 
 class NotificationRepository:
     """Database operations for NotificationEntity (append-only; dismissing marks the row).
@@ -21,29 +40,75 @@ class NotificationRepository:
         await session.flush()
         return entity
 
+    @staticmethod
+    def _page_filters(user_id: int, cursor: str | None) -> list:
+        """WHERE clauses for one page of a user's undismissed notifications.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed or was issued for another
+                user.
+        """
+        filters = [
+            NotificationEntity.user_id == user_id,
+            NotificationEntity.dismissed_at.is_(None),
+        ]
+        if cursor is not None:
+            filters.append(
+                keyset_after(
+                    _PAGE_ORDER,
+                    decode_cursor(
+                        cursor, notification_page_cursor_tag(user_id), len(_PAGE_ORDER)
+                    ),
+                )
+            )
+        return filters
+
     async def list_by_user(
         self,
         session: AsyncSession,
         user_id: int,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[NotificationEntity]:
-        """List one user's undismissed notifications, newest first."""
+        """List one user's undismissed notifications, newest first.
+
+        ``cursor`` (an ``encode_cursor(notification_page_cursor_tag(user_id),
+        created_at, notification_id)`` of the last row already seen) resumes
+        after that row by index seek instead of skipping ``offset`` rows.
+        """
         result = await session.execute(
             select(NotificationEntity)
-            .where(
-                NotificationEntity.user_id == user_id,
-                NotificationEntity.dismissed_at.is_(None),
-            )
-            .order_by(
-                NotificationEntity.created_at.desc(),
-                NotificationEntity.notification_id.desc(),
-            )
+            .where(*self._page_filters(user_id, cursor))
+            .order_by(*(c.order_by() for c in _PAGE_ORDER))
             .limit(limit)
             .offset(offset)
         )
         return list(result.scalars().all())
 
+    async def list_with_events_by_user(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> list[tuple[NotificationEntity, EventEntity | None]]:
+        """List one user's undismissed notifications with their events, newest first.
+
+        The same page as ``list_by_user``, with each row's event loaded by
+        the same query; the event is None where it no longer exists.
+        """
+        result = await session.execute(
+            select(NotificationEntity, EventEntity)
+            .outerjoin(EventEntity, EventEntity.event_id == NotificationEntity.event_id)
+            .where(*self._page_filters(user_id, cursor))
+            .order_by(*(c.order_by() for c in _PAGE_ORDER))
+            .limit(limit)
+            .offset(offset)
+        )
+        return [(notification, event) for notification, event in result.all()]
+
     async def count_by_user(self, session: AsyncSession, user_id: int) -> int:
         """Count one user's undismissed notifications."""
         result = await session.execute(
@@ -1,6 +1,13 @@
 from backend.entity.users_entity import UsersEntity
 from backend.entity.user_emails_entity import UserEmailsEntity
 from backend.common.identity_type import IdentityType
+from backend.common.keyset_cursor import (
+    KeysetColumn,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_tag,
+)
 from sqlalchemy import and_, exists, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -137,11 +144,18 @@ class UsersRepository:
         order: str = "asc",
         is_super_admin: bool | None = None,
         user_type: str | None = None,
-    ) -> tuple[list[tuple[UsersEntity, bool]], int]:
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[tuple[UsersEntity, bool]], int | None, str | None]:
         """
         Paginated user list with optional case-insensitive substring search,
         sorting, and filtering.
 
+        Pages either by ``offset`` or by ``cursor``, the ``next_cursor`` this
+        method returned for the previous page with the same sort and filters.
+        A cursor page seeks past the previous page's last sort key instead of
+        skipping rows, so it costs the same however deep it is.
+
         Args:
             session (AsyncSession): The active async database session.
             search (str | None): Case-insensitive substring over first_name /
@@ -164,11 +178,20 @@ class UsersRepository:
             user_type (str | None): When ``"internal"`` keeps only users whose
                 ``is_internal`` flag is set; when ``"external"`` keeps only
                 users whose flag is unset; otherwise no filter.
+            cursor (str | None): Resume after the row this cursor was issued
+                for.
+            include_total (bool): Whether to run the COUNT for ``total``.
 
         Returns:
-            tuple[list[tuple[UsersEntity, bool]], int]: (page rows where each
-            element is (entity, is_internal), total number of rows matching all
-            active filters across all pages).
+            tuple[list[tuple[UsersEntity, bool]], int | None, str | None]:
+            (page rows where each element is (entity, is_internal), total
+            number of rows matching all active filters across all pages or
+            None when not requested, cursor of the next page or None on the
+            last page).
+
+        Raises:
+            ValueError: If ``cursor`` is malformed or was issued for another
+                sort or other filters.
         """
         # Name columns sort on lower(): the databases use C.UTF-8 (byte-order)
         # collation, under which every uppercase letter precedes every lowercase
@@ -212,25 +235,47 @@ class UsersRepository:
 
         # Build ORDER BY: whitelisted column (asc/desc) + user_id tiebreaker.
         sort_col = _SORT_WHITELIST.get(sort_by) if sort_by else None
+        keys = [KeysetColumn(UsersEntity.user_id)]
         if sort_col is not None:
-            primary_order = sort_col.desc() if order == "desc" else sort_col.asc()
-            if sort_by in _NULLS_LAST_SORTS:
-                primary_order = primary_order.nulls_last()
-            order_clauses = [primary_order, UsersEntity.user_id]
-        else:
-            order_clauses = [UsersEntity.user_id]
-
-        total = await session.scalar(
-            select(func.count()).select_from(UsersEntity).where(*filters)
-        )
+            keys.insert(
+                0,
+                KeysetColumn(
+                    sort_col,
+                    descending=order == "desc",
+                    nulls_last=sort_by in _NULLS_LAST_SORTS,
+                ),
+            )
+
+        total = None
+        if include_total:
+            total = int(
+                await session.scalar(
+                    select(func.count()).select_from(UsersEntity).where(*filters)
+                )
+                or 0
+            )
+        tag = keyset_tag(keys, search, user_id, is_super_admin, user_type)
+        if cursor is not None:
+            filters.append(keyset_after(keys, decode_cursor(cursor, tag, len(keys))))
+        # The sort keys are selected alongside the row so the next cursor
+        # holds exactly the values the database compared (e.g. lower(name)).
         result = await session.execute(
-            select(UsersEntity, is_internal_col)
+            select(
+                UsersEntity,
+                is_internal_col,
+                *(k.expression.label(f"sort_key_{i}") for i, k in enumerate(keys)),
+            )
             .where(*filters)
-            .order_by(*order_clauses)
-            .limit(limit)
+            .order_by(*(k.order_by() for k in keys))
+            .limit(limit + 1)
             .offset(offset)
         )
-        return list(result.tuples().all()), int(total or 0)
+        rows = list(result.all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(tag, *rows[-1][2:])
+        return [(row[0], row[1]) for row in rows], total, next_cursor
 
     async def get_super_admins(self, session: AsyncSession) -> list[UsersEntity]:
         """
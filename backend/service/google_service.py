@@ -171,6 +171,47 @@ class GoogleService:
         )
         return formatted_people
 
+    def fetch_messages_page(
+        self,
+        space_id: str,
+        page_token: str | None = None,
+        created_after: str | None = None,
+    ) -> dict:
+        """
+        Retrieves one page of messages from a Google Chat space, oldest first.
+
+        Args:
+            space_id (str): The ID of the Google Chat space to fetch messages from.
+            page_token (str | None): The page to fetch; None for the first page.
+            created_after (str | None): Optional RFC 3339 time; only messages created
+                after it are listed. Must match the value used for the first page.
+
+        Returns:
+            dict: The API response, with "messages" and, unless this is the last
+                page, "nextPageToken".
+
+        Raises:
+            RuntimeError: If unable to fetch messages due to API error.
+        """
+        list_kwargs = {
+            "parent": f"spaces/{space_id}",
+            "pageSize": 500,
+            "pageToken": page_token,
+        }
+        if created_after:
+            list_kwargs["filter"] = f'create_time > "{created_after}"'
+        req = self.google_chat_client.spaces().messages().list(**list_kwargs)
+        try:
+            return self.retry_utils.get_retry_on_transient(req.execute)
+        except Exception as e:
+            self.logger.error(
+                "Error fetching chat messages (page_token=%s): %s",
+                page_token,
+                e,
+                exc_info=True,
+            )
+            raise RuntimeError("Unable to fetch Google Chat messages") from e
+
     def fetch_messages_by_spaces_id_paginated(self, space_id):
         """
         Generator that retrieves messages from a specific Google Chat space page by page.
@@ -186,25 +227,7 @@ class GoogleService:
         """
         page_token = None
         while True:
-            req = (
-                self.google_chat_client.spaces()
-                .messages()
-                .list(
-                    parent=f"spaces/{space_id}",
-                    pageSize=500,
-                    pageToken=page_token,
-                )
-            )
-            try:
-                response = self.retry_utils.get_retry_on_transient(req.execute)
-            except Exception as e:
-                self.logger.error(
-                    "Error fetching chat messages (page_token=%s): %s",
-                    page_token,
-                    e,
-                    exc_info=True,
-                )
-                raise RuntimeError("Unable to fetch Google Chat messages") from e
+            response = self.fetch_messages_page(space_id, page_token=page_token)
             messages = response.get("messages", [])
             yield messages
 
@@ -111,6 +111,27 @@ class JiraSearchService:
         )
         yield from self._fetch_issues_by_jql_paginated(jql_query)
 
+    def fetch_issues_updated_within_minutes_paginated(
+        self, minutes: int
+    ) -> Generator[list[Issue], None, None]:
+        """
+        Fetch Jira issues updated within the past `minutes` minutes, paginated.
+
+        Pages are ordered by creation time, oldest first, so issues created while
+        paging are appended to the last page instead of shifting earlier ones.
+
+        Args:
+            minutes (int): Only issues updated within the last `minutes` minutes will be fetched.
+
+        Yields:
+            Generator[list[Issue], None, None]: Lists of Jira Issue objects in batches.
+        """
+        if not minutes or minutes <= 0:
+            raise ValueError("Minutes must be a positive integer.")
+
+        jql_query = f"updated >= -{minutes}m ORDER BY created ASC"
+        yield from self._fetch_issues_by_jql_paginated(jql_query)
+
     def fetch_issue_by_issue_id(self, issue_id: str) -> Issue:
         """
         Fetches issue from Jira for a given issue ID.
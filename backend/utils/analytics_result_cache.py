@@ -0,0 +1,144 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+
+from backend.common.constants import (
+    ANALYTICS_GENERATION_KEY,
+    ANALYTICS_RESULT_CACHE_KEY,
+    AnalyticsSource,
+)
+
+# Entries are also invalidated by generation bumps; the TTL only bounds how
+# long results that nobody asks for again stay in Redis.
+DEFAULT_RESULT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+def bump_analytics_generation(pipeline, source: AnalyticsSource) -> None:
+    """
+    Queue a generation bump for an analytics source into the provided pipeline.
+
+    Every write path that changes data an analytics query reads must call this
+    in the same pipeline as the write, so cached results computed from the old
+    data are no longer served.
+
+    Args:
+        pipeline: A Redis pipeline used for batched operations.
+        source (AnalyticsSource): The source whose data is being written.
+    """
+    pipeline.incr(ANALYTICS_GENERATION_KEY.format(source=source.value))
+
+
+class AnalyticsResultCache:
+    """
+    Caches analytics query results for closed date ranges in Redis.
+
+    A result is stored together with the generation counters of the sources it
+    was computed from, and is only served while all of those counters are
+    unchanged. Ranges ending today or later are never cached, since their data
+    is still arriving.
+    """
+
+    def __init__(
+        self,
+        logger,
+        redis_client,
+        retry_utils,
+        ttl_seconds: int = DEFAULT_RESULT_CACHE_TTL_SECONDS,
+    ):
+        """
+        Initialize the AnalyticsResultCache.
+
+        Args:
+            logger: The logger instance for logging messages.
+            redis_client: The asyncio Redis client instance.
+            retry_utils: A RetryUtils for handling retries on transient errors.
+            ttl_seconds: Expiry applied to every stored result.
+        """
+        self.logger = logger
+        self.redis_client = redis_client
+        self.retry_utils = retry_utils
+        self.ttl_seconds = ttl_seconds
+
+    def _result_key(self, name: str, params: dict) -> str:
+        """Build the cache key for a query name and its normalized parameters."""
+        digest = hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return ANALYTICS_RESULT_CACHE_KEY.format(name=name, digest=digest)
+
+    async def get_or_compute(
+        self,
+        name: str,
+        params: dict,
+        sources: list[AnalyticsSource],
+        range_end: datetime,
+        compute,
+        should_cache=None,
+    ):
+        """
+        Return the cached result for a query, computing and storing it on a miss.
+
+        Cache failures are logged and the query is computed uncached; they
+        never fail the caller.
+
+        Args:
+            name (str): Query name, part of the cache key.
+            params (dict): Normalized, JSON-serializable query parameters.
+            sources (list[AnalyticsSource]): Sources the result is computed from.
+            range_end (datetime): End of the queried range (UTC). Results are
+                only cached when it falls before today.
+            compute: Coroutine function producing the result on a miss. The
+                result must be JSON-serializable.
+            should_cache: Optional predicate; results for which it returns
+                False (e.g. partial results) are returned but not stored.
+
+        Returns:
+            The cached or freshly computed result.
+        """
+        if (
+            range_end.astimezone(timezone.utc).date()
+            >= datetime.now(timezone.utc).date()
+        ):
+            return await compute()
+
+        result_key = self._result_key(name, params)
+        generation_keys = [
+            ANALYTICS_GENERATION_KEY.format(source=source.value) for source in sources
+        ]
+
+        generations = None
+        try:
+            pipeline = self.redis_client.pipeline()
+            pipeline.mget(generation_keys)
+            pipeline.get(result_key)
+            generations, cached = await self.retry_utils.get_async_retry_on_transient(
+                pipeline.execute
+            )
+            if cached:
+                entry = json.loads(cached)
+                if entry.get("generations") == generations:
+                    self.logger.debug("[AnalyticsResultCache] hit for %s", name)
+                    return entry["result"]
+        except Exception as e:
+            self.logger.warning(
+                "[AnalyticsResultCache] lookup failed for %s, computing uncached: %s",
+                name,
+                e,
+            )
+
+        result = await compute()
+        if generations is None or (should_cache and not should_cache(result)):
+            return result
+
+        try:
+            await self.retry_utils.get_async_retry_on_transient(
+                self.redis_client.set,
+                result_key,
+                json.dumps({"generations": generations, "result": result}),
+                ex=self.ttl_seconds,
+            )
+        except Exception as e:
+            self.logger.warning(
+                "[AnalyticsResultCache] failed to store result for %s: %s", name, e
+            )
+        return result
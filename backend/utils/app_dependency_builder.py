@@ -1,7 +1,7 @@
 import os
 from backend.common.logger import get_logger
 from backend.utils.retry_utils import RetryUtils
-from backend.common.redis_client import RedisClient
+from backend.common.redis_client import AsyncRedisClient, RedisClient
 from backend.common.google_client import GoogleClient
 from backend.common.jira_client import JiraClient
 from backend.service.google_service import GoogleService
@@ -23,6 +23,9 @@ from backend.utils.google_chat_message_utils import GoogleChatMessagesUtils
 from backend.consumers.consumer_controller import ConsumerController
 from backend.utils.microsoft_chat_message_util import MicrosoftChatMessageUtil
 from backend.utils.date_time_util import DateTimeUtil
+from backend.utils.analytics_result_cache import AnalyticsResultCache
+from backend.utils.google_chat_sender_ldap_cache import GoogleChatSenderLdapCache
+from backend.utils.microsoft_user_ldap_cache import MicrosoftUserLdapCache
 from backend.consumers.microsoft_message_processor_service import (
     MicrosoftMessageProcessorService,
 )
@@ -262,6 +265,13 @@ class AppDependencyBuilder:
             logger=self.logger,
             retry_utils=self.retry_utils,
         ).get_redis_client()
+        # The analytics read path runs on the event loop, so it gets a pooled
+        # asyncio client; the connection is verified in the app lifespan.
+        self.async_redis = AsyncRedisClient(
+            logger=self.logger,
+            retry_utils=self.retry_utils,
+        )
+        self.async_redis_client = self.async_redis.get_redis_client()
         self.graph_client = MicrosoftGraphServiceClient().get_graph_service_client
         self.google_client = GoogleClient(
             logger=self.logger,
@@ -315,12 +325,19 @@ class AppDependencyBuilder:
             google_chat_subscription_service=self.google_chat_subscription_service,
         )
         self.date_time_util = DateTimeUtil(logger=self.logger)
+        self.microsoft_user_ldap_cache = MicrosoftUserLdapCache(
+            logger=self.logger,
+            redis_client=self.redis_client,
+            microsoft_service=self.microsoft_service,
+            retry_utils=self.retry_utils,
+        )
         self.microsoft_chat_message_util = MicrosoftChatMessageUtil(
             logger=self.logger,
             redis_client=self.redis_client,
             microsoft_service=self.microsoft_service,
             date_time_util=self.date_time_util,
             retry_utils=self.retry_utils,
+            user_ldap_cache=self.microsoft_user_ldap_cache,
         )
         self.gerrit_sync_service = GerritSyncService(
             logger=self.logger,
@@ -361,11 +378,18 @@ class AppDependencyBuilder:
             meet_spaces_client=self.meet_spaces_client,
             meet_conference_records_client=self.meet_conference_records_client,
         )
+        self.google_chat_sender_ldap_cache = GoogleChatSenderLdapCache(
+            logger=self.logger,
+            redis_client=self.redis_client,
+            google_service=self.google_service,
+            retry_utils=self.retry_utils,
+        )
         self.google_chat_processor_service = GoogleChatProcessorService(
             logger=self.logger,
             pubsub_puller_factory=self.pubsub_puller_factory,
             google_chat_messages_utils=self.google_chat_messages_utils,
             google_service=self.google_service,
+            sender_ldap_cache=self.google_chat_sender_ldap_cache,
         )
         self.gerrit_processor_service = GerritProcessorService(
             logger=self.logger,
@@ -382,16 +406,25 @@ class AppDependencyBuilder:
             google_chat_processor_service=self.google_chat_processor_service,
             gerrit_processor_service=self.gerrit_processor_service,
             asyncio_event_loop_manager=self.asyncio_event_loop_manager,
+            redis_client=self.redis_client,
+            retry_utils=self.retry_utils,
         )
         self.consumer_controller = ConsumerController(
             pubsub_sync_pull_service=self.pubsub_sync_pull_service,
         )
 
+        self.ldap_service = LdapService(
+            logger=self.logger,
+            redis_client=self.async_redis_client,
+            retry_utils=self.retry_utils,
+        )
         self.microsoft_member_sync_service = MicrosoftMemberSyncService(
             logger=self.logger,
             redis_client=self.redis_client,
             microsoft_service=self.microsoft_service,
             retry_utils=self.retry_utils,
+            ldap_service=self.ldap_service,
+            user_ldap_cache=self.microsoft_user_ldap_cache,
         )
         # Hoisted above the employment sync, which records a level change on
         # the ledger and so needs both a session and a way to resolve an ldap to
@@ -416,10 +449,21 @@ class AppDependencyBuilder:
             leave_ledger_repository=self.leave_ledger_repository,
             participant_resolver=self.leave_participant_resolver,
         )
+        self.microsoft_meeting_chat_topic_cache_service = (
+            MicrosoftMeetingChatTopicCacheService(
+                logger=self.logger,
+                redis_client=self.async_redis_client,
+                microsoft_service=self.microsoft_service,
+                retry_utils=self.retry_utils,
+            )
+        )
         self.microsoft_chat_history_sync_service = MicrosoftChatHistorySyncService(
             logger=self.logger,
             microsoft_service=self.microsoft_service,
             microsoft_chat_message_util=self.microsoft_chat_message_util,
+            redis_client=self.async_redis_client,
+            retry_utils=self.retry_utils,
+            microsoft_meeting_chat_topic_cache_service=self.microsoft_meeting_chat_topic_cache_service,
         )
         self.jira_search_service = JiraSearchService(
             logger=self.logger,
@@ -434,11 +478,6 @@ class AppDependencyBuilder:
             date_time_util=self.date_time_util,
             retry_utils=self.retry_utils,
         )
-        self.ldap_service = LdapService(
-            logger=self.logger,
-            redis_client=self.redis_client,
-            retry_utils=self.retry_utils,
-        )
         self.google_calendar_sync_service = GoogleCalendarSyncService(
             logger=self.logger,
             redis_client=self.redis_client,
@@ -452,6 +491,8 @@ class AppDependencyBuilder:
             logger=self.logger,
             google_service=self.google_service,
             google_chat_message_utils=self.google_chat_messages_utils,
+            redis_client=self.redis_client,
+            retry_utils=self.retry_utils,
         )
         self.historical_controller = HistoricalController(
             logger=self.logger,
@@ -466,49 +507,50 @@ class AppDependencyBuilder:
         )
         self.microsoft_chat_analytics_service = MicrosoftChatAnalyticsService(
             logger=self.logger,
-            redis_client=self.redis_client,
+            redis_client=self.async_redis_client,
             date_time_util=self.date_time_util,
             ldap_service=self.ldap_service,
             retry_utils=self.retry_utils,
         )
-        self.microsoft_meeting_chat_topic_cache_service = (
-            MicrosoftMeetingChatTopicCacheService(
-                logger=self.logger,
-                redis_client=self.redis_client,
-                microsoft_service=self.microsoft_service,
-                retry_utils=self.retry_utils,
-            )
+        self.analytics_result_cache = AnalyticsResultCache(
+            logger=self.logger,
+            redis_client=self.async_redis_client,
+            retry_utils=self.retry_utils,
         )
         self.jira_analytics_service = JiraAnalyticsService(
             logger=self.logger,
-            redis_client=self.redis_client,
+            redis_client=self.async_redis_client,
             retry_utils=self.retry_utils,
             date_time_util=self.date_time_util,
             ldap_service=self.ldap_service,
+            result_cache=self.analytics_result_cache,
         )
         self.google_calendar_analytics_service = GoogleCalendarAnalyticsService(
             logger=self.logger,
-            redis_client=self.redis_client,
+            redis_client=self.async_redis_client,
             retry_utils=self.retry_utils,
             ldap_service=self.ldap_service,
+            date_time_util=self.date_time_util,
         )
         self.gerrit_analytics_service = GerritAnalyticsService(
             logger=self.logger,
-            redis_client=self.redis_client,
+            redis_client=self.async_redis_client,
             retry_utils=self.retry_utils,
             ldap_service=self.ldap_service,
             date_time_util=self.date_time_util,
             gerrit_client=self.gerrit_client,
+            result_cache=self.analytics_result_cache,
         )
         self.google_chat_analytics_service = GoogleChatAnalyticsService(
             logger=self.logger,
-            redis_client=self.redis_client,
+            redis_client=self.async_redis_client,
             retry_utils=self.retry_utils,
             date_time_util=self.date_time_util,
             google_service=self.google_service,
             ldap_service=self.ldap_service,
         )
         self.summary_service = SummaryService(
+            logger=self.logger,
             ldap_service=self.ldap_service,
             microsoft_chat_analytics_service=self.microsoft_chat_analytics_service,
             google_calendar_analytics_service=self.google_calendar_analytics_service,
@@ -516,6 +558,7 @@ class AppDependencyBuilder:
             gerrit_analytics_service=self.gerrit_analytics_service,
             jira_analytics_service=self.jira_analytics_service,
             date_time_util=self.date_time_util,
+            result_cache=self.analytics_result_cache,
         )
         self.internal_activity_controller = InternalActivityController(
             ldap_service=self.ldap_service,
@@ -967,5 +1010,6 @@ class AppDependencyBuilder:
             notification_topic_path=self.notification_topic_path,
             launchdarkly_client=self.launchdarkly_client,
             database=self.database,
+            async_redis=self.async_redis,
             logger=self.logger,
         )
@@ -0,0 +1,104 @@
+from collections import Counter
+from datetime import datetime, timezone
+
+from backend.common.constants import DATE_FORMAT_YMD
+
+# Adjusts a daily rollup only when the index membership is about to change, so
+# replayed events and re-run history syncs cannot count a message twice.
+#   KEYS[1]: chat message index sorted set
+#   KEYS[2]: daily rollup hash
+#   ARGV[1]: message ID (index member)
+#   ARGV[2]: rollup hash field
+#   ARGV[3]: +1 when the message is about to be added, -1 when removed
+_ADJUST_DAILY_COUNT_SCRIPT = """
+local indexed = redis.call('ZSCORE', KEYS[1], ARGV[1])
+local delta = tonumber(ARGV[3])
+if (delta > 0 and not indexed) or (delta < 0 and indexed) then
+    return redis.call('HINCRBY', KEYS[2], ARGV[2], delta)
+end
+return false
+"""
+
+
+def daily_bucket(timestamp: float) -> str:
+    """Return the UTC day ('YYYY-MM-DD') a message timestamp rolls up into."""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(DATE_FORMAT_YMD)
+
+
+def queue_daily_count_adjustment(
+    pipeline,
+    index_key: str,
+    message_id: str,
+    rollup_key: str,
+    field: str,
+    delta: int,
+) -> None:
+    """
+    Queue a guarded daily rollup adjustment into the provided pipeline.
+
+    Must be queued before the ZADD/ZREM on `index_key` it accompanies: the
+    script checks index membership as it was before that command runs.
+
+    Args:
+        pipeline: A Redis pipeline used for batched operations.
+        index_key (str): Sorted set the message is being added to or removed from.
+        message_id (str): The message ID (member of `index_key`).
+        rollup_key (str): Daily rollup hash key.
+        field (str): Field within the rollup hash to adjust.
+        delta (int): 1 for an addition to the index, -1 for a removal.
+    """
+    pipeline.eval(
+        _ADJUST_DAILY_COUNT_SCRIPT, 2, index_key, rollup_key, message_id, field, delta
+    )
+
+
+def rebuild_daily_counts(
+    redis_client,
+    retry_utils,
+    index_key_pattern: str,
+    rollup_key_template: str,
+    ready_key: str,
+    field_from_index_key,
+) -> int:
+    """
+    Rebuild daily rollup hashes from the chat message index sorted sets.
+
+    Scans every index key matching `index_key_pattern`, buckets each member's
+    score into its UTC day, then replaces all existing rollup hashes with the
+    recomputed counts and sets `ready_key` so readers switch to the rollups.
+
+    Messages indexed while the rebuild is running may be missed by the counts;
+    run it again if the rollups drift.
+
+    Args:
+        redis_client: The Redis client instance.
+        retry_utils: A RetryUtils for handling retries on transient errors.
+        index_key_pattern (str): SCAN pattern matching the index sorted sets.
+        rollup_key_template (str): Rollup key template with a `{day}` placeholder.
+        ready_key (str): Marker key signalling that the rollups are complete.
+        field_from_index_key (Callable[[str], str]): Maps an index key to its
+            rollup hash field.
+
+    Returns:
+        int: The number of daily rollup hashes written.
+    """
+    counts: dict[str, Counter] = {}
+    for index_key in redis_client.scan_iter(match=index_key_pattern):
+        field = field_from_index_key(index_key)
+        scores = retry_utils.get_retry_on_transient(
+            redis_client.zrange, index_key, 0, -1, withscores=True
+        )
+        for _, score in scores:
+            counts.setdefault(daily_bucket(score), Counter())[field] += 1
+
+    stale_keys = list(redis_client.scan_iter(match=rollup_key_template.format(day="*")))
+
+    pipeline = redis_client.pipeline()
+    if stale_keys:
+        pipeline.delete(*stale_keys)
+    for day, day_counts in counts.items():
+        pipeline.hset(rollup_key_template.format(day=day), mapping=dict(day_counts))
+    pipeline.set(ready_key, datetime.now(timezone.utc).isoformat())
+    retry_utils.get_retry_on_transient(pipeline.execute)
+
+    return len(counts)
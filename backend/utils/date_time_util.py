@@ -86,6 +86,15 @@ class DateTimeUtil:
 
         return buckets
 
+    def get_day_buckets(self, start: date, end: date) -> list[str]:
+        """Returns a list of daily bucket strings like 'YYYY-MM-DD', inclusive of both ends."""
+        if start > end:
+            raise ValueError(f"start_date ({start}) must be <= end_date ({end})")
+        return [
+            (start + timedelta(days=offset)).isoformat()
+            for offset in range((end - start).days + 1)
+        ]
+
     def format_datetime_to_int(self, dt: datetime) -> int:
         """
         Convert a datetime objectinto an integer in YYYYMMDD format.
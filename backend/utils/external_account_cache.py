@@ -0,0 +1,19 @@
+def queue_external_account(
+    pipeline, key: str, account_id: str, ttl_seconds: int
+) -> None:
+    """
+    Queue a negative cache entry for an account without a workspace LDAP.
+
+    Negative entries share one Redis hash per source. Only the first entry sets
+    the hash's TTL (EXPIRE NX), so the hash is dropped as a whole at most
+    `ttl_seconds` after it was created and no entry outlives that, however
+    often later entries are added.
+
+    Args:
+        pipeline: The Redis pipeline to queue the commands on.
+        key (str): The hash of external account IDs.
+        account_id (str): The account ID with no workspace LDAP.
+        ttl_seconds (int): Maximum lifetime of the negative entry.
+    """
+    pipeline.hset(key, account_id, "")
+    pipeline.expire(key, ttl_seconds, nx=True)
@@ -52,6 +52,7 @@ class FastAppFactory:
         notification_topic_path,
         launchdarkly_client,
         database,
+        async_redis,
         logger,
     ):
         """
@@ -88,6 +89,8 @@ class FastAppFactory:
                 published to.
             launchdarkly_client: LaunchDarklyClient instance for feature flag lifecycle management.
             database: Database instance for application lifecycle cleanup.
+            async_redis: AsyncRedisClient whose pooled connection is verified on
+                startup and released on shutdown.
         """
         self.authentication_controller = authentication_controller
         self.authentication_service = authentication_service
@@ -118,6 +121,7 @@ class FastAppFactory:
         self.notification_topic_path = notification_topic_path
         self.launchdarkly_client = launchdarkly_client
         self.database = database
+        self.async_redis = async_redis
         self.logger = logger
 
     def create_app(self, is_prod: bool = False) -> FastAPI:
@@ -153,8 +157,10 @@ class FastAppFactory:
         @asynccontextmanager
         async def lifespan(app):
             self.launchdarkly_client.initialize()
+            await self.async_redis.verify_connection()
             yield
             await self.database.close()
+            await self.async_redis.close()
             self.launchdarkly_client.close()
 
         # Initialize the FastAPI app
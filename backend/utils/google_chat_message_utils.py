@@ -5,6 +5,16 @@ from backend.common.constants import (
     GoogleChatEventType,
     CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY,
     DELETED_GOOGLE_CHAT_MESSAGES_INDEX_KEY,
+    GOOGLE_CHAT_DAILY_COUNT_KEY,
+    GOOGLE_CHAT_DAILY_COUNT_FIELD,
+    GOOGLE_CHAT_DAILY_COUNT_READY_KEY,
+    AnalyticsSource,
+)
+from backend.utils.analytics_result_cache import bump_analytics_generation
+from backend.utils.chat_daily_count import (
+    daily_bucket,
+    queue_daily_count_adjustment,
+    rebuild_daily_counts,
 )
 
 
@@ -73,6 +83,7 @@ class GoogleChatMessagesUtils:
         ldaps_dict: dict,
         batch_messages: list[dict],
         message_type: GoogleChatEventType,
+        pipeline=None,
     ) -> None:
         """
         Processes a batch of Google Chat messages and persists their state in Redis.
@@ -112,6 +123,10 @@ class GoogleChatMessagesUtils:
                 - `CREATED`, `BATCH_CREATED`
                 - `UPDATED`, `BATCH_UPDATED`
                 - `DELETED`, `BATCH_DELETED`
+            pipeline:
+                Optional staged pipeline of a `RedisWriteBatch`. When given, the
+                commands are queued on it and executed with the rest of the
+                pulled Pub/Sub batch instead of here.
 
         Raises:
             ValueError:
@@ -164,7 +179,17 @@ class GoogleChatMessagesUtils:
                 f"Missing ldaps_dict for batch message type: {message_type}"
             )
 
-        pipeline = self.redis_client.pipeline()
+        owned = pipeline is None
+        if owned:
+            pipeline = self.redis_client.pipeline()
+        elif message_type not in (
+            GoogleChatEventType.CREATED,
+            GoogleChatEventType.BATCH_CREATED,
+        ):
+            # Updates and deletes read the stored message, which an earlier
+            # message of the same batch may have just written.
+            pipeline.flush_batch()
+
         if message_type in (
             GoogleChatEventType.CREATED,
             GoogleChatEventType.BATCH_CREATED,
@@ -202,6 +227,9 @@ class GoogleChatMessagesUtils:
             )
             return
 
+        bump_analytics_generation(pipeline, AnalyticsSource.GOOGLE_CHAT)
+        if not owned:
+            return
         try:
             self.retry_utils.get_retry_on_transient(pipeline.execute)
         except Exception as e:
@@ -222,9 +250,11 @@ class GoogleChatMessagesUtils:
 
         This method extracts metadata from the message payload, builds a
         `StoredGoogleChatMessage`, and queues Redis operations into the
-        provided pipeline. Two things are stored:
+        provided pipeline. Three things are stored:
         1. The message ID is added to a sorted set (for chronological lookup).
-        2. The serialized message details are stored under its Redis key.
+        2. The sender/space count in the message's daily rollup is incremented,
+           unless the message is already indexed.
+        3. The serialized message details are stored under its Redis key.
 
         Note:
             The pipeline is not executed here. It must be executed by the caller.
@@ -247,6 +277,9 @@ class GoogleChatMessagesUtils:
                 Key: "google:chat:created:{sender_ldap}:{space_id}"
                 Member: "{message_id}"
                 Score:  timestamp from "createTime"
+            - Daily rollup:
+                Key:   "google:chat_daily:{YYYY-MM-DD}"
+                Field: "{sender_ldap}:{space_id}"
             - Message details:
                 Key:   "spaces/{space_id}/messages/{message_id}"
                 Value: JSON-serialized `StoredGoogleChatMessage`
@@ -287,6 +320,18 @@ class GoogleChatMessagesUtils:
             attachment=message.get("attachment") or [],
         )
 
+        queue_daily_count_adjustment(
+            pipeline,
+            index_key=created_key,
+            message_id=message_id,
+            rollup_key=GOOGLE_CHAT_DAILY_COUNT_KEY.format(
+                day=daily_bucket(index_score)
+            ),
+            field=GOOGLE_CHAT_DAILY_COUNT_FIELD.format(
+                sender_ldap=sender_ldap, space_id=space_id
+            ),
+            delta=1,
+        )
         pipeline.zadd(created_key, {message_id: index_score})
         self.logger.debug("ZADD %s {%s: %s}", created_key, message_id, index_score)
 
@@ -406,6 +451,8 @@ class GoogleChatMessagesUtils:
                 { "is_deleted": true }
                 ```
             4. **Update Indexes**:
+                - Decrement the sender/space count in the message's daily rollup
+                  (`google:chat_daily:{YYYY-MM-DD}`), guarded by CREATED index membership.
                 - Remove from active messages:
                   ```
                   ZREM google:chat:created:{sender_ldap}:{space_id} {message_id}
@@ -484,6 +531,16 @@ class GoogleChatMessagesUtils:
         pipeline.set(name, json.dumps(saved))
         self.logger.debug("SET %s is_deleted=True", name)
 
+        queue_daily_count_adjustment(
+            pipeline,
+            index_key=created_key,
+            message_id=message_id,
+            rollup_key=GOOGLE_CHAT_DAILY_COUNT_KEY.format(day=daily_bucket(score)),
+            field=GOOGLE_CHAT_DAILY_COUNT_FIELD.format(
+                sender_ldap=sender_ldap, space_id=space_id
+            ),
+            delta=-1,
+        )
         pipeline.zrem(created_key, message_id)
 
         self.logger.debug("ZREM %s from %s", message_id, created_key)
@@ -540,6 +597,7 @@ class GoogleChatMessagesUtils:
                 pipeline=pipeline, message=message_data, sender_ldap=sender_ldap
             )
 
+        bump_analytics_generation(pipeline, AnalyticsSource.GOOGLE_CHAT)
         try:
             self.retry_utils.get_retry_on_transient(pipeline.execute)
         except Exception as e:
@@ -547,3 +605,34 @@ class GoogleChatMessagesUtils:
                 "Redis pipeline failed for batch sync: %s", e, exc_info=True
             )
             raise RuntimeError("Redis pipeline failed for batch sync") from e
+
+    def rebuild_daily_counts(self) -> int:
+        """
+        Backfill the daily Google Chat count rollups from the CREATED indexes.
+
+        Rollups are maintained incrementally by `_handle_created_message` and
+        `_handle_deleted_message`; this rebuilds them from the existing
+        `google:chat:created:{sender_ldap}:{space_id}` sorted sets, then marks
+        them ready so `GoogleChatAnalyticsService.count_messages` reads them.
+
+        Returns:
+            int: The number of daily rollup hashes written.
+        """
+        prefix, _, _ = CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY.partition("{")
+
+        def field_from_index_key(index_key: str) -> str:
+            sender_ldap, space_id = index_key[len(prefix) :].split(":", 1)
+            return GOOGLE_CHAT_DAILY_COUNT_FIELD.format(
+                sender_ldap=sender_ldap, space_id=space_id
+            )
+
+        days = rebuild_daily_counts(
+            redis_client=self.redis_client,
+            retry_utils=self.retry_utils,
+            index_key_pattern=f"{prefix}*",
+            rollup_key_template=GOOGLE_CHAT_DAILY_COUNT_KEY,
+            ready_key=GOOGLE_CHAT_DAILY_COUNT_READY_KEY,
+            field_from_index_key=field_from_index_key,
+        )
+        self.logger.info("Rebuilt Google Chat daily count rollups for %d days.", days)
+        return days
@@ -0,0 +1,192 @@
+import threading
+import time
+from collections import OrderedDict
+
+from backend.common.constants import (
+    GOOGLE_CHAT_EXTERNAL_SENDERS_KEY,
+    GOOGLE_CHAT_SENDER_LDAP_KEY,
+)
+from backend.utils.external_account_cache import queue_external_account
+
+# The directory hash is replaced wholesale from list_directory_all_people_ldap
+# whenever it expires, so new hires are picked up within a day without a
+# People API call per message.
+DEFAULT_SENDER_LDAP_TTL_SECONDS = 24 * 3600
+# External accounts are remembered for less time, in case an account that
+# looked external was only missing from a stale directory snapshot.
+DEFAULT_EXTERNAL_SENDER_TTL_SECONDS = 3600
+DEFAULT_LOCAL_CACHE_SIZE = 2048
+
+# Adds a sender to the directory hash only while the hash exists. A plain HSET
+# after the directory expired would recreate it with that single sender, and
+# every other lookup would then see a directory and never warm the full one.
+_HSET_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+end
+return 0
+"""
+
+
+class GoogleChatSenderLdapCache:
+    """
+    Two-tier cache resolving Google Chat sender IDs to LDAPs.
+
+    Lookups are served from an in-process LRU first, then from a Redis hash
+    shared by all workers, which is pre-warmed from the People API directory
+    listing. Only senders missing from both fall back to a per-user People API
+    lookup; senders without a workspace email (external accounts) are cached
+    negatively so they are not looked up again on every message.
+    """
+
+    def __init__(
+        self,
+        logger,
+        redis_client,
+        google_service,
+        retry_utils,
+        ttl_seconds: int = DEFAULT_SENDER_LDAP_TTL_SECONDS,
+        external_ttl_seconds: int = DEFAULT_EXTERNAL_SENDER_TTL_SECONDS,
+        local_cache_size: int = DEFAULT_LOCAL_CACHE_SIZE,
+    ):
+        """
+        Initialize the GoogleChatSenderLdapCache.
+
+        Args:
+            logger: The logger instance for logging messages.
+            redis_client: The Redis client instance.
+            google_service: A GoogleService used to list and look up people.
+            retry_utils: A RetryUtils for handling retries on transient errors.
+            ttl_seconds: Lifetime of the shared directory hash and of local entries.
+            external_ttl_seconds: Lifetime of negative (external sender) entries.
+            local_cache_size: Maximum number of senders kept in the in-process LRU.
+        """
+        self.logger = logger
+        self.redis_client = redis_client
+        self.google_service = google_service
+        self.retry_utils = retry_utils
+        self.ttl_seconds = ttl_seconds
+        self.external_ttl_seconds = external_ttl_seconds
+        self.local_cache_size = local_cache_size
+        self._local = OrderedDict()  # sender_id -> (expires_at, ldap or None)
+        self._lock = threading.Lock()
+        self._hset_if_exists = redis_client.register_script(_HSET_IF_EXISTS_SCRIPT)
+
+    def _get_local(self, sender_id: str):
+        """Return the (hit, ldap) pair for a sender from the in-process LRU."""
+        with self._lock:
+            entry = self._local.get(sender_id)
+            if not entry:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._local[sender_id]
+                return False, None
+            self._local.move_to_end(sender_id)
+            return True, entry[1]
+
+    def _put_local(self, sender_id: str, ldap: str | None) -> None:
+        """Remember a sender in the in-process LRU, evicting the oldest entry."""
+        ttl = self.ttl_seconds if ldap else self.external_ttl_seconds
+        with self._lock:
+            self._local[sender_id] = (time.monotonic() + ttl, ldap)
+            self._local.move_to_end(sender_id)
+            while len(self._local) > self.local_cache_size:
+                self._local.popitem(last=False)
+
+    def warm(self, ldaps_by_id: dict[str, str] | None = None) -> dict[str, str]:
+        """
+        Replace the shared directory hash with a fresh directory snapshot.
+
+        Args:
+            ldaps_by_id (dict[str, str] | None): Sender ID to LDAP mapping to
+                store. Fetched from the People API directory when omitted.
+
+        Returns:
+            dict[str, str]: The stored sender ID to LDAP mapping.
+        """
+        if ldaps_by_id is None:
+            ldaps_by_id = self.google_service.list_directory_all_people_ldap()
+        if not ldaps_by_id:
+            return {}
+
+        pipeline = self.redis_client.pipeline()
+        pipeline.delete(GOOGLE_CHAT_SENDER_LDAP_KEY)
+        pipeline.hset(GOOGLE_CHAT_SENDER_LDAP_KEY, mapping=ldaps_by_id)
+        pipeline.expire(GOOGLE_CHAT_SENDER_LDAP_KEY, self.ttl_seconds)
+        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self.logger.info(
+            "[GoogleChatSenderLdapCache] Warmed sender LDAP cache with %d people.",
+            len(ldaps_by_id),
+        )
+        return ldaps_by_id
+
+    def get_directory(self) -> dict[str, str]:
+        """
+        Return the full sender ID to LDAP mapping, warming it when absent.
+
+        Returns:
+            dict[str, str]: Mapping of sender IDs to LDAPs.
+        """
+        ldaps_by_id = self.retry_utils.get_retry_on_transient(
+            self.redis_client.hgetall, GOOGLE_CHAT_SENDER_LDAP_KEY
+        )
+        return ldaps_by_id or self.warm()
+
+    def get_ldap(self, sender_id: str) -> str | None:
+        """
+        Resolve a Google Chat sender ID to its LDAP.
+
+        Args:
+            sender_id (str): The sender's Google user ID.
+
+        Returns:
+            str | None: The LDAP, or None for senders outside the workspace.
+
+        Raises:
+            RuntimeError: If the People API lookup fails on a cache miss.
+        """
+        hit, ldap = self._get_local(sender_id)
+        if hit:
+            return ldap
+
+        pipeline = self.redis_client.pipeline()
+        pipeline.hget(GOOGLE_CHAT_SENDER_LDAP_KEY, sender_id)
+        pipeline.hexists(GOOGLE_CHAT_EXTERNAL_SENDERS_KEY, sender_id)
+        pipeline.exists(GOOGLE_CHAT_SENDER_LDAP_KEY)
+        ldap, is_external, directory_exists = self.retry_utils.get_retry_on_transient(
+            pipeline.execute
+        )
+
+        if not ldap and not is_external and not directory_exists:
+            try:
+                ldap = self.warm().get(sender_id)
+            except RuntimeError as e:
+                self.logger.warning(
+                    "[GoogleChatSenderLdapCache] Failed to warm sender LDAP cache: %s",
+                    e,
+                )
+
+        if ldap or is_external:
+            self._put_local(sender_id, ldap or None)
+            return ldap or None
+
+        ldap = self.google_service.get_ldap_by_id(sender_id)
+        if ldap:
+            self.retry_utils.get_retry_on_transient(
+                self._hset_if_exists,
+                keys=[GOOGLE_CHAT_SENDER_LDAP_KEY],
+                args=[sender_id, ldap],
+            )
+            self._put_local(sender_id, ldap)
+            return ldap
+
+        pipeline = self.redis_client.pipeline()
+        queue_external_account(
+            pipeline,
+            GOOGLE_CHAT_EXTERNAL_SENDERS_KEY,
+            sender_id,
+            self.external_ttl_seconds,
+        )
+        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self._put_local(sender_id, None)
+        return None
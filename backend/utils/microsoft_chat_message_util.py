@@ -5,8 +5,17 @@ from backend.common.constants import (
     MicrosoftChatMessagesChangeType,
     MICROSOFT_CHAT_MESSAGES_INDEX_KEY,
     MICROSOFT_CHAT_MESSAGES_DETAILS_KEY,
+    MICROSOFT_CHAT_DAILY_COUNT_KEY,
+    MICROSOFT_CHAT_DAILY_COUNT_READY_KEY,
     MicrosoftChatMessageAttachmentType,
     MicrosoftChatMessageType,
+    AnalyticsSource,
+)
+from backend.utils.analytics_result_cache import bump_analytics_generation
+from backend.utils.chat_daily_count import (
+    daily_bucket,
+    queue_daily_count_adjustment,
+    rebuild_daily_counts,
 )
 
 
@@ -58,6 +67,7 @@ class MicrosoftChatMessageUtil:
         microsoft_service,
         date_time_util,
         retry_utils,
+        user_ldap_cache,
     ):
         """
         Initializes the MicrosoftChatMessageUtil with necessary clients and logger.
@@ -68,12 +78,14 @@ class MicrosoftChatMessageUtil:
             microsoft_service: The MicrosoftService instance.
             date_time_util: A DateTimeUtil for date and time operations.
             retry_utils: A RetryUtils for handling retries on transient errors.
+            user_ldap_cache: A MicrosoftUserLdapCache resolving message senders.
         """
         self.logger = logger
         self.redis_client = redis_client
         self.microsoft_service = microsoft_service
         self.date_time_util = date_time_util
         self.retry_utils = retry_utils
+        self.user_ldap_cache = user_ldap_cache
 
     def _process_attachments(
         self, attachments: list, message_id: str
@@ -131,7 +143,8 @@ class MicrosoftChatMessageUtil:
     ) -> None:
         """
         Processes a deleted message by removing it from the 'created' index
-        and adding it to the 'deleted' index in Redis.
+        and adding it to the 'deleted' index in Redis. The sender's count in the
+        message's daily rollup is decremented alongside.
 
         Args:
             message_id (str): The unique identifier of the message that has been deleted.
@@ -176,6 +189,14 @@ class MicrosoftChatMessageUtil:
             sender_ldap=sender_ldap,
         )
 
+        queue_daily_count_adjustment(
+            pipeline,
+            index_key=created_index_redis_key,
+            message_id=message_id,
+            rollup_key=MICROSOFT_CHAT_DAILY_COUNT_KEY.format(day=daily_bucket(score)),
+            field=sender_ldap,
+            delta=-1,
+        )
         pipeline.zrem(created_index_redis_key, message_id)
         self.logger.debug(
             "[MicrosoftChatMessageUtil] Added ZREM command for %s from %s to pipeline.",
@@ -198,7 +219,8 @@ class MicrosoftChatMessageUtil:
         Processes a newly created message and stores its details in Redis.
         Extracts message content, sender information, attachment URLs, and reply-to
         message ID. Formats the creation timestamp and then uses a Redis pipeline
-        to store the message's index (ranked by time) and its detailed information.
+        to store the message's index (ranked by time), its daily rollup count and
+        its detailed information.
 
         Args:
             message: The microsoft.graph.chatMessage object.
@@ -254,6 +276,16 @@ class MicrosoftChatMessageUtil:
             sender_ldap=sender_ldap,
         )
 
+        queue_daily_count_adjustment(
+            pipeline,
+            index_key=index_redis_key,
+            message_id=message_id,
+            rollup_key=MICROSOFT_CHAT_DAILY_COUNT_KEY.format(
+                day=daily_bucket(index_score)
+            ),
+            field=sender_ldap,
+            delta=1,
+        )
         pipeline.zadd(index_redis_key, {message_id: index_score})
         self.logger.debug(
             "[MicrosoftChatMessageUtil] Added message %s to %s with score %s",
@@ -332,6 +364,16 @@ class MicrosoftChatMessageUtil:
                 deleted_index_redis_key,
             )
 
+            queue_daily_count_adjustment(
+                pipeline,
+                index_key=created_index_redis_key,
+                message_id=message_id,
+                rollup_key=MICROSOFT_CHAT_DAILY_COUNT_KEY.format(
+                    day=daily_bucket(score)
+                ),
+                field=sender_ldap,
+                delta=1,
+            )
             pipeline.zadd(created_index_redis_key, {message_id: score})
             self.logger.debug(
                 "[MicrosoftChatMessageUtil] Added ZADD command for %s to %s to pipeline with score %s.",
@@ -391,7 +433,7 @@ class MicrosoftChatMessageUtil:
                 )
 
     async def sync_near_real_time_message_to_redis(
-        self, change_type: MicrosoftChatMessagesChangeType, resource: str
+        self, change_type: MicrosoftChatMessagesChangeType, resource: str, pipeline=None
     ):
         """
         Synchronizes a single chat message update (create, update, or delete) from
@@ -408,6 +450,9 @@ class MicrosoftChatMessageUtil:
                         Expected values are from `MicrosoftChatMessagesChangeType`.
             resource: A string representing the resource that changed. Expected format is
                     "chats('{chat_id}')/messages('{message_id}')".
+            pipeline: Optional staged pipeline of a `RedisWriteBatch`. When given,
+                    the commands are queued on it and executed with the rest of
+                    the pulled Pub/Sub batch instead of here.
 
         Raises:
             ValueError: If the `resource` string format is invalid, if clients (Graph or Redis)
@@ -436,7 +481,6 @@ class MicrosoftChatMessageUtil:
                 message_id,
             )
             return
-        pipeline = self.redis_client.pipeline()
         sender_info = message.from_.user if message.from_ else None
         sender_id = sender_info.id if sender_info else None
         if not sender_id:
@@ -445,13 +489,21 @@ class MicrosoftChatMessageUtil:
                 message_id,
             )
             return
-        sender_ldap = await self.microsoft_service.get_ldap_by_id(sender_id)
+        sender_ldap = await self.user_ldap_cache.get_ldap(sender_id)
         if not sender_ldap:
             self.logger.warning(
                 "[MicrosoftChatMessageUtil] Skipping message %s: Sent by external account.",
                 message_id,
             )
             return
+        owned = pipeline is None
+        if owned:
+            pipeline = self.redis_client.pipeline()
+        elif MicrosoftChatMessagesChangeType.CREATED.value != change_type:
+            # Updates and deletes read the indexes and stored message, which an
+            # earlier message of the same batch may have just written.
+            pipeline.flush_batch()
+
         if MicrosoftChatMessagesChangeType.DELETED.value == change_type:
             created_index_redis_key = MICROSOFT_CHAT_MESSAGES_INDEX_KEY.format(
                 message_status=MicrosoftChatMessagesChangeType.CREATED.value,
@@ -473,6 +525,9 @@ class MicrosoftChatMessageUtil:
         else:
             self._handle_update_message(message, sender_ldap, pipeline)
 
+        bump_analytics_generation(pipeline, AnalyticsSource.MICROSOFT_CHAT)
+        if not owned:
+            return
         try:
             self.retry_utils.get_retry_on_transient(pipeline.execute)
         except Exception as e:
@@ -560,6 +615,7 @@ class MicrosoftChatMessageUtil:
             self._handle_created_messages(message, sender_ldap, pipe)
             total_processed += 1
 
+        bump_analytics_generation(pipe, AnalyticsSource.MICROSOFT_CHAT)
         self.retry_utils.get_retry_on_transient(pipe.execute)
 
         self.logger.debug(
@@ -569,3 +625,33 @@ class MicrosoftChatMessageUtil:
         )
 
         return total_processed, total_skipped
+
+    def rebuild_daily_counts(self) -> int:
+        """
+        Backfill the daily Microsoft chat count rollups from the CREATED indexes.
+
+        Rollups are maintained incrementally as messages are created, deleted
+        or restored; this rebuilds them from the existing
+        `microsoft:chat:created:{sender_ldap}` sorted sets, then marks them ready
+        so `MicrosoftChatAnalyticsService` reads them.
+
+        Returns:
+            int: The number of daily rollup hashes written.
+        """
+        prefix = MICROSOFT_CHAT_MESSAGES_INDEX_KEY.format(
+            message_status=MicrosoftChatMessagesChangeType.CREATED.value,
+            sender_ldap="",
+        )
+        days = rebuild_daily_counts(
+            redis_client=self.redis_client,
+            retry_utils=self.retry_utils,
+            index_key_pattern=f"{prefix}*",
+            rollup_key_template=MICROSOFT_CHAT_DAILY_COUNT_KEY,
+            ready_key=MICROSOFT_CHAT_DAILY_COUNT_READY_KEY,
+            field_from_index_key=lambda index_key: index_key[len(prefix) :],
+        )
+        self.logger.info(
+            "[MicrosoftChatMessageUtil] Rebuilt daily count rollups for %d days.",
+            days,
+        )
+        return days
@@ -0,0 +1,117 @@
+import asyncio
+
+from backend.common.constants import (
+    MICROSOFT_EXTERNAL_USERS_KEY,
+    MICROSOFT_USER_LDAP_KEY,
+)
+from backend.utils.external_account_cache import queue_external_account
+
+# Users Graph cannot resolve to a workspace mail (guests, external tenants) are
+# remembered for this long before Graph is asked again.
+DEFAULT_EXTERNAL_USER_TTL_SECONDS = 3600
+
+
+class MicrosoftUserLdapCache:
+    """
+    Shared cache resolving Microsoft Graph user IDs to LDAPs.
+
+    The full directory is stored in a Redis hash, replaced from
+    `MicrosoftService.list_all_id_ldap_mapping` on every member sync. Users
+    missing from it are looked up in Graph once, however many messages from
+    them arrive concurrently, and the result is written back for every worker.
+    """
+
+    def __init__(
+        self,
+        logger,
+        redis_client,
+        microsoft_service,
+        retry_utils,
+        external_ttl_seconds: int = DEFAULT_EXTERNAL_USER_TTL_SECONDS,
+    ):
+        """
+        Initialize the MicrosoftUserLdapCache.
+
+        Args:
+            logger: The logger instance for logging messages.
+            redis_client: The Redis client instance.
+            microsoft_service: The MicrosoftService instance.
+            retry_utils: A RetryUtils for handling retries on transient errors.
+            external_ttl_seconds: Lifetime of negative (external user) entries.
+        """
+        self.logger = logger
+        self.redis_client = redis_client
+        self.microsoft_service = microsoft_service
+        self.retry_utils = retry_utils
+        self.external_ttl_seconds = external_ttl_seconds
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    async def refresh(self) -> int:
+        """
+        Replace the cached directory with the current Graph user listing.
+
+        Returns:
+            int: The number of users stored.
+        """
+        ldaps_by_id = await self.microsoft_service.list_all_id_ldap_mapping()
+        if not ldaps_by_id:
+            self.logger.warning(
+                "[MicrosoftUserLdapCache] Graph returned no users; keeping the cached directory."
+            )
+            return 0
+
+        pipeline = self.redis_client.pipeline()
+        pipeline.delete(MICROSOFT_USER_LDAP_KEY, MICROSOFT_EXTERNAL_USERS_KEY)
+        pipeline.hset(MICROSOFT_USER_LDAP_KEY, mapping=ldaps_by_id)
+        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        self.logger.info(
+            "[MicrosoftUserLdapCache] Cached %d Graph user IDs.", len(ldaps_by_id)
+        )
+        return len(ldaps_by_id)
+
+    async def get_ldap(self, user_id: str) -> str | None:
+        """
+        Resolve a Microsoft Graph user ID to its LDAP.
+
+        Args:
+            user_id (str): The Microsoft Graph user ID.
+
+        Returns:
+            str | None: The LDAP, or None for users outside the workspace.
+        """
+        pipeline = self.redis_client.pipeline()
+        pipeline.hget(MICROSOFT_USER_LDAP_KEY, user_id)
+        pipeline.hexists(MICROSOFT_EXTERNAL_USERS_KEY, user_id)
+        ldap, is_external = self.retry_utils.get_retry_on_transient(pipeline.execute)
+        if ldap:
+            return ldap
+        if is_external:
+            return None
+
+        # Single flight: concurrent misses for the same user share one Graph
+        # call. The shared task is shielded so a caller timing out does not
+        # cancel the lookup for the others.
+        task = self._in_flight.get(user_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load(user_id))
+            self._in_flight[user_id] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(user_id, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, user_id: str) -> str | None:
+        """Look a user up in Graph and store the result in the shared cache."""
+        ldap = await self.microsoft_service.get_ldap_by_id(user_id)
+        pipeline = self.redis_client.pipeline()
+        if ldap:
+            pipeline.hset(MICROSOFT_USER_LDAP_KEY, user_id, ldap)
+        else:
+            # Also cleared by every refresh, so a guest who joins the
+            # workspace is resolved at the next member sync at the latest.
+            queue_external_account(
+                pipeline,
+                MICROSOFT_EXTERNAL_USERS_KEY,
+                user_id,
+                self.external_ttl_seconds,
+            )
+        self.retry_utils.get_retry_on_transient(pipeline.execute)
+        return ldap
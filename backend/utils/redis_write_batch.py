@@ -0,0 +1,125 @@
+import threading
+
+
+class StagedPipeline:
+    """
+    Records the Redis commands queued while processing one message.
+
+    Exposes the command methods of a Redis pipeline (zadd, set, eval, ...) but
+    only records them; they are sent to Redis by the owning RedisWriteBatch
+    once the message has been processed successfully.
+    """
+
+    def __init__(self, batch):
+        self._batch = batch
+        self.commands = []
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return record
+
+    def execute(self):
+        raise TypeError(
+            "A staged pipeline is executed by its RedisWriteBatch, not by the processor."
+        )
+
+    def flush_batch(self) -> None:
+        """
+        Write the commands committed by earlier messages of the batch.
+
+        Processors call this before reading state that an earlier message of
+        the same batch may have written (e.g. an edit of a message created in
+        the same pull). Commands recorded on this pipeline are not affected.
+        """
+        self._batch.flush()
+
+
+class RedisWriteBatch:
+    """
+    Collects the Redis writes of a pulled Pub/Sub batch into one pipeline.
+
+    Every message records its commands on its own StagedPipeline, which is
+    only committed to the batch once the message was processed successfully,
+    so a failing message contributes nothing. `flush` sends all committed
+    commands in a single MULTI/EXEC round trip and reports which messages
+    were written and which must be redelivered.
+    """
+
+    def __init__(self, redis_client, retry_utils):
+        """
+        Initialize the RedisWriteBatch.
+
+        Args:
+            redis_client: The Redis client instance.
+            retry_utils: A RetryUtils for handling retries on transient errors.
+        """
+        self.redis_client = redis_client
+        self.retry_utils = retry_utils
+        self.written = []
+        self.failed = []
+        self._commands = []
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def stage(self) -> StagedPipeline:
+        """Return an empty staged pipeline for one message."""
+        return StagedPipeline(self)
+
+    def commit(self, staged: StagedPipeline, token) -> None:
+        """
+        Add a successfully processed message's commands to the batch.
+
+        Args:
+            staged (StagedPipeline): The message's staged pipeline.
+            token: Identifies the message in `written` / `failed` (e.g. its ack ID).
+        """
+        with self._lock:
+            self._commands.extend(staged.commands)
+            self._pending.append(token)
+
+    def flush(self) -> None:
+        """
+        Execute all committed commands in one pipeline.
+
+        Tokens of the flushed messages move to `written`, or to `failed` when
+        the pipeline cannot be executed. A failed pipeline may still have
+        applied some of its commands -- Redis does not roll back a command
+        that fails at runtime inside EXEC, such as a Lua error -- so `failed`
+        only means the messages must be redelivered, not that they left no
+        trace.
+
+        Each retry builds a fresh pipeline from the committed commands:
+        redis-py resets a pipeline's command stack once `execute` returns or
+        raises, so re-executing the same pipeline would send nothing.
+
+        Raises:
+            Exception: The pipeline error, after retries on transient errors.
+        """
+        with self._lock:
+            commands, tokens = self._commands, self._pending
+            self._commands, self._pending = [], []
+            if not commands:
+                self.written.extend(tokens)
+                return
+
+            try:
+                self.retry_utils.get_retry_on_transient(
+                    self._execute_commands, commands
+                )
+            except Exception:
+                self.failed.extend(tokens)
+                raise
+            self.written.extend(tokens)
+
+    def _execute_commands(self, commands: list) -> list:
+        """Queue `commands` on a new pipeline and execute it."""
+        pipeline = self.redis_client.pipeline()
+        for name, args, kwargs in commands:
+            getattr(pipeline, name)(*args, **kwargs)
+        return pipeline.execute()
@@ -155,6 +155,17 @@ class TestPermissionAdminController(unittest.TestCase):
         self.assertIsNone(kwargs["is_super_admin"])
         self.assertIsNone(kwargs["user_type"])
 
+    def test_users_counts_total_only_without_cursor(self):
+        client = _client(self.service, permissions={Permission.PERMISSION_MANAGE})
+
+        client.get(ADMIN_USERS_ENDPOINT)
+        first = self.service.list_users.await_args.kwargs
+        client.get(ADMIN_USERS_ENDPOINT, params={"cursor": "abc"})
+        later = self.service.list_users.await_args.kwargs
+
+        self.assertEqual((first["cursor"], first["include_total"]), (None, True))
+        self.assertEqual((later["cursor"], later["include_total"]), ("abc", False))
+
     def test_audit_passes_filters(self):
         client = _client(self.service, permissions={Permission.PERMISSION_MANAGE})
         resp = client.get(
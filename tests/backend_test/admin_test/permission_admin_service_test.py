@@ -239,6 +239,7 @@ class TestPermissionAdminService(unittest.IsolatedAsyncioTestCase):
                 )
             ],
             1,
+            None,
         )
         self.user_emails.get_contact_emails_by_user_ids.return_value = {1: "a@x.com"}
         out = await self.service.list_users(
@@ -265,6 +266,7 @@ class TestPermissionAdminService(unittest.IsolatedAsyncioTestCase):
                 )
             ],
             1,
+            None,
         )
         out = await self.service.list_users(
             self.session, search=None, limit=20, offset=0
@@ -272,9 +274,28 @@ class TestPermissionAdminService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(out.users[0].user_type, "internal")
         self.assertEqual(out.users[0].preferred_name, "Bee")
 
+    async def test_list_users_forwards_cursor_and_returns_next_cursor(self):
+        self.users.list_users.return_value = ([], None, "next")
+        self.user_emails.get_contact_emails_by_user_ids.return_value = {}
+
+        out = await self.service.list_users(
+            self.session,
+            search=None,
+            limit=20,
+            offset=0,
+            cursor="prev",
+            include_total=False,
+        )
+
+        kwargs = self.users.list_users.await_args.kwargs
+        self.assertEqual(kwargs["cursor"], "prev")
+        self.assertFalse(kwargs["include_total"])
+        self.assertIsNone(out.total)
+        self.assertEqual(out.next_cursor, "next")
+
     async def test_list_users_forwards_sort_and_filter_params(self):
         """Service passes sort_by, order, is_super_admin, user_type through to repo."""
-        self.users.list_users.return_value = ([], 0)
+        self.users.list_users.return_value = ([], 0, None)
         await self.service.list_users(
             self.session,
             search="q",
@@ -297,7 +318,7 @@ class TestPermissionAdminService(unittest.IsolatedAsyncioTestCase):
 
     async def test_list_users_defaults_sort_and_filter_params(self):
         """Service passes None defaults when sort/filter params are omitted."""
-        self.users.list_users.return_value = ([], 0)
+        self.users.list_users.return_value = ([], 0, None)
         await self.service.list_users(self.session, search=None, limit=20, offset=0)
         kwargs = self.users.list_users.await_args.kwargs
         self.assertIsNone(kwargs["sort_by"])
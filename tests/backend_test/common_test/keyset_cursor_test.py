@@ -0,0 +1,110 @@
+"""Unit tests for keyset pagination cursors and predicates."""
+
+from datetime import datetime, timezone
+from unittest import TestCase, main
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func
+from sqlalchemy.dialects import postgresql
+
+from backend.common.keyset_cursor import (
+    KeysetColumn,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_tag,
+)
+
+_TABLE = Table(
+    "item",
+    MetaData(),
+    Column("item_id", Integer, primary_key=True),
+    Column("created_at", DateTime(timezone=True)),
+    Column("name", String),
+)
+
+
+def _sql(clause) -> str:
+    return str(
+        clause.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+_TAG = keyset_tag([KeysetColumn(_TABLE.c.item_id)])
+
+
+class KeysetCursorTest(TestCase):
+    def test_round_trips_datetimes_and_scalars(self):
+        created_at = datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(_TAG, created_at, "ada", None, 42)
+
+        self.assertEqual(decode_cursor(cursor, _TAG, 4), (created_at, "ada", None, 42))
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(_TAG, "??>>", 1)
+
+        self.assertNotRegex(cursor, r"[+/=]")
+
+    def test_rejects_garbage(self):
+        with self.assertRaisesRegex(ValueError, "Invalid cursor"):
+            decode_cursor("not a cursor!", _TAG, 2)
+
+    def test_rejects_wrong_arity(self):
+        with self.assertRaisesRegex(ValueError, "Invalid cursor"):
+            decode_cursor(encode_cursor(_TAG, 1, 2), _TAG, 3)
+
+    def test_rejects_a_cursor_of_another_query(self):
+        ascending = [KeysetColumn(_TABLE.c.name), KeysetColumn(_TABLE.c.item_id)]
+        descending = [
+            KeysetColumn(_TABLE.c.name, descending=True),
+            KeysetColumn(_TABLE.c.item_id, descending=True),
+        ]
+        cursor = encode_cursor(keyset_tag(ascending, "ada"), "ada", 7)
+
+        for tag in (
+            keyset_tag(descending, "ada"),
+            keyset_tag(ascending, "bob"),
+            keyset_tag([KeysetColumn(_TABLE.c.item_id)], "ada"),
+        ):
+            with self.assertRaisesRegex(ValueError, "Invalid cursor"):
+                decode_cursor(cursor, tag, 2)
+        self.assertEqual(
+            decode_cursor(cursor, keyset_tag(ascending, "ada"), 2), ("ada", 7)
+        )
+
+    def test_non_null_keys_in_one_direction_use_a_row_comparison(self):
+        columns = [
+            KeysetColumn(_TABLE.c.created_at, descending=True),
+            KeysetColumn(_TABLE.c.item_id, descending=True),
+        ]
+
+        sql = _sql(keyset_after(columns, (datetime(2026, 1, 1), 7)))
+
+        self.assertIn("(item.created_at, item.item_id) < (", sql)
+
+    def test_nulls_last_keys_expand_to_or_of_branches(self):
+        columns = [
+            KeysetColumn(func.lower(_TABLE.c.name), nulls_last=True),
+            KeysetColumn(_TABLE.c.item_id),
+        ]
+
+        sql = _sql(keyset_after(columns, ("ada", 7)))
+
+        self.assertIn("lower(item.name) > 'ada' OR lower(item.name) IS NULL", sql)
+        self.assertIn("lower(item.name) = 'ada' AND item.item_id > 7", sql)
+
+    def test_null_cursor_value_only_advances_later_keys(self):
+        columns = [
+            KeysetColumn(_TABLE.c.name, nulls_last=True),
+            KeysetColumn(_TABLE.c.item_id),
+        ]
+
+        sql = _sql(keyset_after(columns, (None, 7)))
+
+        self.assertEqual(sql, "item.name IS NULL AND item.item_id > 7")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
-from unittest import TestCase, main
-from unittest.mock import patch, Mock, MagicMock
-from backend.common.redis_client import RedisClient
+from unittest import IsolatedAsyncioTestCase, TestCase, main
+from unittest.mock import AsyncMock, patch, Mock, MagicMock
+from redis.exceptions import ConnectionError as RedisConnectionError
+from backend.common.redis_client import (
+    AsyncRedisClient,
+    RedisClient,
+    RedisClientError,
+)
 from backend.common.environment_constants import (
     REDIS_HOST,
     REDIS_PASSWORD,
@@ -95,5 +100,96 @@ class TestRedisClient(TestCase):
         self.assertEqual(redis_client, mock_client)
 
 
+@patch.dict(
+    os.environ,
+    {
+        REDIS_HOST: TEST_REDIS_HOST,
+        REDIS_PORT: TEST_REDIS_PORT,
+        REDIS_PASSWORD: TEST_REDIS_PASSWORD,
+    },
+)
+class TestAsyncRedisClient(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock_logger = MagicMock()
+        self.mock_retry_utils = MagicMock()
+        self.mock_retry_utils.get_async_retry_on_transient = AsyncMock(
+            side_effect=lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+
+    @patch("backend.common.redis_client.AsyncRedis")
+    @patch("backend.common.redis_client.BlockingConnectionPool")
+    def test_init_builds_pooled_client_without_connecting(
+        self, mock_pool_cls, mock_redis_cls
+    ):
+        client = AsyncRedisClient(
+            logger=self.mock_logger,
+            retry_utils=self.mock_retry_utils,
+            max_connections=7,
+            pool_timeout=3,
+        )
+
+        pool_kwargs = mock_pool_cls.call_args.kwargs
+        self.assertEqual(pool_kwargs["max_connections"], 7)
+        self.assertEqual(pool_kwargs["timeout"], 3)
+        self.assertEqual(pool_kwargs["host"], TEST_REDIS_HOST)
+        self.assertEqual(pool_kwargs["port"], TEST_REDIS_PORT)
+        self.assertEqual(pool_kwargs["password"], TEST_REDIS_PASSWORD)
+        self.assertTrue(pool_kwargs["decode_responses"])
+        mock_redis_cls.assert_called_once_with(
+            connection_pool=mock_pool_cls.return_value
+        )
+        self.assertEqual(client.get_redis_client(), mock_redis_cls.return_value)
+        mock_redis_cls.return_value.ping.assert_not_called()
+
+    @patch("backend.common.redis_client.AsyncRedis")
+    @patch("backend.common.redis_client.BlockingConnectionPool")
+    async def test_verify_connection_pings_with_async_retry(
+        self, mock_pool_cls, mock_redis_cls
+    ):
+        mock_redis_cls.return_value.ping = AsyncMock(return_value=True)
+        client = AsyncRedisClient(
+            logger=self.mock_logger, retry_utils=self.mock_retry_utils
+        )
+
+        await client.verify_connection()
+
+        self.mock_retry_utils.get_async_retry_on_transient.assert_awaited_once_with(
+            mock_redis_cls.return_value.ping
+        )
+        self.mock_logger.info.assert_called_with(
+            "Created async Redis client successfully."
+        )
+
+    @patch("backend.common.redis_client.AsyncRedis")
+    @patch("backend.common.redis_client.BlockingConnectionPool")
+    async def test_verify_connection_raises_after_retries(
+        self, mock_pool_cls, mock_redis_cls
+    ):
+        self.mock_retry_utils.get_async_retry_on_transient = AsyncMock(
+            side_effect=RedisConnectionError("down")
+        )
+        client = AsyncRedisClient(
+            logger=self.mock_logger, retry_utils=self.mock_retry_utils
+        )
+
+        with self.assertRaises(RedisClientError):
+            await client.verify_connection()
+        self.mock_logger.error.assert_called_once()
+
+    @patch("backend.common.redis_client.AsyncRedis")
+    @patch("backend.common.redis_client.BlockingConnectionPool")
+    async def test_close_releases_client_and_pool(self, mock_pool_cls, mock_redis_cls):
+        mock_redis_cls.return_value.aclose = AsyncMock()
+        mock_pool_cls.return_value.disconnect = AsyncMock()
+        client = AsyncRedisClient(
+            logger=self.mock_logger, retry_utils=self.mock_retry_utils
+        )
+
+        await client.close()
+
+        mock_redis_cls.return_value.aclose.assert_awaited_once()
+        mock_pool_cls.return_value.disconnect.assert_awaited_once()
+
+
 if __name__ == "__main__":
     main()
@@ -81,6 +81,44 @@ class TestConsumerController(unittest.TestCase):
         ]
         self.assertEqual(len(matching), 1)
 
+    def test_sync_pull_defaults_to_serial_mode(self):
+        client = self._client([Permission.SYSTEM_SYNC])
+        self.mock_sync_pull_service.sync_pull_all.return_value = {}
+
+        client.post(
+            PUBSUB_SYNC_PULL_ENDPOINT,
+            headers={"Authorization": "Bearer valid-token"},
+        )
+
+        self.mock_sync_pull_service.sync_pull_all.assert_called_once_with(
+            max_messages=10, concurrent=False, max_workers=1
+        )
+
+    def test_sync_pull_passes_concurrency_options(self):
+        client = self._client([Permission.SYSTEM_SYNC])
+        self.mock_sync_pull_service.sync_pull_all.return_value = {}
+
+        response = client.post(
+            f"{PUBSUB_SYNC_PULL_ENDPOINT}?concurrent=true&max_messages=100&max_workers=8",
+            headers={"Authorization": "Bearer valid-token"},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.mock_sync_pull_service.sync_pull_all.assert_called_once_with(
+            max_messages=100, concurrent=True, max_workers=8
+        )
+
+    def test_sync_pull_rejects_out_of_range_workers(self):
+        client = self._client([Permission.SYSTEM_SYNC])
+
+        response = client.post(
+            f"{PUBSUB_SYNC_PULL_ENDPOINT}?max_workers=0",
+            headers={"Authorization": "Bearer valid-token"},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.mock_sync_pull_service.sync_pull_all.assert_not_called()
+
     def test_sync_pull_forbidden_for_normal_user(self):
         client = self._client([])
 
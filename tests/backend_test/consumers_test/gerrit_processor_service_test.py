@@ -1,9 +1,15 @@
 import unittest
 from unittest.mock import MagicMock, call  # Import call for multiple assertions
-from backend.consumers.gerrit_processor_service import GerritProcessorService
+from backend.consumers.gerrit_processor_service import (
+    GerritProcessorService,
+    _COUNT_REVIEW_ONCE_SCRIPT,
+    gerrit_event_id,
+)
 from backend.common.constants import (
     PullStatus,  # Not used in the provided test, but kept for context
     GERRIT_DEDUPE_REVIEWED_KEY,
+    GERRIT_PROCESSED_EVENT_KEY,
+    GERRIT_PROCESSED_EVENT_TTL_SECONDS,
     GERRIT_CL_REVIEWED_FIELD,
     GerritChangeStatus,
     THREE_MONTHS_IN_SECONDS,
@@ -105,38 +111,33 @@ class TestStorePayload(unittest.TestCase):
             "comment": "Patch Set 1: LGTM+1",
         }
 
-        # Mock Redis deduplication check: first comment (not in set)
-        self.mock_redis.sismember.return_value = False
-
         mock_pipeline = MagicMock()
         self.mock_redis.pipeline.return_value = mock_pipeline
 
         self.service.store_payload(payload)
 
-        # Check deduplication key
+        # Deduplication and both stats increments run in one script
         dedupe_key = GERRIT_DEDUPE_REVIEWED_KEY.format(change_number=7043)
-        self.mock_redis.sismember.assert_called_once_with(dedupe_key, "alice")
-
-        # Assert project-specific stats key generation and increment execution
         stats_key_project = GERRIT_STATS_PROJECT_BUCKET_KEY.format(
             ldap="alice", project=self.mock_project_value, bucket=self.bucket_value
         )
-        mock_pipeline.hincrby.assert_any_call(
-            stats_key_project, GERRIT_CL_REVIEWED_FIELD, 1
-        )
-
-        # Assert global stats key generation and increment execution
         stats_key_global = GERRIT_STATS_BUCKET_KEY.format(
             ldap="alice", bucket=self.bucket_value
         )
-        mock_pipeline.hincrby.assert_any_call(
-            stats_key_global, GERRIT_CL_REVIEWED_FIELD, 1
-        )
-
-        mock_pipeline.sadd.assert_called_once_with(dedupe_key, "alice")
-        mock_pipeline.expire.assert_called_once_with(
-            dedupe_key, THREE_MONTHS_IN_SECONDS
+        args = mock_pipeline.eval.call_args.args
+        self.assertEqual(
+            args[1:],
+            (
+                3,
+                dedupe_key,
+                stats_key_project,
+                stats_key_global,
+                "alice",
+                GERRIT_CL_REVIEWED_FIELD,
+                THREE_MONTHS_IN_SECONDS,
+            ),
         )
+        self.mock_redis.sismember.assert_not_called()
         mock_pipeline.execute.assert_called_once()
 
     def test_comment_added_by_bot(self):
@@ -177,35 +178,33 @@ class TestStorePayload(unittest.TestCase):
 
         self.service.store_payload(payload)
 
-        # Merge statistics updated (LOC and merge count) for project-specific
+        # Merge statistics (LOC and merge count) for project-specific and
+        # global keys are applied once per event through the ledger script
         stats_key_project = GERRIT_STATS_PROJECT_BUCKET_KEY.format(
             ldap="bob", project=self.mock_project_value, bucket=self.bucket_value
         )
-        mock_pipeline.hincrby.assert_any_call(
-            stats_key_project, GERRIT_LOC_MERGED_FIELD, 16
-        )
-        mock_pipeline.hincrby.assert_any_call(
-            stats_key_project,
-            GERRIT_STATUS_TO_FIELD_TEMPLATE.format(
-                status=GerritChangeStatus.MERGED.value
-            ),
-            1,
-        )
-
-        # Merge statistics updated (LOC and merge count) for global
         stats_key_global = GERRIT_STATS_BUCKET_KEY.format(
             ldap="bob", bucket=self.bucket_value
         )
-        mock_pipeline.hincrby.assert_any_call(
-            stats_key_global, GERRIT_LOC_MERGED_FIELD, 16
+        ledger_key = GERRIT_PROCESSED_EVENT_KEY.format(
+            event_id=gerrit_event_id(payload)
         )
-        mock_pipeline.hincrby.assert_any_call(
-            stats_key_global,
-            GERRIT_STATUS_TO_FIELD_TEMPLATE.format(
-                status=GerritChangeStatus.MERGED.value
+        self.assertEqual(
+            mock_pipeline.eval.call_args.args[1:],
+            (
+                3,
+                ledger_key,
+                stats_key_project,
+                stats_key_global,
+                GERRIT_PROCESSED_EVENT_TTL_SECONDS,
+                GERRIT_LOC_MERGED_FIELD,
+                16,
+                GERRIT_STATUS_TO_FIELD_TEMPLATE.format(
+                    status=GerritChangeStatus.MERGED.value
+                ),
             ),
-            1,
         )
+        mock_pipeline.hincrby.assert_not_called()
 
         # Removed from NEW status set for project-specific
         new_status_key_project = GERRIT_UNMERGED_CL_KEY_BY_PROJECT.format(
@@ -224,6 +223,16 @@ class TestStorePayload(unittest.TestCase):
         # Ensure pipeline execution
         mock_pipeline.execute.assert_called_once()
 
+    def test_gerrit_event_id_is_stable_across_redeliveries(self):
+        payload = {"type": "change-merged", "change": {"number": 1, "project": "p"}}
+        redelivered = {"change": {"project": "p", "number": 1}, "type": "change-merged"}
+
+        self.assertEqual(gerrit_event_id(payload), gerrit_event_id(redelivered))
+        self.assertNotEqual(
+            gerrit_event_id(payload),
+            gerrit_event_id({**payload, "eventCreatedOn": 1761280203}),
+        )
+
     def test_change_abandoned(self):
         """Test real-format abandon event to verify status migration logic for project-specific and global keys"""
         payload = {
@@ -314,7 +323,17 @@ class TestStorePayload(unittest.TestCase):
         mock_pipeline.execute.assert_called_once()
 
     def test_duplicate_comment(self):
-        """Test multiple comments from the same user on the same CL to verify deduplication"""
+        """Test that the review script only increments stats for a newly added reviewer"""
+        # The script bails out before any HINCRBY when SADD reports the
+        # reviewer was already in the dedupe set.
+        self.assertTrue(
+            _COUNT_REVIEW_ONCE_SCRIPT.lstrip().startswith(
+                "if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then\n    return 0"
+            )
+        )
+
+    def test_store_payload_queues_on_given_pipeline(self):
+        """Test that a caller-provided pipeline is used and left for the caller to execute"""
         payload = {
             "type": "comment-added",
             "author": {"username": "alice"},
@@ -323,17 +342,16 @@ class TestStorePayload(unittest.TestCase):
                 "owner": {"username": "bob"},
                 "project": self.mock_project_value,
             },
-            "eventCreatedOn": 1761279121,  # Added timestamp for compute_buckets_weekly to be called
+            "eventCreatedOn": 1761279121,
         }
+        batch_pipeline = MagicMock()
 
-        # Mock deduplication check: already reviewed
-        self.mock_redis.sismember.return_value = True
-
-        self.service.store_payload(payload)
+        self.service.store_payload(payload, pipeline=batch_pipeline)
 
-        # Verify: No statistics update (duplicate count skipped)
+        batch_pipeline.eval.assert_called_once()
+        batch_pipeline.incr.assert_called_once_with("analytics:generation:gerrit")
+        batch_pipeline.execute.assert_not_called()
         self.mock_redis.pipeline.assert_not_called()
-        self.mock_redis.sismember.assert_called_once()  # sismember is still called to check for duplication
 
 
 class TestPullGerrit(unittest.TestCase):
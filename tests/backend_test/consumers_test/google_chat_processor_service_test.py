@@ -29,12 +29,14 @@ class TestGoogleChatProcessorService(TestCase):
         self.pubsub_puller_factory = MagicMock()
         self.google_chat_messages_utils = MagicMock()
         self.google_service = MagicMock()
+        self.sender_ldap_cache = MagicMock()
 
         self.service = GoogleChatProcessorService(
             logger=self.logger,
             pubsub_puller_factory=self.pubsub_puller_factory,
             google_chat_messages_utils=self.google_chat_messages_utils,
             google_service=self.google_service,
+            sender_ldap_cache=self.sender_ldap_cache,
         )
         self.project_id = "test-project"
         self.subscription_id = "test-subscription"
@@ -112,15 +114,16 @@ class TestGoogleChatProcessorService(TestCase):
             data=chat_message_payload,
             attributes={"ce-type": message_type_full},
         )
-        self.google_service.get_ldap_by_id.return_value = sender_ldap
+        self.sender_ldap_cache.get_ldap.return_value = sender_ldap
 
         self.service.callback(message)
 
-        self.google_service.get_ldap_by_id.assert_called_once_with(sender_id)
+        self.sender_ldap_cache.get_ldap.assert_called_once_with(sender_id)
         self.google_chat_messages_utils.store_messages.assert_called_once_with(
             {sender_name_full: sender_ldap},  # ldaps_dict
             [chat_message_payload],  # messages_list
             GoogleChatEventType.CREATED,  # message_enum
+            pipeline=None,
         )
         message.ack.assert_called_once()
         message.nack.assert_not_called()
@@ -144,11 +147,12 @@ class TestGoogleChatProcessorService(TestCase):
 
         self.service.callback(message)
 
-        self.google_service.get_ldap_by_id.assert_not_called()
+        self.sender_ldap_cache.get_ldap.assert_not_called()
         self.google_chat_messages_utils.store_messages.assert_called_once_with(
             {sender_name_full: ""},  # ldaps_dict
             [chat_message_payload],  # messages_list
             GoogleChatEventType.CREATED,  # message_enum
+            pipeline=None,
         )
         message.ack.assert_called_once()
         message.nack.assert_not_called()
@@ -170,17 +174,16 @@ class TestGoogleChatProcessorService(TestCase):
             data=batch_messages_payload,
             attributes={"ce-type": message_type_full},
         )
-        self.google_service.list_directory_all_people_ldap.return_value = (
-            all_people_ldap
-        )
+        self.sender_ldap_cache.get_directory.return_value = all_people_ldap
 
         self.service.callback(message)
 
-        self.google_service.list_directory_all_people_ldap.assert_called_once()
+        self.sender_ldap_cache.get_directory.assert_called_once()
         self.google_chat_messages_utils.store_messages.assert_called_once_with(
             all_people_ldap,  # ldaps_dict
             batch_messages_payload.get("messages"),  # messages_list
             GoogleChatEventType.BATCH_CREATED,  # message_enum
+            pipeline=None,
         )
         message.ack.assert_called_once()
         message.nack.assert_not_called()
@@ -194,7 +197,7 @@ class TestGoogleChatProcessorService(TestCase):
 
         self.service.callback(message)
 
-        self.google_service.get_ldap_by_id.assert_not_called()
+        self.sender_ldap_cache.get_ldap.assert_not_called()
         self.google_chat_messages_utils.store_messages.assert_not_called()
         message.ack.assert_not_called()
         message.nack.assert_called_once()
@@ -208,7 +211,7 @@ class TestGoogleChatProcessorService(TestCase):
 
         self.service.callback(message)
 
-        self.google_service.get_ldap_by_id.assert_not_called()
+        self.sender_ldap_cache.get_ldap.assert_not_called()
         self.google_chat_messages_utils.store_messages.assert_not_called()
         message.ack.assert_not_called()
         message.nack.assert_called_once()
@@ -1,10 +1,12 @@
 import json
 import os
+import threading
 from unittest import TestCase, main
 from unittest.mock import MagicMock, patch
 
 from backend.common.constants import EXPIRATION_REMINDER_EVENT
 from backend.consumers.pubsub_sync_pull_service import PubSubSyncPullService
+from backend.utils.redis_write_batch import StagedPipeline
 
 PROJECT_ID = "test-project"
 MICROSOFT_SUB = "ms-sub"
@@ -220,7 +222,7 @@ class TestPubSubSyncPullService(TestCase):
         result = self.service.sync_pull_microsoft(PROJECT_ID, MICROSOFT_SUB)
 
         self.mock_ms_util.sync_near_real_time_message_to_redis.assert_called_once_with(
-            "created", "chats/1/messages/2"
+            "created", "chats/1/messages/2", pipeline=None
         )
         self.mock_loop_mgr.run_async_in_background_loop.assert_called_once()
         self.assertEqual(result, {"processed": 1, "failed": 0})
@@ -266,7 +268,7 @@ class TestPubSubSyncPullService(TestCase):
         result = self.service.sync_pull_google_chat(PROJECT_ID, GOOGLE_CHAT_SUB)
 
         self.mock_google_chat.process_event.assert_called_once_with(
-            {"type": "MESSAGE"}, attributes
+            {"type": "MESSAGE"}, attributes, pipeline=None
         )
         self.assertEqual(result, {"processed": 1, "failed": 0})
 
@@ -294,7 +296,7 @@ class TestPubSubSyncPullService(TestCase):
 
         result = self.service.sync_pull_gerrit(PROJECT_ID, GERRIT_SUB)
 
-        self.mock_gerrit.store_payload.assert_called_once_with(payload)
+        self.mock_gerrit.store_payload.assert_called_once_with(payload, pipeline=None)
         self.assertEqual(result, {"processed": 1, "failed": 0})
 
     def test_sync_pull_gerrit_store_payload_error(self):
@@ -560,6 +562,185 @@ class TestPubSubSyncPullService(TestCase):
         nack_ids = self.mock_subscriber.modify_ack_deadline.call_args.kwargs["ack_ids"]
         self.assertIn("ack-bad-json", nack_ids)
 
+    def test_pull_and_process_concurrent_processes_batch_in_parallel(self):
+        # Two workers must both be inside process_fn at once, or the barrier
+        # times out and both messages fail.
+        barrier = threading.Barrier(2, timeout=5)
+        received = [
+            self._make_received(b"a", ack_id="ack-1", message_id="msg-1"),
+            self._make_received(b"b", ack_id="ack-2", message_id="msg-2"),
+        ]
+        self.mock_subscriber.pull.side_effect = self._pull_side_effect(received)
+
+        result = self.service._pull_and_process(
+            PROJECT_ID, "sub", lambda data, attrs: barrier.wait(), max_workers=2
+        )
+
+        self.assertEqual(result, {"processed": 2, "failed": 0})
+        self.mock_subscriber.acknowledge.assert_called_once()
+        self.assertCountEqual(
+            self.mock_subscriber.acknowledge.call_args.kwargs["ack_ids"],
+            ["ack-1", "ack-2"],
+        )
+
+    def test_pull_and_process_concurrent_acks_and_nacks(self):
+        def process_fn(data, attrs):
+            if data == b"bad":
+                raise ValueError("boom")
+
+        received = [
+            self._make_received(b"ok", ack_id="ack-1", message_id="msg-1"),
+            self._make_received(b"bad", ack_id="ack-2", message_id="msg-2"),
+        ]
+        self.mock_subscriber.pull.side_effect = self._pull_side_effect(
+            received, [self._make_received(b"ok", ack_id="ack-3", message_id="msg-3")]
+        )
+
+        result = self.service._pull_and_process(
+            PROJECT_ID, "sub", process_fn, max_workers=4
+        )
+
+        self.assertEqual(result, {"processed": 2, "failed": 1})
+        self.assertEqual(self.mock_subscriber.acknowledge.call_count, 2)
+        self.mock_subscriber.modify_ack_deadline.assert_called_once_with(
+            subscription=self.mock_subscriber.subscription_path.return_value,
+            ack_ids=["ack-2"],
+            ack_deadline_seconds=0,
+        )
+
+    def test_pull_and_process_concurrent_surfaces_ack_failure(self):
+        self.mock_subscriber.pull.side_effect = self._pull_side_effect([
+            self._make_received(b"ok")
+        ])
+        self.mock_subscriber.acknowledge.side_effect = RuntimeError("ack failed")
+
+        with self.assertRaises(RuntimeError):
+            self.service._pull_and_process(
+                PROJECT_ID, "sub", MagicMock(), max_workers=2
+            )
+
+    def _batched_service(self):
+        self.mock_redis = MagicMock()
+        self.mock_retry_utils = MagicMock()
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        return PubSubSyncPullService(
+            logger=self.mock_logger,
+            subscriber_client=self.mock_subscriber,
+            microsoft_chat_message_util=self.mock_ms_util,
+            google_chat_processor_service=self.mock_google_chat,
+            gerrit_processor_service=self.mock_gerrit,
+            asyncio_event_loop_manager=self.mock_loop_mgr,
+            redis_client=self.mock_redis,
+            retry_utils=self.mock_retry_utils,
+        )
+
+    def test_pull_and_process_batches_writes_into_one_pipeline(self):
+        service = self._batched_service()
+
+        def process_fn(data, attrs, pipeline):
+            if data == b"bad":
+                pipeline.set("half-written", "x")
+                raise ValueError("boom")
+            pipeline.set(data.decode(), "v")
+
+        received = [
+            self._make_received(b"a", ack_id="ack-1", message_id="msg-1"),
+            self._make_received(b"bad", ack_id="ack-2", message_id="msg-2"),
+            self._make_received(b"b", ack_id="ack-3", message_id="msg-3"),
+        ]
+        self.mock_subscriber.pull.side_effect = self._pull_side_effect(received)
+
+        result = service._pull_and_process(PROJECT_ID, "sub", process_fn)
+
+        self.assertEqual(result, {"processed": 2, "failed": 1})
+        self.mock_redis.pipeline.assert_called_once()
+        batch_pipeline = self.mock_redis.pipeline.return_value
+        self.assertEqual(
+            batch_pipeline.set.call_args_list,
+            [(("a", "v"),), (("b", "v"),)],
+        )
+        batch_pipeline.execute.assert_called_once()
+        self.assertEqual(
+            self.mock_subscriber.acknowledge.call_args.kwargs["ack_ids"],
+            ["ack-1", "ack-3"],
+        )
+        self.assertEqual(
+            self.mock_subscriber.modify_ack_deadline.call_args.kwargs["ack_ids"],
+            ["ack-2"],
+        )
+
+    def test_pull_and_process_batch_write_failure_nacks_batch(self):
+        service = self._batched_service()
+        self.mock_redis.pipeline.return_value.execute.side_effect = ConnectionError(
+            "redis down"
+        )
+        received = [
+            self._make_received(b"a", ack_id="ack-1", message_id="msg-1"),
+            self._make_received(b"b", ack_id="ack-2", message_id="msg-2"),
+        ]
+        self.mock_subscriber.pull.side_effect = self._pull_side_effect(received)
+
+        result = service._pull_and_process(
+            PROJECT_ID,
+            "sub",
+            lambda data, attrs, pipeline: pipeline.set(data, "v"),
+        )
+
+        self.assertEqual(result, {"processed": 0, "failed": 2})
+        self.mock_subscriber.acknowledge.assert_not_called()
+        self.assertEqual(
+            self.mock_subscriber.modify_ack_deadline.call_args.kwargs["ack_ids"],
+            ["ack-1", "ack-2"],
+        )
+
+    def test_sync_pull_gerrit_passes_staged_pipeline(self):
+        service = self._batched_service()
+        payload = {"type": "patchset-created"}
+        self.mock_subscriber.pull.side_effect = self._pull_side_effect([
+            self._make_received(json.dumps(payload).encode(), {})
+        ])
+
+        result = service.sync_pull_gerrit(PROJECT_ID, GERRIT_SUB)
+
+        self.assertEqual(result, {"processed": 1, "failed": 0})
+        staged = self.mock_gerrit.store_payload.call_args.kwargs["pipeline"]
+        self.assertIsInstance(staged, StagedPipeline)
+
+    @patch.dict(
+        os.environ,
+        {
+            "PUBSUB_PROJECT_ID": PROJECT_ID,
+            "MICROSOFT_SUBSCRIPTION_ID": MICROSOFT_SUB,
+            "GOOGLE_CHAT_SUBSCRIPTION_ID": GOOGLE_CHAT_SUB,
+            "GERRIT_SUBSCRIPTION_ID": GERRIT_SUB,
+        },
+    )
+    def test_sync_pull_all_concurrent_drains_subscriptions_in_parallel(self):
+        # Both healthy subscriptions must be draining at the same time to pass
+        # the barrier; gerrit fails and must stay isolated.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def drain(project_id, sub, max_messages, max_iterations, max_workers):
+            barrier.wait()
+            return {"processed": max_workers, "failed": 0}
+
+        with (
+            patch.object(self.service, "sync_pull_microsoft", side_effect=drain),
+            patch.object(self.service, "sync_pull_google_chat", side_effect=drain),
+            patch.object(
+                self.service,
+                "sync_pull_gerrit",
+                side_effect=RuntimeError("gerrit broke"),
+            ),
+        ):
+            result = self.service.sync_pull_all(concurrent=True, max_workers=4)
+
+        self.assertEqual(result["microsoft"], {"processed": 4, "failed": 0})
+        self.assertEqual(result["google_chat"], {"processed": 4, "failed": 0})
+        self.assertEqual(result["gerrit"], {"processed": 0, "failed": 0})
+
 
 if __name__ == "__main__":
     main()
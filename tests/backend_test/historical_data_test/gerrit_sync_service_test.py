@@ -1,3 +1,4 @@
+import threading
 import unittest
 from unittest.mock import MagicMock, call
 from datetime import datetime
@@ -17,6 +18,7 @@ from backend.common.constants import (
     GERRIT_STATUS_TO_FIELD_TEMPLATE,
     GERRIT_UNMERGED_CL_KEY_BY_PROJECT,
     GERRIT_UNMERGED_CL_KEY_GLOBAL,
+    GERRIT_SYNC_HIGH_WATER_MARK_KEY,
 )
 
 
@@ -396,6 +398,214 @@ class TestGerritSyncService(unittest.TestCase):
             self.mock_pipe.execute
         )
 
+    def test_fetch_and_store_changes_sums_stats_across_pages(self):
+        """Stats for the same key on different pages are written once, as totals."""
+        self.mock_gerrit_client.query_changes.side_effect = [
+            [self.MERGED_CHANGE],
+            [self.UNDER_REVIEW_CHANGE],
+            [],
+        ]
+
+        self.service.fetch_and_store_changes(page_size=1)
+
+        self.mock_pipe.hset.assert_any_call(
+            GERRIT_STATS_BUCKET_KEY.format(ldap="jdoe", bucket="2025-10-20_2025-10-26"),
+            mapping={
+                GERRIT_STATUS_TO_FIELD_TEMPLATE.format(status="merged"): 1,
+                GERRIT_LOC_MERGED_FIELD: 934,
+                GERRIT_CL_REVIEWED_FIELD: 1,
+            },
+        )
+        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+            self.mock_pipe.execute
+        )
+
+    def test_fetch_and_store_changes_fetches_status_streams_in_parallel(self):
+        # Both streams must be paging at the same time to pass the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+        pages = {
+            "status:merged": [[self.MERGED_CHANGE], []],
+            "status:abandoned": [[self.ABANDONED_CHANGE], []],
+        }
+
+        def query_changes(queries, start, **kwargs):
+            if start == 0:
+                barrier.wait()
+            return pages[queries[0]][0 if start == 0 else 1]
+
+        self.mock_gerrit_client.query_changes.side_effect = query_changes
+
+        self.service.fetch_and_store_changes(
+            statuses=["merged", "abandoned"], page_size=1, max_workers=2
+        )
+
+        queried = {
+            c.kwargs["queries"][0]
+            for c in self.mock_gerrit_client.query_changes.call_args_list
+        }
+        self.assertEqual(queried, {"status:merged", "status:abandoned"})
+        self.mock_pipe.zadd.assert_any_call(
+            GERRIT_UNMERGED_CL_KEY_GLOBAL.format(ldap="charlie", cl_status="abandoned"),
+            {7777: datetime.fromisoformat("2025-09-18T12:00:00").timestamp()},
+        )
+        self.mock_pipe.hset.assert_any_call(
+            GERRIT_STATS_PROJECT_BUCKET_KEY.format(
+                ldap="jdoe", project="project1", bucket="2025-10-20_2025-10-26"
+            ),
+            mapping={
+                GERRIT_STATUS_TO_FIELD_TEMPLATE.format(status="merged"): 1,
+                GERRIT_LOC_MERGED_FIELD: 934,
+            },
+        )
+        self.mock_retry_utils.get_retry_on_transient.assert_called_once()
+
+    def test_fetch_and_store_changes_splits_streams_by_project(self):
+        self.mock_gerrit_client.query_changes.return_value = []
+
+        self.service.fetch_and_store_changes(
+            statuses=["merged"], projects=["p1", "p2"], max_workers=2
+        )
+
+        queried = sorted(
+            c.kwargs["queries"][0]
+            for c in self.mock_gerrit_client.query_changes.call_args_list
+        )
+        self.assertEqual(
+            queried, ["(status:merged) project:p1", "(status:merged) project:p2"]
+        )
+        self.mock_redis.pipeline.assert_not_called()
+
+    def test_fetch_and_store_changes_stream_error_is_raised(self):
+        def query_changes(queries, **kwargs):
+            if queries[0] == "status:abandoned":
+                raise RuntimeError("gerrit unavailable")
+            return []
+
+        self.mock_gerrit_client.query_changes.side_effect = query_changes
+
+        with self.assertRaises(RuntimeError):
+            self.service.fetch_and_store_changes(
+                statuses=["merged", "abandoned"], max_workers=2
+            )
+        self.mock_redis.pipeline.assert_not_called()
+
+    def _setup_incremental_sync(self, high_water_mark):
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args: func(*args)
+        )
+        self.mock_redis.get.return_value = high_water_mark
+        # An older merged CL of jdoe in the same week, updated before the mark.
+        self.EARLIER_MERGED_CHANGE = {
+            "project": "project1",
+            "status": "MERGED",
+            "updated": "2025-10-20 10:00:00.000000000",
+            "submitted": "2025-10-20 09:00:00.000000000",
+            "insertions": 10,
+            "virtual_id_number": 6600,
+            "owner": {"username": "jdoe"},
+            "messages": [],
+        }
+        self.dt_map.update({
+            "2025-10-22 05:00:00.000000000": datetime(2025, 10, 22, 5, 0),
+            "2025-10-22 05:44:27.000000000": datetime(2025, 10, 22, 5, 44, 27),
+            "2025-10-20 10:00:00.000000000": datetime(2025, 10, 20, 10, 0),
+        })
+        self.bucket_map.update({
+            datetime(2025, 10, 22, 4, 0): "2025-10-20_2025-10-26",
+            "2025-10-20 09:00:00.000000000": "2025-10-20_2025-10-26",
+        })
+
+    def test_sync_changes_incrementally_rewrites_only_changed_keys(self):
+        self._setup_incremental_sync("2025-10-22 05:00:00.000000000")
+        self.mock_gerrit_client.query_changes.return_value = [
+            self.EARLIER_MERGED_CHANGE,
+            self.MERGED_CHANGE,
+            self.UNDER_REVIEW_CHANGE,
+        ]
+
+        count = self.service.sync_changes_incrementally(page_size=500)
+
+        self.assertEqual(count, 2)
+        self.mock_gerrit_client.query_changes.assert_called_once()
+        self.assertEqual(
+            self.mock_gerrit_client.query_changes.call_args.kwargs["queries"],
+            [
+                "(status:new OR status:merged OR status:abandoned) "
+                'after:"2025-10-20 00:00:00"'
+            ],
+        )
+
+        written = {
+            c.args[0]: c.kwargs["mapping"] for c in self.mock_pipe.hset.call_args_list
+        }
+        # The unchanged CL still counts towards the rewritten week totals, while
+        # alice's March review bucket lies before the window and is left alone.
+        self.assertEqual(
+            written,
+            {
+                GERRIT_STATS_PROJECT_BUCKET_KEY.format(
+                    ldap="jdoe", project="project1", bucket="2025-10-20_2025-10-26"
+                ): {
+                    GERRIT_STATUS_TO_FIELD_TEMPLATE.format(status="merged"): 2,
+                    GERRIT_LOC_MERGED_FIELD: 944,
+                },
+                GERRIT_STATS_BUCKET_KEY.format(
+                    ldap="jdoe", bucket="2025-10-20_2025-10-26"
+                ): {
+                    GERRIT_STATUS_TO_FIELD_TEMPLATE.format(status="merged"): 2,
+                    GERRIT_LOC_MERGED_FIELD: 944,
+                    GERRIT_CL_REVIEWED_FIELD: 1,
+                },
+                GERRIT_STATS_PROJECT_BUCKET_KEY.format(
+                    ldap="jdoe", project="project2", bucket="2025-10-20_2025-10-26"
+                ): {GERRIT_CL_REVIEWED_FIELD: 1},
+            },
+        )
+        self.mock_pipe.zadd.assert_any_call(
+            GERRIT_UNMERGED_CL_KEY_GLOBAL.format(ldap="eve", cl_status="new"),
+            {4554: datetime(2025, 10, 22, 5, 49).timestamp()},
+        )
+        self.mock_pipe.zrem.assert_any_call(
+            GERRIT_UNMERGED_CL_KEY_GLOBAL.format(ldap="eve", cl_status="abandoned"),
+            4554,
+        )
+        self.mock_pipe.set.assert_called_once_with(
+            GERRIT_SYNC_HIGH_WATER_MARK_KEY, "2025-10-22 05:49:00.000000000"
+        )
+        self.mock_pipe.execute.assert_called_once()
+
+    def test_sync_changes_incrementally_nothing_changed(self):
+        self._setup_incremental_sync("2025-10-22 05:00:00.000000000")
+        self.mock_gerrit_client.query_changes.return_value = [
+            self.EARLIER_MERGED_CHANGE
+        ]
+
+        self.assertEqual(self.service.sync_changes_incrementally(), 0)
+        self.mock_redis.pipeline.assert_not_called()
+
+    def test_sync_changes_incrementally_first_run_writes_everything(self):
+        self._setup_incremental_sync(None)
+        self.mock_gerrit_client.query_changes.return_value = [
+            self.MERGED_CHANGE,
+            self.ABANDONED_CHANGE,
+        ]
+
+        self.assertEqual(self.service.sync_changes_incrementally(), 2)
+
+        self.assertEqual(
+            self.mock_gerrit_client.query_changes.call_args.kwargs["queries"],
+            ["status:new OR status:merged OR status:abandoned"],
+        )
+        self.mock_pipe.hset.assert_any_call(
+            GERRIT_STATS_BUCKET_KEY.format(
+                ldap="alice", bucket="2025-03-24_2025-03-30"
+            ),
+            mapping={GERRIT_CL_REVIEWED_FIELD: 1},
+        )
+        self.mock_pipe.set.assert_called_once_with(
+            GERRIT_SYNC_HIGH_WATER_MARK_KEY, "2025-10-22 05:44:27.000000000"
+        )
+
     def test_fetch_changes_pagination(self):
         fake_pages = [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
         self.mock_gerrit_client.query_changes.side_effect = fake_pages
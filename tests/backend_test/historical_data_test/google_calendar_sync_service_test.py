@@ -1,6 +1,6 @@
 import json
 from unittest import TestCase, main
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 from datetime import datetime, timezone
 
 from backend.historical_data.google_calendar_sync_service import (
@@ -351,7 +351,7 @@ class TestGoogleCalendarSyncService(TestCase):
             MagicMock()
         )
 
-        result = self.service._get_events_attendees(
+        result, failed_codes = self.service._get_events_attendees(
             events, self.time_min_str, self.time_max_str
         )
 
@@ -411,7 +411,7 @@ class TestGoogleCalendarSyncService(TestCase):
             MagicMock()
         )
 
-        result = self.service._get_events_attendees(events, "min", "max")
+        result, _ = self.service._get_events_attendees(events, "min", "max")
         # Outside MATCH_WINDOW_SECONDS (7200 seconds), the result should be empty
         self.assertEqual(len(result["evt1"]), 0)
 
@@ -440,8 +440,46 @@ class TestGoogleCalendarSyncService(TestCase):
             MagicMock()
         )
 
-        result = self.service._get_events_attendees(events, "min", "max")
+        result, failed_codes = self.service._get_events_attendees(events, "min", "max")
         self.assertEqual(result["e1"], [])
+        self.assertEqual(failed_codes, set())
+
+    def test_get_events_attendees_reports_failed_codes(self):
+        """A failed audit log request is reported instead of looking empty."""
+        events = {
+            "ok": CalendarEventDTO(
+                event_id="ok",
+                calendar_id="c",
+                summary="S",
+                start="2025-11-19T10:00:00Z",
+                meeting_code="good",
+            ),
+            "lost": CalendarEventDTO(
+                event_id="lost",
+                calendar_id="c",
+                summary="S",
+                start="2025-11-19T10:00:00Z",
+                meeting_code="bad",
+            ),
+        }
+
+        def batch_side_effect(callback):
+            def execute():
+                callback("good", {"items": []}, None)
+                callback("bad", None, Exception("quota exceeded"))
+
+            mock_batch = MagicMock()
+            mock_batch.execute.side_effect = execute
+            return mock_batch
+
+        self.mock_google_reports_client.new_batch_http_request.side_effect = (
+            batch_side_effect
+        )
+
+        result, failed_codes = self.service._get_events_attendees(events, "min", "max")
+
+        self.assertEqual(result, {"ok": [], "lost": []})
+        self.assertEqual(failed_codes, {"bad"})
 
     # Redis & Persistence
     def test_cache_calendar_events_strips_suffix(self):
@@ -488,7 +526,9 @@ class TestGoogleCalendarSyncService(TestCase):
             leave_time=datetime(2025, 11, 19, 10, 10, tzinfo=timezone.utc),
         )
 
-        self.service._get_events_attendees = MagicMock(return_value={eid: [att]})
+        self.service._get_events_attendees = MagicMock(
+            return_value=({eid: [att]}, set())
+        )
         mock_pipeline = MagicMock()
         self.mock_redis_client.pipeline.return_value = mock_pipeline
 
@@ -500,6 +540,92 @@ class TestGoogleCalendarSyncService(TestCase):
             {eid: dto.start_ts},
         )
 
+    def test_cache_events_attendees_credits_meeting_seconds(self):
+        """Test that each attendance record is stored with its duration for the rollup."""
+        eid = "evt_1"
+        dto = CalendarEventDTO(
+            event_id=eid,
+            calendar_id="team_cal",
+            summary="S",
+            start="2025-11-19T10:00:00Z",
+            meeting_code="c",
+        )
+        att = AttendanceDTO(
+            ldap="alice",
+            join_time=datetime(2025, 11, 19, 10, 0, tzinfo=timezone.utc),
+            leave_time=datetime(2025, 11, 19, 10, 45, tzinfo=timezone.utc),
+        )
+
+        self.service._get_events_attendees = MagicMock(
+            return_value=({eid: [att]}, set())
+        )
+        mock_pipeline = MagicMock()
+        self.mock_redis_client.pipeline.return_value = mock_pipeline
+
+        self.service._cache_events_attendees({eid: dto}, "min", "max")
+
+        mock_pipeline.eval.assert_called_once_with(
+            ANY,
+            2,
+            "event:evt_1:user:alice:attendance",
+            "calendar:meeting_seconds:2025-11-19",
+            json.dumps({
+                "join_time": "2025-11-19T10:00:00Z",
+                "leave_time": "2025-11-19T10:45:00Z",
+            }),
+            "team_cal:alice",
+            2700,
+        )
+        mock_pipeline.sadd.assert_not_called()
+
+    def test_rebuild_meeting_seconds(self):
+        """Test that rollups are recomputed from the cached attendance and marked ready."""
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        self.mock_redis_client.scan_iter.side_effect = [
+            iter(["calendar:personal:user:alice:events"]),
+            iter(["calendar:meeting_seconds:2025-01-01"]),
+        ]
+        self.mock_redis_client.zrange.return_value = [
+            ("evt_1", datetime(2025, 11, 19, 10, tzinfo=timezone.utc).timestamp()),
+            ("evt_2", datetime(2025, 11, 20, 10, tzinfo=timezone.utc).timestamp()),
+        ]
+        read_pipeline = MagicMock()
+        read_pipeline.execute.return_value = [
+            {
+                json.dumps({
+                    "join_time": "2025-11-19T10:00:00Z",
+                    "leave_time": "2025-11-19T10:30:00Z",
+                }),
+                json.dumps({
+                    "join_time": "2025-11-19T10:40:00Z",
+                    "leave_time": "2025-11-19T11:00:00Z",
+                }),
+            },
+            {"not json"},
+        ]
+        write_pipeline = MagicMock()
+        self.mock_redis_client.pipeline.side_effect = [read_pipeline, write_pipeline]
+
+        days = self.service.rebuild_meeting_seconds()
+
+        self.assertEqual(days, 1)
+        read_pipeline.smembers.assert_has_calls([
+            call("event:evt_1:user:alice:attendance"),
+            call("event:evt_2:user:alice:attendance"),
+        ])
+        write_pipeline.delete.assert_called_once_with(
+            "calendar:meeting_seconds:2025-01-01"
+        )
+        write_pipeline.hset.assert_called_once_with(
+            "calendar:meeting_seconds:2025-11-19", mapping={"personal:alice": 3000}
+        )
+        write_pipeline.set.assert_called_once_with(
+            "calendar:meeting_seconds_ready", ANY
+        )
+        self.mock_logger.warning.assert_called_once()
+
     def test_cache_calendar_events_empty_input(self):
         """Verify that the pipeline does not break when no events are returned from calendars."""
         self.service._get_calendars_events = MagicMock(return_value={})
@@ -527,13 +653,276 @@ class TestGoogleCalendarSyncService(TestCase):
             leave_time=datetime(2025, 11, 19, 10, 10, tzinfo=timezone.utc),
         )
 
-        self.service._get_events_attendees = MagicMock(return_value={eid: [bad_att]})
+        self.service._get_events_attendees = MagicMock(
+            return_value=({eid: [bad_att]}, set())
+        )
         mock_pipeline = MagicMock()
         self.mock_redis_client.pipeline.return_value = mock_pipeline
 
         self.service._cache_events_attendees({eid: dto}, "min", "max")
         mock_pipeline.sadd.assert_not_called()
 
+    # Incremental sync
+    def _serve_batches(self, responses):
+        """Answer each batched request with the next (response, exception) of its calendar."""
+
+        def new_batch(callback):
+            batch = MagicMock()
+            request_ids = []
+            batch.add.side_effect = lambda req, request_id: request_ids.append(
+                request_id
+            )
+
+            def execute():
+                for request_id in request_ids:
+                    calendar_id = request_id.split(":", 1)[0]
+                    response, exception = responses[calendar_id].pop(0)
+                    callback(request_id, response, exception)
+
+            batch.execute.side_effect = execute
+            return batch
+
+        self.mock_google_calendar_client.new_batch_http_request.side_effect = new_batch
+
+    def _meet_event(self, event_id, start, end):
+        return {
+            "id": event_id,
+            "summary": "Sync Meeting",
+            "status": "confirmed",
+            "start": {"dateTime": start},
+            "end": {"dateTime": end},
+            "conferenceData": {
+                "entryPoints": [
+                    {
+                        "entryPointType": "video",
+                        "uri": "https://meet.google.com/aaa-bbb-ccc",
+                    }
+                ]
+            },
+        }
+
+    def test_get_calendars_event_changes_uses_sync_tokens(self):
+        """Calendars with a token list changes since it; others sync from time_min."""
+        event = self._meet_event("evt1", "2025-11-19T10:00:00Z", "2025-11-19T11:00:00Z")
+        self._serve_batches({
+            "cal1": [({"items": [event], "nextSyncToken": "next1"}, None)],
+            "cal2": [
+                ({"items": [], "nextPageToken": "page2"}, None),
+                ({"items": [], "nextSyncToken": "next2"}, None),
+            ],
+        })
+        list_mock = self.mock_google_calendar_client.events.return_value.list
+
+        events, next_tokens = self.service._get_calendars_event_changes(
+            ["cal1", "cal2"], {"cal1": "token1", "cal2": None}, self.time_min_str
+        )
+
+        self.assertEqual(list(events), ["evt1"])
+        self.assertEqual(
+            events["evt1"].end, datetime(2025, 11, 19, 11, 0, tzinfo=timezone.utc)
+        )
+        self.assertEqual(next_tokens, {"cal1": "next1", "cal2": "next2"})
+        list_mock.assert_any_call(
+            calendarId="cal1",
+            singleEvents=True,
+            eventTypes="default",
+            timeZone="UTC",
+            pageToken=None,
+            syncToken="token1",
+        )
+        list_mock.assert_any_call(
+            calendarId="cal2",
+            singleEvents=True,
+            eventTypes="default",
+            timeZone="UTC",
+            pageToken="page2",
+            timeMin=self.time_min_str,
+        )
+
+    def test_get_calendars_event_changes_resyncs_expired_token(self):
+        """An expired sync token (HTTP 410) falls back to a full sync of that calendar."""
+        gone = Exception("Sync token is no longer valid")
+        gone.resp = MagicMock(status=410)
+        self._serve_batches({
+            "cal1": [(None, gone), ({"items": [], "nextSyncToken": "fresh"}, None)]
+        })
+        list_mock = self.mock_google_calendar_client.events.return_value.list
+
+        _, next_tokens = self.service._get_calendars_event_changes(
+            ["cal1"], {"cal1": "expired"}, self.time_min_str
+        )
+
+        self.assertEqual(next_tokens, {"cal1": "fresh"})
+        list_mock.assert_called_with(
+            calendarId="cal1",
+            singleEvents=True,
+            eventTypes="default",
+            timeZone="UTC",
+            pageToken=None,
+            timeMin=self.time_min_str,
+        )
+
+    def test_get_calendars_event_changes_keeps_token_of_failed_calendar(self):
+        """A calendar whose request fails gets no new token, so it is retried next run."""
+        failure = Exception("Backend Error")
+        failure.resp = MagicMock(status=500)
+        self._serve_batches({
+            "cal1": [(None, failure)],
+            "cal2": [({"items": [], "nextSyncToken": "next2"}, None)],
+        })
+
+        _, next_tokens = self.service._get_calendars_event_changes(
+            ["cal1", "cal2"], {"cal1": "token1", "cal2": "token2"}, self.time_min_str
+        )
+
+        self.assertEqual(next_tokens, {"cal2": "next2"})
+        self.mock_logger.warning.assert_called_once()
+
+    def test_sync_calendar_events_queues_changes_and_fetches_ended_events(self):
+        """Changed events are queued by end time; only ended ones are sent to Reports."""
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        changed = CalendarEventDTO(
+            event_id="evt_new",
+            calendar_id="cal1",
+            summary="Planning",
+            start="2099-01-01T10:00:00Z",
+            end="2099-01-01T11:00:00Z",
+            meeting_code="code1",
+        )
+        ended = CalendarEventDTO(
+            event_id="evt_old",
+            calendar_id="cal1",
+            summary="Standup",
+            start="2025-11-19T10:00:00Z",
+            end="2025-11-19T10:15:00Z",
+            meeting_code="code2",
+        )
+        self.mock_redis_client.hmget.side_effect = [
+            ["token1"],
+            [ended.model_dump_json()],
+        ]
+        self.mock_redis_client.zrangebyscore.return_value = ["evt_old"]
+        write_pipeline = MagicMock()
+        cleanup_pipeline = MagicMock()
+        self.mock_redis_client.pipeline.side_effect = [write_pipeline, cleanup_pipeline]
+
+        with (
+            patch.object(self.service, "_get_all_calendar_ids", return_value=["cal1"]),
+            patch.object(
+                self.service,
+                "_get_calendars_event_changes",
+                return_value=({"evt_new": changed}, {"cal1": "token2"}),
+            ) as mock_changes,
+            patch.object(
+                self.service, "_cache_events_attendees", return_value=set()
+            ) as mock_attendees,
+            patch(
+                "backend.historical_data.google_calendar_sync_service.datetime",
+                wraps=datetime,
+            ) as mock_datetime,
+        ):
+            mock_datetime.now.return_value = datetime(2025, 11, 20, tzinfo=timezone.utc)
+            result = self.service.sync_calendar_events()
+
+        self.assertEqual(result, {"event_count": 1, "attendance_event_count": 1})
+        self.mock_redis_client.zrangebyscore.assert_called_once_with(
+            "calendar:pending_attendance:by_end",
+            "-inf",
+            int(datetime(2025, 11, 19, 23, tzinfo=timezone.utc).timestamp()),
+        )
+        self.assertEqual(mock_changes.call_args.args[1], {"cal1": "token1"})
+        write_pipeline.set.assert_called_once_with("event:evt", ANY)
+        write_pipeline.hset.assert_any_call(
+            "calendar:pending_attendance",
+            mapping={"evt_new": changed.model_dump_json()},
+        )
+        write_pipeline.zadd.assert_called_once_with(
+            "calendar:pending_attendance:by_end",
+            {"evt_new": int(changed.end.timestamp())},
+        )
+        write_pipeline.hset.assert_any_call(
+            "calendar:sync_token", mapping={"cal1": "token2"}
+        )
+        write_pipeline.execute.assert_called_once()
+
+        mock_attendees.assert_called_once_with(
+            {"evt_old": ended}, "2025-11-19T08:00:00Z", "2025-11-20T00:00:00Z"
+        )
+        cleanup_pipeline.zrem.assert_called_once_with(
+            "calendar:pending_attendance:by_end", "evt_old"
+        )
+        cleanup_pipeline.hdel.assert_called_once_with(
+            "calendar:pending_attendance", "evt_old"
+        )
+
+    def test_sync_calendar_events_keeps_events_whose_lookup_failed_queued(self):
+        """Only events whose attendance was read leave the pending queue."""
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        fetched = CalendarEventDTO(
+            event_id="evt_ok",
+            calendar_id="cal1",
+            summary="Standup",
+            start="2025-11-19T10:00:00Z",
+            end="2025-11-19T10:15:00Z",
+            meeting_code="code_ok",
+        )
+        failed = CalendarEventDTO(
+            event_id="evt_failed",
+            calendar_id="cal1",
+            summary="Retro",
+            start="2025-11-19T11:00:00Z",
+            end="2025-11-19T11:30:00Z",
+            meeting_code="code_failed",
+        )
+        self.mock_redis_client.hmget.return_value = [
+            fetched.model_dump_json(),
+            failed.model_dump_json(),
+        ]
+        self.mock_redis_client.zrangebyscore.return_value = ["evt_ok", "evt_failed"]
+        cleanup_pipeline = MagicMock()
+        self.mock_redis_client.pipeline.return_value = cleanup_pipeline
+
+        with (
+            patch.object(self.service, "_get_all_calendar_ids", return_value=[]),
+            patch.object(
+                self.service, "_cache_events_attendees", return_value={"evt_failed"}
+            ),
+        ):
+            result = self.service.sync_calendar_events()
+
+        self.assertEqual(result, {"event_count": 0, "attendance_event_count": 1})
+        cleanup_pipeline.zrem.assert_called_once_with(
+            "calendar:pending_attendance:by_end", "evt_ok"
+        )
+        cleanup_pipeline.hdel.assert_called_once_with(
+            "calendar:pending_attendance", "evt_ok"
+        )
+
+    def test_sync_calendar_events_skips_reports_without_ended_events(self):
+        """Nothing is sent to the Reports API while no queued event has ended."""
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        self.mock_redis_client.hmget.return_value = [None]
+        self.mock_redis_client.zrangebyscore.return_value = []
+
+        with (
+            patch.object(self.service, "_get_all_calendar_ids", return_value=["cal1"]),
+            patch.object(
+                self.service, "_get_calendars_event_changes", return_value=({}, {})
+            ),
+            patch.object(self.service, "_cache_events_attendees") as mock_attendees,
+        ):
+            result = self.service.sync_calendar_events()
+
+        self.assertEqual(result, {"event_count": 0, "attendance_event_count": 0})
+        mock_attendees.assert_not_called()
+        self.mock_redis_client.pipeline.assert_called_once()
+
 
 if __name__ == "__main__":
     main()
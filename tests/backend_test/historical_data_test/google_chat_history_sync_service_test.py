@@ -1,10 +1,12 @@
 from unittest import TestCase, main
-from unittest.mock import Mock, call
+from unittest.mock import MagicMock, Mock, call
 
 from backend.historical_data.google_chat_history_sync_service import (
     GoogleChatHistorySyncService,
 )
 
+CURSOR_KEY = "google:chat:history_cursor:{space_id}"
+
 
 class TestGoogleChatHistorySyncService(TestCase):
     def setUp(self):
@@ -12,11 +14,22 @@ class TestGoogleChatHistorySyncService(TestCase):
         self.mock_logger = Mock()
         self.mock_google_service = Mock()
         self.mock_google_chat_message_utils = Mock()
+        self.mock_redis_client = MagicMock()
+        self.mock_redis_client.hgetall.return_value = {}
+        self.mock_pipeline = MagicMock()
+        self.mock_redis_client.pipeline.return_value = self.mock_pipeline
+        self.mock_retry_utils = Mock()
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args: func(*args)
+        )
 
         self.service = GoogleChatHistorySyncService(
             self.mock_logger,
             self.mock_google_service,
             self.mock_google_chat_message_utils,
+            self.mock_redis_client,
+            self.mock_retry_utils,
+            max_workers=2,
         )
 
     def test_sync_history_messages_happy_path(self):
@@ -24,24 +37,34 @@ class TestGoogleChatHistorySyncService(TestCase):
         Test the happy path where spaces and messages are found and processed.
         """
 
-        spaces = {"space/1": "Space One", "space/2": "Space Two"}
+        spaces = {"space1": "Space One", "space2": "Space Two"}
         ldaps = {"user/123": "ldap1"}
-        messages_batch_1 = [{"name": "msg1"}, {"name": "msg2"}]
-        messages_batch_2 = [{"name": "msg3"}]
+        messages_batch_1 = [
+            {"name": "msg1", "createTime": "2025-01-01T00:00:00Z"},
+            {"name": "msg2", "createTime": "2025-01-02T00:00:00Z"},
+        ]
+        messages_batch_2 = [{"name": "msg3", "createTime": "2025-01-03T00:00:00Z"}]
+        pages = {
+            "space1": {"messages": messages_batch_1},
+            "space2": {"messages": messages_batch_2},
+        }
 
         self.mock_google_service.get_chat_spaces.return_value = spaces
         self.mock_google_service.list_directory_all_people_ldap.return_value = ldaps
-        self.mock_google_service.fetch_messages_by_spaces_id_paginated.side_effect = [
-            iter([messages_batch_1]),  # Messages for space/1
-            iter([messages_batch_2]),  # Messages for space/2
-        ]
+        self.mock_google_service.fetch_messages_page.side_effect = (
+            lambda space_id, **kwargs: pages[space_id]
+        )
 
-        self.service.sync_history_messages()
+        self.assertEqual(self.service.sync_history_messages(), 3)
 
         self.mock_google_service.get_chat_spaces.assert_called_once_with("SPACE")
         self.mock_google_service.list_directory_all_people_ldap.assert_called_once()
-        self.mock_google_service.fetch_messages_by_spaces_id_paginated.assert_has_calls(
-            [call("space/1"), call("space/2")], any_order=True
+        self.mock_google_service.fetch_messages_page.assert_has_calls(
+            [
+                call("space1", page_token=None, created_after=None),
+                call("space2", page_token=None, created_after=None),
+            ],
+            any_order=True,
         )
         self.mock_google_chat_message_utils.sync_batch_created_messages.assert_has_calls(
             [
@@ -54,25 +77,148 @@ class TestGoogleChatHistorySyncService(TestCase):
             self.mock_google_chat_message_utils.sync_batch_created_messages.call_count,
             2,
         )
+        self.mock_pipeline.hset.assert_any_call(
+            CURSOR_KEY.format(space_id="space1"),
+            mapping={
+                "created_after": "",
+                "last_create_time": "2025-01-02T00:00:00Z",
+            },
+        )
+        self.mock_pipeline.hdel.assert_any_call(
+            CURSOR_KEY.format(space_id="space1"), "page_token"
+        )
+
+    def test_sync_history_messages_saves_cursor_after_each_page(self):
+        spaces = {"space1": "Space One"}
+        self.mock_google_service.get_chat_spaces.return_value = spaces
+        self.mock_google_service.list_directory_all_people_ldap.return_value = {
+            "user/1": "ldap1"
+        }
+        self.mock_google_service.fetch_messages_page.side_effect = [
+            {
+                "messages": [{"name": "msg1", "createTime": "2025-01-01T00:00:00Z"}],
+                "nextPageToken": "token-2",
+            },
+            {"messages": [{"name": "msg2", "createTime": "2025-01-02T00:00:00Z"}]},
+        ]
+
+        self.service.sync_history_messages()
+
+        self.mock_google_service.fetch_messages_page.assert_called_with(
+            "space1", page_token="token-2", created_after=None
+        )
+        self.mock_pipeline.hset.assert_any_call(
+            CURSOR_KEY.format(space_id="space1"), "page_token", "token-2"
+        )
+        self.assertEqual(self.mock_pipeline.execute.call_count, 2)
+
+    def test_sync_history_messages_resumes_stored_pass(self):
+        self.mock_google_service.get_chat_spaces.return_value = {"space1": "Space One"}
+        self.mock_google_service.list_directory_all_people_ldap.return_value = {
+            "user/1": "ldap1"
+        }
+        self.mock_redis_client.hgetall.return_value = {
+            "page_token": "token-7",
+            "created_after": "2024-12-01T00:00:00Z",
+            "last_create_time": "2024-12-20T00:00:00Z",
+        }
+        self.mock_google_service.fetch_messages_page.return_value = {"messages": []}
+
+        self.service.sync_history_messages()
+
+        self.mock_redis_client.hgetall.assert_called_once_with(
+            CURSOR_KEY.format(space_id="space1")
+        )
+        self.mock_google_service.fetch_messages_page.assert_called_once_with(
+            "space1", page_token="token-7", created_after="2024-12-01T00:00:00Z"
+        )
+        self.mock_pipeline.hset.assert_called_once_with(
+            CURSOR_KEY.format(space_id="space1"),
+            mapping={
+                "created_after": "2024-12-01T00:00:00Z",
+                "last_create_time": "2024-12-20T00:00:00Z",
+            },
+        )
+
+    def test_sync_history_messages_fetches_only_new_messages(self):
+        self.mock_google_service.get_chat_spaces.return_value = {"space1": "Space One"}
+        self.mock_google_service.list_directory_all_people_ldap.return_value = {
+            "user/1": "ldap1"
+        }
+        self.mock_redis_client.hgetall.return_value = {
+            "created_after": "",
+            "last_create_time": "2024-12-20T00:00:00Z",
+        }
+        self.mock_google_service.fetch_messages_page.return_value = {"messages": []}
+
+        self.service.sync_history_messages()
+
+        self.mock_google_service.fetch_messages_page.assert_called_once_with(
+            "space1", page_token=None, created_after="2024-12-20T00:00:00Z"
+        )
+
+    def test_sync_history_messages_restarts_pass_on_rejected_token(self):
+        self.mock_google_service.get_chat_spaces.return_value = {"space1": "Space One"}
+        self.mock_google_service.list_directory_all_people_ldap.return_value = {
+            "user/1": "ldap1"
+        }
+        self.mock_redis_client.hgetall.return_value = {
+            "page_token": "expired",
+            "created_after": "",
+            "last_create_time": "",
+        }
+        self.mock_google_service.fetch_messages_page.side_effect = [
+            RuntimeError("Unable to fetch Google Chat messages"),
+            {"messages": []},
+        ]
+
+        self.service.sync_history_messages()
+
+        self.mock_google_service.fetch_messages_page.assert_called_with(
+            "space1", page_token=None, created_after=None
+        )
+        self.mock_logger.warning.assert_called_once()
+
+    def test_sync_history_messages_failed_space_does_not_stop_others(self):
+        self.mock_google_service.get_chat_spaces.return_value = {
+            "space1": "Space One",
+            "space2": "Space Two",
+        }
+        self.mock_google_service.list_directory_all_people_ldap.return_value = {
+            "user/1": "ldap1"
+        }
+        messages = [{"name": "msg1", "createTime": "2025-01-01T00:00:00Z"}]
+
+        def fetch_messages_page(space_id, **kwargs):
+            if space_id == "space1":
+                raise RuntimeError("Unable to fetch Google Chat messages")
+            return {"messages": messages}
+
+        self.mock_google_service.fetch_messages_page.side_effect = fetch_messages_page
+
+        with self.assertRaisesRegex(RuntimeError, "space1"):
+            self.service.sync_history_messages()
+
+        self.mock_google_chat_message_utils.sync_batch_created_messages.assert_called_once_with(
+            messages, {"user/1": "ldap1"}
+        )
 
     def test_sync_history_messages_no_messages_in_space(self):
         """
         Test behavior for a space that contains no messages.
         """
 
-        spaces = {"space/1": "Space One"}
+        spaces = {"space1": "Space One"}
         self.mock_google_service.get_chat_spaces.return_value = spaces
         self.mock_google_service.list_directory_all_people_ldap.return_value = {
             "user/1": "ldap1"
         }
-        self.mock_google_service.fetch_messages_by_spaces_id_paginated.return_value = (
-            iter([[]])
-        )
+        self.mock_google_service.fetch_messages_page.return_value = {"messages": []}
 
-        self.service.sync_history_messages()
+        self.assertEqual(self.service.sync_history_messages(), 0)
 
-        self.mock_google_service.fetch_messages_by_spaces_id_paginated.assert_called_once_with(
-            "space/1"
+        self.mock_google_service.fetch_messages_page.assert_called_once_with(
+            "space1", page_token=None, created_after=None
         )
         self.mock_google_chat_message_utils.sync_batch_created_messages.assert_not_called()
 
@@ -101,14 +247,14 @@ class TestGoogleChatHistorySyncService(TestCase):
 
         self.mock_google_service.get_chat_spaces.assert_called_once_with("SPACE")
         self.mock_google_service.list_directory_all_people_ldap.assert_not_called()
-        self.mock_google_service.fetch_messages_by_spaces_id_paginated.assert_not_called()
+        self.mock_google_service.fetch_messages_page.assert_not_called()
 
     def test_sync_history_messages_no_ldap_mappings(self):
         """
         Test that exceptions when no LDAP mappings are found.
         """
 
-        spaces = {"space/1": "Space One"}
+        spaces = {"space1": "Space One"}
         self.mock_google_service.get_chat_spaces.return_value = spaces
         self.mock_google_service.list_directory_all_people_ldap.return_value = {}
 
@@ -116,7 +262,7 @@ class TestGoogleChatHistorySyncService(TestCase):
             self.service.sync_history_messages()
 
         self.mock_google_service.list_directory_all_people_ldap.assert_called_once()
-        self.mock_google_service.fetch_messages_by_spaces_id_paginated.assert_not_called()
+        self.mock_google_service.fetch_messages_page.assert_not_called()
 
 
 if __name__ == "__main__":
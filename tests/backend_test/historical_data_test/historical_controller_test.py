@@ -9,13 +9,21 @@ from backend.historical_data.historical_controller import HistoricalController
 from backend.common.api_endpoints import (
     MICROSOFT_BACKFILL_LDAPS_ENDPOINT,
     MICROSOFT_BACKFILL_CHAT_MESSAGES_ENDPOINT,
+    MICROSOFT_BACKFILL_ALL_CHAT_MESSAGES_ENDPOINT,
     JIRA_SYNC_PROJECTS_ENDPOINT,
     JIRA_BACKFILL_ISSUES_ENDPOINT,
     JIRA_UPDATE_ISSUES_ENDPOINT,
+    JIRA_SYNC_ISSUES_ENDPOINT,
+    JIRA_BACKFILL_STORY_POINTS_ENDPOINT,
     GOOGLE_CALENDAR_PULL_HISTORY_ENDPOINT,
+    GOOGLE_CALENDAR_SYNC_ENDPOINT,
+    GOOGLE_CALENDAR_BACKFILL_MEETING_SECONDS_ENDPOINT,
     GERRIT_BACKFILL_CHANGES_ENDPOINT,
     GERRIT_BACKFILL_PROJECTS_ENDPOINT,
+    GERRIT_SYNC_CHANGES_ENDPOINT,
     GOOGLE_CHAT_SYNC_HISTORY_MESSAGES_ENDPOINT,
+    GOOGLE_CHAT_BACKFILL_DAILY_COUNTS_ENDPOINT,
+    MICROSOFT_BACKFILL_CHAT_DAILY_COUNTS_ENDPOINT,
 )
 from backend.common.permissions import Permission
 from backend.dto.user_context_dto import UserContextDto
@@ -149,6 +157,38 @@ class TestHistoricalController(unittest.TestCase):
             chat_id
         )
 
+    def test_backfill_all_microsoft_chat_messages(self):
+        """Test the multi-chat Microsoft backfill endpoint forwards its options."""
+        self._set_authenticated_user()
+        result = {"chats": 2, "processed": 10, "skipped": 1}
+        self.mock_ms_chat_service.backfill_chat_messages.return_value = result
+
+        response = self.client.post(
+            MICROSOFT_BACKFILL_ALL_CHAT_MESSAGES_ENDPOINT,
+            json={"chat_ids": ["c1", "c2"], "max_concurrency": 2},
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["data"], result)
+        self.mock_ms_chat_service.backfill_chat_messages.assert_awaited_once_with(
+            chat_ids=["c1", "c2"], max_concurrency=2
+        )
+
+    def test_backfill_all_microsoft_chat_messages_defaults_to_cached_chats(self):
+        """Test the multi-chat Microsoft backfill endpoint without a body."""
+        self._set_authenticated_user()
+        self.mock_ms_chat_service.backfill_chat_messages.return_value = {}
+
+        response = self.client.post(
+            MICROSOFT_BACKFILL_ALL_CHAT_MESSAGES_ENDPOINT, json={}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.mock_ms_chat_service.backfill_chat_messages.assert_awaited_once_with(
+            chat_ids=None, max_concurrency=4
+        )
+
     def test_update_jira_issues_with_query_param(self):
         """Test Jira update endpoint with query parameter (CRON_RUNNER role)."""
         self._set_authenticated_user()
@@ -200,9 +240,37 @@ class TestHistoricalController(unittest.TestCase):
 
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.mock_gerrit_service.fetch_and_store_changes.assert_called_once_with(
-            statuses=["MERGED"]
+            statuses=["MERGED"], max_workers=1
         )
 
+    def test_backfill_gerrit_changes_with_max_workers(self):
+        """Test Gerrit backfill endpoint forwards the fetch concurrency."""
+        self._set_authenticated_user()
+
+        response = self.client.post(
+            GERRIT_BACKFILL_CHANGES_ENDPOINT,
+            json={"max_workers": 4},
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.mock_gerrit_service.fetch_and_store_changes.assert_called_once_with(
+            statuses=None, max_workers=4
+        )
+
+    def test_backfill_gerrit_changes_rejects_excessive_max_workers(self):
+        """Test Gerrit backfill endpoint bounds the fetch concurrency."""
+        self._set_authenticated_user()
+
+        response = self.client.post(
+            GERRIT_BACKFILL_CHANGES_ENDPOINT,
+            json={"max_workers": 100},
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.mock_gerrit_service.fetch_and_store_changes.assert_not_called()
+
     def _assert_offloaded_once(self, spy_to_thread, target_callable):
         """Assert asyncio.to_thread was invoked exactly once for `target_callable`."""
         matching = [
@@ -229,6 +297,82 @@ class TestHistoricalController(unittest.TestCase):
             spy_to_thread, self.mock_google_chat_service.sync_history_messages
         )
 
+    def test_backfill_google_chat_daily_counts_offloads_to_thread(self):
+        """backfill_daily_counts scans Redis synchronously; must run on a worker thread."""
+        self._set_authenticated_user()
+        self.mock_google_chat_service.backfill_daily_counts.return_value = 12
+
+        with patch(
+            "backend.historical_data.historical_controller.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as spy_to_thread:
+            response = self.client.post(
+                GOOGLE_CHAT_BACKFILL_DAILY_COUNTS_ENDPOINT, headers=self.headers
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["data"], {"day_count": 12})
+        self._assert_offloaded_once(
+            spy_to_thread, self.mock_google_chat_service.backfill_daily_counts
+        )
+
+    def test_backfill_microsoft_chat_daily_counts_offloads_to_thread(self):
+        """backfill_daily_counts scans Redis synchronously; must run on a worker thread."""
+        self._set_authenticated_user()
+        self.mock_ms_chat_service.backfill_daily_counts = MagicMock(return_value=7)
+
+        with patch(
+            "backend.historical_data.historical_controller.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as spy_to_thread:
+            response = self.client.post(
+                MICROSOFT_BACKFILL_CHAT_DAILY_COUNTS_ENDPOINT, headers=self.headers
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["data"], {"day_count": 7})
+        self._assert_offloaded_once(
+            spy_to_thread, self.mock_ms_chat_service.backfill_daily_counts
+        )
+
+    def test_backfill_jira_story_points_offloads_to_thread(self):
+        """rebuild_story_points_index scans Redis synchronously; must run on a worker thread."""
+        self._set_authenticated_user()
+        self.mock_jira_service.rebuild_story_points_index.return_value = 12
+
+        with patch(
+            "backend.historical_data.historical_controller.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as spy_to_thread:
+            response = self.client.post(
+                JIRA_BACKFILL_STORY_POINTS_ENDPOINT, headers=self.headers
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["data"], {"index_count": 12})
+        self._assert_offloaded_once(
+            spy_to_thread, self.mock_jira_service.rebuild_story_points_index
+        )
+
+    def test_backfill_calendar_meeting_seconds_offloads_to_thread(self):
+        """rebuild_meeting_seconds scans Redis synchronously; must run on a worker thread."""
+        self._set_authenticated_user()
+        self.mock_google_calendar_service.rebuild_meeting_seconds.return_value = 30
+
+        with patch(
+            "backend.historical_data.historical_controller.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as spy_to_thread:
+            response = self.client.post(
+                GOOGLE_CALENDAR_BACKFILL_MEETING_SECONDS_ENDPOINT, headers=self.headers
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["data"], {"day_count": 30})
+        self._assert_offloaded_once(
+            spy_to_thread, self.mock_google_calendar_service.rebuild_meeting_seconds
+        )
+
     def test_update_jira_issues_offloads_to_thread(self):
         """process_update_jira_issues is a sync JIRA HTTP call; must run on a worker thread."""
         self._set_authenticated_user()
@@ -246,6 +390,23 @@ class TestHistoricalController(unittest.TestCase):
             spy_to_thread, self.mock_jira_service.process_update_jira_issues
         )
 
+    def test_sync_jira_issues_offloads_to_thread(self):
+        """sync_updated_jira_issues is a sync JIRA HTTP call; must run on a worker thread."""
+        self._set_authenticated_user()
+        self.mock_jira_service.sync_updated_jira_issues.return_value = 2
+
+        with patch(
+            "backend.historical_data.historical_controller.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as spy_to_thread:
+            response = self.client.post(JIRA_SYNC_ISSUES_ENDPOINT, headers=self.headers)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["data"], {"updated_issues": 2})
+        self._assert_offloaded_once(
+            spy_to_thread, self.mock_jira_service.sync_updated_jira_issues
+        )
+
     def test_backfill_jira_issues_offloads_to_thread(self):
         """backfill_all_jira_issues is a sync JIRA HTTP call; must run on a worker thread."""
         self._set_authenticated_user()
@@ -304,6 +465,30 @@ class TestHistoricalController(unittest.TestCase):
             spy_to_thread, self.mock_google_calendar_service.pull_calendar_history
         )
 
+    def test_sync_calendar_events_offloads_to_thread(self):
+        """sync_calendar_events wraps Google Discovery .execute() and time.sleep; must offload."""
+        self._set_authenticated_user()
+        self.mock_google_calendar_service.sync_calendar_events.return_value = {
+            "event_count": 4,
+            "attendance_event_count": 2,
+        }
+
+        with patch(
+            "backend.historical_data.historical_controller.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as spy_to_thread:
+            response = self.client.post(
+                GOOGLE_CALENDAR_SYNC_ENDPOINT, headers=self.headers
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json()["data"], {"event_count": 4, "attendance_event_count": 2}
+        )
+        self._assert_offloaded_once(
+            spy_to_thread, self.mock_google_calendar_service.sync_calendar_events
+        )
+
     def test_backfill_gerrit_changes_offloads_to_thread(self):
         """fetch_and_store_changes is a sync Gerrit HTTP call; must run on a worker thread."""
         self._set_authenticated_user()
@@ -340,6 +525,25 @@ class TestHistoricalController(unittest.TestCase):
             spy_to_thread, self.mock_gerrit_service.sync_gerrit_projects
         )
 
+    def test_sync_gerrit_changes_offloads_to_thread(self):
+        """sync_changes_incrementally is a sync Gerrit HTTP call; must run on a worker thread."""
+        self._set_authenticated_user()
+        self.mock_gerrit_service.sync_changes_incrementally.return_value = 3
+
+        with patch(
+            "backend.historical_data.historical_controller.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as spy_to_thread:
+            response = self.client.post(
+                GERRIT_SYNC_CHANGES_ENDPOINT, headers=self.headers
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["data"], {"change_count": 3})
+        self._assert_offloaded_once(
+            spy_to_thread, self.mock_gerrit_service.sync_changes_incrementally
+        )
+
     def test_unauthorized_access(self):
         """Test access without required roles (should return 403 Forbidden)."""
         # Simulate a normal user without INFRA_ADMIN or CRON_RUNNER role
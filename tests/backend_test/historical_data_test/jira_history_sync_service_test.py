@@ -1,12 +1,17 @@
 from unittest import TestCase, main
-from unittest.mock import MagicMock, patch, call
+from datetime import datetime, timezone
+from unittest.mock import ANY, MagicMock, patch, call
 from backend.historical_data.jira_history_sync_service import JiraHistorySyncService
 from backend.common.constants import (
     JiraIssueStatus,
+    JIRA_ISSUE_CONTENT_HASH_KEY,
     JIRA_ISSUE_DETAILS_KEY,
     JIRA_STORY_POINT_FIELD,
     JIRA_LDAP_PROJECT_STATUS_INDEX_KEY,
     JIRA_EXCLUDED_STATUS_ID,
+    JIRA_STORY_POINTS_KEY,
+    JIRA_SYNC_INITIAL_LOOKBACK_MINUTES,
+    JIRA_SYNC_WATERMARK_KEY,
 )
 
 
@@ -204,10 +209,18 @@ class TestJiraHistorySyncService(TestCase):
 
         self.assertEqual(result, 1)
         self.mock_jira_search_service.fetch_assigned_issues_paginated.assert_called_once()
-        mock_pipeline.hset.assert_called_once_with(
+        mock_pipeline.hset.assert_any_call(
             JIRA_ISSUE_DETAILS_KEY.format(issue_id=self.mock_issue_1_id),
             mapping=self.expected_detail_info_done,
         )
+        mock_pipeline.hset.assert_any_call(
+            JIRA_ISSUE_CONTENT_HASH_KEY,
+            mapping={
+                self.mock_issue_1_id: self.service._issue_content_hash(
+                    self.mock_issue_1_raw_data
+                )
+            },
+        )
         self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
             mock_pipeline.execute
         )
@@ -358,12 +371,31 @@ class TestJiraHistorySyncService(TestCase):
             project_id=self.mock_issue_1_project_id,
             status=JiraIssueStatus.DONE.value,
         )
-        mock_pipeline.zadd.assert_called_once_with(
+        mock_pipeline.eval.assert_called_once_with(
+            ANY,
+            3,
             expected_zadd_key,
-            {self.mock_issue_1_id: self.finish_date},
+            JIRA_STORY_POINTS_KEY.format(
+                ldap=self.mock_issue_1_assignee_name,
+                project_id=self.mock_issue_1_project_id,
+            ),
+            expected_set_key,
+            self.mock_issue_1_id,
+            self.finish_date,
+            self.mock_issue_1_story_point,
         )
         mock_pipeline.sadd.assert_not_called()
 
+    def test_queue_issues_in_redis_pipeline_indexes_before_overwriting_details(self):
+        """The DONE index script must read the old story points before HSET."""
+        mock_pipeline = MagicMock()
+
+        self.service._queue_issues_in_redis_pipeline([self.mock_issue_1], mock_pipeline)
+
+        self.assertEqual(
+            [name for name, _, _ in mock_pipeline.mock_calls], ["eval", "hset"]
+        )
+
     def test_queue_issues_in_redis_pipeline_non_done_issue(self):
         """Should queue a non-DONE issue with SADD and HSET commands."""
         mock_pipeline = MagicMock()
@@ -608,7 +640,7 @@ class TestJiraHistorySyncService(TestCase):
             JIRA_ISSUE_DETAILS_KEY.format(issue_id=self.mock_issue_2_id),
             mapping=self.expected_detail_info_in_progress,
         )
-        self.assertEqual(mock_pipeline_1.zadd.call_count, 1)
+        self.assertEqual(mock_pipeline_1.eval.call_count, 1)
         self.assertEqual(mock_pipeline_1.sadd.call_count, 1)
         self.mock_retry_utils.get_retry_on_transient.assert_any_call(
             mock_pipeline_1.execute
@@ -627,7 +659,7 @@ class TestJiraHistorySyncService(TestCase):
             JIRA_ISSUE_DETAILS_KEY.format(issue_id=mock_issue_3_id),
             mapping=expected_detail_info_mock_issue_3,
         )
-        self.assertEqual(mock_pipeline_2.zadd.call_count, 1)
+        self.assertEqual(mock_pipeline_2.eval.call_count, 1)
         self.assertEqual(mock_pipeline_2.sadd.call_count, 0)
         self.mock_retry_utils.get_retry_on_transient.assert_any_call(
             mock_pipeline_2.execute
@@ -660,13 +692,22 @@ class TestJiraHistorySyncService(TestCase):
             JIRA_ISSUE_DETAILS_KEY.format(issue_id=self.mock_issue_1_id),
             mapping=self.expected_detail_info_done,
         )
-        updated_pipeline_mock.zadd.assert_called_once_with(
+        updated_pipeline_mock.eval.assert_called_once_with(
+            ANY,
+            3,
             JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
                 ldap=self.mock_issue_1_assignee_name,
                 project_id=self.mock_issue_1_project_id,
                 status=JiraIssueStatus.DONE.value,
             ),
-            {self.mock_issue_1_id: self.finish_date},
+            JIRA_STORY_POINTS_KEY.format(
+                ldap=self.mock_issue_1_assignee_name,
+                project_id=self.mock_issue_1_project_id,
+            ),
+            JIRA_ISSUE_DETAILS_KEY.format(issue_id=self.mock_issue_1_id),
+            self.mock_issue_1_id,
+            self.finish_date,
+            self.mock_issue_1_story_point,
         )
         expected_calls = [
             call(search_pipeline_mock.execute),
@@ -699,14 +740,26 @@ class TestJiraHistorySyncService(TestCase):
         updated_pipeline_mock.delete.assert_called_once_with(
             JIRA_ISSUE_DETAILS_KEY.format(issue_id=self.mock_issue_1_id)
         )
-        updated_pipeline_mock.zrem.assert_called_once_with(
+        updated_pipeline_mock.eval.assert_called_once_with(
+            ANY,
+            3,
             JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
                 ldap=self.mock_issue_1_assignee_name,
                 project_id=self.mock_issue_1_project_id,
                 status=JiraIssueStatus.DONE.value,
             ),
+            JIRA_STORY_POINTS_KEY.format(
+                ldap=self.mock_issue_1_assignee_name,
+                project_id=self.mock_issue_1_project_id,
+            ),
+            JIRA_ISSUE_DETAILS_KEY.format(issue_id=self.mock_issue_1_id),
             self.mock_issue_1_id,
         )
+        # Story points are read from the issue hash, so it is deleted last.
+        self.assertEqual(
+            [name for name, _, _ in updated_pipeline_mock.mock_calls][:2],
+            ["eval", "delete"],
+        )
         expected_calls = [
             call(search_pipeline_mock.execute),
             call(updated_pipeline_mock.execute),
@@ -760,6 +813,232 @@ class TestJiraHistorySyncService(TestCase):
         ]
         self.mock_retry_utils.get_retry_on_transient.assert_has_calls(expected_calls)
 
+    def _use_args_retry(self):
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+
+    def test_issue_content_hash_ignores_unrelated_updates(self):
+        """Only synced fields change the digest of an issue."""
+        original = self.service._issue_content_hash(self.mock_issue_2_raw_data)
+        touched = {
+            **self.mock_issue_2_raw_data,
+            "fields": {
+                **self.mock_issue_2_raw_data["fields"],
+                "updated": "2023-03-20T09:00:00.000+0000",
+            },
+        }
+        reassigned = {
+            **self.mock_issue_2_raw_data,
+            "fields": {
+                **self.mock_issue_2_raw_data["fields"],
+                "assignee": {"name": "someoneelse"},
+            },
+        }
+
+        self.assertEqual(self.service._issue_content_hash(touched), original)
+        self.assertNotEqual(self.service._issue_content_hash(reassigned), original)
+
+    def test_issue_content_hash_tracks_updated_of_unresolved_done_issue(self):
+        """DONE issues without a resolution date fall back to `updated`."""
+        fields = {**self.mock_issue_1_raw_data["fields"], "resolutiondate": None}
+        issue_raw = {**self.mock_issue_1_raw_data, "fields": fields}
+        touched_raw = {
+            **issue_raw,
+            "fields": {**fields, "updated": "2023-03-20T09:00:00.000+0000"},
+        }
+
+        self.assertNotEqual(
+            self.service._issue_content_hash(touched_raw),
+            self.service._issue_content_hash(issue_raw),
+        )
+
+    def test_sync_updated_jira_issues_without_watermark_uses_initial_lookback(self):
+        """The first sync looks back the initial window and stores a watermark."""
+        self._use_args_retry()
+        self.mock_redis_client.get.return_value = None
+        self.mock_jira_search_service.fetch_issues_updated_within_minutes_paginated.return_value = [
+            [self.mock_issue_1, self.mock_issue_2]
+        ]
+        self.mock_redis_client.hmget.return_value = [
+            self.service._issue_content_hash(self.mock_issue_1_raw_data),
+            self.service._issue_content_hash(self.mock_issue_2_raw_data),
+        ]
+
+        result = self.service.sync_updated_jira_issues()
+
+        self.assertEqual(result, 0)
+        self.mock_jira_search_service.fetch_issues_updated_within_minutes_paginated.assert_called_once_with(
+            JIRA_SYNC_INITIAL_LOOKBACK_MINUTES
+        )
+        self.mock_redis_client.hmget.assert_called_once_with(
+            JIRA_ISSUE_CONTENT_HASH_KEY, [self.mock_issue_1_id, self.mock_issue_2_id]
+        )
+        self.mock_redis_client.pipeline.assert_not_called()
+        self.mock_redis_client.set.assert_called_once_with(
+            JIRA_SYNC_WATERMARK_KEY, "2023-03-15T09:00:00.000+0000"
+        )
+
+    def test_sync_updated_jira_issues_queries_from_watermark(self):
+        """The look-back covers the time since the watermark plus the overlap."""
+        self._use_args_retry()
+        self.mock_redis_client.get.return_value = "2023-03-15T09:00:00.000+0000"
+        self.mock_jira_search_service.fetch_issues_updated_within_minutes_paginated.return_value = []
+
+        with patch(
+            "backend.historical_data.jira_history_sync_service.datetime",
+            wraps=datetime,
+        ) as mock_datetime:
+            mock_datetime.now.return_value = datetime(
+                2023, 3, 15, 11, 0, 30, tzinfo=timezone.utc
+            )
+            result = self.service.sync_updated_jira_issues()
+
+        self.assertEqual(result, 0)
+        self.mock_jira_search_service.fetch_issues_updated_within_minutes_paginated.assert_called_once_with(
+            121 + 30
+        )
+        self.mock_redis_client.set.assert_not_called()
+
+    def test_sync_updated_jira_issues_restores_changed_issue(self):
+        """Changed issues are unindexed from their stored state and re-stored."""
+        self._use_args_retry()
+        self.mock_redis_client.get.return_value = None
+        updated_issue = MagicMock()
+        updated_issue.raw = {
+            **self.mock_issue_2_raw_data,
+            "fields": {
+                **self.mock_issue_2_raw_data["fields"],
+                "summary": "Updated Summary",
+            },
+        }
+        self.mock_jira_search_service.fetch_issues_updated_within_minutes_paginated.return_value = [
+            [self.mock_issue_1, updated_issue]
+        ]
+        self.mock_redis_client.hmget.return_value = [
+            self.service._issue_content_hash(self.mock_issue_1_raw_data),
+            self.service._issue_content_hash(self.mock_issue_2_raw_data),
+        ]
+        search_pipeline = MagicMock()
+        search_pipeline.execute.return_value = [
+            [
+                self.mock_issue_2_assignee_name,
+                self.mock_issue_2_project_id,
+                JiraIssueStatus.IN_PROGRESS.value,
+            ]
+        ]
+        updated_pipeline = MagicMock()
+        self.mock_redis_client.pipeline.side_effect = [
+            search_pipeline,
+            updated_pipeline,
+        ]
+
+        result = self.service.sync_updated_jira_issues()
+
+        self.assertEqual(result, 1)
+        search_pipeline.hmget.assert_called_once_with(
+            JIRA_ISSUE_DETAILS_KEY.format(issue_id=self.mock_issue_2_id),
+            ["ldap", "project_id", "issue_status"],
+        )
+        updated_pipeline.srem.assert_any_call(
+            JIRA_LDAP_PROJECT_STATUS_INDEX_KEY.format(
+                ldap=self.mock_issue_2_assignee_name,
+                project_id=self.mock_issue_2_project_id,
+                status=JiraIssueStatus.IN_PROGRESS.value,
+            ),
+            self.mock_issue_2_id,
+        )
+        expected_detail = {
+            **self.expected_detail_info_in_progress,
+            "issue_title": "Updated Summary",
+        }
+        updated_pipeline.hset.assert_any_call(
+            JIRA_ISSUE_DETAILS_KEY.format(issue_id=self.mock_issue_2_id),
+            mapping=expected_detail,
+        )
+        updated_pipeline.hset.assert_any_call(
+            JIRA_ISSUE_CONTENT_HASH_KEY,
+            mapping={
+                self.mock_issue_2_id: self.service._issue_content_hash(
+                    updated_issue.raw
+                )
+            },
+        )
+        updated_pipeline.execute.assert_called_once()
+
+    def test_sync_updated_jira_issues_records_hash_of_unassigned_issue(self):
+        """Unassigned issues are not stored, but their digest is recorded."""
+        self._use_args_retry()
+        self.mock_redis_client.get.return_value = None
+        unassigned_issue = MagicMock()
+        unassigned_issue.raw = {
+            **self.mock_issue_2_raw_data,
+            "fields": {**self.mock_issue_2_raw_data["fields"], "assignee": None},
+        }
+        self.mock_jira_search_service.fetch_issues_updated_within_minutes_paginated.return_value = [
+            [unassigned_issue]
+        ]
+        self.mock_redis_client.hmget.return_value = [None]
+        search_pipeline = MagicMock()
+        search_pipeline.execute.return_value = [[None, None, None]]
+        updated_pipeline = MagicMock()
+        self.mock_redis_client.pipeline.side_effect = [
+            search_pipeline,
+            updated_pipeline,
+        ]
+
+        result = self.service.sync_updated_jira_issues()
+
+        self.assertEqual(result, 0)
+        updated_pipeline.hset.assert_called_once_with(
+            JIRA_ISSUE_CONTENT_HASH_KEY,
+            mapping={
+                self.mock_issue_2_id: self.service._issue_content_hash(
+                    unassigned_issue.raw
+                )
+            },
+        )
+        updated_pipeline.srem.assert_not_called()
+        updated_pipeline.execute.assert_called_once()
+
+    def test_rebuild_story_points_index(self):
+        """Should sum stored story points per finish date for every DONE index."""
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        self.mock_redis_client.scan_iter.side_effect = [
+            iter(["jira:ldap:johndoe:project:100:status:done"]),
+            iter(["jira:story_points:ldap:olduser:project:100"]),
+        ]
+        self.mock_redis_client.zrange.return_value = [
+            ("10001", 20230315.0),
+            ("10003", 20230315.0),
+            ("10004", 20230316.0),
+        ]
+        read_pipeline = MagicMock()
+        read_pipeline.execute.return_value = ["5.0", "3.0", None]
+        write_pipeline = MagicMock()
+        self.mock_redis_client.pipeline.side_effect = [read_pipeline, write_pipeline]
+
+        result = self.service.rebuild_story_points_index()
+
+        self.assertEqual(result, 1)
+        self.mock_redis_client.zrange.assert_called_once_with(
+            "jira:ldap:johndoe:project:100:status:done", 0, -1, withscores=True
+        )
+        read_pipeline.hget.assert_any_call(
+            JIRA_ISSUE_DETAILS_KEY.format(issue_id="10001"), "story_point"
+        )
+        write_pipeline.delete.assert_called_once_with(
+            "jira:story_points:ldap:olduser:project:100"
+        )
+        write_pipeline.hset.assert_called_once_with(
+            "jira:story_points:ldap:johndoe:project:100",
+            mapping={"20230315": 8.0, "20230316": 0.0},
+        )
+        write_pipeline.set.assert_called_once_with("jira:story_points_ready", ANY)
+        write_pipeline.incr.assert_called_once_with("analytics:generation:jira")
+
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, Mock, call, patch
 
@@ -181,5 +182,147 @@ class TestMicrosoftChatHistorySyncService(unittest.IsolatedAsyncioTestCase):
         self.microsoft_chat_message_util.sync_history_chat_messages_to_redis.assert_not_called()
 
 
+class TestMicrosoftChatHistoryBackfill(unittest.IsolatedAsyncioTestCase):
+    CHECKPOINT_KEY = "microsoft:chat:history_checkpoint"
+
+    def setUp(self):
+        self.logger = Mock()
+        self.microsoft_service = AsyncMock()
+        self.microsoft_service.list_all_id_ldap_mapping.return_value = {"u1": "ldap1"}
+        self.microsoft_chat_message_util = Mock()
+        self.microsoft_chat_message_util.sync_history_chat_messages_to_redis.side_effect = (
+            lambda messages, _: (
+                len(messages),
+                0,
+            )
+        )
+        self.redis_client = AsyncMock()
+        self.redis_client.hgetall.return_value = {}
+        self.retry_utils = Mock()
+
+        async def run(func, *args, **kwargs):
+            return await func(*args, **kwargs)
+
+        self.retry_utils.get_async_retry_on_transient.side_effect = run
+        self.topic_cache_service = AsyncMock()
+        self.service = MicrosoftChatHistorySyncService(
+            self.logger,
+            self.microsoft_service,
+            self.microsoft_chat_message_util,
+            redis_client=self.redis_client,
+            retry_utils=self.retry_utils,
+            microsoft_meeting_chat_topic_cache_service=self.topic_cache_service,
+        )
+
+        # Chat "a" has two pages, chat "b" one.
+        self.first_pages = {
+            "a": Mock(value=["m1", "m2"], odata_next_link="a-2"),
+            "b": Mock(value=["m4"], odata_next_link=None),
+        }
+        self.linked_pages = {
+            "a-2": Mock(value=["m3"], odata_next_link=None),
+            "b-1": Mock(value=["m4"], odata_next_link=None),
+        }
+        self.microsoft_service.fetch_initial_chat_messages_page.side_effect = (
+            lambda chat_id: self.first_pages[chat_id]
+        )
+        self.microsoft_service.fetch_chat_messages_by_url.side_effect = (
+            lambda chat_id, url: self.linked_pages[url]
+        )
+
+    async def test_backfill_writes_fixed_size_chunks_and_checkpoints(self):
+        result = await self.service.backfill_chat_messages(
+            ["a", "b"], max_concurrency=1, chunk_size=2
+        )
+
+        self.assertEqual(result, {"chats": 2, "processed": 4, "skipped": 0})
+        self.microsoft_chat_message_util.sync_history_chat_messages_to_redis.assert_has_calls([
+            call(["m1", "m2"], {"u1": "ldap1"}),
+            call(["m3", "m4"], {"u1": "ldap1"}),
+        ])
+        self.assertEqual(
+            self.redis_client.hset.await_args_list,
+            [
+                call(self.CHECKPOINT_KEY, mapping={"a": "a-2"}),
+                call(self.CHECKPOINT_KEY, mapping={"a": "done", "b": "done"}),
+            ],
+        )
+        self.redis_client.hdel.assert_awaited_once_with(self.CHECKPOINT_KEY, "a", "b")
+
+    async def test_backfill_resumes_from_checkpoints(self):
+        self.redis_client.hgetall.return_value = {"a": "done", "b": "b-1"}
+
+        result = await self.service.backfill_chat_messages(["a", "b"])
+
+        self.assertEqual(result["processed"], 1)
+        self.microsoft_service.fetch_initial_chat_messages_page.assert_not_awaited()
+        self.microsoft_service.fetch_chat_messages_by_url.assert_awaited_once_with(
+            chat_id="b", url="b-1"
+        )
+
+    async def test_backfill_keeps_checkpoints_of_other_chats(self):
+        """A run only clears its own chats, not those of an earlier failed run."""
+        self.redis_client.hgetall.return_value = {"b": "b-1", "other": "other-3"}
+
+        await self.service.backfill_chat_messages(["b"])
+
+        self.redis_client.hdel.assert_awaited_once_with(self.CHECKPOINT_KEY, "b")
+        self.redis_client.delete.assert_not_awaited()
+
+    async def test_backfill_restarts_chat_with_rejected_checkpoint(self):
+        self.redis_client.hgetall.return_value = {"b": "expired"}
+
+        result = await self.service.backfill_chat_messages(["b"])
+
+        self.assertEqual(result["processed"], 1)
+        self.microsoft_service.fetch_initial_chat_messages_page.assert_awaited_once_with(
+            chat_id="b"
+        )
+        self.logger.warning.assert_called_once()
+
+    async def test_backfill_defaults_to_cached_meeting_chats(self):
+        self.topic_cache_service.get_microsoft_chat_topics.return_value = {
+            "b": "Weekly sync"
+        }
+
+        result = await self.service.backfill_chat_messages()
+
+        self.assertEqual(result["chats"], 1)
+        self.microsoft_service.fetch_initial_chat_messages_page.assert_awaited_once_with(
+            chat_id="b"
+        )
+
+    async def test_backfill_keeps_progress_of_failed_chat(self):
+        self.first_pages["a"] = Mock(value=["m1"], odata_next_link="broken")
+
+        with self.assertRaisesRegex(RuntimeError, "a"):
+            await self.service.backfill_chat_messages(["a", "b"], chunk_size=1)
+
+        self.redis_client.hset.assert_any_await(
+            self.CHECKPOINT_KEY, mapping={"a": "broken"}
+        )
+        self.redis_client.hset.assert_any_await(
+            self.CHECKPOINT_KEY, mapping={"b": "done"}
+        )
+        self.redis_client.hdel.assert_not_awaited()
+
+    async def test_backfill_writer_failure_stops_fetchers(self):
+        self.microsoft_chat_message_util.sync_history_chat_messages_to_redis.side_effect = RuntimeError(
+            "redis down"
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "redis down"):
+            await asyncio.wait_for(
+                self.service.backfill_chat_messages(["a", "b"], chunk_size=1),
+                timeout=5,
+            )
+
+    async def test_backfill_without_chats_raises(self):
+        self.topic_cache_service.get_microsoft_chat_topics.return_value = {}
+
+        with self.assertRaises(ValueError):
+            await self.service.backfill_chat_messages()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -36,11 +36,13 @@ class TestMicrosoftMemberSyncService(IsolatedAsyncioTestCase):
         self.mock_retry_utils.get_retry_on_transient.side_effect = (
             lambda func, *args, **kwargs: func()
         )
+        self.mock_ldap_service = MagicMock()
         self.microsoft_member_service = MicrosoftMemberSyncService(
             logger=self.mock_logger,
             redis_client=self.mock_redis,
             microsoft_service=self.mock_microsoft_service,
             retry_utils=self.mock_retry_utils,
+            ldap_service=self.mock_ldap_service,
         )
 
         self.mock_interns_group = make_mock_group(
@@ -292,6 +294,7 @@ class TestMicrosoftMemberSyncService(IsolatedAsyncioTestCase):
         )
         self.mock_pipeline.hdel.assert_not_called()
         self.mock_pipeline.execute.assert_called_once()
+        self.mock_ldap_service.invalidate_cache.assert_called_once()
 
     @patch(
         "backend.historical_data.microsoft_member_sync_service.MicrosoftMemberSyncService.get_current_redis_members_by_group_and_status"
@@ -359,6 +362,63 @@ class TestMicrosoftMemberSyncService(IsolatedAsyncioTestCase):
         self.assertEqual(self.mock_pipeline.hset.call_count, 0)
         self.mock_pipeline.execute.assert_called_once()
 
+    @patch(
+        "backend.historical_data.microsoft_member_sync_service.MicrosoftMemberSyncService.get_current_redis_members_by_group_and_status"
+    )
+    @patch(
+        "backend.historical_data.microsoft_member_sync_service.MicrosoftMemberSyncService.get_latest_members_by_group_and_status"
+    )
+    async def test_sync_microsoft_members_no_changes_keeps_ldap_cache(
+        self, mock_get_latest_data, mock_get_current_data
+    ):
+        members = {("active", "employees"): {"ldap1": "Employee One"}}
+        mock_get_current_data.return_value = members
+        mock_get_latest_data.return_value = members
+
+        await self.microsoft_member_service.sync_microsoft_members_to_redis()
+
+        self.mock_pipeline.execute.assert_not_called()
+        self.mock_ldap_service.invalidate_cache.assert_not_called()
+
+    @patch(
+        "backend.historical_data.microsoft_member_sync_service.MicrosoftMemberSyncService.get_current_redis_members_by_group_and_status"
+    )
+    @patch(
+        "backend.historical_data.microsoft_member_sync_service.MicrosoftMemberSyncService.get_latest_members_by_group_and_status"
+    )
+    async def test_sync_microsoft_members_refreshes_user_ldap_cache(
+        self, mock_get_latest_data, mock_get_current_data
+    ):
+        members = {("active", "employees"): {"ldap1": "Employee One"}}
+        mock_get_current_data.return_value = members
+        mock_get_latest_data.return_value = members
+        self.microsoft_member_service.user_ldap_cache = AsyncMock()
+
+        await self.microsoft_member_service.sync_microsoft_members_to_redis()
+
+        self.microsoft_member_service.user_ldap_cache.refresh.assert_awaited_once()
+
+    @patch(
+        "backend.historical_data.microsoft_member_sync_service.MicrosoftMemberSyncService.get_current_redis_members_by_group_and_status"
+    )
+    @patch(
+        "backend.historical_data.microsoft_member_sync_service.MicrosoftMemberSyncService.get_latest_members_by_group_and_status"
+    )
+    async def test_sync_microsoft_members_user_ldap_cache_failure_is_logged(
+        self, mock_get_latest_data, mock_get_current_data
+    ):
+        members = {("active", "employees"): {"ldap1": "Employee One"}}
+        mock_get_current_data.return_value = members
+        mock_get_latest_data.return_value = members
+        self.microsoft_member_service.user_ldap_cache = AsyncMock()
+        self.microsoft_member_service.user_ldap_cache.refresh.side_effect = (
+            RuntimeError("Graph down")
+        )
+
+        await self.microsoft_member_service.sync_microsoft_members_to_redis()
+
+        self.mock_logger.warning.assert_called_once()
+
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,13 @@
 import unittest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import AsyncMock, MagicMock, patch, call
 from datetime import date, datetime, timezone
+
+from redis.exceptions import ResponseError
+
 from backend.internal_activity_service.gerrit_analytics_service import (
     GerritAnalyticsService,
 )
+from backend.utils.retry_utils import RetryUtils
 from backend.common.constants import (
     GERRIT_STATS_PROJECT_BUCKET_KEY,
     GERRIT_UNMERGED_CL_KEY_BY_PROJECT,
@@ -16,15 +20,16 @@ from backend.common.constants import (
     GERRIT_CL_REVIEWED_FIELD,
     GERRIT_LOC_MERGED_FIELD,
     GERRIT_STATS_BUCKET_KEY,
+    AnalyticsSource,
 )
 
 
-class TestGerritAnalyticsService(unittest.TestCase):
+class TestGerritAnalyticsService(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.logger = MagicMock()
         self.redis_client = MagicMock()
         self.retry_utils = MagicMock()
-        self.ldap_service = MagicMock()
+        self.ldap_service = AsyncMock()
         self.date_time_util = MagicMock()
         self.gerrit_client = MagicMock()
 
@@ -36,9 +41,10 @@ class TestGerritAnalyticsService(unittest.TestCase):
         )
         self.date_time_util.get_week_buckets.return_value = ["2025W42", "2025W43"]
 
-        self.retry_utils.get_retry_on_transient.side_effect = (
-            lambda func, *args, **kwargs: func(*args, **kwargs)
-        )
+        async def run(func, *args, **kwargs):
+            return await func(*args, **kwargs)
+
+        self.retry_utils.get_async_retry_on_transient = AsyncMock(side_effect=run)
 
         self.service = GerritAnalyticsService(
             logger=self.logger,
@@ -47,9 +53,11 @@ class TestGerritAnalyticsService(unittest.TestCase):
             ldap_service=self.ldap_service,
             date_time_util=self.date_time_util,
             gerrit_client=self.gerrit_client,
+            use_script_aggregation=False,
         )
 
         self.mock_pipeline = MagicMock()
+        self.mock_pipeline.execute = AsyncMock()
         self.redis_client.pipeline.return_value = self.mock_pipeline
         self.default_hgetall_data = {
             GERRIT_CL_MERGED_FIELD: "10",
@@ -59,7 +67,7 @@ class TestGerritAnalyticsService(unittest.TestCase):
         self.mock_pipeline.reset_mock()
 
     @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
-    def test_empty_project_list_defaults_to_global(self, mock_dt):
+    async def test_empty_project_list_defaults_to_global(self, mock_dt):
         """
         Test that when project_list is empty, None, or contains empty strings,
         the global statistics (project=None) are queried.
@@ -93,7 +101,7 @@ class TestGerritAnalyticsService(unittest.TestCase):
 
                 self.mock_pipeline.execute.return_value = expected_results
 
-                result_stats = self.service.get_gerrit_stats(
+                result_stats = await self.service.get_gerrit_stats(
                     ldap_list=ldap_list,
                     start_date_str="2025-10-21",
                     end_date_str="2025-10-28",
@@ -172,7 +180,7 @@ class TestGerritAnalyticsService(unittest.TestCase):
                 )
 
     @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
-    def test_full_stats_with_under_review_today_and_projects(self, mock_dt):
+    async def test_full_stats_with_under_review_today_and_projects(self, mock_dt):
         """
         Test full stats (abandoned, under-review) when end_date is today.
         In this case, all types of statistics (including under_review) should be queried and filtered by projects.
@@ -197,7 +205,7 @@ class TestGerritAnalyticsService(unittest.TestCase):
 
         self.mock_pipeline.execute.return_value = expected_results
 
-        result = self.service.get_gerrit_stats(
+        result = await self.service.get_gerrit_stats(
             ldap_list=ldap_list,
             start_date_str="2025-10-21",
             end_date_str="2025-10-28",
@@ -279,7 +287,7 @@ class TestGerritAnalyticsService(unittest.TestCase):
             )
 
     @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
-    def test_basic_global_stats_no_full_stats_not_today(self, mock_dt):
+    async def test_basic_global_stats_no_full_stats_not_today(self, mock_dt):
         """
         Test basic case: no project list, full stats not included, and end_date is not today.
         Only global weekly statistics should be queried, and include_under_review should be False.
@@ -296,7 +304,7 @@ class TestGerritAnalyticsService(unittest.TestCase):
         ]
         self.mock_pipeline.execute.return_value = expected_results
 
-        result = self.service.get_gerrit_stats(
+        result = await self.service.get_gerrit_stats(
             ldap_list=ldap_list,
             start_date_str="2025-10-21",
             end_date_str="2025-10-28",
@@ -330,20 +338,195 @@ class TestGerritAnalyticsService(unittest.TestCase):
         self.assertEqual(result["user1"][GERRIT_CL_UNDER_REVIEW_FIELD], 0)
 
     @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
-    def test_no_active_ldap_users_found(self, mock_dt):
+    async def test_result_cache_serves_normalized_query(self, mock_dt):
+        mock_now_instance = MagicMock()
+        mock_now_instance.date.return_value = date(2025, 10, 29)
+        mock_dt.now.return_value = mock_now_instance
+        self.service.result_cache = MagicMock()
+        self.service.result_cache.get_or_compute = AsyncMock(
+            return_value={"user1": {GERRIT_CL_MERGED_FIELD: 3}}
+        )
+
+        result = await self.service.get_gerrit_stats(
+            ldap_list=["user2", "user1"],
+            start_date_str="2025-10-21",
+            end_date_str="2025-10-28",
+            project_list=["proj-b", "proj-a"],
+            include_all_projects=False,
+        )
+
+        self.assertEqual(result, {"user1": {GERRIT_CL_MERGED_FIELD: 3}})
+        name, params, sources, range_end, _ = (
+            self.service.result_cache.get_or_compute.call_args.args
+        )
+        self.assertEqual(name, "gerrit_stats")
+        self.assertEqual(
+            params,
+            {
+                "ldaps": ["user1", "user2"],
+                "projects": ["proj-a", "proj-b"],
+                "start": self.mock_start_datetime.date(),
+                "end": self.mock_end_datetime.date(),
+                "include_full_stats": False,
+            },
+        )
+        self.assertEqual(sources, [AnalyticsSource.GERRIT])
+        self.assertEqual(range_end, self.mock_end_datetime)
+        self.mock_pipeline.execute.assert_not_called()
+
+    @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
+    async def test_no_active_ldap_users_found(self, mock_dt):
         """
         Test when ldap_service.get_all_active_interns_and_employees_ldaps returns empty,
         the method should return an empty dictionary and log a warning.
         """
         self.ldap_service.get_all_active_interns_and_employees_ldaps.return_value = []
 
-        result = self.service.get_gerrit_stats(
+        result = await self.service.get_gerrit_stats(
             start_date_str="2025-10-21", end_date_str="2025-10-28"
         )
 
         self.assertEqual(result, {})
         self.ldap_service.get_all_active_interns_and_employees_ldaps.assert_called_once()
 
+    def _script_service(self):
+        self.sum_script = AsyncMock()
+        self.redis_client.register_script = MagicMock(return_value=self.sum_script)
+        return GerritAnalyticsService(
+            logger=self.logger,
+            redis_client=self.redis_client,
+            retry_utils=self.retry_utils,
+            ldap_service=self.ldap_service,
+            date_time_util=self.date_time_util,
+            gerrit_client=self.gerrit_client,
+        )
+
+    @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
+    async def test_script_aggregation_sums_buckets_in_redis(self, mock_dt):
+        """With scripting available, each LDAP costs one EVALSHA over all its bucket keys."""
+        mock_dt.now.return_value.date.return_value = date(2025, 10, 28)
+        service = self._script_service()
+        project_list = ["projA", "projB"]
+        self.mock_pipeline.execute.return_value = [
+            [40, 20, 400],  # user1 EVALSHA
+            2,  # user1 projA abandoned
+            1,  # user1 projA under review
+            3,  # user1 projB abandoned
+            0,  # user1 projB under review
+        ]
+
+        result = await service.get_gerrit_stats(
+            ldap_list=["user1"],
+            start_date_str="2025-10-21",
+            end_date_str="2025-10-28",
+            project_list=project_list,
+            include_full_stats=True,
+            include_all_projects=False,
+        )
+
+        bucket_keys = [
+            GERRIT_STATS_PROJECT_BUCKET_KEY.format(
+                ldap="user1", project=project, bucket=bucket
+            )
+            for project in project_list
+            for bucket in ["2025W42", "2025W43"]
+        ]
+        self.sum_script.assert_awaited_once_with(
+            keys=bucket_keys,
+            args=(
+                GERRIT_CL_MERGED_FIELD,
+                GERRIT_CL_REVIEWED_FIELD,
+                GERRIT_LOC_MERGED_FIELD,
+            ),
+            client=self.mock_pipeline,
+        )
+        self.mock_pipeline.hgetall.assert_not_called()
+        self.assertEqual(
+            result["user1"],
+            {
+                GERRIT_CL_MERGED_FIELD: 40,
+                GERRIT_CL_ABANDONED_FIELD: 5,
+                GERRIT_CL_UNDER_REVIEW_FIELD: 1,
+                GERRIT_CL_REVIEWED_FIELD: 20,
+                GERRIT_LOC_MERGED_FIELD: 400,
+            },
+        )
+
+        # Registered once; the pipeline loads it into the server as needed.
+        self.redis_client.register_script.assert_called_once()
+
+    @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
+    async def test_scripting_rejected_falls_back_to_pipeline(self, mock_dt):
+        mock_dt.now.return_value.date.return_value = date(2025, 10, 29)
+        service = self._script_service()
+        self.mock_pipeline.execute.side_effect = [
+            ResponseError("unknown command 'SCRIPT'"),
+            [self.default_hgetall_data, self.default_hgetall_data],
+        ]
+
+        result = await service.get_gerrit_stats(
+            ldap_list=["user1"],
+            start_date_str="2025-10-21",
+            end_date_str="2025-10-28",
+        )
+
+        self.assertFalse(service.use_script_aggregation)
+        self.sum_script.assert_awaited_once()
+        self.assertEqual(self.mock_pipeline.hgetall.call_count, 2)
+        self.assertEqual(result["user1"][GERRIT_CL_MERGED_FIELD], 20)
+        self.logger.warning.assert_called_once()
+
+    @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
+    async def test_other_script_errors_propagate_and_keep_the_script(self, mock_dt):
+        mock_dt.now.return_value.date.return_value = date(2025, 10, 29)
+        service = self._script_service()
+        self.mock_pipeline.execute.side_effect = ResponseError(
+            "WRONGTYPE Operation against a key holding the wrong kind of value"
+        )
+
+        with self.assertRaises(ResponseError):
+            await service.get_gerrit_stats(
+                ldap_list=["user1"],
+                start_date_str="2025-10-21",
+                end_date_str="2025-10-28",
+            )
+
+        self.assertTrue(service.use_script_aggregation)
+        self.mock_pipeline.hgetall.assert_not_called()
+        self.logger.warning.assert_not_called()
+
+    @patch("backend.internal_activity_service.gerrit_analytics_service.datetime")
+    async def test_transient_failure_retries_on_a_fresh_pipeline(self, mock_dt):
+        """A retried read re-queues every command on a new pipeline, since
+        redis-py resets a pipeline after execute."""
+        mock_dt.now.return_value.date.return_value = date(2025, 10, 29)
+        failing = MagicMock()
+        failing.execute = AsyncMock(side_effect=ConnectionError("connection reset"))
+        succeeding = MagicMock()
+        succeeding.execute = AsyncMock(
+            return_value=[self.default_hgetall_data, self.default_hgetall_data]
+        )
+        self.redis_client.pipeline.side_effect = [failing, succeeding]
+        service = GerritAnalyticsService(
+            logger=self.logger,
+            redis_client=self.redis_client,
+            retry_utils=RetryUtils(),
+            ldap_service=self.ldap_service,
+            date_time_util=self.date_time_util,
+            gerrit_client=self.gerrit_client,
+            use_script_aggregation=False,
+        )
+
+        result = await service.get_gerrit_stats(
+            ldap_list=["user1"],
+            start_date_str="2025-10-21",
+            end_date_str="2025-10-28",
+        )
+
+        self.assertEqual(failing.hgetall.call_count, 2)
+        self.assertEqual(succeeding.hgetall.call_count, 2)
+        self.assertEqual(result["user1"][GERRIT_LOC_MERGED_FIELD], 200)
+
 
 if __name__ == "__main__":
     unittest.main()
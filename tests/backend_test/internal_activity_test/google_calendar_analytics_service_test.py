@@ -1,39 +1,30 @@
-from unittest import TestCase, main
-from unittest.mock import Mock
+from unittest import IsolatedAsyncioTestCase, main
+from unittest.mock import AsyncMock, Mock, call
 import json
-from datetime import datetime
+from datetime import date, datetime, timezone
 from backend.internal_activity_service.google_calendar_analytics_service import (
     GoogleCalendarAnalyticsService,
 )
 
 
-class TestGoogleCalendarAnalyticsService(TestCase):
+class TestGoogleCalendarAnalyticsService(IsolatedAsyncioTestCase):
     def setUp(self):
         self.mock_logger = Mock()
         self.mock_redis = Mock()
         self.mock_retry_utils = Mock()
-        self.mock_ldap_service = Mock()
+        self.mock_retry_utils.get_async_retry_on_transient = AsyncMock()
+        self.mock_ldap_service = AsyncMock()
+        self.mock_date_time_util = Mock()
         self.service = GoogleCalendarAnalyticsService(
             logger=self.mock_logger,
             redis_client=self.mock_redis,
             retry_utils=self.mock_retry_utils,
             ldap_service=self.mock_ldap_service,
+            date_time_util=self.mock_date_time_util,
         )
 
-    def test_get_calendar_name_success(self):
-        calendar_id = "personal"
-        expected_name = "Personal Calendar"
-        self.mock_retry_utils.get_retry_on_transient.return_value = expected_name
-
-        name = self.service._get_calendar_name(calendar_id)
-
-        self.assertEqual(name, expected_name)
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
-            self.mock_redis.hget, "calendarlist", calendar_id
-        )
-
-    def test_get_all_calendars_success(self):
-        self.mock_retry_utils.get_retry_on_transient.return_value = {
+    async def test_get_all_calendars_success(self):
+        self.mock_retry_utils.get_async_retry_on_transient.return_value = {
             "calendar_id_1": "Work",
             "calendar_id_2": "Personal",
         }
@@ -43,20 +34,20 @@ class TestGoogleCalendarAnalyticsService(TestCase):
             {"id": "calendar_id_2", "name": "Personal"},
         ]
 
-        result = self.service.get_all_calendars()
+        result = await self.service.get_all_calendars()
         self.assertEqual(result, expected_result)
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_once_with(
             self.mock_redis.hgetall,
             "calendarlist",  # GOOGLE_CALENDAR_LIST_INDEX_KEY
         )
 
-    def test_get_all_calendars_empty(self):
-        self.mock_retry_utils.get_retry_on_transient.return_value = {}
+    async def test_get_all_calendars_empty(self):
+        self.mock_retry_utils.get_async_retry_on_transient.return_value = {}
 
-        result = self.service.get_all_calendars()
+        result = await self.service.get_all_calendars()
         self.assertEqual(result, [])
 
-    def test_get_all_events_success(self):
+    async def test_get_all_events_success(self):
         calendar_id = "personal"
         ldaps = ["user1"]
         start_date = datetime.fromisoformat("2025-07-01")
@@ -65,8 +56,8 @@ class TestGoogleCalendarAnalyticsService(TestCase):
         mock_pipeline = Mock()
         self.mock_redis.pipeline.return_value = mock_pipeline
 
-        self.mock_retry_utils.get_retry_on_transient.side_effect = [
-            [["event123"]],
+        self.mock_retry_utils.get_async_retry_on_transient.side_effect = [
+            [["event123"], ["Personal Calendar"]],
             [
                 [
                     json.dumps({
@@ -86,7 +77,6 @@ class TestGoogleCalendarAnalyticsService(TestCase):
                     "is_recurring": True,
                 })
             ],
-            "Personal Calendar",
         ]
 
         expected_result = {
@@ -110,23 +100,25 @@ class TestGoogleCalendarAnalyticsService(TestCase):
             ]
         }
 
-        result = self.service.get_all_events(calendar_id, ldaps, start_date, end_date)
+        result = await self.service.get_all_events(
+            calendar_id, ldaps, start_date, end_date
+        )
         self.assertEqual(result, expected_result)
 
         self.assertTrue(self.mock_redis.pipeline.called)
-        self.assertTrue(self.mock_retry_utils.get_retry_on_transient.called)
+        self.assertTrue(self.mock_retry_utils.get_async_retry_on_transient.called)
 
-    def test_get_all_events_from_calendars_success(self):
+    async def test_get_all_events_from_calendars_success(self):
         calendar_ids = ["cal1", "cal2"]
         ldaps = ["user1", "user2"]
         start_date = datetime.fromisoformat("2025-07-01")
         end_date = datetime.fromisoformat("2025-08-02")
 
-        self.service.get_all_events = Mock(
-            side_effect=[
-                {"user1": [{"event_id": "e1"}], "user2": []},  # cal1
-                {"user1": [], "user2": [{"event_id": "e2"}]},  # cal2
-            ]
+        self.service._get_events_by_calendar = AsyncMock(
+            return_value={
+                "cal1": {"user1": [{"event_id": "e1"}], "user2": []},
+                "cal2": {"user1": [], "user2": [{"event_id": "e2"}]},
+            }
         )
 
         expected_result = {
@@ -134,21 +126,120 @@ class TestGoogleCalendarAnalyticsService(TestCase):
             "user2": [{"event_id": "e2"}],
         }
 
-        result = self.service.get_all_events_from_calendars(
+        result = await self.service.get_all_events_from_calendars(
             calendar_ids, ldaps, start_date, end_date
         )
         self.assertEqual(result, expected_result)
 
-        self.service.get_all_events.assert_any_call("cal1", ldaps, start_date, end_date)
-        self.service.get_all_events.assert_any_call("cal2", ldaps, start_date, end_date)
+        self.service._get_events_by_calendar.assert_awaited_once_with(
+            calendar_ids, ldaps, start_date, end_date
+        )
+
+    async def test_get_all_events_from_calendars_batches_stages(self):
+        """All calendars share one pipeline per stage and event details are deduped."""
+        calendar_ids = ["cal1", "cal2"]
+        ldaps = ["user1"]
+        start_date = datetime.fromisoformat("2025-07-01")
+        end_date = datetime.fromisoformat("2025-08-02")
+
+        mock_pipeline = Mock()
+        self.mock_redis.pipeline.return_value = mock_pipeline
+        attendance = json.dumps({
+            "join_time": "2025-08-01T10:00:00",
+            "leave_time": "2025-08-01T10:30:00",
+        })
+        self.mock_retry_utils.get_async_retry_on_transient.side_effect = [
+            [["base_20250801"], ["base_20250802"], ["Team", "Personal"]],
+            [[attendance], [attendance]],
+            [json.dumps({"summary": "Standup", "is_recurring": True})],
+        ]
+
+        result = await self.service.get_all_events_from_calendars(
+            calendar_ids, ldaps, start_date, end_date
+        )
+
+        self.assertEqual(
+            [(event["event_id"], event["calendar_name"]) for event in result["user1"]],
+            [("base_20250801", "Team"), ("base_20250802", "Personal")],
+        )
+        self.assertEqual(
+            self.mock_retry_utils.get_async_retry_on_transient.await_count, 3
+        )
+        mock_pipeline.hmget.assert_called_once_with("calendarlist", calendar_ids)
+        mock_pipeline.get.assert_called_once_with("event:base")
+
+    async def test_get_all_events_from_calendars_no_events(self):
+        """Stages with nothing to look up are not sent to Redis."""
+        mock_pipeline = Mock()
+        self.mock_redis.pipeline.return_value = mock_pipeline
+        self.mock_retry_utils.get_async_retry_on_transient.return_value = [
+            [],
+            ["Team"],
+        ]
+
+        result = await self.service.get_all_events_from_calendars(
+            ["cal1"],
+            ["user1"],
+            datetime.fromisoformat("2025-07-01"),
+            datetime.fromisoformat("2025-08-02"),
+        )
+
+        self.assertEqual(result, {"user1": []})
+        self.mock_retry_utils.get_async_retry_on_transient.assert_awaited_once()
+
+    async def test_get_meeting_hours_for_user_from_rollups(self):
+        ldap_list = ["alice", "bob"]
+        calendar_ids = ["cal1", "personal"]
+        start_date = datetime(2025, 9, 1, tzinfo=timezone.utc)
+        end_date = datetime(2025, 9, 2, 23, 59, 59, tzinfo=timezone.utc)
+
+        self.mock_date_time_util.get_day_buckets.return_value = [
+            "2025-09-01",
+            "2025-09-02",
+        ]
+        mock_pipeline = Mock()
+        self.mock_redis.pipeline.return_value = mock_pipeline
+        self.mock_retry_utils.get_async_retry_on_transient.return_value = [
+            1,
+            {"cal1:alice": "3600", "other_cal:alice": "7200", "cal1:carol": "60"},
+            {"personal:alice": "1800", "personal:bob": "900"},
+        ]
+        self.service.get_all_events_from_calendars = AsyncMock()
+
+        meeting_hours = await self.service.get_meeting_hours_for_user(
+            calendar_ids=calendar_ids,
+            ldap_list=ldap_list,
+            start_date=start_date,
+            end_date=end_date,
+        )
 
-    def test_get_meeting_hours_for_user(self):
+        self.assertEqual(meeting_hours, {"alice": 1.5, "bob": 0.25})
+        self.mock_date_time_util.get_day_buckets.assert_called_once_with(
+            date(2025, 9, 1), date(2025, 9, 2)
+        )
+        mock_pipeline.exists.assert_called_once_with("calendar:meeting_seconds_ready")
+        mock_pipeline.hgetall.assert_has_calls([
+            call("calendar:meeting_seconds:2025-09-01"),
+            call("calendar:meeting_seconds:2025-09-02"),
+        ])
+        self.assertEqual(mock_pipeline.hgetall.call_count, 2)
+        self.service.get_all_events_from_calendars.assert_not_called()
+
+    async def test_get_meeting_hours_for_user_falls_back_without_rollups(self):
         ldap_list = ["alice"]
         calendar_ids = ["cal1", "cal2"]
         start_date = datetime(2025, 9, 1)
         end_date = datetime(2025, 9, 30)
 
-        self.service.get_all_events_from_calendars = Mock(
+        self.mock_date_time_util.get_day_buckets.return_value = [
+            f"2025-09-{day:02d}" for day in range(1, 31)
+        ]
+        self.mock_redis.pipeline.return_value = Mock()
+        self.mock_retry_utils.get_async_retry_on_transient.return_value = [0] + [
+            {} for _ in range(30)
+        ]
+
+        self.service.get_all_events_from_calendars = AsyncMock(
             return_value={
                 "alice": [
                     {
@@ -177,7 +268,7 @@ class TestGoogleCalendarAnalyticsService(TestCase):
             }
         )
 
-        meeting_hours = self.service.get_meeting_hours_for_user(
+        meeting_hours = await self.service.get_meeting_hours_for_user(
             calendar_ids=calendar_ids,
             ldap_list=ldap_list,
             start_date=start_date,
@@ -196,7 +287,7 @@ class TestGoogleCalendarAnalyticsService(TestCase):
             end_date=end_date,
         )
 
-    def test_get_all_events_with_ldaps_none(self):
+    async def test_get_all_events_with_ldaps_none(self):
         """Test get_all_events when ldaps=None, use ldap_service to fill"""
         calendar_id = "personal"
         ldaps = None
@@ -210,8 +301,8 @@ class TestGoogleCalendarAnalyticsService(TestCase):
 
         mock_pipeline = Mock()
         self.mock_redis.pipeline.return_value = mock_pipeline
-        self.mock_retry_utils.get_retry_on_transient.side_effect = [
-            [["event123"]],  # get event ids
+        self.mock_retry_utils.get_async_retry_on_transient.side_effect = [
+            [["event123"], ["Personal Calendar"]],  # event ids, calendar names
             [
                 [
                     json.dumps({
@@ -231,7 +322,6 @@ class TestGoogleCalendarAnalyticsService(TestCase):
                     "is_recurring": True,
                 })
             ],  # get event details
-            "Personal Calendar",  # get calendar name
         ]
 
         expected_result = {
@@ -255,13 +345,15 @@ class TestGoogleCalendarAnalyticsService(TestCase):
             ]
         }
 
-        result = self.service.get_all_events(calendar_id, ldaps, start_date, end_date)
+        result = await self.service.get_all_events(
+            calendar_id, ldaps, start_date, end_date
+        )
         self.assertEqual(result, expected_result)
         self.assertTrue(self.mock_redis.pipeline.called)
-        self.assertTrue(self.mock_retry_utils.get_retry_on_transient.called)
+        self.assertTrue(self.mock_retry_utils.get_async_retry_on_transient.called)
         self.mock_ldap_service.get_all_active_interns_and_employees_ldaps.assert_called_once()
 
-    def test_get_all_events_with_ldaps_empty(self):
+    async def test_get_all_events_with_ldaps_empty(self):
         """Test get_all_events when ldaps=[], use ldap_service to fill"""
         calendar_id = "personal"
         ldaps = []
@@ -275,8 +367,8 @@ class TestGoogleCalendarAnalyticsService(TestCase):
 
         mock_pipeline = Mock()
         self.mock_redis.pipeline.return_value = mock_pipeline
-        self.mock_retry_utils.get_retry_on_transient.side_effect = [
-            [["event456"]],  # get event ids
+        self.mock_retry_utils.get_async_retry_on_transient.side_effect = [
+            [["event456"], ["Personal Calendar"]],  # event ids, calendar names
             [
                 [
                     json.dumps({
@@ -292,7 +384,6 @@ class TestGoogleCalendarAnalyticsService(TestCase):
                     "is_recurring": False,
                 })
             ],  # get event details
-            "Personal Calendar",  # get calendar name
         ]
 
         expected_result = {
@@ -312,13 +403,15 @@ class TestGoogleCalendarAnalyticsService(TestCase):
             ]
         }
 
-        result = self.service.get_all_events(calendar_id, ldaps, start_date, end_date)
+        result = await self.service.get_all_events(
+            calendar_id, ldaps, start_date, end_date
+        )
         self.assertEqual(result, expected_result)
         self.assertTrue(self.mock_redis.pipeline.called)
-        self.assertTrue(self.mock_retry_utils.get_retry_on_transient.called)
+        self.assertTrue(self.mock_retry_utils.get_async_retry_on_transient.called)
         self.mock_ldap_service.get_all_active_interns_and_employees_ldaps.assert_called_once()
 
-    def test_get_all_events_from_calendars_with_ldaps_none(self):
+    async def test_get_all_events_from_calendars_with_ldaps_none(self):
         """Test get_all_events_from_calendars when ldaps=None"""
         calendar_ids = ["cal1"]
         ldaps = None
@@ -330,14 +423,16 @@ class TestGoogleCalendarAnalyticsService(TestCase):
             "user2",
         ]
 
-        self.service.get_all_events = Mock(
+        self.service._get_events_by_calendar = AsyncMock(
             return_value={
-                "user1": [{"event_id": "e1"}],
-                "user2": [{"event_id": "e2"}],
+                "cal1": {
+                    "user1": [{"event_id": "e1"}],
+                    "user2": [{"event_id": "e2"}],
+                }
             }
         )
 
-        result = self.service.get_all_events_from_calendars(
+        result = await self.service.get_all_events_from_calendars(
             calendar_ids=calendar_ids,
             ldaps=ldaps,
             start_date=start_date,
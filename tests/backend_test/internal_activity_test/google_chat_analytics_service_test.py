@@ -1,21 +1,26 @@
 import unittest
-from unittest.mock import MagicMock, call
+from unittest.mock import AsyncMock, MagicMock, call
 import datetime
-from backend.common.constants import CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY
+from backend.common.constants import (
+    CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY,
+    GOOGLE_CHAT_DAILY_COUNT_KEY,
+    GOOGLE_CHAT_DAILY_COUNT_READY_KEY,
+)
 from backend.internal_activity_service.google_chat_analytics_service import (
     GoogleChatAnalyticsService,
 )
 
 
-class TestGoogleChatAnalyticsService(unittest.TestCase):
+class TestGoogleChatAnalyticsService(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         """Set up mock objects for each test."""
         self.mock_logger = MagicMock()
         self.mock_redis_client = MagicMock()
         self.mock_retry_utils = MagicMock()
+        self.mock_retry_utils.get_async_retry_on_transient = AsyncMock()
         self.mock_date_time_util = MagicMock()
         self.mock_google_service = MagicMock()
-        self.mock_ldap_service = MagicMock()
+        self.mock_ldap_service = AsyncMock()
 
         self.service = GoogleChatAnalyticsService(
             logger=self.mock_logger,
@@ -38,8 +43,19 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
         self.mock_pipeline = MagicMock()
         self.mock_redis_client.pipeline.return_value = self.mock_pipeline
         self.mock_pipeline.zcount.return_value = None
+        self.mock_date_time_util.get_day_buckets.return_value = [
+            "2023-01-01",
+            "2023-01-02",
+        ]
+
+    def _set_index_counts(self, counts):
+        """Rollups not backfilled yet, so counts come from the ZCOUNT fallback."""
+        self.mock_retry_utils.get_async_retry_on_transient.side_effect = [
+            [0, {}, {}],
+            counts,
+        ]
 
-    def test_count_messages_defaults_to_all_spaces_by_interns_and_employees(self):
+    async def test_count_messages_defaults_to_all_spaces_by_interns_and_employees(self):
         """Test with no space_ids or sender_ldaps provided."""
         mock_spaces = {"spaceA": "Space A Name", "spaceB": "Space B Name"}
         mock_intern_ldaps = ["intern1", "intern2"]
@@ -49,7 +65,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
         self.mock_ldap_service.get_all_active_interns_and_employees_ldaps.return_value = (
             mock_intern_ldaps + mock_employee_ldaps
         )
-        self.mock_retry_utils.get_retry_on_transient.return_value = [
+        self._set_index_counts([
             10,
             5,
             7,
@@ -58,7 +74,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             20,
             9,
             27,
-        ]
+        ])
         expected_result = {
             "start_date": self.start_dt.isoformat(),
             "end_date": self.end_dt.isoformat(),
@@ -70,7 +86,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             },
         }
 
-        result = self.service.count_messages(
+        result = await self.service.count_messages(
             start_date="2023-01-01", end_date="2023-01-31"
         )
 
@@ -140,15 +156,20 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
         self.mock_pipeline.zcount.assert_has_calls(
             expected_zcount_calls, any_order=True
         )
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_with(
             self.mock_pipeline.execute
         )
 
-    def test_count_messages_with_specific_inputs(self):
+    async def test_count_messages_with_specific_inputs(self):
         """Test with specific space_ids and sender_ldaps provided."""
         space_ids = ["space1", "space2"]
         sender_ldaps = ["userA", "userB"]
-        self.mock_retry_utils.get_retry_on_transient.return_value = [5, 10, 15, 20]
+        self._set_index_counts([
+            5,
+            10,
+            15,
+            20,
+        ])
 
         expected_result = {
             "start_date": self.start_dt.isoformat(),
@@ -159,7 +180,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             },
         }
 
-        result = self.service.count_messages(
+        result = await self.service.count_messages(
             space_ids=space_ids,
             sender_ldaps=sender_ldaps,
             start_date="2023-01-01",
@@ -203,11 +224,11 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
         self.mock_pipeline.zcount.assert_has_calls(
             expected_zcount_calls, any_order=True
         )
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_with(
             self.mock_pipeline.execute
         )
 
-    def test_count_messages_with_empty_and_whitespace_inputs(self):
+    async def test_count_messages_with_empty_and_whitespace_inputs(self):
         """Test that empty strings and strings with only whitespace are ignored."""
         space_ids_input = ["space1", " ", "space2", ""]
         sender_ldaps_input = ["userA", "", "  ", "userB"]
@@ -215,7 +236,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
         space_ids_filtered = ["space1", "space2"]
         sender_ldaps_filtered = ["userA", "userB"]
 
-        self.mock_retry_utils.get_retry_on_transient.return_value = [1, 2, 3, 4]
+        self._set_index_counts([1, 2, 3, 4])
 
         expected_result = {
             "start_date": self.start_dt.isoformat(),
@@ -226,7 +247,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             },
         }
 
-        result = self.service.count_messages(
+        result = await self.service.count_messages(
             space_ids=space_ids_input,
             sender_ldaps=sender_ldaps_input,
             start_date="2023-01-01",
@@ -275,11 +296,11 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             len(space_ids_filtered) * len(sender_ldaps_filtered),
         )
 
-    def test_count_messages_redis_returns_zero_counts(self):
+    async def test_count_messages_redis_returns_zero_counts(self):
         """Test when Redis pipeline returns zero for some or all counts."""
         space_ids = ["spaceX"]
         sender_ldaps = ["userC", "userD"]
-        self.mock_retry_utils.get_retry_on_transient.return_value = [0, 5]
+        self._set_index_counts([0, 5])
 
         expected_result = {
             "start_date": self.start_dt.isoformat(),
@@ -290,7 +311,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             },
         }
 
-        result = self.service.count_messages(
+        result = await self.service.count_messages(
             space_ids=space_ids,
             sender_ldaps=sender_ldaps,
             start_date="2023-01-01",
@@ -299,9 +320,10 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
 
         self.assertEqual(result, expected_result)
 
-    def test_count_messages_date_time_util_called_correctly(self):
+    async def test_count_messages_date_time_util_called_correctly(self):
         """Test that date_time_util is called with the correct arguments."""
-        self.service.count_messages(
+        self._set_index_counts([0])
+        await self.service.count_messages(
             space_ids=["s1"],
             sender_ldaps=["u1"],
             start_date="2024-03-01",
@@ -311,13 +333,13 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             "2024-03-01", "2024-03-05"
         )
 
-    def test_count_messages_empty_input_lists_cause_defaults_to_be_fetched(self):
+    async def test_count_messages_empty_input_lists_cause_defaults_to_be_fetched(self):
         """Test that empty list inputs for space_ids and sender_ldaps trigger default fetching."""
         self.mock_google_service.get_chat_spaces.return_value = {"s1": "S1"}
         self.mock_ldap_service.get_all_active_interns_and_employees_ldaps.return_value = [
             "u1"
         ]
-        self.mock_retry_utils.get_retry_on_transient.return_value = [10]
+        self._set_index_counts([10])
 
         expected_result = {
             "start_date": self.start_dt.isoformat(),
@@ -325,7 +347,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             "result": {"u1": {"s1": 10}},
         }
 
-        result = self.service.count_messages(
+        result = await self.service.count_messages(
             space_ids=[],  # Empty list
             sender_ldaps=[],  # Empty list
             start_date="2023-01-01",
@@ -336,11 +358,11 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
         self.mock_google_service.get_chat_spaces.assert_called_once()
         self.mock_ldap_service.get_all_active_interns_and_employees_ldaps.assert_called_once()
 
-    def test_count_messages_no_messages_found_for_any(self):
+    async def test_count_messages_no_messages_found_for_any(self):
         """Test case where no messages are found for any sender/space pair."""
         space_ids = ["s1", "s2"]
         sender_ldaps = ["u1", "u2"]
-        self.mock_retry_utils.get_retry_on_transient.return_value = [0, 0, 0, 0]
+        self._set_index_counts([0, 0, 0, 0])
 
         expected_result = {
             "start_date": self.start_dt.isoformat(),
@@ -351,7 +373,7 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
             },
         }
 
-        result = self.service.count_messages(
+        result = await self.service.count_messages(
             space_ids=space_ids,
             sender_ldaps=sender_ldaps,
             start_date="2023-01-01",
@@ -361,20 +383,57 @@ class TestGoogleChatAnalyticsService(unittest.TestCase):
         self.assertEqual(result, expected_result)
         self.assertEqual(self.mock_pipeline.zcount.call_count, 4)
 
-    def test_count_messages_retry_on_transient_called(self):
-        """Ensure get_retry_on_transient is used for pipeline execution."""
+    async def test_count_messages_retry_on_transient_called(self):
+        """Ensure get_async_retry_on_transient is used for pipeline execution."""
         space_ids = ["s1"]
         sender_ldaps = ["u1"]
-        self.mock_retry_utils.get_retry_on_transient.return_value = [1]
+        self._set_index_counts([1])
 
-        self.service.count_messages(
+        await self.service.count_messages(
             space_ids=space_ids,
             sender_ldaps=sender_ldaps,
             start_date="2023-01-01",
             end_date="2023-01-31",
         )
 
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_with(
+            self.mock_pipeline.execute
+        )
+
+    async def test_count_messages_sums_daily_rollups_when_ready(self):
+        """Backfilled rollups are summed per day instead of issuing ZCOUNTs."""
+        self.mock_retry_utils.get_async_retry_on_transient.return_value = [
+            1,
+            {"userA:space1": "2", "userB:space2": "1", "outsider:space1": "9"},
+            {"userA:space1": "3", "userA:other": "4"},
+        ]
+
+        result = await self.service.count_messages(
+            space_ids=["space1", "space2"],
+            sender_ldaps=["userA", "userB"],
+            start_date="2023-01-01",
+            end_date="2023-01-02",
+        )
+
+        self.assertEqual(
+            result["result"],
+            {
+                "userA": {"space1": 5, "space2": 0},
+                "userB": {"space1": 0, "space2": 1},
+            },
+        )
+        self.mock_date_time_util.get_day_buckets.assert_called_once_with(
+            self.start_dt.date(), self.end_dt.date()
+        )
+        self.mock_pipeline.exists.assert_called_once_with(
+            GOOGLE_CHAT_DAILY_COUNT_READY_KEY
+        )
+        self.mock_pipeline.hgetall.assert_has_calls([
+            call(GOOGLE_CHAT_DAILY_COUNT_KEY.format(day="2023-01-01")),
+            call(GOOGLE_CHAT_DAILY_COUNT_KEY.format(day="2023-01-02")),
+        ])
+        self.mock_pipeline.zcount.assert_not_called()
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_once_with(
             self.mock_pipeline.execute
         )
 
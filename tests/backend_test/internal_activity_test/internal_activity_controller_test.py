@@ -44,6 +44,32 @@ class TestInternalActivityControllerIntegration(unittest.TestCase):
         self.summary_service = MagicMock()
         self.launchdarkly_service = MagicMock()
 
+        # The analytics services are async; default every awaited call to an
+        # empty payload so routes whose test does not stub a result still serialize.
+        self.ldap_service.get_ldaps_by_status_and_group = AsyncMock(return_value={})
+        self.microsoft_chat_analytics_service.count_microsoft_chat_messages_in_date_range = AsyncMock(
+            return_value={}
+        )
+        self.jira_analytics_service.get_all_jira_projects = AsyncMock(return_value={})
+        self.jira_analytics_service.get_issues_summary = AsyncMock(return_value={})
+        self.jira_analytics_service.process_get_issue_detail_batch = AsyncMock(
+            return_value={}
+        )
+        self.google_calendar_analytics_service.get_all_calendars = AsyncMock(
+            return_value={}
+        )
+        self.google_calendar_analytics_service.get_all_events_from_calendars = (
+            AsyncMock(return_value={})
+        )
+        self.google_chat_analytics_service.get_chat_spaces_by_type = AsyncMock(
+            return_value={}
+        )
+        self.google_chat_analytics_service.count_messages = AsyncMock(return_value={})
+        self.gerrit_analytics_service.get_gerrit_stats = AsyncMock(return_value={})
+        self.gerrit_analytics_service.get_gerrit_projects = AsyncMock(return_value={})
+        self.summary_service.get_summary = AsyncMock(return_value=([], []))
+        self.summary_service.get_my_summary = AsyncMock(return_value=({}, []))
+
         self.controller = InternalActivityController(
             ldap_service=self.ldap_service,
             microsoft_chat_analytics_service=self.microsoft_chat_analytics_service,
@@ -300,19 +326,43 @@ class TestInternalActivityControllerIntegration(unittest.TestCase):
         )
 
         self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["message"], "Summary fetched successfully")
         self.summary_service.get_summary.assert_called_once()
 
+    def test_get_summary_partial_result(self):
+        """Test SUMMARY_ENDPOINT names unavailable sources in the message."""
+        self._set_auth([Permission.DASHBOARD_ACTIVITY_SUMMARY_READ])
+        rows = [{"ldap": "alice", "chat_count": 3}]
+        self.summary_service.get_summary.return_value = (rows, ["gerrit", "jira"])
+
+        response = self.client.post(
+            SUMMARY_ENDPOINT,
+            json={"groups": ["employees"]},
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        body = response.json()
+        self.assertEqual(body["data"], rows)
+        self.assertEqual(
+            body["message"],
+            "Summary fetched with partial results; unavailable sources: gerrit, jira",
+        )
+
     def test_get_my_summary_success(self):
         """Test MY_SUMMARY_ENDPOINT (POST) returns 200 when LD flag is enabled."""
         self._set_auth([Permission.DASHBOARD_ACTIVITY_SUMMARY_READ])
         self.launchdarkly_service.is_view_personal_summary_enabled.return_value = True
-        self.summary_service.get_my_summary.return_value = ActivitySummaryDto(
-            ldap="test",
-            chat_count=0,
-            meeting_hours=0,
-            cl_merged=0,
-            loc_merged=0,
-            jira_issue_done=0,
+        self.summary_service.get_my_summary.return_value = (
+            ActivitySummaryDto(
+                ldap="test",
+                chat_count=0,
+                meeting_hours=0,
+                cl_merged=0,
+                loc_merged=0,
+                jira_issue_done=0,
+            ),
+            [],
         )
 
         payload = {"startDate": "2025-01-01", "endDate": "2026-01-31"}
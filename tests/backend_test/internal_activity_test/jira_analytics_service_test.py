@@ -1,9 +1,10 @@
-from unittest import TestCase, main
-from unittest.mock import Mock, MagicMock, patch, ANY
+from unittest import IsolatedAsyncioTestCase, main
+from unittest.mock import AsyncMock, Mock, MagicMock, patch, ANY
 from backend.common.constants import (
     JIRA_PROJECTS_KEY,
     JiraIssueStatus,
     JIRA_ISSUE_DETAILS_KEY,
+    AnalyticsSource,
 )
 from backend.internal_activity_service.jira_analytics_service import (
     JiraAnalyticsService,
@@ -11,17 +12,17 @@ from backend.internal_activity_service.jira_analytics_service import (
 from datetime import datetime, timezone
 
 
-class TestJiraAnalyticsService(TestCase):
+class TestJiraAnalyticsService(IsolatedAsyncioTestCase):
     def setUp(self):
         self.mock_logger = Mock()
         self.mock_redis = Mock()
         self.mock_date_time_util = Mock()
-        self.mock_ldap_service = Mock()
+        self.mock_ldap_service = AsyncMock()
         self.mock_retry_utils = Mock()
 
         # Make retry util execute the function directly
-        self.mock_retry_utils.get_retry_on_transient.side_effect = (
-            lambda func, *args, **kwargs: func(*args, **kwargs)
+        self.mock_retry_utils.get_async_retry_on_transient = AsyncMock(
+            side_effect=lambda func, *args, **kwargs: func(*args, **kwargs)
         )
 
         self.jira_service = JiraAnalyticsService(
@@ -44,39 +45,41 @@ class TestJiraAnalyticsService(TestCase):
             1675209599,
         ]
 
-    def test_get_all_jira_projects_success(self):
+    async def test_get_all_jira_projects_success(self):
         mock_project_data = {"10503": "Intern Practice", "24998": "Purrf"}
         self.mock_redis.hgetall.return_value = mock_project_data
 
-        result = self.jira_service.get_all_jira_projects()
+        result = await self.jira_service.get_all_jira_projects()
 
         self.assertEqual(result, mock_project_data)
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_once_with(
             self.mock_redis.hgetall, JIRA_PROJECTS_KEY
         )
 
-    def test_get_all_jira_projects_empty(self):
+    async def test_get_all_jira_projects_empty(self):
         mock_project_data = {}
         self.mock_redis.hgetall.return_value = mock_project_data
 
-        result = self.jira_service.get_all_jira_projects()
+        result = await self.jira_service.get_all_jira_projects()
 
         self.assertEqual(result, mock_project_data)
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_once_with(
             self.mock_redis.hgetall, JIRA_PROJECTS_KEY
         )
 
-    def test_get_all_jira_projects_connection_error(self):
-        self.mock_retry_utils.get_retry_on_transient.side_effect = ConnectionError(
-            "Redis unavailable"
+    async def test_get_all_jira_projects_connection_error(self):
+        self.mock_retry_utils.get_async_retry_on_transient.side_effect = (
+            ConnectionError("Redis unavailable")
         )
 
         with self.assertRaises(ConnectionError):
-            self.jira_service.get_all_jira_projects()
+            await self.jira_service.get_all_jira_projects()
 
-        self.assertEqual(self.mock_retry_utils.get_retry_on_transient.call_count, 1)
+        self.assertEqual(
+            self.mock_retry_utils.get_async_retry_on_transient.call_count, 1
+        )
 
-    def test_get_issues_summary_without_done_status(self):
+    async def test_get_issues_summary_without_done_status(self):
         """Test summary generation for statuses other than DONE."""
         mock_pipeline = MagicMock()
         self.mock_redis.pipeline.return_value = mock_pipeline
@@ -85,7 +88,7 @@ class TestJiraAnalyticsService(TestCase):
             {"issue-103"},  # user1, todo, proj1
         ]
 
-        result = self.jira_service.get_issues_summary(
+        result = await self.jira_service.get_issues_summary(
             status_list=[JiraIssueStatus.IN_PROGRESS, JiraIssueStatus.TODO],
             ldaps=["user1"],
             project_ids=["proj1"],
@@ -95,7 +98,7 @@ class TestJiraAnalyticsService(TestCase):
 
         self.assertEqual(mock_pipeline.smembers.call_count, 2)
         mock_pipeline.zrange.assert_not_called()
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_once_with(
             mock_pipeline.execute
         )
 
@@ -108,7 +111,7 @@ class TestJiraAnalyticsService(TestCase):
         self.assertCountEqual(result["user1"]["todo"], ["issue-103"])
         self.assertEqual(result["user1"]["done_story_points_total"], 0.0)
 
-    def test_get_issues_summary_with_done_status_and_story_points(self):
+    async def test_get_issues_summary_with_done_status_and_story_points(self):
         """Test summary generation including DONE status and story point calculation."""
         first_pipeline = MagicMock()
         story_point_pipeline = MagicMock()
@@ -117,13 +120,15 @@ class TestJiraAnalyticsService(TestCase):
         first_pipeline.execute.return_value = [
             ["done-issue-1", "done-issue-2"],  # user1, done, proj1
             {"inprogress-issue-1"},  # user1, in_progress, proj1
+            0,  # story points totals not built yet
+            {},  # user1, proj1 story points totals
         ]
         story_point_pipeline.execute.return_value = [
             "5.0",  # story point for done-issue-1
             "3.0",  # story point for done-issue-2
         ]
 
-        result = self.jira_service.get_issues_summary(
+        result = await self.jira_service.get_issues_summary(
             status_list=[JiraIssueStatus.DONE, JiraIssueStatus.IN_PROGRESS],
             ldaps=["user1"],
             project_ids=["proj1"],
@@ -134,12 +139,12 @@ class TestJiraAnalyticsService(TestCase):
         self.assertEqual(self.mock_redis.pipeline.call_count, 2)
         first_pipeline.zrange.assert_called_once()
         first_pipeline.smembers.assert_called_once()
-        self.mock_retry_utils.get_retry_on_transient.assert_any_call(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_any_call(
             first_pipeline.execute
         )
 
         self.assertEqual(story_point_pipeline.hget.call_count, 2)
-        self.mock_retry_utils.get_retry_on_transient.assert_any_call(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_any_call(
             story_point_pipeline.execute
         )
 
@@ -152,7 +157,7 @@ class TestJiraAnalyticsService(TestCase):
         "backend.internal_activity_service.jira_analytics_service.JiraAnalyticsService.get_all_jira_projects",
         return_value={"proj1": "Project 1"},
     )
-    def test_get_issues_summary_with_defaults(self, mock_get_projects):
+    async def test_get_issues_summary_with_defaults(self, mock_get_projects):
         """Test that the method correctly uses defaults for ldaps and project_ids."""
         self.mock_ldap_service.get_all_active_interns_and_employees_ldaps.return_value = [
             "intern1",
@@ -165,7 +170,7 @@ class TestJiraAnalyticsService(TestCase):
 
         mock_get_projects.return_value = ["test_project-1"]
 
-        self.jira_service.get_issues_summary(
+        await self.jira_service.get_issues_summary(
             status_list=[JiraIssueStatus.IN_PROGRESS, JiraIssueStatus.DONE],
             ldaps=None,
             project_ids=None,
@@ -187,12 +192,12 @@ class TestJiraAnalyticsService(TestCase):
             else:
                 mock_pipeline.zrange.assert_any_call(key, ANY, ANY, byscore=True)
 
-    def test_get_issues_summary_with_no_results(self):
+    async def test_get_issues_summary_with_no_results(self):
         mock_pipeline = MagicMock()
         self.mock_redis.pipeline.return_value = mock_pipeline
         mock_pipeline.execute.return_value = [set(), set()]
 
-        result = self.jira_service.get_issues_summary(
+        result = await self.jira_service.get_issues_summary(
             status_list=[JiraIssueStatus.IN_PROGRESS, JiraIssueStatus.TODO],
             ldaps=["user1"],
             project_ids=["proj1"],
@@ -204,20 +209,22 @@ class TestJiraAnalyticsService(TestCase):
         self.assertEqual(result["user1"]["todo"], [])
         self.assertEqual(result["user1"]["done_story_points_total"], 0.0)
 
-    def test_get_issues_summary_done_with_missing_story_points(self):
+    async def test_get_issues_summary_done_with_missing_story_points(self):
         first_pipeline = MagicMock()
         story_point_pipeline = MagicMock()
         self.mock_redis.pipeline.side_effect = [first_pipeline, story_point_pipeline]
 
         first_pipeline.execute.return_value = [
             ["done-1", "done-2"],  # both DONE
+            0,  # story points totals not built yet
+            {},  # user1, proj1 story points totals
         ]
         story_point_pipeline.execute.return_value = [
             "4.0",  # valid
             None,  # missing
         ]
 
-        result = self.jira_service.get_issues_summary(
+        result = await self.jira_service.get_issues_summary(
             status_list=[JiraIssueStatus.DONE],
             ldaps=["user1"],
             project_ids=["proj1"],
@@ -228,7 +235,76 @@ class TestJiraAnalyticsService(TestCase):
         self.assertEqual(result["user1"]["done_story_points_total"], 4.0)
         self.assertCountEqual(result["user1"]["done"], ["done-1", "done-2"])
 
-    def test_process_get_issue_detail_batch_success(self):
+    async def test_get_issues_summary_reads_story_points_totals(self):
+        """DONE story points come from the per-day totals without reading issues."""
+        self.mock_date_time_util.format_datetime_to_int.side_effect = [
+            20230101,
+            20230131,
+        ]
+        mock_pipeline = MagicMock()
+        self.mock_redis.pipeline.return_value = mock_pipeline
+        mock_pipeline.execute.return_value = [
+            ["done-1", "done-2"],  # user1, done, proj1
+            ["done-3"],  # user1, done, proj2
+            1,  # story points totals are built
+            {"20221231": "13.0", "20230105": "5.0", "20230131": "2.5"},
+            {"20230110": "1.0", "20230201": "8.0"},
+        ]
+
+        result = await self.jira_service.get_issues_summary(
+            status_list=[JiraIssueStatus.DONE],
+            ldaps=["user1"],
+            project_ids=["proj1", "proj2"],
+            start_date="2023-01-01",
+            end_date="2023-01-31",
+        )
+
+        self.mock_redis.pipeline.assert_called_once()
+        mock_pipeline.exists.assert_called_once_with("jira:story_points_ready")
+        mock_pipeline.hgetall.assert_any_call(
+            "jira:story_points:ldap:user1:project:proj1"
+        )
+        mock_pipeline.hgetall.assert_any_call(
+            "jira:story_points:ldap:user1:project:proj2"
+        )
+        mock_pipeline.hget.assert_not_called()
+        self.assertCountEqual(result["user1"]["done"], ["done-1", "done-2", "done-3"])
+        self.assertEqual(result["user1"]["done_story_points_total"], 8.5)
+
+    async def test_get_issues_summary_uses_result_cache(self):
+        self.jira_service.result_cache = Mock()
+        self.jira_service.result_cache.get_or_compute = AsyncMock(
+            return_value={"user1": {"done": ["ISSUE-1"]}}
+        )
+
+        result = await self.jira_service.get_issues_summary(
+            status_list=[JiraIssueStatus.TODO, JiraIssueStatus.DONE],
+            ldaps=["user2", "user1"],
+            project_ids=["20", "10"],
+            start_date="2023-01-01",
+            end_date="2023-01-31",
+        )
+
+        self.assertEqual(result, {"user1": {"done": ["ISSUE-1"]}})
+        name, params, sources, range_end, _ = (
+            self.jira_service.result_cache.get_or_compute.call_args.args
+        )
+        self.assertEqual(name, "jira_issues_summary")
+        self.assertEqual(
+            params,
+            {
+                "statuses": ["done", "todo"],
+                "ldaps": ["user1", "user2"],
+                "project_ids": ["10", "20"],
+                "start": 1672531200,
+                "end": 1675209599,
+            },
+        )
+        self.assertEqual(sources, [AnalyticsSource.JIRA])
+        self.assertEqual(range_end, self.end_dt)
+        self.mock_redis.pipeline.assert_not_called()
+
+    async def test_process_get_issue_detail_batch_success(self):
         """Test fetching issue details in batch successfully."""
         issue_ids = ["issue-1", "issue-2"]
         pipeline_results = [
@@ -239,7 +315,7 @@ class TestJiraAnalyticsService(TestCase):
         self.mock_redis.pipeline.return_value = mock_pipeline
         mock_pipeline.execute.return_value = pipeline_results
 
-        result = self.jira_service.process_get_issue_detail_batch(issue_ids)
+        result = await self.jira_service.process_get_issue_detail_batch(issue_ids)
 
         self.assertEqual(len(result), 2)
         self.assertCountEqual(
@@ -265,7 +341,7 @@ class TestJiraAnalyticsService(TestCase):
             JIRA_ISSUE_DETAILS_KEY.format(issue_id="issue-2")
         )
 
-    def test_process_get_issue_detail_batch_with_missing_details(self):
+    async def test_process_get_issue_detail_batch_with_missing_details(self):
         """Test batch fetch where some issue details are missing."""
         issue_ids = ["issue-1", "issue-2", "issue-3"]
         pipeline_results = [
@@ -277,7 +353,7 @@ class TestJiraAnalyticsService(TestCase):
         self.mock_redis.pipeline.return_value = mock_pipeline
         mock_pipeline.execute.return_value = pipeline_results
 
-        result = self.jira_service.process_get_issue_detail_batch(issue_ids)
+        result = await self.jira_service.process_get_issue_detail_batch(issue_ids)
 
         self.assertEqual(len(result), 3)
         self.assertCountEqual(
@@ -304,10 +380,10 @@ class TestJiraAnalyticsService(TestCase):
             ],
         )
 
-    def test_process_get_issue_detail_batch_empty_input(self):
+    async def test_process_get_issue_detail_batch_empty_input(self):
         """Test batch fetch with an empty list of issue IDs."""
         with self.assertRaises(ValueError):
-            self.jira_service.process_get_issue_detail_batch([])
+            await self.jira_service.process_get_issue_detail_batch([])
 
         self.mock_redis.pipeline.assert_not_called()
         self.mock_redis.pipeline.return_value.hgetall.assert_not_called()
@@ -1,5 +1,5 @@
-from unittest import TestCase, main
-from unittest.mock import MagicMock
+from unittest import IsolatedAsyncioTestCase, main
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from backend.common.constants import (
     LDAP_KEY_TEMPLATE,
@@ -9,7 +9,7 @@ from backend.common.constants import (
 from backend.internal_activity_service.ldap_service import LdapService
 
 
-class TestLdapService(TestCase):
+class TestLdapService(IsolatedAsyncioTestCase):
     def setUp(self):
         self.logger = MagicMock()
         self.redis_client = MagicMock()
@@ -19,11 +19,11 @@ class TestLdapService(TestCase):
             redis_client=self.redis_client,
             retry_utils=self.retry_utils,
         )
-        self.retry_utils.get_retry_on_transient.side_effect = (
-            lambda fn, *args, **kwargs: fn(*args, **kwargs)
+        self.retry_utils.get_async_retry_on_transient = AsyncMock(
+            side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs)
         )
 
-    def test_get_ldaps_by_status_and_group_single_status_and_group(self):
+    async def test_get_ldaps_by_status_and_group_single_status_and_group(self):
         status = MicrosoftAccountStatus.ACTIVE
         groups = [MicrosoftGroups.EMPLOYEES]
 
@@ -33,21 +33,21 @@ class TestLdapService(TestCase):
         expected_redis_result = [{"alice": "Alice", "bob": "Bob"}]
         pipeline_mock.execute.return_value = expected_redis_result
 
-        result = self.service.get_ldaps_by_status_and_group(status, groups)
+        result = await self.service.get_ldaps_by_status_and_group(status, groups)
 
         self.redis_client.pipeline.assert_called_once()
         key = LDAP_KEY_TEMPLATE.format(
             account_status=status.value, group=groups[0].value
         )
         pipeline_mock.hgetall.assert_called_once_with(key)
-        self.retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.retry_utils.get_async_retry_on_transient.assert_called_once_with(
             pipeline_mock.execute
         )
 
         expected_output = {"employees": {"active": {"alice": "Alice", "bob": "Bob"}}}
         self.assertEqual(result, expected_output)
 
-    def test_get_ldaps_by_status_and_group_all_status_multiple_groups(self):
+    async def test_get_ldaps_by_status_and_group_all_status_multiple_groups(self):
         status = MicrosoftAccountStatus.ALL
         groups = [MicrosoftGroups.EMPLOYEES, MicrosoftGroups.INTERNS]
 
@@ -62,7 +62,7 @@ class TestLdapService(TestCase):
         ]
         pipeline_mock.execute.return_value = redis_results
 
-        result = self.service.get_ldaps_by_status_and_group(status, groups)
+        result = await self.service.get_ldaps_by_status_and_group(status, groups)
 
         self.assertEqual(pipeline_mock.hgetall.call_count, 4)
 
@@ -78,21 +78,21 @@ class TestLdapService(TestCase):
         }
         self.assertEqual(result, expected_output)
 
-    def test_get_ldaps_by_status_and_group_no_groups(self):
+    async def test_get_ldaps_by_status_and_group_no_groups(self):
         status = MicrosoftAccountStatus.ACTIVE
         groups = []
 
         with self.assertRaises(TypeError):
-            self.service.get_ldaps_by_status_and_group(status, groups)
+            await self.service.get_ldaps_by_status_and_group(status, groups)
 
-    def test_get_ldaps_by_groups_and_no_status(self):
+    async def test_get_ldaps_by_groups_and_no_status(self):
         status = None
         groups = [MicrosoftGroups.EMPLOYEES, MicrosoftGroups.INTERNS]
 
         with self.assertRaises(TypeError):
-            self.service.get_ldaps_by_status_and_group(status, groups)
+            await self.service.get_ldaps_by_status_and_group(status, groups)
 
-    def test_get_ldaps_by_status_and_group_redis_returns_nothing(self):
+    async def test_get_ldaps_by_status_and_group_redis_returns_nothing(self):
         status = MicrosoftAccountStatus.ACTIVE
         groups = [MicrosoftGroups.EMPLOYEES]
 
@@ -100,18 +100,18 @@ class TestLdapService(TestCase):
         self.redis_client.pipeline.return_value = pipeline_mock
         pipeline_mock.execute.return_value = [{}]
 
-        result = self.service.get_ldaps_by_status_and_group(status, groups)
+        result = await self.service.get_ldaps_by_status_and_group(status, groups)
 
         expected_output = {"employees": {"active": {}}}
         self.assertEqual(result, expected_output)
 
-    def test_returns_all_ldaps_from_all_groups_and_statuses(self):
+    async def test_returns_all_ldaps_from_all_groups_and_statuses(self):
         pipeline = MagicMock()
         self.redis_client.pipeline.return_value = pipeline
         pipeline.hkeys.side_effect = lambda key: None
         pipeline.execute.return_value = [["ldap1"], ["ldap2"], ["ldap3"], []]
 
-        result = self.service.get_all_ldaps()
+        result = await self.service.get_all_ldaps()
 
         expected_keys = []
         for group in MicrosoftGroups:
@@ -131,28 +131,28 @@ class TestLdapService(TestCase):
         self.assertEqual(set(result), {"ldap1", "ldap2", "ldap3"})
         self.assertEqual(set(actual_keys), set(expected_keys))
 
-    def test_empty_pipeline_execute_returns_empty_list(self):
+    async def test_empty_pipeline_execute_returns_empty_list(self):
         pipeline = MagicMock()
         self.redis_client.pipeline.return_value = pipeline
         pipeline.hkeys.side_effect = lambda key: None
         pipeline.execute.return_value = []
 
-        result = self.service.get_all_ldaps()
+        result = await self.service.get_all_ldaps()
         self.assertEqual(result, [])
 
-    def test_pipeline_execute_with_empty_ldaps(self):
+    async def test_pipeline_execute_with_empty_ldaps(self):
         pipeline = MagicMock()
         self.redis_client.pipeline.return_value = pipeline
         pipeline.hkeys.side_effect = lambda key: None
         pipeline.execute.return_value = [[], []]
 
-        result = self.service.get_all_ldaps()
+        result = await self.service.get_all_ldaps()
         self.assertEqual(result, [])
 
-    def test_get_active_interns_ldaps_returns_list(self):
+    async def test_get_active_interns_ldaps_returns_list(self):
         self.redis_client.hkeys.return_value = ["intern1", "intern2"]
 
-        result = self.service.get_active_interns_ldaps()
+        result = await self.service.get_active_interns_ldaps()
 
         expected_key = LDAP_KEY_TEMPLATE.format(
             account_status=MicrosoftAccountStatus.ACTIVE.value,
@@ -165,14 +165,14 @@ class TestLdapService(TestCase):
         )
         self.assertEqual(result, ["intern1", "intern2"])
 
-    def test_get_active_interns_ldaps_empty_redis_returns_empty_list(self):
+    async def test_get_active_interns_ldaps_empty_redis_returns_empty_list(self):
         self.redis_client.hkeys.return_value = []
 
-        result = self.service.get_active_interns_ldaps()
+        result = await self.service.get_active_interns_ldaps()
 
         self.assertEqual(result, [])
 
-    def test_get_all_active_interns_and_employees_ldaps(self):
+    async def test_get_all_active_interns_and_employees_ldaps(self):
         pipeline_mock = MagicMock()
         self.redis_client.pipeline.return_value = pipeline_mock
 
@@ -193,7 +193,7 @@ class TestLdapService(TestCase):
             ["ldap_for_employees"],
         ]
 
-        result = self.service.get_all_active_interns_and_employees_ldaps()
+        result = await self.service.get_all_active_interns_and_employees_ldaps()
 
         for key in expected_keys:
             pipeline_mock.hkeys.assert_any_call(key)
@@ -202,7 +202,7 @@ class TestLdapService(TestCase):
             sorted(result), sorted(["ldap_for_interns", "ldap_for_employees"])
         )
 
-    def test_get_all_active_interns_and_employees_ldaps_from_some_groups_within_ldaps(
+    async def test_get_all_active_interns_and_employees_ldaps_from_some_groups_within_ldaps(
         self,
     ):
         pipeline_mock = MagicMock()
@@ -225,14 +225,14 @@ class TestLdapService(TestCase):
             ),
         ]
 
-        result = self.service.get_all_active_interns_and_employees_ldaps()
+        result = await self.service.get_all_active_interns_and_employees_ldaps()
 
         for key in expected_keys:
             pipeline_mock.hkeys.assert_any_call(key)
 
         self.assertEqual(result, ["ldap_for_employee"])
 
-    def test_get_all_active_interns_and_employees_ldaps_empty_pipeline_execute_returns_empty_list(
+    async def test_get_all_active_interns_and_employees_ldaps_empty_pipeline_execute_returns_empty_list(
         self,
     ):
         pipeline_mock = MagicMock()
@@ -252,14 +252,14 @@ class TestLdapService(TestCase):
             ),
         ]
 
-        result = self.service.get_all_active_interns_and_employees_ldaps()
+        result = await self.service.get_all_active_interns_and_employees_ldaps()
 
         for key in expected_keys:
             pipeline_mock.hkeys.assert_any_call(key)
 
         self.assertEqual(result, [])
 
-    def test_get_all_active_interns_and_employees_ldaps_pipeline_execute_with_empty_ldaps(
+    async def test_get_all_active_interns_and_employees_ldaps_pipeline_execute_with_empty_ldaps(
         self,
     ):
         pipeline_mock = MagicMock()
@@ -270,10 +270,10 @@ class TestLdapService(TestCase):
         )
         pipeline_mock.execute.return_value = [[], []]
 
-        result = self.service.get_all_active_interns_and_employees_ldaps()
+        result = await self.service.get_all_active_interns_and_employees_ldaps()
         self.assertEqual(result, [])
 
-    def test_get_all_active_interns_and_employees_ldaps_empty_redis_returns_empty_list(
+    async def test_get_all_active_interns_and_employees_ldaps_empty_redis_returns_empty_list(
         self,
     ):
         pipeline_mock = MagicMock()
@@ -293,23 +293,99 @@ class TestLdapService(TestCase):
             ),
         ]
 
-        result = self.service.get_all_active_interns_and_employees_ldaps()
+        result = await self.service.get_all_active_interns_and_employees_ldaps()
 
         for key in expected_keys:
             pipeline_mock.hkeys.assert_any_call(key)
 
         self.assertEqual(result, [])
 
-    def test_get_all_active_interns_and_employees_ldaps_redis_raises_exception(self):
+    async def test_get_all_active_interns_and_employees_ldaps_redis_raises_exception(
+        self,
+    ):
         pipeline_mock = MagicMock()
         self.redis_client.pipeline.return_value = pipeline_mock
         pipeline_mock.execute.side_effect = Exception("Redis connection error")
 
         with self.assertRaises(Exception) as context:
-            self.service.get_all_active_interns_and_employees_ldaps()
+            await self.service.get_all_active_interns_and_employees_ldaps()
 
         self.assertEqual(str(context.exception), "Redis connection error")
 
+    async def test_directory_lookups_are_cached(self):
+        pipeline_mock = MagicMock()
+        pipeline_mock.execute.return_value = [["alice"], ["bob"]]
+        self.redis_client.pipeline.return_value = pipeline_mock
+
+        first = await self.service.get_all_active_interns_and_employees_ldaps()
+        first.append("mallory")
+        second = await self.service.get_all_active_interns_and_employees_ldaps()
+
+        self.assertCountEqual(second, ["alice", "bob"])
+        pipeline_mock.execute.assert_called_once()
+        self.assertEqual(
+            self.service.get_cache_stats(), {"hits": 1, "misses": 1, "size": 1}
+        )
+
+    async def test_cache_is_keyed_by_arguments(self):
+        pipeline_mock = MagicMock()
+        pipeline_mock.execute.side_effect = [
+            [{"alice": "Alice"}],
+            [{"ivan": "Ivan"}],
+        ]
+        self.redis_client.pipeline.return_value = pipeline_mock
+
+        employees = await self.service.get_ldaps_by_status_and_group(
+            MicrosoftAccountStatus.ACTIVE, [MicrosoftGroups.EMPLOYEES]
+        )
+        interns = await self.service.get_ldaps_by_status_and_group(
+            MicrosoftAccountStatus.ACTIVE, [MicrosoftGroups.INTERNS]
+        )
+
+        self.assertEqual(employees, {"employees": {"active": {"alice": "Alice"}}})
+        self.assertEqual(interns, {"interns": {"active": {"ivan": "Ivan"}}})
+        self.assertEqual(self.service.cache_misses, 2)
+        self.assertEqual(self.service.cache_hits, 0)
+
+    async def test_cache_expires_after_ttl(self):
+        self.redis_client.hkeys = MagicMock(side_effect=[["alice"], ["alice", "bob"]])
+
+        with patch(
+            "backend.internal_activity_service.ldap_service.time.monotonic",
+            side_effect=[100.0, 100.0 + self.service.cache_ttl_seconds + 1],
+        ):
+            first = await self.service.get_active_interns_ldaps()
+            second = await self.service.get_active_interns_ldaps()
+
+        self.assertEqual(first, ["alice"])
+        self.assertEqual(second, ["alice", "bob"])
+        self.assertEqual(self.service.cache_misses, 2)
+
+    async def test_invalidate_cache_forces_reload(self):
+        self.redis_client.hkeys = MagicMock(side_effect=[["alice"], ["bob"]])
+
+        await self.service.get_active_interns_ldaps()
+        self.service.invalidate_cache()
+        result = await self.service.get_active_interns_ldaps()
+
+        self.assertEqual(result, ["bob"])
+        self.assertEqual(self.redis_client.hkeys.call_count, 2)
+
+    async def test_zero_ttl_disables_cache(self):
+        service = LdapService(
+            logger=self.logger,
+            redis_client=self.redis_client,
+            retry_utils=self.retry_utils,
+            cache_ttl_seconds=0,
+        )
+        self.redis_client.hkeys = MagicMock(return_value=["alice"])
+
+        await service.get_active_interns_ldaps()
+        await service.get_active_interns_ldaps()
+
+        self.assertEqual(self.redis_client.hkeys.call_count, 2)
+        self.assertEqual(service.get_cache_stats()["size"], 0)
+
 
 if __name__ == "__main__":
     main()
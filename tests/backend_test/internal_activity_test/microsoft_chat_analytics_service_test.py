@@ -1,9 +1,11 @@
-from unittest import TestCase, main
+from unittest import IsolatedAsyncioTestCase, main
 from datetime import datetime, timezone
-from unittest.mock import Mock, call
+from unittest.mock import AsyncMock, Mock, call
 
 from backend.common.constants import (
     MICROSOFT_CHAT_MESSAGES_INDEX_KEY,
+    MICROSOFT_CHAT_DAILY_COUNT_KEY,
+    MICROSOFT_CHAT_DAILY_COUNT_READY_KEY,
     MicrosoftChatMessagesChangeType,
 )
 from backend.internal_activity_service.microsoft_chat_analytics_service import (
@@ -11,15 +13,17 @@ from backend.internal_activity_service.microsoft_chat_analytics_service import (
 )
 
 
-class TestMicrosoftChatAnalyticsService(TestCase):
+class TestMicrosoftChatAnalyticsService(IsolatedAsyncioTestCase):
     def setUp(self):
         self.mock_logger = Mock()
         self.mock_redis_client = Mock()
         self.mock_date_time_util = Mock()
-        self.mock_ldap_service = Mock()
+        self.mock_ldap_service = AsyncMock()
         self.mock_retry_utils = Mock()
 
-        self.mock_retry_utils.get_retry_on_transient.side_effect = lambda func: func()
+        self.mock_retry_utils.get_async_retry_on_transient = AsyncMock(
+            side_effect=lambda func: func()
+        )
 
         self.service = MicrosoftChatAnalyticsService(
             logger=self.mock_logger,
@@ -40,16 +44,24 @@ class TestMicrosoftChatAnalyticsService(TestCase):
             self.start_dt_utc,
             self.end_dt_utc,
         )
+        self.mock_date_time_util.get_day_buckets.return_value = [
+            "2024-01-01",
+            "2024-01-02",
+        ]
 
-    def test_count_messages_with_ldap_list_and_date_range(self):
+    async def test_count_messages_with_ldap_list_and_date_range(self):
         ldap_list = ["user1", "user2"]
         redis_counts = [10, 20]
 
         mock_pipeline = Mock()
         self.mock_redis_client.pipeline.return_value = mock_pipeline
-        mock_pipeline.execute.return_value = redis_counts
+        # Rollups not backfilled yet, so counts come from the ZCOUNT fallback.
+        mock_pipeline.execute.side_effect = [
+            [0, [None, None], [None, None]],
+            redis_counts,
+        ]
 
-        result = self.service.count_microsoft_chat_messages_in_date_range(
+        result = await self.service.count_microsoft_chat_messages_in_date_range(
             ldap_list=ldap_list,
             start_date=self.start_date_str,
             end_date=self.end_date_str,
@@ -59,7 +71,6 @@ class TestMicrosoftChatAnalyticsService(TestCase):
             self.start_date_str, self.end_date_str
         )
         self.mock_ldap_service.get_all_active_interns_and_employees_ldaps.assert_not_called()
-        self.mock_redis_client.pipeline.assert_called_once()
 
         expected_zcount_calls = []
         for ldap in ldap_list:
@@ -72,10 +83,10 @@ class TestMicrosoftChatAnalyticsService(TestCase):
             )
         mock_pipeline.zcount.assert_has_calls(expected_zcount_calls, any_order=False)
         self.assertEqual(mock_pipeline.zcount.call_count, len(ldap_list))
-        self.mock_retry_utils.get_retry_on_transient.assert_called_once_with(
+        self.mock_retry_utils.get_async_retry_on_transient.assert_called_with(
             mock_pipeline.execute
         )
-        mock_pipeline.execute.assert_called_once()
+        self.assertEqual(mock_pipeline.execute.call_count, 2)
 
         expected_result = {
             "start_date": self.start_dt_utc.isoformat(),
@@ -84,7 +95,7 @@ class TestMicrosoftChatAnalyticsService(TestCase):
         }
         self.assertEqual(result, expected_result)
 
-    def test_count_messages_without_ldap_list_uses_interns_and_employees(self):
+    async def test_count_messages_without_ldap_list_uses_interns_and_employees(self):
         intern_ldaps = ["intern1", "intern2"]
         employee_ldaps = ["employee1", "employee2"]
         redis_counts = [5, 15, 7, 27]
@@ -95,15 +106,14 @@ class TestMicrosoftChatAnalyticsService(TestCase):
 
         mock_pipeline = Mock()
         self.mock_redis_client.pipeline.return_value = mock_pipeline
-        mock_pipeline.execute.return_value = redis_counts
+        mock_pipeline.execute.side_effect = [[0, [], []], redis_counts]
 
-        result = self.service.count_microsoft_chat_messages_in_date_range(
+        result = await self.service.count_microsoft_chat_messages_in_date_range(
             start_date=self.start_date_str, end_date=self.end_date_str, ldap_list=None
         )
 
         self.mock_ldap_service.get_all_active_interns_and_employees_ldaps.assert_called_once()
 
-        self.mock_redis_client.pipeline.assert_called_once()
         expected_zcount_calls = []
         for ldap in intern_ldaps + employee_ldaps:
             redis_key = MICROSOFT_CHAT_MESSAGES_INDEX_KEY.format(
@@ -114,7 +124,7 @@ class TestMicrosoftChatAnalyticsService(TestCase):
                 call.zcount(redis_key, self.start_timestamp, self.end_timestamp)
             )
         mock_pipeline.zcount.assert_has_calls(expected_zcount_calls, any_order=False)
-        mock_pipeline.execute.assert_called_once()
+        self.assertEqual(mock_pipeline.execute.call_count, 2)
 
         expected_result = {
             "start_date": self.start_dt_utc.isoformat(),
@@ -128,6 +138,33 @@ class TestMicrosoftChatAnalyticsService(TestCase):
         }
         self.assertEqual(result, expected_result)
 
+    async def test_count_messages_sums_daily_rollups_when_ready(self):
+        ldap_list = ["user1", "user2"]
+
+        mock_pipeline = Mock()
+        self.mock_redis_client.pipeline.return_value = mock_pipeline
+        mock_pipeline.execute.return_value = [1, ["3", None], ["4", "2"]]
+
+        result = await self.service.count_microsoft_chat_messages_in_date_range(
+            ldap_list=ldap_list,
+            start_date=self.start_date_str,
+            end_date=self.end_date_str,
+        )
+
+        self.assertEqual(result["result"], {"user1": 7, "user2": 2})
+        self.mock_date_time_util.get_day_buckets.assert_called_once_with(
+            self.start_dt_utc.date(), self.end_dt_utc.date()
+        )
+        mock_pipeline.exists.assert_called_once_with(
+            MICROSOFT_CHAT_DAILY_COUNT_READY_KEY
+        )
+        mock_pipeline.hmget.assert_has_calls([
+            call(MICROSOFT_CHAT_DAILY_COUNT_KEY.format(day="2024-01-01"), ldap_list),
+            call(MICROSOFT_CHAT_DAILY_COUNT_KEY.format(day="2024-01-02"), ldap_list),
+        ])
+        mock_pipeline.zcount.assert_not_called()
+        mock_pipeline.execute.assert_called_once()
+
 
 if __name__ == "__main__":
     main()
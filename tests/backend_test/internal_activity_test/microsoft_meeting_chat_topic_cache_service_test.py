@@ -17,8 +17,8 @@ class TestMicrosoftMeetingChatTopicCacheService(IsolatedAsyncioTestCase):
         self.microsoft_service = AsyncMock()
         self.mock_retry_utils = MagicMock()
 
-        self.mock_retry_utils.get_retry_on_transient.side_effect = (
-            lambda func, *args, **kwargs: func(*args, **kwargs)
+        self.mock_retry_utils.get_async_retry_on_transient = AsyncMock(
+            side_effect=lambda func, *args, **kwargs: func(*args, **kwargs)
         )
 
         self.microsoft_meeting_chat_topic_cache_service = (
@@ -1,20 +1,25 @@
-from unittest import TestCase, main
-from unittest.mock import Mock
+import asyncio
+from datetime import datetime, timezone
+from unittest import IsolatedAsyncioTestCase, main
+from unittest.mock import AsyncMock, Mock
+from backend.common.constants import AnalyticsSource
 from backend.internal_activity_service.summary_service import SummaryService
 from backend.dto.user_context_dto import UserContextDto
 
 
-class TestSummaryService(TestCase):
+class TestSummaryService(IsolatedAsyncioTestCase):
     def setUp(self):
-        self.mock_ldap_service = Mock()
-        self.mock_ms_chat_service = Mock()
-        self.mock_calendar_service = Mock()
-        self.mock_google_chat_service = Mock()
-        self.mock_gerrit_service = Mock()
-        self.mock_jira_service = Mock()
+        self.mock_ldap_service = AsyncMock()
+        self.mock_ms_chat_service = AsyncMock()
+        self.mock_calendar_service = AsyncMock()
+        self.mock_google_chat_service = AsyncMock()
+        self.mock_gerrit_service = AsyncMock()
+        self.mock_jira_service = AsyncMock()
         self.mock_date_time_util = Mock()
+        self.mock_logger = Mock()
 
         self.service = SummaryService(
+            logger=self.mock_logger,
             ldap_service=self.mock_ldap_service,
             microsoft_chat_analytics_service=self.mock_ms_chat_service,
             google_calendar_analytics_service=self.mock_calendar_service,
@@ -24,7 +29,7 @@ class TestSummaryService(TestCase):
             date_time_util=self.mock_date_time_util,
         )
 
-    def test_get_summary_single_user(self):
+    async def test_get_summary_single_user(self):
         ldap_user = "alice"
 
         self.mock_ldap_service.get_ldaps_by_status_and_group.return_value = {
@@ -59,7 +64,7 @@ class TestSummaryService(TestCase):
             ldap_user: {"done": ["JIRA-1", "JIRA-2"]}
         }
 
-        result = self.service.get_summary(
+        result, unavailable_sources = await self.service.get_summary(
             start_date="2025-09-01",
             end_date="2025-09-30",
             groups_list=["interns"],
@@ -77,6 +82,7 @@ class TestSummaryService(TestCase):
             }
         ]
         self.assertEqual(result, expected)
+        self.assertEqual(unavailable_sources, [])
 
         self.mock_ms_chat_service.count_microsoft_chat_messages_in_date_range.assert_called_once_with(
             ldap_list=[ldap_user],
@@ -94,7 +100,7 @@ class TestSummaryService(TestCase):
         self.mock_gerrit_service.get_gerrit_stats.assert_called_once()
         self.mock_jira_service.get_issues_summary.assert_called_once()
 
-    def test_get_summary_multiple_users(self):
+    async def test_get_summary_multiple_users(self):
         self.mock_ldap_service.get_ldaps_by_status_and_group.return_value = {
             "interns": {"active": {"alice": "Alice Doe"}},
             "employees": {"active": {"bob": "Bob Smith"}},
@@ -131,7 +137,7 @@ class TestSummaryService(TestCase):
             "bob": {"done": ["JIRA-2", "JIRA-3"]},
         }
 
-        result = self.service.get_summary(
+        result, unavailable_sources = await self.service.get_summary(
             start_date="2025-09-01",
             end_date="2025-09-30",
             groups_list=["interns", "employees"],
@@ -158,8 +164,9 @@ class TestSummaryService(TestCase):
         ]
 
         self.assertEqual(result, expected)
+        self.assertEqual(unavailable_sources, [])
 
-    def test_get_summary_no_users(self):
+    async def test_get_summary_no_users(self):
         self.mock_ldap_service.get_ldaps_by_status_and_group.return_value = {}
         self.mock_calendar_service.get_all_calendars.return_value = []
         self.mock_date_time_util.get_start_end_timestamps.return_value = (
@@ -167,7 +174,7 @@ class TestSummaryService(TestCase):
             "end",
         )
 
-        result = self.service.get_summary(
+        result, unavailable_sources = await self.service.get_summary(
             start_date="2025-09-01",
             end_date="2025-09-30",
             groups_list=["interns"],
@@ -175,8 +182,9 @@ class TestSummaryService(TestCase):
         )
 
         self.assertEqual(result, [])
+        self.assertEqual(unavailable_sources, [])
 
-    def test_get_summary_empty_analytics(self):
+    async def test_get_summary_empty_analytics(self):
         users = ["alice"]
         self.mock_ldap_service.get_ldaps_by_status_and_group.return_value = {
             "interns": {"active": {user: "Alice Doe" for user in users}}
@@ -194,7 +202,7 @@ class TestSummaryService(TestCase):
         self.mock_gerrit_service.get_gerrit_stats.return_value = {}
         self.mock_jira_service.get_issues_summary.return_value = {}
 
-        result = self.service.get_summary(
+        result, unavailable_sources = await self.service.get_summary(
             start_date="start",
             end_date="end",
             groups_list=["interns"],
@@ -212,32 +220,182 @@ class TestSummaryService(TestCase):
             }
         ]
         self.assertEqual(result, expected)
+        self.assertEqual(unavailable_sources, [])
 
-    def test_get_my_summary_no_primary_email(self):
+    def _set_single_user_sources(self, ldap_user):
+        self.mock_ldap_service.get_ldaps_by_status_and_group.return_value = {
+            "interns": {"active": {ldap_user: "Alice Doe"}}
+        }
+        self.mock_date_time_util.get_start_end_timestamps.return_value = (
+            "start",
+            "end",
+        )
+        self.mock_ms_chat_service.count_microsoft_chat_messages_in_date_range.return_value = {
+            "result": {ldap_user: 5}
+        }
+        self.mock_google_chat_service.count_messages.return_value = {
+            "result": {ldap_user: {"space1": 3}}
+        }
+        self.mock_calendar_service.get_all_calendars.return_value = [{"id": "cal1"}]
+        self.mock_calendar_service.get_meeting_hours_for_user.return_value = {
+            ldap_user: 2.0
+        }
+        self.mock_gerrit_service.get_gerrit_stats.return_value = {
+            ldap_user: {"cl_merged": 4, "loc_merged": 120}
+        }
+        self.mock_jira_service.get_issues_summary.return_value = {
+            ldap_user: {"done": ["JIRA-1"]}
+        }
+
+    async def test_get_summary_failed_source_returns_partial_result(self):
+        self._set_single_user_sources("alice")
+        self.mock_gerrit_service.get_gerrit_stats.side_effect = RuntimeError("down")
+
+        result, unavailable_sources = await self.service.get_summary(
+            start_date="start",
+            end_date="end",
+            groups_list=["interns"],
+            include_terminated=False,
+        )
+
+        self.assertEqual(unavailable_sources, ["gerrit"])
+        self.assertEqual(
+            result,
+            [
+                {
+                    "ldap": "alice",
+                    "chat_count": 8,
+                    "meeting_hours": 2.0,
+                    "cl_merged": 0,
+                    "loc_merged": 0,
+                    "jira_issue_done": 1,
+                }
+            ],
+        )
+        self.mock_logger.error.assert_called_once()
+
+    async def test_get_summary_slow_source_times_out(self):
+        self._set_single_user_sources("alice")
+        self.service.source_timeout_seconds = 0.01
+
+        async def slow_meeting_hours(**kwargs):
+            await asyncio.sleep(1)
+            return {"alice": 2.0}
+
+        self.mock_calendar_service.get_meeting_hours_for_user.side_effect = (
+            slow_meeting_hours
+        )
+
+        result, unavailable_sources = await self.service.get_summary(
+            start_date="start",
+            end_date="end",
+            groups_list=["interns"],
+            include_terminated=False,
+        )
+
+        self.assertEqual(unavailable_sources, ["meeting_hours"])
+        self.assertEqual(result[0]["meeting_hours"], 0)
+        self.assertEqual(result[0]["chat_count"], 8)
+        self.assertEqual(result[0]["cl_merged"], 4)
+        self.mock_logger.warning.assert_called_once()
+
+    async def test_get_summary_fetches_sources_concurrently(self):
+        self._set_single_user_sources("alice")
+        started = []
+        release = asyncio.Event()
+
+        def blocking(name, value):
+            async def _call(**kwargs):
+                started.append(name)
+                await release.wait()
+                return value
+
+            return _call
+
+        self.mock_gerrit_service.get_gerrit_stats.side_effect = blocking("gerrit", {})
+        self.mock_jira_service.get_issues_summary.side_effect = blocking("jira", {})
+
+        task = asyncio.create_task(
+            self.service.get_summary(
+                start_date="start",
+                end_date="end",
+                groups_list=["interns"],
+                include_terminated=False,
+            )
+        )
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertCountEqual(started, ["gerrit", "jira"])
+
+        release.set()
+        _, unavailable_sources = await task
+        self.assertEqual(unavailable_sources, [])
+
+    async def test_get_summary_uses_result_cache(self):
+        result_cache = Mock()
+        result_cache.get_or_compute = AsyncMock(return_value=[[{"ldap": "bob"}], []])
+        self.service.result_cache = result_cache
+        self.mock_ldap_service.get_ldaps_by_status_and_group.return_value = {
+            "interns": {"active": {"bob": "Bob", "alice": "Alice"}}
+        }
+        start_dt = datetime(2025, 9, 1, tzinfo=timezone.utc)
+        end_dt = datetime(2025, 9, 30, 23, 59, 59, tzinfo=timezone.utc)
+        self.mock_date_time_util.get_start_end_timestamps.return_value = (
+            start_dt,
+            end_dt,
+        )
+
+        result, unavailable_sources = await self.service.get_summary(
+            start_date="2025-09-01",
+            end_date="2025-09-30",
+            groups_list=["interns"],
+            include_terminated=False,
+        )
+
+        self.assertEqual(result, [{"ldap": "bob"}])
+        self.assertEqual(unavailable_sources, [])
+        name, params, sources, range_end, _ = result_cache.get_or_compute.call_args.args
+        self.assertEqual(name, "summary")
+        self.assertEqual(
+            params,
+            {"ldaps": ["alice", "bob"], "start": start_dt.date(), "end": end_dt.date()},
+        )
+        self.assertEqual(sources, list(AnalyticsSource))
+        self.assertEqual(range_end, end_dt)
+        should_cache = result_cache.get_or_compute.call_args.kwargs["should_cache"]
+        self.assertTrue(should_cache(([], [])))
+        self.assertFalse(should_cache(([], ["gerrit"])))
+        self.mock_gerrit_service.get_gerrit_stats.assert_not_called()
+
+    async def test_get_my_summary_no_primary_email(self):
         user = UserContextDto(sub="user1", primary_email=None)
 
         with self.assertRaises(ValueError):
-            self.service.get_my_summary(
+            await self.service.get_my_summary(
                 user, start_date="2025-09-01", end_date="2025-09-30"
             )
 
-    def test_get_my_summary_correct_ldap_extraction(self):
+    async def test_get_my_summary_correct_ldap_extraction(self):
         user = UserContextDto(sub="user1", primary_email="user1@example.com")
-        self.service._search_summary_data = Mock(
-            return_value=[
-                {
-                    "ldap": "user1",
-                    "chat_count": 10,
-                    "meeting_hours": 4.5,
-                    "cl_merged": 10,
-                    "loc_merged": 500,
-                    "jira_issue_done": 2,
-                }
-            ]
+        self.service._search_summary_data = AsyncMock(
+            return_value=(
+                [
+                    {
+                        "ldap": "user1",
+                        "chat_count": 10,
+                        "meeting_hours": 4.5,
+                        "cl_merged": 10,
+                        "loc_merged": 500,
+                        "jira_issue_done": 2,
+                    }
+                ],
+                [],
+            )
         )
-        result = self.service.get_my_summary(
+        result, unavailable_sources = await self.service.get_my_summary(
             user, start_date="2025-09-01", end_date="2025-09-30"
         )
+        self.assertEqual(unavailable_sources, [])
         self.assertEqual(result.ldap, "user1")
         self.assertEqual(result.chat_count, 10)
         self.assertEqual(result.meeting_hours, 4.5)
@@ -245,33 +403,37 @@ class TestSummaryService(TestCase):
         self.assertEqual(result.loc_merged, 500)
         self.assertEqual(result.jira_issue_done, 2)
 
-    def test_get_my_summary_calls_search_summary_data(self):
+    async def test_get_my_summary_calls_search_summary_data(self):
         user = UserContextDto(sub="user1", primary_email="user1@example.com")
-        self.service._search_summary_data = Mock(
-            return_value=[
-                {
-                    "ldap": "user1",
-                    "chat_count": 10,
-                    "meeting_hours": 4.5,
-                    "cl_merged": 10,
-                    "loc_merged": 500,
-                    "jira_issue_done": 2,
-                }
-            ]
+        self.service._search_summary_data = AsyncMock(
+            return_value=(
+                [
+                    {
+                        "ldap": "user1",
+                        "chat_count": 10,
+                        "meeting_hours": 4.5,
+                        "cl_merged": 10,
+                        "loc_merged": 500,
+                        "jira_issue_done": 2,
+                    }
+                ],
+                [],
+            )
         )
-        self.service.get_my_summary(
+        await self.service.get_my_summary(
             user, start_date="2025-09-01", end_date="2025-09-30"
         )
         self.service._search_summary_data.assert_called_once_with(
             ["user1"], "2025-09-01", "2025-09-30"
         )
 
-    def test_get_my_summary_empty_data(self):
+    async def test_get_my_summary_empty_data(self):
         user = UserContextDto(sub="user1", primary_email="user1@example.com")
-        self.service._search_summary_data = Mock(return_value=[])
-        result = self.service.get_my_summary(
+        self.service._search_summary_data = AsyncMock(return_value=([], ["gerrit"]))
+        result, unavailable_sources = await self.service.get_my_summary(
             user, start_date="2025-09-01", end_date="2025-09-30"
         )
+        self.assertEqual(unavailable_sources, ["gerrit"])
         self.assertEqual(result.ldap, "user1")
         self.assertEqual(result.chat_count, 0)
         self.assertEqual(result.meeting_hours, 0)
@@ -51,7 +51,14 @@ class TestMentorshipAdminController(unittest.IsolatedAsyncioTestCase):
         await self.controller.search_participants(filters=filters)
 
         self.mock_admin_service.search_participants.assert_awaited_once_with(
-            self.mock_session, filters, 100, 0, None, "asc"
+            self.mock_session,
+            filters,
+            100,
+            0,
+            None,
+            "asc",
+            cursor=None,
+            include_total=True,
         )
         self.mock_api_response.assert_called_once_with(
             message="Successfully retrieved participant search results.",
@@ -71,7 +78,14 @@ class TestMentorshipAdminController(unittest.IsolatedAsyncioTestCase):
         )
 
         self.mock_admin_service.search_participants.assert_awaited_once_with(
-            self.mock_session, filters, 50, 200, None, "asc"
+            self.mock_session,
+            filters,
+            50,
+            200,
+            None,
+            "asc",
+            cursor=None,
+            include_total=True,
         )
 
     async def test_search_participants_custom_sort(self):
@@ -87,7 +101,32 @@ class TestMentorshipAdminController(unittest.IsolatedAsyncioTestCase):
         )
 
         self.mock_admin_service.search_participants.assert_awaited_once_with(
-            self.mock_session, filters, 100, 0, "user_id", "desc"
+            self.mock_session,
+            filters,
+            100,
+            0,
+            "user_id",
+            "desc",
+            cursor=None,
+            include_total=True,
+        )
+
+    async def test_search_participants_by_cursor_skips_total_by_default(self):
+        """A cursor page is forwarded without asking for the total again."""
+        filters = ParticipantSearchFilterDto()
+        self.mock_admin_service.search_participants.return_value = MagicMock()
+
+        await self.controller.search_participants(filters=filters, cursor="abc")
+
+        self.mock_admin_service.search_participants.assert_awaited_once_with(
+            self.mock_session,
+            filters,
+            100,
+            0,
+            None,
+            "asc",
+            cursor="abc",
+            include_total=False,
         )
 
     async def test_get_meeting_log_delegates_to_service(self):
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import unittest
 from unittest.mock import MagicMock, AsyncMock
@@ -153,7 +154,11 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
 
     async def test_empty_rows_returns_immediately(self):
         """Returns empty result without calling other repos when no rows found."""
-        self.mock_participants_repo.search_participants_for_admin.return_value = ([], 0)
+        self.mock_participants_repo.search_participants_for_admin.return_value = (
+            [],
+            0,
+            None,
+        )
 
         result = await self.service.search_participants(
             self.mock_session, ParticipantSearchFilterDto()
@@ -165,11 +170,43 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         self.mock_rounds_repo.get_all_rounds.assert_not_awaited()
         self.mock_training_repo.get_training_by_user_ids_and_categories.assert_not_awaited()
 
+    async def test_cursor_page_passes_through_cursor_and_next_cursor(self):
+        """The cursor goes to the repo and its next cursor comes back out."""
+        self.mock_participants_repo.search_participants_for_admin.return_value = (
+            [_make_row(user_id=1)],
+            None,
+            "next",
+        )
+        self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
+            {
+                1: MagicMock(
+                    user_id=1, first_name="Alice", last_name="Doe", preferred_name=""
+                )
+            },
+            {},
+        )
+        self.mock_training_repo.get_training_by_user_ids_and_categories.return_value = []
+
+        result = await self.service.search_participants(
+            self.mock_session,
+            ParticipantSearchFilterDto(),
+            cursor="prev",
+            include_total=False,
+        )
+
+        kwargs = (
+            self.mock_participants_repo.search_participants_for_admin.await_args.kwargs
+        )
+        self.assertEqual(kwargs, {"cursor": "prev", "include_total": False})
+        self.assertIsNone(result.total)
+        self.assertEqual(result.next_cursor, "next")
+
     async def test_partner_ids_included_in_user_fetch(self):
         """users repo receives both the participant's and the partner's user_id."""
         self.mock_participants_repo.search_participants_for_admin.return_value = (
             [_make_row(user_id=1, pair_id=5, mentor_id=1, mentee_id=2)],
             1,
+            None,
         )
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -218,6 +255,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
                 ),
             ],
             2,
+            None,
         )
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -256,6 +294,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
                 _make_row(user_id=3, participant_role=ParticipantRole.MENTOR),
             ],
             3,
+            None,
         )
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -787,8 +826,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         """Summary mode: header + one CSV row per participant row, no meeting query."""
         row = _make_row(user_id=1, round_id=None, pair_id=None)
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            [row],
-            [],
+            ([row], None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -836,7 +874,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         """The raw byte stream is prefixed with a UTF-8 BOM so Excel on
         Windows doesn't mojibake non-ASCII names."""
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            []
+            ([], None)
         ]
 
         chunks = [
@@ -862,8 +900,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         )
         self.mock_meeting_repo.get_meetings_by_pairs.return_value = {1: [meeting]}
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            [row],
-            [],
+            ([row], None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -914,8 +951,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         }
         self.mock_meeting_repo.get_meetings_by_pairs.return_value = meetings_by_pair
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            rows,
-            [],
+            (rows, None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -985,8 +1021,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
             200: [good_meeting],
         }
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            [bad_row, good_row],
-            [],
+            ([bad_row, good_row], None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -1048,8 +1083,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
             100: [good_meeting, bad_meeting]
         }
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            [row],
-            [],
+            ([row], None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -1076,8 +1110,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         row = _make_row(user_id=1, pair_id=5)
         self.mock_meeting_repo.get_meetings_by_pairs.return_value = {}
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            [row],
-            [],
+            ([row], None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -1103,8 +1136,7 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         """Ignores expand_meetings for non-participant exports."""
         row = _make_row(user_id=1, participant_role=None, pair_id=None)
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            [row],
-            [],
+            ([row], None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -1149,12 +1181,11 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         # expand_meetings=True, since non-participants have no pair/meetings.
         self.mock_meeting_repo.get_meetings_by_pairs.assert_not_awaited()
 
-    async def test_stops_paginating_on_empty_page(self):
-        """The batch loop stops as soon as a page comes back empty."""
+    async def test_stops_paginating_without_next_cursor(self):
+        """The batch loop stops as soon as a page comes back without a cursor."""
         row = _make_row(user_id=1)
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            [row],
-            [],
+            ([row], None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -1174,19 +1205,16 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(
             self.mock_participants_repo.iter_search_participants_for_admin.await_count,
-            2,
+            1,
         )
 
-    async def test_multiple_batches_paginate_with_incrementing_offset_and_bom_once(
-        self,
-    ):
-        """Paginates across batches with incrementing offsets and a single BOM."""
+    async def test_multiple_batches_paginate_by_cursor_and_bom_once(self):
+        """Paginates across batches by each page's cursor with a single BOM."""
         row1 = _make_row(user_id=1)
         row2 = _make_row(user_id=2)
         self.mock_participants_repo.iter_search_participants_for_admin.side_effect = [
-            [row1],
-            [row2],
-            [],
+            ([row1], "after-1"),
+            ([row2], None),
         ]
         self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
             {
@@ -1212,11 +1240,14 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         for later_chunk in chunks[1:]:
             self.assertFalse(later_chunk.startswith(b"\xef\xbb\xbf"))
 
-        call_offsets = [
-            call.kwargs["offset"]
+        call_cursors = [
+            call.kwargs["cursor"]
             for call in self.mock_participants_repo.iter_search_participants_for_admin.call_args_list
         ]
-        self.assertEqual(call_offsets, [0, 500, 1000])
+        self.assertEqual(call_cursors, [None, "after-1"])
+        self.mock_session.connection.assert_awaited_once_with(
+            execution_options={"isolation_level": "REPEATABLE READ"}
+        )
 
         csv_text = b"".join(chunks).decode("utf-8-sig")
         lines = csv_text.strip("\r\n").split("\r\n")
@@ -1224,6 +1255,45 @@ class TestMentorshipAdminService(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(lines[1].startswith("1,Alice,Doe"))
         self.assertTrue(lines[2].startswith("2,Bob,Lee"))
 
+    async def test_closing_the_stream_cancels_the_prefetched_page(self):
+        """A client that disconnects mid-export leaves no page load running."""
+        row = _make_row(user_id=1)
+        second_page_started = asyncio.Event()
+        second_page_cancelled = asyncio.Event()
+
+        async def _pages(session, filters, *, limit, cursor):
+            if cursor is None:
+                return [row], "after-1"
+            second_page_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                second_page_cancelled.set()
+                raise
+
+        self.mock_participants_repo.iter_search_participants_for_admin.side_effect = (
+            _pages
+        )
+        self.mock_users_repo.get_users_and_emails_by_ids.return_value = (
+            {
+                1: MagicMock(
+                    user_id=1, first_name="Alice", last_name="Doe", preferred_name=None
+                )
+            },
+            {1: []},
+        )
+
+        stream = self.service.stream_export_csv(
+            ParticipantSearchFilterDto(participation_status="participant"),
+            expand_meetings=False,
+        )
+        await stream.__anext__()  # header
+        await stream.__anext__()  # first page
+        await second_page_started.wait()
+        await stream.aclose()
+
+        self.assertTrue(second_page_cancelled.is_set())
+
     def test_validate_note_tags_allows_valid_combinations(self):
         """Test that valid note tag combinations do not raise."""
         self.service._validate_note_tags(None)
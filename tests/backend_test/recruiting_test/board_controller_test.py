@@ -333,9 +333,28 @@ class TestBoardController(unittest.IsolatedAsyncioTestCase):
         # The controller must parse the raw `stage` string into the enum and
         # forward the page args to the service unchanged.
         self.board_service.get_board_stage_page.assert_awaited_once_with(
-            self.session, self.ctx, 1, ApplicationStage.REJECTED, 20, 0
+            self.session,
+            self.ctx,
+            1,
+            ApplicationStage.REJECTED,
+            20,
+            0,
+            cursor=None,
+            include_total=True,
         )
 
+    async def test_board_stage_page_by_cursor_skips_total_by_default(self):
+        self.board_service.get_board_stage_page = AsyncMock(
+            return_value={"items": [], "total": None, "has_more": False}
+        )
+
+        await self.controller.get_board_stage_page(
+            self.ctx, job_id=1, stage="rejected", cursor="abc"
+        )
+
+        kwargs = self.board_service.get_board_stage_page.await_args.kwargs
+        self.assertEqual(kwargs, {"cursor": "abc", "include_total": False})
+
     async def test_board_stage_page_rejects_bad_stage(self):
         self.board_service.get_board_stage_page = AsyncMock(
             return_value={"items": [], "total": 0, "has_more": False}
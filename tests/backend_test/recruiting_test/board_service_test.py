@@ -6,13 +6,16 @@ from unittest.mock import AsyncMock, MagicMock, call, create_autospec, patch
 from backend.recruiting.application_access import ApplicationAccess
 from backend.recruiting.board_service import (
     SEARCH_RESULT_LIMIT,
+    TERMINAL_PAGE_SIZE,
     TERMINAL_STAGES,
     BoardService,
 )
 from backend.recruiting.interview_scheduling_service import InterviewSchedulingService
+from backend.recruiting.pipeline_owners import normalized_owner_ids
 from backend.mentorship.mentorship_admission_service import (
     MentorshipAdmissionService,
 )
+from backend.repository.application_repository import stage_page_cursor_tag
 from backend.repository.notification_repository import NotificationRepository
 from backend.recruiting.recruiting_mapper import RecruitingMapper
 from backend.dto.board_dto import (
@@ -26,6 +29,7 @@ from backend.dto.board_dto import (
 )
 from backend.dto.user_context_dto import UserContextDto
 from backend.common.communication_enums import ContextType
+from backend.common.keyset_cursor import encode_cursor
 from backend.common.permissions import Permission
 from backend.dto.email_dto import (
     EmailConversationDto,
@@ -180,10 +184,8 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         # Default: candidate has no other applications, so blacklist's
         # close-out-the-rest loop is a no-op unless a test seeds siblings.
         self.app_repo.list_by_user = AsyncMock(return_value=[])
-        # Default: no terminal-stage rows, so get_board's terminal-stage
-        # loop is a no-op (both stages skipped) unless a test seeds pages.
-        self.app_repo.list_by_job_and_stage = AsyncMock(return_value=[])
-        self.app_repo.count_latest_by_job_and_stage = AsyncMock(return_value=0)
+        # Default: an empty board unless a test seeds lanes.
+        self.app_repo.list_board_rows = AsyncMock(return_value=[])
 
     def _notification_repository_double(self):
         """A notification repository whose writes are observable and ordered.
@@ -236,6 +238,18 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         }
         return job
 
+    def _stub_jobs(self, *jobs):
+        """Back list_all/list_by_owner with these jobs, the way the job
+        repository would answer over a table holding exactly them."""
+        self.job_repo.list_all = AsyncMock(return_value=list(jobs))
+        self.job_repo.list_by_owner = AsyncMock(
+            side_effect=lambda session, user_id: [
+                job
+                for job in jobs
+                if user_id in normalized_owner_ids(job.pipeline_config)
+            ]
+        )
+
     def _user(self, user_id=2, first="A", last="B", email="a@b.com"):
         u = UsersEntity(first_name=first, last_name=last)
         u.user_id = user_id
@@ -759,7 +773,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
     async def test_list_my_jobs_returns_only_owned_jobs(self):
         job_a = self._job(job_id=1, owner_ids=(2,))
         job_b = self._job(job_id=2, owner_ids=(9,))
-        self.job_repo.list_all = AsyncMock(return_value=[job_a, job_b])
+        self._stub_jobs(job_a, job_b)
 
         result = await self.service.list_my_jobs(self.session, self._ctx(user_id=2))
 
@@ -769,6 +783,8 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
             [(s.stage, s.rounds) for s in result[0].stages],
             [("recruiter_screening", 1), ("tech", 1)],
         )
+        self.job_repo.list_by_owner.assert_awaited_once_with(self.session, 2)
+        self.job_repo.list_all.assert_not_called()
 
     async def test_list_my_jobs_reports_configured_rounds_per_stage(self):
         job = self._job(
@@ -777,7 +793,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
             stages=("recruiter_screening", "tech"),
             rounds={"tech": 3},
         )
-        self.job_repo.list_all = AsyncMock(return_value=[job])
+        self._stub_jobs(job)
 
         result = await self.service.list_my_jobs(self.session, self._ctx(user_id=2))
 
@@ -788,7 +804,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
 
     async def test_list_my_jobs_empty_when_not_owner_of_any(self):
         job_a = self._job(job_id=1, owner_ids=(9,))
-        self.job_repo.list_all = AsyncMock(return_value=[job_a])
+        self._stub_jobs(job_a)
 
         result = await self.service.list_my_jobs(self.session, self._ctx(user_id=2))
 
@@ -797,7 +813,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
     async def test_list_my_jobs_returns_all_jobs_for_read_all_holder(self):
         job_a = self._job(job_id=1, owner_ids=(9,))
         job_b = self._job(job_id=2, owner_ids=(8,))
-        self.job_repo.list_all = AsyncMock(return_value=[job_a, job_b])
+        self._stub_jobs(job_a, job_b)
         ctx = UserContextDto(
             sub="s",
             primary_email="hr@b.com",
@@ -808,6 +824,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         result = await self.service.list_my_jobs(self.session, ctx)
 
         self.assertEqual({j.id for j in result}, {1, 2})
+        self.job_repo.list_by_owner.assert_not_called()
 
     # -- search_applicants --
 
@@ -826,9 +843,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         return (application, user)
 
     async def test_search_applicants_rejects_a_job_outside_the_visible_set(self):
-        self.job_repo.list_all = AsyncMock(
-            return_value=[self._job(job_id=1, owner_ids=(9,))]
-        )
+        self._stub_jobs(self._job(job_id=1, owner_ids=(9,)))
 
         with self.assertRaises(ValueError):
             await self.service.search_applicants(
@@ -840,7 +855,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
     async def test_search_applicants_scopes_to_one_job_when_given(self):
         job_a = self._job(job_id=1, owner_ids=(2,))
         job_b = self._job(job_id=2, owner_ids=(2,))
-        self.job_repo.list_all = AsyncMock(return_value=[job_a, job_b])
+        self._stub_jobs(job_a, job_b)
         self.app_repo.search_latest_by_jobs = AsyncMock(return_value=[])
 
         await self.service.search_applicants(
@@ -853,7 +868,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         job_a = self._job(job_id=1, owner_ids=(2,))
         job_b = self._job(job_id=2, owner_ids=(2,))
         job_c = self._job(job_id=3, owner_ids=(9,))
-        self.job_repo.list_all = AsyncMock(return_value=[job_a, job_b, job_c])
+        self._stub_jobs(job_a, job_b, job_c)
         self.app_repo.search_latest_by_jobs = AsyncMock(return_value=[])
 
         await self.service.search_applicants(
@@ -863,9 +878,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.app_repo.search_latest_by_jobs.await_args.args[1], [1, 2])
 
     async def test_search_applicants_returns_nothing_when_no_jobs_are_visible(self):
-        self.job_repo.list_all = AsyncMock(
-            return_value=[self._job(job_id=1, owner_ids=(9,))]
-        )
+        self._stub_jobs(self._job(job_id=1, owner_ids=(9,)))
         self.app_repo.search_latest_by_jobs = AsyncMock(return_value=[])
 
         result = await self.service.search_applicants(
@@ -876,9 +889,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         self.app_repo.search_latest_by_jobs.assert_not_called()
 
     async def test_search_applicants_returns_nothing_for_a_blank_term(self):
-        self.job_repo.list_all = AsyncMock(
-            return_value=[self._job(job_id=1, owner_ids=(2,))]
-        )
+        self._stub_jobs(self._job(job_id=1, owner_ids=(2,)))
         self.app_repo.search_latest_by_jobs = AsyncMock(return_value=[])
 
         result = await self.service.search_applicants(
@@ -890,7 +901,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
 
     async def test_search_applicants_projects_job_title_kind_and_contact_email(self):
         job = self._job(job_id=1, owner_ids=(2,), kind=JobKind.ACTIVITY)
-        self.job_repo.list_all = AsyncMock(return_value=[job])
+        self._stub_jobs(job)
         self.app_repo.search_latest_by_jobs = AsyncMock(
             return_value=[self._hit_row(application_id=10, job_id=1, user_id=5)]
         )
@@ -914,9 +925,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
     async def test_search_applicants_leaves_email_blank_when_the_applicant_has_none(
         self,
     ):
-        self.job_repo.list_all = AsyncMock(
-            return_value=[self._job(job_id=1, owner_ids=(2,))]
-        )
+        self._stub_jobs(self._job(job_id=1, owner_ids=(2,)))
         self.app_repo.search_latest_by_jobs = AsyncMock(
             return_value=[self._hit_row(application_id=10, job_id=1, user_id=5)]
         )
@@ -933,9 +942,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
     async def test_search_applicants_asks_for_one_row_past_the_cap_and_flags_truncation(
         self,
     ):
-        self.job_repo.list_all = AsyncMock(
-            return_value=[self._job(job_id=1, owner_ids=(2,))]
-        )
+        self._stub_jobs(self._job(job_id=1, owner_ids=(2,)))
         rows = [
             self._hit_row(application_id=i, job_id=1, user_id=i)
             for i in range(SEARCH_RESULT_LIMIT + 1)
@@ -956,7 +963,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
     async def test_search_applicants_floats_current_job_hits_to_the_front(self):
         job_a = self._job(job_id=1, owner_ids=(2,))
         job_b = self._job(job_id=2, owner_ids=(2,))
-        self.job_repo.list_all = AsyncMock(return_value=[job_a, job_b])
+        self._stub_jobs(job_a, job_b)
         # Repository order: other job, current job, other job.
         self.app_repo.search_latest_by_jobs = AsyncMock(
             return_value=[
@@ -978,7 +985,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         # the front can never change which rows survive the cap.
         job_a = self._job(job_id=1, owner_ids=(2,))
         job_b = self._job(job_id=2, owner_ids=(2,))
-        self.job_repo.list_all = AsyncMock(return_value=[job_a, job_b])
+        self._stub_jobs(job_a, job_b)
         # SEARCH_RESULT_LIMIT + 1 rows from the repository, in recency order.
         # Every row belongs to job 2 except the very LAST one, which belongs
         # to job 1 -- the currently-open posting. Under the broken ordering
@@ -1019,8 +1026,8 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
             application_id=12, stage=ApplicationStage.RECRUITER_SCREENING
         )
         user = self._user(user_id=3)
-        self.app_repo.list_by_job = AsyncMock(
-            return_value=[(app1, user), (app2, user), (app3, user)]
+        self.app_repo.list_board_rows = AsyncMock(
+            return_value=[(app1, user, 2), (app2, user, 1), (app3, user, 2)]
         )
 
         result = await self.service.get_board(self.session, self._ctx(user_id=2), 1)
@@ -1052,7 +1059,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
             application_id=10, stage=ApplicationStage.RECRUITER_SCREENING
         )
         user = self._user(user_id=3)
-        self.app_repo.list_by_job = AsyncMock(return_value=[(app, user)])
+        self.app_repo.list_board_rows = AsyncMock(return_value=[(app, user, 1)])
         self.assignment_repo.list_by_application_ids = AsyncMock(
             return_value=[
                 self._assignment(10, ApplicationStage.RECRUITER_SCREENING, 1, 42)
@@ -1084,7 +1091,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
             application_id=10, stage=ApplicationStage.RECRUITER_SCREENING
         )
         user = self._user(user_id=3)
-        self.app_repo.list_by_job = AsyncMock(return_value=[(app, user)])
+        self.app_repo.list_board_rows = AsyncMock(return_value=[(app, user, 1)])
         self.users_repo.get_all_by_ids = AsyncMock(
             return_value=[self._user(user_id=99, first="Default", last="Person")]
         )
@@ -1103,7 +1110,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
             application_id=10, stage=ApplicationStage.RECRUITER_SCREENING
         )
         user = self._user(user_id=3)
-        self.app_repo.list_by_job = AsyncMock(return_value=[(app, user)])
+        self.app_repo.list_board_rows = AsyncMock(return_value=[(app, user, 1)])
 
         result = await self.service.get_board(self.session, self._ctx(user_id=2), 1)
 
@@ -1127,7 +1134,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         )
         app.current_round = 2
         user = self._user(user_id=3)
-        self.app_repo.list_by_job = AsyncMock(return_value=[(app, user)])
+        self.app_repo.list_board_rows = AsyncMock(return_value=[(app, user, 1)])
         self.users_repo.get_all_by_ids = AsyncMock(
             return_value=[self._user(user_id=99, first="Default", last="Person")]
         )
@@ -1143,7 +1150,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         self.job_repo.get_by_job_id = AsyncMock(return_value=job)
         app = self._application(application_id=10, stage=ApplicationStage.OFFER)
         user = self._user(user_id=3)
-        self.app_repo.list_by_job = AsyncMock(return_value=[(app, user)])
+        self.app_repo.list_board_rows = AsyncMock(return_value=[(app, user, 1)])
         # Contrived: even if an assignment row happened to exist for this
         # (application, stage, round), OFFER isn't in INTERVIEW_STAGES, so
         # it must never surface as a reviewer.
@@ -1164,7 +1171,7 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
     async def test_get_board_succeeds_for_read_all_non_owner(self):
         job = self._job(job_id=1, owner_ids=(9,))
         self.job_repo.get_by_job_id = AsyncMock(return_value=job)
-        self.app_repo.list_by_job = AsyncMock(return_value=[])
+        self.app_repo.list_board_rows = AsyncMock(return_value=[])
         ctx = UserContextDto(
             sub="s",
             primary_email="hr@b.com",
@@ -1183,7 +1190,6 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
             application_id=10, stage=ApplicationStage.RECRUITER_SCREENING
         )
         active_user = self._user(user_id=3)
-        self.app_repo.list_by_job = AsyncMock(return_value=[(active_app, active_user)])
 
         rejected_rows = [
             (
@@ -1196,32 +1202,51 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
             )
             for i in range(25)
         ]
-
-        def _count(session, job_id, stage):
-            return 25 if stage == ApplicationStage.REJECTED else 0
-
-        def _page(session, job_id, stage, limit, offset):
-            if stage != ApplicationStage.REJECTED:
-                return []
-            return rejected_rows[offset : offset + limit]
-
-        self.app_repo.count_latest_by_job_and_stage = AsyncMock(side_effect=_count)
-        self.app_repo.list_by_job_and_stage = AsyncMock(side_effect=_page)
+        # The repository cuts each terminal lane to its first page plus one
+        # look-ahead row, each row carrying the whole lane's total.
+        self.app_repo.list_board_rows = AsyncMock(
+            return_value=[(active_app, active_user, 1)]
+            + [(app, user, 25) for app, user in rejected_rows[:21]]
+        )
 
         board = await self.service.get_board(self.session, self._ctx(user_id=2), 1)
 
         active = board["stages"]["recruiter_screening"]
         self.assertFalse(active["has_more"])
         self.assertEqual(active["total"], len(active["items"]))
+        self.assertEqual([c.id for c in active["items"]], [10])
 
         rej = board["stages"]["rejected"]
         self.assertEqual(len(rej["items"]), 20)
+        self.assertEqual(
+            [c.id for c in rej["items"]],
+            [app.application_id for app, _ in rejected_rows[:20]],
+        )
         self.assertEqual(rej["total"], 25)
         self.assertTrue(rej["has_more"])
+        last = rejected_rows[19][0]
+        self.assertEqual(
+            rej["next_cursor"],
+            encode_cursor(
+                stage_page_cursor_tag(last.job_id, last.stage),
+                last.stage_entered_at,
+                last.application_id,
+            ),
+        )
+        self.assertNotIn("hired", board["stages"])
 
-        self.app_repo.list_by_job.assert_awaited_once_with(
-            self.session, 1, exclude_stages=set(TERMINAL_STAGES)
+        self.app_repo.list_board_rows.assert_awaited_once_with(
+            self.session,
+            1,
+            paged_stages=set(TERMINAL_STAGES),
+            paged_limit=TERMINAL_PAGE_SIZE + 1,
+        )
+        # Reviewer/contact lookups run once for every lane together.
+        self.assignment_repo.list_by_application_ids.assert_awaited_once()
+        self.assertEqual(
+            len(self.assignment_repo.list_by_application_ids.await_args.args[1]), 21
         )
+        self.user_emails_repo.get_contact_emails_by_user_ids.assert_awaited_once()
 
     async def test_get_board_stage_page_second_page(self):
         job = self._job(job_id=1, owner_ids=(2,))
@@ -1254,8 +1279,56 @@ class TestBoardService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(page["items"]), 5)
         self.assertEqual(page["total"], 25)
         self.assertFalse(page["has_more"])
+        self.assertIsNone(page["next_cursor"])
+        self.app_repo.list_by_job_and_stage.assert_awaited_once_with(
+            self.session, 1, ApplicationStage.REJECTED, limit=21, offset=20, cursor=None
+        )
+
+    async def test_get_board_stage_page_by_cursor_skips_the_count(self):
+        job = self._job(job_id=1, owner_ids=(2,))
+        self.job_repo.get_by_job_id = AsyncMock(return_value=job)
+        rows = [
+            (
+                self._application(
+                    application_id=200 - i,
+                    user_id=100 + i,
+                    stage=ApplicationStage.REJECTED,
+                ),
+                self._user(user_id=100 + i),
+            )
+            for i in range(3)
+        ]
+        for app, _ in rows:
+            app.stage_entered_at = datetime(2026, 9, 1, tzinfo=timezone.utc)
+        self.app_repo.count_latest_by_job_and_stage = AsyncMock(return_value=25)
+        self.app_repo.list_by_job_and_stage = AsyncMock(return_value=rows)
+
+        page = await self.service.get_board_stage_page(
+            self.session,
+            self._ctx(user_id=2),
+            1,
+            ApplicationStage.REJECTED,
+            limit=2,
+            offset=0,
+            cursor="prev",
+            include_total=False,
+        )
+
+        self.assertEqual(len(page["items"]), 2)
+        self.assertIsNone(page["total"])
+        self.assertTrue(page["has_more"])
+        last = rows[1][0]
+        self.assertEqual(
+            page["next_cursor"],
+            encode_cursor(
+                stage_page_cursor_tag(last.job_id, last.stage),
+                last.stage_entered_at,
+                last.application_id,
+            ),
+        )
+        self.app_repo.count_latest_by_job_and_stage.assert_not_awaited()
         self.app_repo.list_by_job_and_stage.assert_awaited_once_with(
-            self.session, 1, ApplicationStage.REJECTED, limit=20, offset=20
+            self.session, 1, ApplicationStage.REJECTED, limit=3, offset=0, cursor="prev"
         )
 
     async def test_get_board_stage_page_requires_owner(self):
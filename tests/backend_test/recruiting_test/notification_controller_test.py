@@ -45,7 +45,7 @@ class TestRecruitingNotificationController(unittest.IsolatedAsyncioTestCase):
         resp = await self.controller.list_notifications(self.ctx)
 
         self.notification_service.list_for_user.assert_awaited_once_with(
-            self.session, 2, limit=20, offset=0
+            self.session, 2, limit=20, offset=0, cursor=None
         )
         self.assertEqual(resp["data"], result)
 
@@ -53,7 +53,14 @@ class TestRecruitingNotificationController(unittest.IsolatedAsyncioTestCase):
         await self.controller.list_notifications(self.ctx, limit=5, offset=10)
 
         self.notification_service.list_for_user.assert_awaited_once_with(
-            self.session, 2, limit=5, offset=10
+            self.session, 2, limit=5, offset=10, cursor=None
+        )
+
+    async def test_list_notifications_passes_through_cursor(self):
+        await self.controller.list_notifications(self.ctx, cursor="abc")
+
+        self.notification_service.list_for_user.assert_awaited_once_with(
+            self.session, 2, limit=20, offset=0, cursor="abc"
         )
 
     async def test_dismiss_delegates(self):
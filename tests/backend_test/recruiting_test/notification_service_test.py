@@ -2,6 +2,7 @@ import unittest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, create_autospec
 
+from backend.common.keyset_cursor import encode_cursor
 from backend.common.recruiting_enums import (
     ApplicationStage,
     JobKind,
@@ -15,7 +16,10 @@ from backend.entity.users_entity import UsersEntity
 from backend.recruiting.notification_service import RecruitingNotificationService
 from backend.repository.application_repository import ApplicationRepository
 from backend.repository.job_repository import JobRepository
-from backend.repository.notification_repository import NotificationRepository
+from backend.repository.notification_repository import (
+    NotificationRepository,
+    notification_page_cursor_tag,
+)
 from backend.repository.users_repository import UsersRepository
 
 
@@ -31,10 +35,11 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
         )
 
     def _notification(self, event=None, **overrides):
-        """A notification row plus the event it points at.
+        """A notification row paired with the event it points at.
 
         The event is what the service reads to say what happened, so it is
-        stubbed onto the session here rather than left to a bare mock.
+        returned with the row as the repository's joined query does, rather
+        than left to a bare mock.
         """
         entity = NotificationEntity(
             user_id=overrides.get("user_id", 2),
@@ -42,12 +47,12 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
             created_at=overrides.get("created_at", datetime.now(timezone.utc)),
         )
         entity.notification_id = overrides.get("notification_id", 1)
-        self._stub_event(
+        return (
+            entity,
             event
             if event is not None
-            else self._event(event_type="recruiting.reassigned")
+            else self._event(event_type="recruiting.reassigned"),
         )
-        return entity
 
     def _event(self, **overrides):
         defaults = dict(
@@ -62,12 +67,14 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
         event.event_id = overrides.get("event_id", 5)
         return event
 
-    def _stub_event(self, event):
-        self.session.get = AsyncMock(return_value=event)
+    def _stub_lookups(self, applications=(), jobs=(), users=()):
+        self.app_repo.get_by_ids = AsyncMock(return_value=list(applications))
+        self.job_repo.get_by_job_ids = AsyncMock(return_value=list(jobs))
+        self.users_repo.get_all_by_ids = AsyncMock(return_value=list(users))
 
     async def test_list_for_user_resolves_application_scoped_display_fields(self):
         row = self._notification()
-        self.notification_repo.list_by_user = AsyncMock(return_value=[row])
+        self.notification_repo.list_with_events_by_user = AsyncMock(return_value=[row])
         self.notification_repo.count_by_user = AsyncMock(return_value=1)
         job = JobEntity(
             kind=JobKind.ACTIVITY, title="Backend Engineer", status=JobStatus.PUBLISHED
@@ -77,17 +84,11 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
             job_id=1, user_id=3, stage=ApplicationStage.RECRUITER_SCREENING
         )
         application.application_id = 10
-        self.app_repo.get_by_id = AsyncMock(return_value=application)
-        self.job_repo.get_by_job_id = AsyncMock(return_value=job)
         applicant = UsersEntity(first_name="Ada", last_name="Lovelace")
         applicant.user_id = 3
         actor = UsersEntity(first_name="Grace", last_name="Hopper")
         actor.user_id = 9
-
-        async def get_user(session, user_id):
-            return {3: applicant, 9: actor}[user_id]
-
-        self.users_repo.get_user_by_user_id = AsyncMock(side_effect=get_user)
+        self._stub_lookups([application], [job], [applicant, actor])
 
         result = await self.service.list_for_user(self.session, user_id=2)
 
@@ -97,6 +98,10 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(item.job_title, "Backend Engineer")
         self.assertEqual(item.applicant_name, "Ada Lovelace")
         self.assertEqual(item.actor_name, "Grace Hopper")
+        self.notification_repo.list_with_events_by_user.assert_awaited_once_with(
+            self.session, 2, 21, 0, cursor=None
+        )
+        self.assertIsNone(result.next_cursor)
 
     async def test_list_for_user_resolves_job_scoped_display_fields(self):
         row = self._notification(
@@ -106,16 +111,15 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
                 event_type="recruiting.review_opened",
             )
         )
-        self.notification_repo.list_by_user = AsyncMock(return_value=[row])
+        self.notification_repo.list_with_events_by_user = AsyncMock(return_value=[row])
         self.notification_repo.count_by_user = AsyncMock(return_value=0)
         job = JobEntity(
             kind=JobKind.ACTIVITY, title="Design Review", status=JobStatus.DRAFT
         )
         job.job_id = 1
-        self.job_repo.get_by_job_id = AsyncMock(return_value=job)
         actor = UsersEntity(first_name="Grace", last_name="Hopper")
         actor.user_id = 9
-        self.users_repo.get_user_by_user_id = AsyncMock(return_value=actor)
+        self._stub_lookups(jobs=[job], users=[actor])
 
         result = await self.service.list_for_user(self.session, user_id=2)
 
@@ -123,7 +127,90 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(item.event_type, "recruiting.review_opened")
         self.assertEqual(item.job_title, "Design Review")
         self.assertEqual(item.applicant_name, "")
-        self.app_repo.get_by_id.assert_not_awaited()
+        self.app_repo.get_by_ids.assert_awaited_once_with(self.session, [])
+
+    async def test_list_for_user_loads_a_page_with_one_query_per_kind(self):
+        """However long the page, each referenced kind is loaded with one query."""
+        jobs = []
+        applications = []
+        users = []
+        rows = []
+        for i in range(1, 21):
+            job = JobEntity(
+                kind=JobKind.ACTIVITY, title=f"Job {i}", status=JobStatus.PUBLISHED
+            )
+            job.job_id = i
+            application = ApplicationEntity(
+                job_id=i, user_id=100 + i, stage=ApplicationStage.TECH
+            )
+            application.application_id = 1000 + i
+            applicant = UsersEntity(first_name="Applicant", last_name=str(i))
+            applicant.user_id = 100 + i
+            jobs.append(job)
+            applications.append(application)
+            users.append(applicant)
+            rows.append(
+                self._notification(
+                    event=self._event(subject_id=1000 + i, actor_id=None),
+                    notification_id=i,
+                )
+            )
+        self.notification_repo.list_with_events_by_user = AsyncMock(return_value=rows)
+        self.notification_repo.count_by_user = AsyncMock(return_value=20)
+        self._stub_lookups(applications, jobs, users)
+
+        result = await self.service.list_for_user(self.session, user_id=2)
+
+        self.assertEqual(
+            [item.job_title for item in result.notifications],
+            [f"Job {i}" for i in range(1, 21)],
+        )
+        self.assertEqual(result.notifications[4].applicant_name, "Applicant 5")
+        self.assertIsNone(result.notifications[0].actor_name)
+        self.app_repo.get_by_ids.assert_awaited_once()
+        self.assertCountEqual(
+            self.app_repo.get_by_ids.await_args.args[1], range(1001, 1021)
+        )
+        self.job_repo.get_by_job_ids.assert_awaited_once()
+        self.users_repo.get_all_by_ids.assert_awaited_once()
+
+    async def test_list_for_user_returns_cursor_of_last_row_when_more_follow(self):
+        created_at = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+        rows = [
+            self._notification(notification_id=3, created_at=created_at),
+            self._notification(notification_id=2, created_at=created_at),
+        ]
+        self.notification_repo.list_with_events_by_user = AsyncMock(return_value=rows)
+        self.notification_repo.count_by_user = AsyncMock(return_value=5)
+        self._stub_lookups()
+
+        result = await self.service.list_for_user(
+            self.session, user_id=2, limit=1, cursor="prev"
+        )
+
+        self.assertEqual([item.id for item in result.notifications], [3])
+        self.assertEqual(
+            result.next_cursor,
+            encode_cursor(notification_page_cursor_tag(2), created_at, 3),
+        )
+        self.notification_repo.list_with_events_by_user.assert_awaited_once_with(
+            self.session, 2, 2, 0, cursor="prev"
+        )
+
+    async def test_list_for_user_tolerates_a_missing_event(self):
+        row, _ = self._notification()
+        self.notification_repo.list_with_events_by_user = AsyncMock(
+            return_value=[(row, None)]
+        )
+        self.notification_repo.count_by_user = AsyncMock(return_value=1)
+        self._stub_lookups()
+
+        result = await self.service.list_for_user(self.session, user_id=2)
+
+        item = result.notifications[0]
+        self.assertEqual(item.event_type, "")
+        self.assertEqual(item.details, {})
+        self.assertIsNone(item.actor_name)
 
     async def test_dismiss_returns_updated_pending_count(self):
         self.notification_repo.dismiss_by_id = AsyncMock(return_value=True)
@@ -149,7 +236,7 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
 
     async def test_list_for_user_carries_job_kind_for_application_scoped_rows(self):
         row = self._notification()
-        self.notification_repo.list_by_user = AsyncMock(return_value=[row])
+        self.notification_repo.list_with_events_by_user = AsyncMock(return_value=[row])
         self.notification_repo.count_by_user = AsyncMock(return_value=1)
         job = JobEntity(
             kind=JobKind.ACTIVITY, title="Mentorship", status=JobStatus.PUBLISHED
@@ -159,11 +246,9 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
             job_id=3, user_id=4, stage=ApplicationStage.TECH
         )
         application.application_id = 10
-        self.app_repo.get_by_id = AsyncMock(return_value=application)
-        self.job_repo.get_by_job_id = AsyncMock(return_value=job)
-        self.users_repo.get_user_by_user_id = AsyncMock(
-            return_value=UsersEntity(first_name="Ada", last_name="Lovelace")
-        )
+        applicant = UsersEntity(first_name="Ada", last_name="Lovelace")
+        applicant.user_id = 4
+        self._stub_lookups([application], [job], [applicant])
 
         result = await self.service.list_for_user(self.session, 2)
 
@@ -171,10 +256,9 @@ class TestRecruitingNotificationService(unittest.IsolatedAsyncioTestCase):
 
     async def test_list_for_user_leaves_job_kind_none_when_the_job_is_missing(self):
         row = self._notification(application_id=None, job_id=7)
-        self.notification_repo.list_by_user = AsyncMock(return_value=[row])
+        self.notification_repo.list_with_events_by_user = AsyncMock(return_value=[row])
         self.notification_repo.count_by_user = AsyncMock(return_value=1)
-        self.job_repo.get_by_job_id = AsyncMock(return_value=None)
-        self.users_repo.get_user_by_user_id = AsyncMock(return_value=None)
+        self._stub_lookups()
 
         result = await self.service.list_for_user(self.session, 2)
 
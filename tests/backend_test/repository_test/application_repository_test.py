@@ -60,6 +60,20 @@ class TestApplicationRepository(BaseRepositoryTestLib):
             entity.stage_entered_at = stage_entered_at
         return await self.repo.create(self.session, entity)
 
+    async def test_get_by_ids_returns_only_existing_applications(self):
+        first = await self._make_application()
+        second = await self._make_application()
+
+        found = await self.repo.get_by_ids(
+            self.session, [first.application_id, second.application_id, 999999]
+        )
+
+        self.assertCountEqual(
+            [a.application_id for a in found],
+            [first.application_id, second.application_id],
+        )
+        self.assertEqual(await self.repo.get_by_ids(self.session, []), [])
+
     async def test_create_and_get_latest_by_job_and_user(self):
         job, user = await self._seed_job_and_user()
         repo = ApplicationRepository()
@@ -824,6 +838,86 @@ class TestApplicationRepository(BaseRepositoryTestLib):
         self.assertEqual(total, len(page))
         self.assertEqual(total, 2)
 
+    async def test_list_board_rows_pages_terminal_lanes_with_totals(self):
+        job = JobEntity(kind=JobKind.ACTIVITY, title="T", status=JobStatus.PUBLISHED)
+        users = [_make_user(f"U{i}", "Board", f"board{i}@b.com") for i in range(6)]
+        await self.insert_entities([job, *users])
+        await self.session.flush()
+
+        repo = ApplicationRepository()
+        # A superseded rejected attempt: history, never a card or a count.
+        await repo.create(
+            self.session,
+            ApplicationEntity(
+                job_id=job.job_id,
+                user_id=users[0].user_id,
+                stage=ApplicationStage.REJECTED,
+                stage_entered_at=datetime(2026, 1, 9, tzinfo=timezone.utc),
+            ),
+        )
+        active_1 = await repo.create(
+            self.session,
+            ApplicationEntity(
+                job_id=job.job_id,
+                user_id=users[0].user_id,
+                stage=ApplicationStage.APPLIED,
+            ),
+        )
+        active_2 = await repo.create(
+            self.session,
+            ApplicationEntity(
+                job_id=job.job_id,
+                user_id=users[1].user_id,
+                stage=ApplicationStage.APPLIED,
+            ),
+        )
+        rejected = []
+        for day, user in zip((1, 3, 2), users[2:5]):
+            rejected.append(
+                await repo.create(
+                    self.session,
+                    ApplicationEntity(
+                        job_id=job.job_id,
+                        user_id=user.user_id,
+                        stage=ApplicationStage.REJECTED,
+                        stage_entered_at=datetime(2026, 1, day, tzinfo=timezone.utc),
+                    ),
+                )
+            )
+        hired = await repo.create(
+            self.session,
+            ApplicationEntity(
+                job_id=job.job_id,
+                user_id=users[5].user_id,
+                stage=ApplicationStage.HIRED,
+            ),
+        )
+
+        rows = await repo.list_board_rows(
+            self.session,
+            job.job_id,
+            paged_stages={ApplicationStage.REJECTED, ApplicationStage.HIRED},
+            paged_limit=2,
+        )
+
+        by_stage: dict = {}
+        for application, user, total in rows:
+            self.assertEqual(application.user_id, user.user_id)
+            by_stage.setdefault(application.stage, []).append((
+                application.application_id,
+                total,
+            ))
+        self.assertEqual(
+            by_stage[ApplicationStage.APPLIED],
+            [(active_1.application_id, 2), (active_2.application_id, 2)],
+        )
+        # Newest entry first, cut to the limit, total counting the whole lane.
+        self.assertEqual(
+            by_stage[ApplicationStage.REJECTED],
+            [(rejected[1].application_id, 3), (rejected[2].application_id, 3)],
+        )
+        self.assertEqual(by_stage[ApplicationStage.HIRED], [(hired.application_id, 1)])
+
     async def test_list_by_job_exclude_stages_drops_terminal(self):
         job = JobEntity(kind=JobKind.ACTIVITY, title="T", status=JobStatus.PUBLISHED)
         applied_user = _make_user("A", "One", "exclude-applied@b.com")
@@ -107,6 +107,88 @@ class TestJobRepository(BaseRepositoryTestLib):
         fetched = await self.repo.get_by_job_id(self.session, job_id)
         self.assertIsNone(fetched)
 
+    async def test_get_by_job_ids_returns_only_existing_jobs(self):
+        first = await self.repo.create_job(
+            self.session,
+            JobEntity(kind=JobKind.ACTIVITY, title="First", status=JobStatus.DRAFT),
+        )
+        second = await self.repo.create_job(
+            self.session,
+            JobEntity(kind=JobKind.EMPLOYMENT, title="Second", status=JobStatus.DRAFT),
+        )
+
+        found = await self.repo.get_by_job_ids(
+            self.session, [first.job_id, second.job_id, 999999]
+        )
+
+        self.assertCountEqual([j.title for j in found], ["First", "Second"])
+        self.assertEqual(await self.repo.get_by_job_ids(self.session, []), [])
+
+    async def test_list_by_owner_matches_both_owner_shapes(self):
+        """list_by_owner finds owners in ownerIds and in the legacy ownerId."""
+        multi = await self.repo.create_job(
+            self.session,
+            JobEntity(
+                kind=JobKind.ACTIVITY,
+                title="Multi",
+                status=JobStatus.DRAFT,
+                pipeline_config={"ownerIds": [5, 6]},
+            ),
+        )
+        legacy = await self.repo.create_job(
+            self.session,
+            JobEntity(
+                kind=JobKind.ACTIVITY,
+                title="Legacy",
+                status=JobStatus.DRAFT,
+                pipeline_config={"ownerIds": [], "ownerId": 5},
+            ),
+        )
+        await self.repo.create_job(
+            self.session,
+            JobEntity(
+                kind=JobKind.ACTIVITY,
+                title="Other",
+                status=JobStatus.DRAFT,
+                pipeline_config={"ownerIds": [7]},
+            ),
+        )
+        await self.repo.create_job(
+            self.session,
+            JobEntity(kind=JobKind.ACTIVITY, title="Unowned", status=JobStatus.DRAFT),
+        )
+
+        owned = await self.repo.list_by_owner(self.session, 5)
+
+        self.assertEqual(
+            [j.job_id for j in owned], sorted([multi.job_id, legacy.job_id])
+        )
+        self.assertEqual(
+            [j.title for j in await self.repo.list_by_owner(self.session, 6)],
+            ["Multi"],
+        )
+
+    async def test_list_by_owner_follows_pipeline_config_updates(self):
+        """The owner index is regenerated on update_job, so ownership moves."""
+        job = await self.repo.create_job(
+            self.session,
+            JobEntity(
+                kind=JobKind.ACTIVITY,
+                title="Handover",
+                status=JobStatus.DRAFT,
+                pipeline_config={"ownerIds": [5]},
+            ),
+        )
+
+        job.pipeline_config = {"ownerIds": [8]}
+        await self.repo.update_job(self.session, job)
+
+        self.assertEqual(await self.repo.list_by_owner(self.session, 5), [])
+        self.assertEqual(
+            [j.job_id for j in await self.repo.list_by_owner(self.session, 8)],
+            [job.job_id],
+        )
+
     async def test_config_columns_round_trip(self):
         """create_job round-trips screen_rules/profile_config/pipeline_config."""
         repo = JobRepository()
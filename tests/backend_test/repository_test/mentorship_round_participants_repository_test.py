@@ -432,7 +432,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         await self.insert_entities([user2])
         await self._hire_for_activity(user2)
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session, ParticipantSearchFilterDto(), limit=50, offset=0
         )
 
@@ -457,7 +457,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             category=TrainingCategory.RESIDENCY_PROGRAM_ONBOARDING,
         )
 
-        rows, _ = await self.repo.search_participants_for_admin(
+        rows, _, _ = await self.repo.search_participants_for_admin(
             self.session, ParticipantSearchFilterDto(), limit=20, offset=0
         )
 
@@ -503,7 +503,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             non_participant_user, category=TrainingCategory.MENTORSHIP_MENTEE_ONBOARDING
         )
 
-        rows, _ = await self.repo.search_participants_for_admin(
+        rows, _, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(onboarding_status="completed"),
             limit=20,
@@ -549,13 +549,13 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             category=TrainingCategory.MENTORSHIP_MENTEE_ONBOARDING,
         )
 
-        completed_rows, _ = await self.repo.search_participants_for_admin(
+        completed_rows, _, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(onboarding_status="completed"),
             limit=20,
             offset=0,
         )
-        incomplete_rows, _ = await self.repo.search_participants_for_admin(
+        incomplete_rows, _, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(onboarding_status="incomplete"),
             limit=20,
@@ -617,7 +617,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         ])
         # no_application_user has no application at all (recruiting first-login only).
 
-        rows, _ = await self.repo.search_participants_for_admin(
+        rows, _, _ = await self.repo.search_participants_for_admin(
             self.session, ParticipantSearchFilterDto(), limit=20, offset=0
         )
 
@@ -638,7 +638,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         await self.insert_entities([inactive_user])
         await self._hire_for_activity(inactive_user)
 
-        rows, _ = await self.repo.search_participants_for_admin(
+        rows, _, _ = await self.repo.search_participants_for_admin(
             self.session, ParticipantSearchFilterDto(), limit=20, offset=0
         )
 
@@ -651,7 +651,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         )
         await self.insert_entities([user2])
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(user_id=self.user.user_id),
             limit=50,
@@ -678,7 +678,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         await self._hire_for_activity(bob_jones)
         await self._hire_for_activity(rosalie_wu)
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(name="ali"),
             limit=50,
@@ -705,7 +705,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             )
         ])
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(email="alice@work"),
             limit=50,
@@ -731,7 +731,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             ),
         ])
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(round_id=self.rounds[0].round_id),
             limit=50,
@@ -759,7 +759,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             ),
         ])
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(participant_role=ParticipantRole.MENTOR),
             limit=50,
@@ -787,7 +787,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             ),
         ])
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(approval_status=ApprovalStatus.MATCHED),
             limit=50,
@@ -809,7 +809,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             ),
         ])
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(participation_status="participant"),
             limit=50,
@@ -832,7 +832,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             ),
         ])
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(participation_status="non_participant"),
             limit=50,
@@ -874,7 +874,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             )
         ])
 
-        rows, total = await self.repo.search_participants_for_admin(
+        rows, total, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(matched_user="jones"),
             limit=50,
@@ -895,10 +895,10 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         for extra_user in extra_users:
             await self._hire_for_activity(extra_user)
 
-        rows_p1, total = await self.repo.search_participants_for_admin(
+        rows_p1, total, _ = await self.repo.search_participants_for_admin(
             self.session, ParticipantSearchFilterDto(), limit=2, offset=0
         )
-        rows_p2, _ = await self.repo.search_participants_for_admin(
+        rows_p2, _, _ = await self.repo.search_participants_for_admin(
             self.session, ParticipantSearchFilterDto(), limit=2, offset=2
         )
 
@@ -909,6 +909,38 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
             len({r.user_id for r in rows_p1} & {r.user_id for r in rows_p2}), 0
         )
 
+    async def test_search_cursor_pages_match_offset_order(self):
+        extra_users = [
+            self._make_user(
+                first_name=f"User{i}", last_name="Test", email=f"kc{i}@example.com"
+            )
+            for i in range(3)
+        ]
+        await self.insert_entities(extra_users)
+        for extra_user in extra_users:
+            await self._hire_for_activity(extra_user)
+
+        expected, _, _ = await self.repo.search_participants_for_admin(
+            self.session, ParticipantSearchFilterDto(), limit=10, offset=0
+        )
+        walked = []
+        cursor = None
+        while True:
+            rows, total, cursor = await self.repo.search_participants_for_admin(
+                self.session,
+                ParticipantSearchFilterDto(),
+                limit=1,
+                offset=0,
+                cursor=cursor,
+                include_total=False,
+            )
+            self.assertIsNone(total)
+            walked.extend(r.user_id for r in rows)
+            if cursor is None:
+                break
+
+        self.assertEqual(walked, [r.user_id for r in expected])
+
     async def test_search_sort_by_user_id_desc(self):
         user2 = self._make_user(
             first_name="Bob", last_name="Jones", email="bob@example.com"
@@ -916,7 +948,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         await self.insert_entities([user2])
         await self._hire_for_activity(user2)
 
-        rows, _ = await self.repo.search_participants_for_admin(
+        rows, _, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(),
             limit=50,
@@ -959,7 +991,7 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         )
         await self.insert_entities([pair])
 
-        rows, _ = await self.repo.search_participants_for_admin(
+        rows, _, _ = await self.repo.search_participants_for_admin(
             self.session,
             ParticipantSearchFilterDto(user_id=self.user.user_id),
             limit=50,
@@ -975,27 +1007,30 @@ class TestMentorshipRoundParticipantsRepository(BaseRepositoryTestLib):
         self.assertEqual(row.mentor_id, self.user.user_id)
         self.assertEqual(row.mentee_id, user2.user_id)
 
-    async def test_iter_search_participants_for_admin_respects_limit_and_offset(self):
-        """limit/offset paginate the same way search_participants_for_admin does."""
+    async def test_iter_search_participants_for_admin_pages_by_cursor(self):
+        """limit/cursor page through the same order search_participants_for_admin uses."""
         second_user = self._make_user(
             first_name="Zoe", last_name="Zephyr", email="zoe@example.com"
         )
         await self.insert_entities([second_user])
         await self._hire_for_activity(second_user)
 
-        all_rows = await self.repo.iter_search_participants_for_admin(
-            self.session, ParticipantSearchFilterDto(), limit=1000, offset=0
+        all_rows, cursor = await self.repo.iter_search_participants_for_admin(
+            self.session, ParticipantSearchFilterDto(), limit=1000
         )
         self.assertEqual(len(all_rows), 2)
+        self.assertIsNone(cursor)
 
-        first_page = await self.repo.iter_search_participants_for_admin(
-            self.session, ParticipantSearchFilterDto(), limit=1, offset=0
+        first_page, cursor = await self.repo.iter_search_participants_for_admin(
+            self.session, ParticipantSearchFilterDto(), limit=1
         )
-        second_page = await self.repo.iter_search_participants_for_admin(
-            self.session, ParticipantSearchFilterDto(), limit=1, offset=1
+        self.assertIsNotNone(cursor)
+        second_page, last_cursor = await self.repo.iter_search_participants_for_admin(
+            self.session, ParticipantSearchFilterDto(), limit=1, cursor=cursor
         )
         self.assertEqual(len(first_page), 1)
         self.assertEqual(len(second_page), 1)
+        self.assertIsNone(last_cursor)
         self.assertEqual(first_page[0].user_id, all_rows[0].user_id)
         self.assertEqual(second_page[0].user_id, all_rows[1].user_id)
         self.assertNotEqual(first_page[0].user_id, second_page[0].user_id)
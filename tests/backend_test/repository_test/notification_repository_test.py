@@ -100,6 +100,24 @@ class TestNotificationRepository(BaseRepositoryTestLib):
             [second.notification_id, first.notification_id],
         )
 
+    async def test_list_with_events_by_user_pairs_each_row_with_its_event(self):
+        _app, recipient = await self._seed()
+        repo = NotificationRepository()
+        created = await repo.create(
+            self.session,
+            NotificationEntity(
+                user_id=recipient.user_id,
+                event_id=self.event.event_id,
+            ),
+        )
+
+        result = await repo.list_with_events_by_user(self.session, recipient.user_id)
+
+        self.assertEqual(len(result), 1)
+        notification, event = result[0]
+        self.assertEqual(notification.notification_id, created.notification_id)
+        self.assertEqual(event.event_id, self.event.event_id)
+
     async def test_count_by_user_only_counts_that_user(self):
         _app, recipient = await self._seed()
         other = _make_user()
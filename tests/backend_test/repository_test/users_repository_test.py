@@ -183,13 +183,13 @@ class TestUsersRepository(BaseRepositoryTestLib):
             ),
         ])
 
-        page1, total = await self.repo.list_users(
+        page1, total, _ = await self.repo.list_users(
             self.session, search=token, limit=1, offset=0
         )
         self.assertEqual(total, 2)
         self.assertEqual(len(page1), 1)
 
-        page2, total2 = await self.repo.list_users(
+        page2, total2, _ = await self.repo.list_users(
             self.session, search=token, limit=1, offset=1
         )
         self.assertEqual(total2, 2)
@@ -201,7 +201,9 @@ class TestUsersRepository(BaseRepositoryTestLib):
         await self.insert_entities([
             self._make_user(first_name=f"Name{token}", email="byname@example.com"),
         ])
-        by_name, total = await self.repo.list_users(self.session, search=token.upper())
+        by_name, total, _ = await self.repo.list_users(
+            self.session, search=token.upper()
+        )
         self.assertEqual(total, 1)
         self.assertEqual(by_name[0][0].first_name, f"Name{token}")
 
@@ -215,7 +217,9 @@ class TestUsersRepository(BaseRepositoryTestLib):
         )
         await self.insert_entities([target, other])
 
-        rows, total = await self.repo.list_users(self.session, user_id=target.user_id)
+        rows, total, _ = await self.repo.list_users(
+            self.session, user_id=target.user_id
+        )
         self.assertEqual(total, 1)
         self.assertEqual(rows[0][0].user_id, target.user_id)
 
@@ -227,7 +231,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         await self.insert_entities([match])
 
         # user_id matches but search does not -> no rows (filters are ANDed).
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, user_id=match.user_id, search="no-such-token-xyz"
         )
         self.assertEqual(total, 0)
@@ -239,7 +243,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         await self.insert_entities([user])
         await self.repo.set_internal(self.session, user.user_id)
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, limit=10, offset=0
         )
         self.assertEqual(total, 1)
@@ -261,7 +265,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
             )
         ])
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, limit=10, offset=0
         )
         self.assertEqual(total, 1)
@@ -273,7 +277,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         user = self._make_user(email=f"noident-{token}@example.com")
         await self.insert_entities([user])
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, limit=10, offset=0
         )
         self.assertEqual(total, 1)
@@ -286,7 +290,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         user.preferred_name = "Zoe Preferred"
         await self.insert_entities([user])
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, limit=10, offset=0
         )
         self.assertEqual(total, 1)
@@ -299,7 +303,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         # preferred_name not set → defaults to None
         await self.insert_entities([user])
 
-        rows, _ = await self.repo.list_users(
+        rows, _, _ = await self.repo.list_users(
             self.session, search=token, limit=10, offset=0
         )
         entity, _ = rows[0]
@@ -556,7 +560,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         ]
         await self.insert_entities(users)
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session,
             search=token,
             sort_by="last_name",
@@ -583,7 +587,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         ]
         await self.insert_entities(users)
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session,
             search=token,
             sort_by="last_name",
@@ -610,7 +614,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         ]
         await self.insert_entities(users)
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, sort_by="last_name", order="desc"
         )
         self.assertEqual(total, 4)
@@ -619,7 +623,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
             [f"Zhu-{token}", f"zhao-{token}", f"Wang-{token}", f"w-{token}"],
         )
 
-        rows, _ = await self.repo.list_users(
+        rows, _, _ = await self.repo.list_users(
             self.session, search=token, sort_by="last_name", order="asc"
         )
         self.assertEqual(
@@ -654,17 +658,49 @@ class TestUsersRepository(BaseRepositoryTestLib):
         users[2].preferred_name = "ant"
         await self.insert_entities(users)
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, sort_by="preferred_name", order="asc"
         )
         self.assertEqual(total, 3)
         self.assertEqual([r[0].preferred_name for r in rows], ["ant", "Bee", None])
 
-        rows, _ = await self.repo.list_users(
+        rows, _, _ = await self.repo.list_users(
             self.session, search=token, sort_by="preferred_name", order="desc"
         )
         self.assertEqual([r[0].preferred_name for r in rows], ["Bee", "ant", None])
 
+    async def test_list_users_cursor_pages_match_offset_pages(self):
+        """Walking by next_cursor yields the offset order, NULLs last, no COUNT."""
+        token = uuid.uuid4().hex[:10]
+        users = [self._make_user(email=f"kc{i}-{token}@example.com") for i in range(4)]
+        users[0].preferred_name = "Bee"
+        users[1].preferred_name = None
+        users[2].preferred_name = "ant"
+        users[3].preferred_name = "bee"
+        await self.insert_entities(users)
+
+        expected, _, _ = await self.repo.list_users(
+            self.session, search=token, sort_by="preferred_name", order="desc"
+        )
+        walked = []
+        cursor = None
+        while True:
+            rows, total, cursor = await self.repo.list_users(
+                self.session,
+                search=token,
+                limit=1,
+                sort_by="preferred_name",
+                order="desc",
+                cursor=cursor,
+                include_total=False,
+            )
+            self.assertIsNone(total)
+            walked.extend(r[0].user_id for r in rows)
+            if cursor is None:
+                break
+        self.assertEqual(walked, [r[0].user_id for r in expected])
+        self.assertIsNone(expected[-1][0].preferred_name)
+
     async def test_list_users_default_order_is_by_user_id(self):
         """No sort_by → deterministic ascending user_id order."""
         token = uuid.uuid4().hex[:10]
@@ -681,7 +717,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         ]
         await self.insert_entities(users)
 
-        rows, total = await self.repo.list_users(self.session, search=token)
+        rows, total, _ = await self.repo.list_users(self.session, search=token)
         self.assertEqual(total, 3)
         ids = [r[0].user_id for r in rows]
         self.assertEqual(
@@ -697,7 +733,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         ]
         await self.insert_entities(users)
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, sort_by="nonexistent_column"
         )
         self.assertEqual(total, 2)
@@ -712,7 +748,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         await self.insert_entities([super_user, regular_user])
         await self.repo.set_super_admin(self.session, super_user.user_id, True)
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, is_super_admin=True
         )
         self.assertEqual(total, 1)
@@ -728,7 +764,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         await self.insert_entities([super_user, regular_user])
         await self.repo.set_super_admin(self.session, super_user.user_id, True)
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, is_super_admin=False
         )
         self.assertEqual(total, 1)
@@ -751,7 +787,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
             ),
         ])
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, user_type="internal"
         )
         self.assertEqual(total, 1)
@@ -775,7 +811,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
             ),
         ])
 
-        rows, total = await self.repo.list_users(
+        rows, total, _ = await self.repo.list_users(
             self.session, search=token, user_type="external"
         )
         self.assertEqual(total, 2)
@@ -796,7 +832,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
         await self.insert_entities([internal_user, external_user])
         await self.repo.set_internal(self.session, internal_user.user_id)
 
-        asc_rows, _ = await self.repo.list_users(
+        asc_rows, _, _ = await self.repo.list_users(
             self.session, search=token, sort_by="user_type", order="asc"
         )
         self.assertEqual(
@@ -805,7 +841,7 @@ class TestUsersRepository(BaseRepositoryTestLib):
             msg="asc should list external before internal",
         )
 
-        desc_rows, _ = await self.repo.list_users(
+        desc_rows, _, _ = await self.repo.list_users(
             self.session, search=token, sort_by="user_type", order="desc"
         )
         self.assertEqual(
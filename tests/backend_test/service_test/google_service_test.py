@@ -380,6 +380,30 @@ class TestGoogleService(TestCase):
         )
         self.mock_retry_utils.get_retry_on_transient.assert_called_once()
 
+    def test_fetch_messages_page_filters_by_create_time(self):
+        """
+        Tests that a page can be resumed and limited to newer messages.
+        """
+        mock_response = {"messages": [], "nextPageToken": "next"}
+        (
+            self.mock_google_chat_client.spaces.return_value.messages.return_value.list.return_value.execute.return_value
+        ) = mock_response
+
+        result = self.service.fetch_messages_page(
+            "test_space", page_token="token", created_after="2025-01-01T00:00:00Z"
+        )
+
+        self.assertEqual(result, mock_response)
+        list_mock = (
+            self.mock_google_chat_client.spaces.return_value.messages.return_value.list
+        )
+        list_mock.assert_called_once_with(
+            parent="spaces/test_space",
+            pageSize=500,
+            pageToken="token",
+            filter='create_time > "2025-01-01T00:00:00Z"',
+        )
+
     def test_fetch_messages_by_spaces_id_paginated_api_error(self):
         """
         Tests that a RuntimeError is raised when the API call fails.
@@ -158,6 +158,26 @@ class TestJiraSearchService(unittest.TestCase):
         ]
         self.retry_utils.get_retry_on_transient.assert_has_calls(expected_calls)
 
+    def test_fetch_issues_updated_within_minutes_paginated(self):
+        self.retry_utils.get_retry_on_transient.side_effect = [[MagicMock()]]
+
+        pages = list(
+            self.service.fetch_issues_updated_within_minutes_paginated(minutes=90)
+        )
+
+        self.assertEqual(len(pages), 1)
+        self.retry_utils.get_retry_on_transient.assert_called_once_with(
+            self.jira.search_issues,
+            jql_str="updated >= -90m ORDER BY created ASC",
+            startAt=0,
+            maxResults=JIRA_MAX_RESULTS_DEFAULT,
+            fields=self.required_fields,
+        )
+
+    def test_fetch_issues_updated_within_minutes_paginated_invalid_minutes(self):
+        with self.assertRaises(ValueError):
+            list(self.service.fetch_issues_updated_within_minutes_paginated(minutes=0))
+
     def test_fetch_issues_updated_within_hours_paginated_invalid_hours(self):
         with self.assertRaises(ValueError):
             list(self.service.fetch_issues_updated_within_hours_paginated(hours=0))
@@ -0,0 +1,159 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import IsolatedAsyncioTestCase, main
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.common.constants import AnalyticsSource
+from backend.utils.analytics_result_cache import (
+    AnalyticsResultCache,
+    bump_analytics_generation,
+)
+
+
+class TestAnalyticsResultCache(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.logger = MagicMock()
+        self.redis_client = MagicMock()
+        self.pipeline = MagicMock()
+        self.redis_client.pipeline.return_value = self.pipeline
+        self.retry_utils = MagicMock()
+        self.retry_utils.get_async_retry_on_transient = AsyncMock(
+            side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs)
+        )
+        self.cache = AnalyticsResultCache(
+            logger=self.logger,
+            redis_client=self.redis_client,
+            retry_utils=self.retry_utils,
+            ttl_seconds=600,
+        )
+        self.closed_range_end = datetime.now(timezone.utc) - timedelta(days=2)
+        self.params = {"ldaps": ["alice"], "start": "2025-01-01", "end": "2025-01-31"}
+        self.sources = [AnalyticsSource.GERRIT, AnalyticsSource.JIRA]
+
+    async def test_hit_serves_cached_result(self):
+        self.pipeline.execute.return_value = [
+            ["3", "7"],
+            json.dumps({"generations": ["3", "7"], "result": {"alice": 5}}),
+        ]
+        compute = AsyncMock()
+
+        result = await self.cache.get_or_compute(
+            "stats", self.params, self.sources, self.closed_range_end, compute
+        )
+
+        self.assertEqual(result, {"alice": 5})
+        compute.assert_not_awaited()
+        self.pipeline.mget.assert_called_once_with([
+            "analytics:generation:gerrit",
+            "analytics:generation:jira",
+        ])
+        self.redis_client.set.assert_not_called()
+
+    async def test_miss_computes_and_stores_with_generations(self):
+        self.pipeline.execute.return_value = [["3", None], None]
+        compute = AsyncMock(return_value={"alice": 5})
+
+        result = await self.cache.get_or_compute(
+            "stats", self.params, self.sources, self.closed_range_end, compute
+        )
+
+        self.assertEqual(result, {"alice": 5})
+        compute.assert_awaited_once()
+        key, value = self.redis_client.set.call_args.args
+        self.assertTrue(key.startswith("analytics:result:stats:"))
+        self.assertEqual(
+            json.loads(value), {"generations": ["3", None], "result": {"alice": 5}}
+        )
+        self.assertEqual(self.redis_client.set.call_args.kwargs, {"ex": 600})
+
+    async def test_bumped_generation_invalidates_entry(self):
+        self.pipeline.execute.return_value = [
+            ["4", "7"],
+            json.dumps({"generations": ["3", "7"], "result": {"alice": 5}}),
+        ]
+        compute = AsyncMock(return_value={"alice": 6})
+
+        result = await self.cache.get_or_compute(
+            "stats", self.params, self.sources, self.closed_range_end, compute
+        )
+
+        self.assertEqual(result, {"alice": 6})
+        compute.assert_awaited_once()
+        self.redis_client.set.assert_called_once()
+
+    async def test_key_ignores_parameter_order(self):
+        reordered = dict(reversed(list(self.params.items())))
+        self.assertEqual(
+            self.cache._result_key("stats", self.params),
+            self.cache._result_key("stats", reordered),
+        )
+        self.assertNotEqual(
+            self.cache._result_key("stats", self.params),
+            self.cache._result_key("stats", {**self.params, "end": "2025-02-28"}),
+        )
+
+    async def test_open_range_is_never_cached(self):
+        compute = AsyncMock(return_value={"alice": 1})
+
+        result = await self.cache.get_or_compute(
+            "stats",
+            self.params,
+            self.sources,
+            datetime.now(timezone.utc),
+            compute,
+        )
+
+        self.assertEqual(result, {"alice": 1})
+        self.redis_client.pipeline.assert_not_called()
+        self.redis_client.set.assert_not_called()
+
+    async def test_should_cache_rejects_result(self):
+        self.pipeline.execute.return_value = [["1", "1"], None]
+        compute = AsyncMock(return_value=[[], ["gerrit"]])
+
+        result = await self.cache.get_or_compute(
+            "summary",
+            self.params,
+            self.sources,
+            self.closed_range_end,
+            compute,
+            should_cache=lambda result: not result[1],
+        )
+
+        self.assertEqual(result, [[], ["gerrit"]])
+        self.redis_client.set.assert_not_called()
+
+    async def test_lookup_failure_computes_uncached(self):
+        self.pipeline.execute.side_effect = ConnectionError("redis down")
+        compute = AsyncMock(return_value={"alice": 5})
+
+        result = await self.cache.get_or_compute(
+            "stats", self.params, self.sources, self.closed_range_end, compute
+        )
+
+        self.assertEqual(result, {"alice": 5})
+        self.redis_client.set.assert_not_called()
+        self.logger.warning.assert_called_once()
+
+    async def test_store_failure_still_returns_result(self):
+        self.pipeline.execute.return_value = [["1", "1"], None]
+        self.redis_client.set.side_effect = ConnectionError("redis down")
+        compute = AsyncMock(return_value={"alice": 5})
+
+        result = await self.cache.get_or_compute(
+            "stats", self.params, self.sources, self.closed_range_end, compute
+        )
+
+        self.assertEqual(result, {"alice": 5})
+        self.logger.warning.assert_called_once()
+
+    def test_bump_analytics_generation_queues_incr(self):
+        pipeline = MagicMock()
+
+        bump_analytics_generation(pipeline, AnalyticsSource.GOOGLE_CHAT)
+
+        pipeline.incr.assert_called_once_with("analytics:generation:google_chat")
+
+
+if __name__ == "__main__":
+    main()
@@ -92,6 +92,7 @@ from backend.common.environment_constants import (
 @patch("backend.utils.app_dependency_builder.GoogleClient")
 @patch("backend.utils.app_dependency_builder.MicrosoftGraphServiceClient")
 @patch("backend.utils.app_dependency_builder.RedisClient")
+@patch("backend.utils.app_dependency_builder.AsyncRedisClient")
 @patch("backend.utils.app_dependency_builder.get_logger")
 @patch("backend.utils.app_dependency_builder.RetryUtils")
 @patch("backend.utils.app_dependency_builder.JiraClient")
@@ -105,6 +106,7 @@ class TestAppDependencyBuilder(TestCase):
         mock_jira_client_cls,
         mock_retry_utils_cls,
         mock_get_logger,
+        mock_async_redis_client_cls,
         mock_redis_client_cls,
         mock_graph_service_client_cls,
         mock_google_client_cls,
@@ -192,6 +194,12 @@ class TestAppDependencyBuilder(TestCase):
         mock_redis_client_instance = MagicMock()
         mock_redis_client_instance.get_redis_client.return_value = mock_redis_client
         mock_redis_client_cls.return_value = mock_redis_client_instance
+        mock_async_redis_client = MagicMock()
+        mock_async_redis_instance = MagicMock()
+        mock_async_redis_instance.get_redis_client.return_value = (
+            mock_async_redis_client
+        )
+        mock_async_redis_client_cls.return_value = mock_async_redis_instance
         mock_graph_client = MagicMock()
         mock_graph_service_client_instance = MagicMock()
         mock_graph_service_client_instance.get_graph_service_client = mock_graph_client
@@ -286,6 +294,11 @@ class TestAppDependencyBuilder(TestCase):
         mock_get_logger.assert_called_once()
         mock_redis_client_cls.assert_called_once()
         mock_redis_client_instance.get_redis_client.assert_called_once()
+        mock_async_redis_client_cls.assert_called_once_with(
+            logger=mock_logger,
+            retry_utils=mock_retry_utils_instance,
+        )
+        mock_async_redis_instance.get_redis_client.assert_called_once()
         mock_graph_service_client_cls.assert_called_once()
         mock_google_client_cls.assert_called_once()
         mock_google_client_instance.create_workspaceevents_client.assert_called_once()
@@ -325,6 +338,7 @@ class TestAppDependencyBuilder(TestCase):
             microsoft_service=mock_microsoft_service.return_value,
             date_time_util=mock_date_time_util_cls.return_value,
             retry_utils=mock_retry_utils_instance,
+            user_ldap_cache=builder.microsoft_user_ldap_cache,
         )
 
         mock_pubsub_puller_factory_cls.assert_called_once_with(
@@ -363,6 +377,8 @@ class TestAppDependencyBuilder(TestCase):
             redis_client=mock_redis_client,
             microsoft_service=mock_microsoft_service.return_value,
             retry_utils=mock_retry_utils_instance,
+            ldap_service=mock_ldap_service_cls.return_value,
+            user_ldap_cache=builder.microsoft_user_ldap_cache,
         )
         mock_employment_sync_service_cls.assert_called_once_with(
             logger=mock_logger,
@@ -377,6 +393,9 @@ class TestAppDependencyBuilder(TestCase):
             logger=mock_logger,
             microsoft_service=mock_microsoft_service.return_value,
             microsoft_chat_message_util=mock_microsoft_chat_message_util_cls.return_value,
+            redis_client=mock_async_redis_client,
+            retry_utils=mock_retry_utils_instance,
+            microsoft_meeting_chat_topic_cache_service=mock_microsoft_meeting_chat_topic_cache_service_cls.return_value,
         )
         mock_jira_search_service_cls.assert_called_once_with(
             logger=mock_logger,
@@ -411,6 +430,8 @@ class TestAppDependencyBuilder(TestCase):
             logger=mock_logger,
             google_service=mock_google_service.return_value,
             google_chat_message_utils=mock_google_chat_messages_utils.return_value,
+            redis_client=mock_redis_client,
+            retry_utils=mock_retry_utils_instance,
         )
         mock_historical_controller_cls.assert_called_once_with(
             logger=mock_logger,
@@ -425,52 +446,56 @@ class TestAppDependencyBuilder(TestCase):
         )
         mock_ldap_service_cls.assert_called_once_with(
             logger=mock_logger,
-            redis_client=mock_redis_client,
+            redis_client=mock_async_redis_client,
             retry_utils=mock_retry_utils_instance,
         )
         mock_microsoft_chat_analytics_service_cls.assert_called_once_with(
             logger=mock_logger,
-            redis_client=mock_redis_client,
+            redis_client=mock_async_redis_client,
             date_time_util=mock_date_time_util_cls.return_value,
             ldap_service=mock_ldap_service_cls.return_value,
             retry_utils=mock_retry_utils_instance,
         )
         mock_microsoft_meeting_chat_topic_cache_service_cls.assert_called_once_with(
             logger=mock_logger,
-            redis_client=mock_redis_client,
+            redis_client=mock_async_redis_client,
             microsoft_service=mock_microsoft_service.return_value,
             retry_utils=mock_retry_utils_instance,
         )
         mock_jira_analytics_service_cls.assert_called_once_with(
             logger=mock_logger,
-            redis_client=mock_redis_client,
+            redis_client=mock_async_redis_client,
             retry_utils=mock_retry_utils_instance,
             date_time_util=mock_date_time_util_cls.return_value,
             ldap_service=mock_ldap_service_cls.return_value,
+            result_cache=builder.analytics_result_cache,
         )
         mock_google_calendar_analytics_service_cls.assert_called_once_with(
             logger=mock_logger,
-            redis_client=mock_redis_client,
+            redis_client=mock_async_redis_client,
             retry_utils=mock_retry_utils_instance,
             ldap_service=mock_ldap_service_cls.return_value,
+            date_time_util=mock_date_time_util_cls.return_value,
         )
         mock_gerrit_analytics_service_cls.assert_called_once_with(
             logger=mock_logger,
-            redis_client=mock_redis_client,
+            redis_client=mock_async_redis_client,
             retry_utils=mock_retry_utils_instance,
             ldap_service=mock_ldap_service_cls.return_value,
             date_time_util=mock_date_time_util_cls.return_value,
             gerrit_client=mock_gerrit_client,
+            result_cache=builder.analytics_result_cache,
         )
         mock_google_chat_analytics_service_cls.assert_called_once_with(
             logger=mock_logger,
-            redis_client=mock_redis_client,
+            redis_client=mock_async_redis_client,
             retry_utils=mock_retry_utils_instance,
             date_time_util=mock_date_time_util_cls.return_value,
             google_service=mock_google_service.return_value,
             ldap_service=mock_ldap_service_cls.return_value,
         )
         mock_summary_service_cls.assert_called_once_with(
+            logger=mock_logger,
             ldap_service=mock_ldap_service_cls.return_value,
             microsoft_chat_analytics_service=mock_microsoft_chat_analytics_service_cls.return_value,
             google_calendar_analytics_service=mock_google_calendar_analytics_service_cls.return_value,
@@ -478,6 +503,7 @@ class TestAppDependencyBuilder(TestCase):
             gerrit_analytics_service=mock_gerrit_analytics_service_cls.return_value,
             jira_analytics_service=mock_jira_analytics_service_cls.return_value,
             date_time_util=mock_date_time_util_cls.return_value,
+            result_cache=builder.analytics_result_cache,
         )
         mock_launchdarkly_service_cls.assert_called_once_with(
             logger=mock_logger,
@@ -626,6 +652,7 @@ class TestAppDependencyBuilder(TestCase):
             notification_topic_path="projects/test-project/topics/notifications",
             launchdarkly_client=mock_launchdarkly_client_cls.return_value,
             database=mock_database_cls.return_value,
+            async_redis=mock_async_redis_instance,
             logger=mock_logger,
         )
 
@@ -655,11 +682,12 @@ class TestAppDependencyBuilder(TestCase):
             pubsub_puller_factory=mock_pubsub_puller_factory_cls.return_value,
             google_chat_messages_utils=mock_google_chat_messages_utils.return_value,
             google_service=mock_google_service.return_value,
+            sender_ldap_cache=builder.google_chat_sender_ldap_cache,
         )
 
         mock_google_chat_analytics_service_cls.assert_called_once_with(
             logger=mock_logger,
-            redis_client=mock_redis_client,
+            redis_client=mock_async_redis_client,
             retry_utils=mock_retry_utils_instance,
             date_time_util=mock_date_time_util_cls.return_value,
             google_service=mock_google_service.return_value,
@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+from unittest import TestCase, main
+from unittest.mock import MagicMock, call
+
+from backend.utils.chat_daily_count import (
+    daily_bucket,
+    queue_daily_count_adjustment,
+    rebuild_daily_counts,
+)
+
+TEST_ROLLUP_KEY_TEMPLATE = "test:chat_daily:{day}"
+TEST_READY_KEY = "test:chat_daily_ready"
+DAY_ONE = datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc).timestamp()
+DAY_ONE_LATE = datetime(2024, 5, 1, 23, 59, 59, tzinfo=timezone.utc).timestamp()
+DAY_TWO = datetime(2024, 5, 2, 0, 0, tzinfo=timezone.utc).timestamp()
+
+
+class TestChatDailyCount(TestCase):
+    def setUp(self):
+        self.mock_redis = MagicMock()
+        self.mock_pipeline = MagicMock()
+        self.mock_redis.pipeline.return_value = self.mock_pipeline
+        self.mock_retry_utils = MagicMock()
+        self.mock_retry_utils.get_retry_on_transient.side_effect = (
+            lambda fn, *args, **kwargs: fn(*args, **kwargs)
+        )
+
+    def test_daily_bucket_uses_utc_day(self):
+        self.assertEqual(daily_bucket(DAY_ONE), "2024-05-01")
+        self.assertEqual(daily_bucket(DAY_ONE_LATE), "2024-05-01")
+        self.assertEqual(daily_bucket(DAY_TWO), "2024-05-02")
+
+    def test_queue_daily_count_adjustment(self):
+        queue_daily_count_adjustment(
+            self.mock_pipeline,
+            index_key="index",
+            message_id="m1",
+            rollup_key="rollup",
+            field="alice",
+            delta=-1,
+        )
+
+        args = self.mock_pipeline.eval.call_args.args
+        self.assertIn("HINCRBY", args[0])
+        self.assertEqual(args[1:], (2, "index", "rollup", "m1", "alice", -1))
+
+    def test_rebuild_daily_counts(self):
+        self.mock_redis.scan_iter.side_effect = [
+            iter(["test:created:alice", "test:created:bob"]),
+            iter(["test:chat_daily:2024-04-30"]),
+        ]
+        self.mock_redis.zrange.side_effect = [
+            [("m1", DAY_ONE), ("m2", DAY_ONE_LATE), ("m3", DAY_TWO)],
+            [("m4", DAY_TWO)],
+        ]
+
+        days = rebuild_daily_counts(
+            redis_client=self.mock_redis,
+            retry_utils=self.mock_retry_utils,
+            index_key_pattern="test:created:*",
+            rollup_key_template=TEST_ROLLUP_KEY_TEMPLATE,
+            ready_key=TEST_READY_KEY,
+            field_from_index_key=lambda key: key.rsplit(":", 1)[1],
+        )
+
+        self.assertEqual(days, 2)
+        self.mock_redis.scan_iter.assert_has_calls([
+            call(match="test:created:*"),
+            call(match="test:chat_daily:*"),
+        ])
+        self.mock_pipeline.delete.assert_called_once_with("test:chat_daily:2024-04-30")
+        self.mock_pipeline.hset.assert_has_calls(
+            [
+                call("test:chat_daily:2024-05-01", mapping={"alice": 2}),
+                call("test:chat_daily:2024-05-02", mapping={"alice": 1, "bob": 1}),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(self.mock_pipeline.set.call_args.args[0], TEST_READY_KEY)
+        self.mock_pipeline.execute.assert_called_once()
+
+
+if __name__ == "__main__":
+    main()
@@ -390,6 +390,19 @@ class TestDateTimeUtil(TestCase):
                     str(ctx.exception),
                 )
 
+    def test_get_day_buckets(self):
+        """Test get_day_buckets spans month boundaries inclusively."""
+        self.assertEqual(
+            self.utils.get_day_buckets(date(2024, 2, 28), date(2024, 3, 1)),
+            ["2024-02-28", "2024-02-29", "2024-03-01"],
+        )
+        self.assertEqual(
+            self.utils.get_day_buckets(date(2024, 3, 1), date(2024, 3, 1)),
+            ["2024-03-01"],
+        )
+        with self.assertRaises(ValueError):
+            self.utils.get_day_buckets(date(2024, 3, 2), date(2024, 3, 1))
+
     def test_parse_timestamp_without_microseconds_valid_input(self):
         """Tests the parse_timestamp_without_microseconds method with valid timestamp strings."""
         for i, (timestamp_str, expected_dt) in enumerate(
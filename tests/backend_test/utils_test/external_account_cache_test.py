@@ -0,0 +1,20 @@
+from unittest import TestCase, main
+from unittest.mock import MagicMock, call
+
+from backend.utils.external_account_cache import queue_external_account
+
+
+class TestExternalAccountCache(TestCase):
+    def test_queue_external_account_only_sets_ttl_once(self):
+        pipeline = MagicMock()
+
+        queue_external_account(pipeline, "external", "guest", 60)
+
+        self.assertEqual(
+            pipeline.mock_calls,
+            [call.hset("external", "guest", ""), call.expire("external", 60, nx=True)],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -125,6 +126,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -172,6 +174,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -222,6 +225,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -269,6 +273,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -316,6 +321,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -365,6 +371,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -415,6 +422,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -464,6 +472,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -522,6 +531,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -581,6 +591,7 @@ class TestFastAppFactory(unittest.TestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=MagicMock(),
             database=MagicMock(),
+            async_redis=MagicMock(),
             logger=MagicMock(),
         )
 
@@ -633,6 +644,10 @@ class TestFastAppFactoryLifespan(unittest.IsolatedAsyncioTestCase):
         self.mock_database = MagicMock()
         self.mock_database.close = AsyncMock()
 
+        self.mock_async_redis = MagicMock()
+        self.mock_async_redis.verify_connection = AsyncMock()
+        self.mock_async_redis.close = AsyncMock()
+
         self.factory = FastAppFactory(
             authentication_controller=self.mock_controller,
             authentication_service=self.mock_service,
@@ -663,6 +678,7 @@ class TestFastAppFactoryLifespan(unittest.IsolatedAsyncioTestCase):
             notification_topic_path="projects/p/topics/t",
             launchdarkly_client=self.mock_launchdarkly_client,
             database=self.mock_database,
+            async_redis=self.mock_async_redis,
             logger=MagicMock(),
         )
 
@@ -675,6 +691,16 @@ class TestFastAppFactoryLifespan(unittest.IsolatedAsyncioTestCase):
 
         self.mock_database.close.assert_awaited_once()
 
+    async def test_lifespan_verifies_and_closes_async_redis(self):
+        """Test that the async Redis pool is pinged on startup and closed on shutdown."""
+        app = self.factory.create_app()
+
+        async with app.router.lifespan_context(app):
+            self.mock_async_redis.verify_connection.assert_awaited_once()
+            self.mock_async_redis.close.assert_not_awaited()
+
+        self.mock_async_redis.close.assert_awaited_once()
+
 
 if __name__ == "__main__":
     unittest.main()
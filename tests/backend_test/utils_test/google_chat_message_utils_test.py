@@ -1,6 +1,6 @@
 import json
 from unittest import TestCase, main
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from datetime import datetime
 
 from backend.utils.google_chat_message_utils import (
@@ -11,8 +11,11 @@ from backend.utils.google_chat_message_utils import (
 from backend.common.constants import (
     CREATED_GOOGLE_CHAT_MESSAGES_INDEX_KEY,
     DELETED_GOOGLE_CHAT_MESSAGES_INDEX_KEY,
+    GOOGLE_CHAT_DAILY_COUNT_KEY,
+    GOOGLE_CHAT_DAILY_COUNT_READY_KEY,
     GoogleChatEventType,
 )
+from backend.utils.chat_daily_count import daily_bucket
 
 TEST_MESSAGE_ID = "test_message"
 TEST_MESSAGE_NAME = f"spaces/test_space/messages/{TEST_MESSAGE_ID}"
@@ -112,6 +115,8 @@ TEST_DELETED_INDEX_REDIS_KEY = DELETED_INDEX_KEY_FORMAT.format(
 
 REDIS_MEMBER = TEST_MESSAGE_ID
 TEST_SCORE = datetime.fromisoformat(TEST_TIME.replace("Z", "+00:00")).timestamp()
+TEST_DAILY_COUNT_KEY = GOOGLE_CHAT_DAILY_COUNT_KEY.format(day=daily_bucket(TEST_SCORE))
+TEST_DAILY_COUNT_FIELD = f"{TEST_SENDER_LDAP}:{TEST_SPACE_ID}"
 
 
 class TestGoogleChatMessagesUtils(TestCase):
@@ -141,6 +146,18 @@ class TestGoogleChatMessagesUtils(TestCase):
         )
 
         self.mock_redis.pipeline.assert_called_once()
+        eval_args = self.mock_pipe.eval.call_args.args
+        self.assertEqual(
+            eval_args[1:],
+            (
+                2,
+                TEST_INDEX_REDIS_KEY,
+                TEST_DAILY_COUNT_KEY,
+                REDIS_MEMBER,
+                TEST_DAILY_COUNT_FIELD,
+                1,
+            ),
+        )
         self.mock_pipe.zadd.assert_called_once_with(
             TEST_INDEX_REDIS_KEY, {REDIS_MEMBER: TEST_SCORE}
         )
@@ -156,6 +173,40 @@ class TestGoogleChatMessagesUtils(TestCase):
         )
         self.mock_logger.debug.assert_any_call("SET %s created", TEST_MESSAGE_NAME)
 
+    def test_store_created_messages_on_batch_pipeline(self):
+        batch_pipe = Mock()
+
+        self.utils.store_messages(
+            ldaps_dict=TEST_MOCK_LDAP_MAPPING,
+            batch_messages=[TEST_MOCK_CREATED_MESSAGE_PAYLOAD],
+            message_type=GoogleChatEventType.CREATED,
+            pipeline=batch_pipe,
+        )
+
+        batch_pipe.set.assert_called_once_with(
+            TEST_MESSAGE_NAME, TEST_STORED_CREATED_MESSAGE
+        )
+        batch_pipe.flush_batch.assert_not_called()
+        batch_pipe.execute.assert_not_called()
+        self.mock_redis.pipeline.assert_not_called()
+
+    def test_store_updated_messages_on_batch_pipeline_flushes_first(self):
+        self.mock_redis.get.return_value = TEST_STORED_UPDATED_MESSAGE_PRE_UPDATE
+        batch_pipe = Mock()
+
+        self.utils.store_messages(
+            ldaps_dict={},
+            batch_messages=[TEST_MOCK_UPDATED_MESSAGE_PAYLOAD],
+            message_type=GoogleChatEventType.UPDATED,
+            pipeline=batch_pipe,
+        )
+
+        batch_pipe.flush_batch.assert_called_once()
+        batch_pipe.set.assert_called_once_with(
+            TEST_MESSAGE_NAME, TEST_STORED_UPDATED_MESSAGE_POST_UPDATE
+        )
+        batch_pipe.execute.assert_not_called()
+
     def test_store_updated_messages_success(self):
         self.mock_redis.get.return_value = TEST_STORED_UPDATED_MESSAGE_PRE_UPDATE
 
@@ -193,6 +244,17 @@ class TestGoogleChatMessagesUtils(TestCase):
             TEST_MESSAGE_NAME, TEST_STORED_DELETED_MESSAGE
         )
         self.mock_pipe.zrem.assert_called_once_with(TEST_INDEX_REDIS_KEY, REDIS_MEMBER)
+        self.assertEqual(
+            self.mock_pipe.eval.call_args.args[1:],
+            (
+                2,
+                TEST_INDEX_REDIS_KEY,
+                TEST_DAILY_COUNT_KEY,
+                REDIS_MEMBER,
+                TEST_DAILY_COUNT_FIELD,
+                -1,
+            ),
+        )
         self.mock_pipe.zadd.assert_called_once_with(
             TEST_DELETED_INDEX_REDIS_KEY, {REDIS_MEMBER: float(TEST_SCORE)}
         )
@@ -365,6 +427,22 @@ class TestGoogleChatMessagesUtils(TestCase):
             with self.assertRaises(ValueError):
                 self.utils.sync_batch_created_messages(messages, ldap_mapping)
 
+    @patch("backend.utils.google_chat_message_utils.rebuild_daily_counts")
+    def test_rebuild_daily_counts(self, mock_rebuild):
+        mock_rebuild.return_value = 3
+
+        result = self.utils.rebuild_daily_counts()
+
+        self.assertEqual(result, 3)
+        kwargs = mock_rebuild.call_args.kwargs
+        self.assertEqual(kwargs["index_key_pattern"], "google:chat:created:*")
+        self.assertEqual(kwargs["rollup_key_template"], GOOGLE_CHAT_DAILY_COUNT_KEY)
+        self.assertEqual(kwargs["ready_key"], GOOGLE_CHAT_DAILY_COUNT_READY_KEY)
+        self.assertEqual(
+            kwargs["field_from_index_key"](TEST_INDEX_REDIS_KEY),
+            TEST_DAILY_COUNT_FIELD,
+        )
+
 
 if __name__ == "__main__":
     main()
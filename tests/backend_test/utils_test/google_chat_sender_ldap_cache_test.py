@@ -0,0 +1,160 @@
+from unittest import TestCase, main
+from unittest.mock import MagicMock, patch
+
+from backend.utils.google_chat_sender_ldap_cache import GoogleChatSenderLdapCache
+
+SENDER_LDAP_KEY = "google:chat_sender_ldap"
+EXTERNAL_SENDERS_KEY = "google:chat_sender_external"
+
+
+class TestGoogleChatSenderLdapCache(TestCase):
+    def setUp(self):
+        self.logger = MagicMock()
+        self.redis_client = MagicMock()
+        self.lookup_pipeline = MagicMock()
+        self.write_pipeline = MagicMock()
+        self.redis_client.pipeline.side_effect = [
+            self.lookup_pipeline,
+            self.write_pipeline,
+        ]
+        self.hset_if_exists = self.redis_client.register_script.return_value
+        self.google_service = MagicMock()
+        self.retry_utils = MagicMock()
+        self.retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        self.cache = GoogleChatSenderLdapCache(
+            logger=self.logger,
+            redis_client=self.redis_client,
+            google_service=self.google_service,
+            retry_utils=self.retry_utils,
+            ttl_seconds=600,
+            external_ttl_seconds=60,
+            local_cache_size=2,
+        )
+
+    def test_redis_hit_is_kept_locally(self):
+        self.lookup_pipeline.execute.return_value = ["alice", False, 1]
+
+        self.assertEqual(self.cache.get_ldap("111"), "alice")
+        self.assertEqual(self.cache.get_ldap("111"), "alice")
+
+        self.lookup_pipeline.hget.assert_called_once_with(SENDER_LDAP_KEY, "111")
+        self.redis_client.pipeline.assert_called_once()
+        self.google_service.get_ldap_by_id.assert_not_called()
+
+    def test_external_sender_is_cached_negatively(self):
+        self.lookup_pipeline.execute.return_value = [None, True, 1]
+
+        self.assertIsNone(self.cache.get_ldap("999"))
+        self.assertIsNone(self.cache.get_ldap("999"))
+
+        self.redis_client.pipeline.assert_called_once()
+        self.google_service.get_ldap_by_id.assert_not_called()
+
+    def test_miss_falls_back_to_people_api_and_stores_result(self):
+        self.lookup_pipeline.execute.return_value = [None, False, 1]
+        self.google_service.get_ldap_by_id.return_value = "bob"
+
+        self.assertEqual(self.cache.get_ldap("222"), "bob")
+
+        self.google_service.get_ldap_by_id.assert_called_once_with("222")
+        self.hset_if_exists.assert_called_once_with(
+            keys=[SENDER_LDAP_KEY], args=["222", "bob"]
+        )
+        self.write_pipeline.hset.assert_not_called()
+        self.write_pipeline.expire.assert_not_called()
+
+    def test_unknown_sender_is_stored_as_external(self):
+        self.lookup_pipeline.execute.return_value = [None, False, 1]
+        self.google_service.get_ldap_by_id.return_value = None
+
+        self.assertIsNone(self.cache.get_ldap("333"))
+        self.assertIsNone(self.cache.get_ldap("333"))
+
+        self.google_service.get_ldap_by_id.assert_called_once_with("333")
+        self.write_pipeline.hset.assert_called_once_with(
+            EXTERNAL_SENDERS_KEY, "333", ""
+        )
+        self.write_pipeline.expire.assert_called_once_with(
+            EXTERNAL_SENDERS_KEY, 60, nx=True
+        )
+
+    def test_missing_directory_is_warmed_from_listing(self):
+        self.lookup_pipeline.execute.return_value = [None, False, 0]
+        self.google_service.list_directory_all_people_ldap.return_value = {
+            "111": "alice",
+            "222": "bob",
+        }
+
+        self.assertEqual(self.cache.get_ldap("222"), "bob")
+
+        self.google_service.get_ldap_by_id.assert_not_called()
+        self.write_pipeline.delete.assert_called_once_with(SENDER_LDAP_KEY)
+        self.write_pipeline.hset.assert_called_once_with(
+            SENDER_LDAP_KEY, mapping={"111": "alice", "222": "bob"}
+        )
+        self.write_pipeline.expire.assert_called_once_with(SENDER_LDAP_KEY, 600)
+
+    def test_warm_failure_falls_back_to_people_api(self):
+        self.lookup_pipeline.execute.return_value = [None, False, 0]
+        self.google_service.list_directory_all_people_ldap.side_effect = RuntimeError(
+            "People API down"
+        )
+        self.google_service.get_ldap_by_id.return_value = "carol"
+
+        self.assertEqual(self.cache.get_ldap("444"), "carol")
+        self.logger.warning.assert_called_once()
+
+    def test_local_entries_expire(self):
+        self.redis_client.pipeline.side_effect = None
+        self.redis_client.pipeline.return_value = self.lookup_pipeline
+        self.lookup_pipeline.execute.return_value = ["alice", False, 1]
+
+        with patch(
+            "backend.utils.google_chat_sender_ldap_cache.time.monotonic"
+        ) as monotonic:
+            monotonic.return_value = 100
+            self.cache.get_ldap("111")
+            monotonic.return_value = 701
+            self.cache.get_ldap("111")
+
+        self.assertEqual(self.lookup_pipeline.execute.call_count, 2)
+
+    def test_local_cache_evicts_least_recently_used(self):
+        self.redis_client.pipeline.side_effect = None
+        self.redis_client.pipeline.return_value = self.lookup_pipeline
+        self.lookup_pipeline.execute.side_effect = [
+            ["alice", False, 1],
+            ["bob", False, 1],
+            ["carol", False, 1],
+            ["bob", False, 1],
+        ]
+
+        self.cache.get_ldap("111")
+        self.cache.get_ldap("222")
+        self.cache.get_ldap("111")
+        self.cache.get_ldap("333")
+        self.cache.get_ldap("111")
+        self.cache.get_ldap("222")
+
+        self.assertEqual(self.lookup_pipeline.execute.call_count, 4)
+
+    def test_get_directory_reads_redis(self):
+        self.redis_client.hgetall.return_value = {"111": "alice"}
+
+        self.assertEqual(self.cache.get_directory(), {"111": "alice"})
+        self.google_service.list_directory_all_people_ldap.assert_not_called()
+
+    def test_get_directory_warms_when_empty(self):
+        self.redis_client.hgetall.return_value = {}
+        self.google_service.list_directory_all_people_ldap.return_value = {
+            "111": "alice"
+        }
+
+        self.assertEqual(self.cache.get_directory(), {"111": "alice"})
+        self.redis_client.pipeline.assert_called_once()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ from backend.common.constants import (
     MicrosoftChatMessagesChangeType,
     MICROSOFT_CHAT_MESSAGES_INDEX_KEY,
     MICROSOFT_CHAT_MESSAGES_DETAILS_KEY,
+    MICROSOFT_CHAT_DAILY_COUNT_KEY,
+    MICROSOFT_CHAT_DAILY_COUNT_READY_KEY,
     MicrosoftChatMessageAttachmentType,
     MicrosoftChatMessageType,
 )
@@ -90,12 +92,31 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
             self.TEST_FORMATED_DATETIME
         )
         self.mock_retry_utils = MagicMock()
+        self.mock_user_ldap_cache = AsyncMock()
         self.microsoft_chat_message_util = MicrosoftChatMessageUtil(
             logger=self.mock_logger,
             redis_client=self.mock_redis_client,
             microsoft_service=self.mock_microsoft_service,
             date_time_util=self.mock_date_time_util,
             retry_utils=self.mock_retry_utils,
+            user_ldap_cache=self.mock_user_ldap_cache,
+        )
+
+    def assert_daily_count_adjusted(self, index_key, score, delta):
+        self.assertEqual(
+            self.mock_pipeline.eval.call_args.args[1:],
+            (
+                2,
+                index_key,
+                MICROSOFT_CHAT_DAILY_COUNT_KEY.format(
+                    day=datetime.fromtimestamp(score, tz=timezone.utc).strftime(
+                        "%Y-%m-%d"
+                    )
+                ),
+                self.TEST_MESSAGE_ID,
+                self.TEST_USER_LDAP,
+                delta,
+            ),
         )
 
     def make_attachment(self, content_type, content_url=None, id=None):
@@ -112,6 +133,7 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
             microsoft_service=MagicMock(),
             date_time_util=MagicMock(),
             retry_utils=MagicMock(),
+            user_ldap_cache=MagicMock(),
         )
 
     def test_process_attachments(self):
@@ -158,6 +180,7 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         self.mock_pipeline.zadd.assert_called_once_with(
             deleted_index_key, {self.TEST_MESSAGE_ID: self.TEST_SCORE}
         )
+        self.assert_daily_count_adjusted(created_index_key, self.TEST_SCORE, -1)
 
     def test_handle_deleted_message_input_validation(self):
         with self.assertRaises(ValueError):
@@ -193,6 +216,7 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         self.mock_pipeline.zadd.assert_called_once_with(
             index_redis_key, {self.TEST_MESSAGE_ID: index_score}
         )
+        self.assert_daily_count_adjusted(index_redis_key, index_score, 1)
         self.mock_pipeline.set.assert_called_once()
         args, _ = self.mock_pipeline.set.call_args
         self.assertEqual(args[0], detail_key)
@@ -279,6 +303,7 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         self.mock_pipeline.zadd.assert_called_once_with(
             created_index_key, {self.TEST_MESSAGE_ID: self.TEST_SCORE}
         )
+        self.assert_daily_count_adjusted(created_index_key, self.TEST_SCORE, 1)
 
     def test_handle_update_message_not_found_in_any_index_raises(self):
         self.mock_redis_client.zscore.side_effect = [None, None]
@@ -340,14 +365,14 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         mock_handle_created,
     ):
         self.mock_microsoft_service.get_message_by_id.return_value = self.TEST_MESSAGE
-        self.mock_microsoft_service.get_ldap_by_id.return_value = self.TEST_USER_LDAP
+        self.mock_user_ldap_cache.get_ldap.return_value = self.TEST_USER_LDAP
 
         await self.microsoft_chat_message_util.sync_near_real_time_message_to_redis(
             MicrosoftChatMessagesChangeType.CREATED.value, self.TEST_RESOURCE
         )
 
         self.mock_microsoft_service.get_message_by_id.assert_called_once()
-        self.mock_microsoft_service.get_ldap_by_id.assert_called_once()
+        self.mock_user_ldap_cache.get_ldap.assert_called_once()
         mock_handle_created.assert_called_once_with(
             self.TEST_MESSAGE, self.TEST_USER_LDAP, self.mock_pipeline
         )
@@ -370,20 +395,43 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         mock_handle_created,
     ):
         self.mock_microsoft_service.get_message_by_id.return_value = self.TEST_MESSAGE
-        self.mock_microsoft_service.get_ldap_by_id.return_value = self.TEST_USER_LDAP
+        self.mock_user_ldap_cache.get_ldap.return_value = self.TEST_USER_LDAP
 
         await self.microsoft_chat_message_util.sync_near_real_time_message_to_redis(
             MicrosoftChatMessagesChangeType.UPDATED.value, self.TEST_RESOURCE
         )
 
         self.mock_microsoft_service.get_message_by_id.assert_called_once()
-        self.mock_microsoft_service.get_ldap_by_id.assert_called_once()
+        self.mock_user_ldap_cache.get_ldap.assert_called_once()
         mock_handle_created.assert_not_called()
         mock_handle_update.assert_called_once_with(
             self.TEST_MESSAGE, self.TEST_USER_LDAP, self.mock_pipeline
         )
         mock_handle_deleted.assert_not_called()
 
+    @patch.object(
+        MicrosoftChatMessageUtil, "_handle_update_message", new_callable=MagicMock
+    )
+    async def test_sync_near_real_time_message_to_redis_batch_pipeline(
+        self, mock_handle_update
+    ):
+        self.mock_microsoft_service.get_message_by_id.return_value = self.TEST_MESSAGE
+        self.mock_user_ldap_cache.get_ldap.return_value = self.TEST_USER_LDAP
+        batch_pipeline = MagicMock()
+
+        await self.microsoft_chat_message_util.sync_near_real_time_message_to_redis(
+            MicrosoftChatMessagesChangeType.UPDATED.value,
+            self.TEST_RESOURCE,
+            pipeline=batch_pipeline,
+        )
+
+        batch_pipeline.flush_batch.assert_called_once()
+        mock_handle_update.assert_called_once_with(
+            self.TEST_MESSAGE, self.TEST_USER_LDAP, batch_pipeline
+        )
+        batch_pipeline.execute.assert_not_called()
+        self.mock_redis_client.pipeline.assert_not_called()
+
     @patch.object(
         MicrosoftChatMessageUtil, "_handle_created_messages", new_callable=MagicMock
     )
@@ -400,7 +448,7 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         mock_handle_created,
     ):
         self.mock_microsoft_service.get_message_by_id.return_value = self.TEST_MESSAGE
-        self.mock_microsoft_service.get_ldap_by_id.return_value = self.TEST_USER_LDAP
+        self.mock_user_ldap_cache.get_ldap.return_value = self.TEST_USER_LDAP
         self.mock_redis_client.zscore.return_value = self.TEST_SCORE
 
         await self.microsoft_chat_message_util.sync_near_real_time_message_to_redis(
@@ -408,7 +456,7 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         )
 
         self.mock_microsoft_service.get_message_by_id.assert_called_once()
-        self.mock_microsoft_service.get_ldap_by_id.assert_called_once()
+        self.mock_user_ldap_cache.get_ldap.assert_called_once()
         mock_handle_created.assert_not_called()
         mock_handle_update.assert_not_called()
         mock_handle_deleted.assert_called_once_with(
@@ -435,7 +483,7 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         mock_handle_created,
     ):
         self.mock_microsoft_service.get_message_by_id.return_value = self.TEST_MESSAGE
-        self.mock_microsoft_service.get_ldap_by_id.return_value = self.TEST_USER_LDAP
+        self.mock_user_ldap_cache.get_ldap.return_value = self.TEST_USER_LDAP
         self.mock_redis_client.zscore.return_value = None
 
         with self.assertRaises(ValueError):
@@ -444,7 +492,7 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
             )
 
         self.mock_microsoft_service.get_message_by_id.assert_called_once()
-        self.mock_microsoft_service.get_ldap_by_id.assert_called_once()
+        self.mock_user_ldap_cache.get_ldap.assert_called_once()
         mock_handle_created.assert_not_called()
         mock_handle_update.assert_not_called()
         mock_handle_deleted.assert_not_called()
@@ -453,27 +501,27 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
         self.mock_microsoft_service.get_message_by_id.return_value = (
             self.TEST_SYSTEM_MESSAGE
         )
-        self.mock_microsoft_service.get_ldap_by_id.return_value = self.TEST_USER_LDAP
+        self.mock_user_ldap_cache.get_ldap.return_value = self.TEST_USER_LDAP
 
         await self.microsoft_chat_message_util.sync_near_real_time_message_to_redis(
             MicrosoftChatMessagesChangeType.CREATED.value, self.TEST_RESOURCE
         )
 
-        self.mock_microsoft_service.get_ldap_by_id.assert_not_called()
+        self.mock_user_ldap_cache.get_ldap.assert_not_called()
 
     async def test_sync_near_real_time_message_to_redis_external_sender_skipped(self):
         self.mock_microsoft_service.get_message_by_id.return_value = self.TEST_MESSAGE
-        self.mock_microsoft_service.get_ldap_by_id.return_value = None
+        self.mock_user_ldap_cache.get_ldap.return_value = None
 
         await self.microsoft_chat_message_util.sync_near_real_time_message_to_redis(
             MicrosoftChatMessagesChangeType.CREATED.value, self.TEST_RESOURCE
         )
 
-        self.mock_microsoft_service.get_ldap_by_id.assert_called_once()
+        self.mock_user_ldap_cache.get_ldap.assert_called_once()
 
     async def test_sync_near_real_time_message_to_redis_redis_pipeline_failure(self):
         self.mock_microsoft_service.get_message_by_id.return_value = self.TEST_MESSAGE
-        self.mock_microsoft_service.get_ldap_by_id.return_value = self.TEST_USER_LDAP
+        self.mock_user_ldap_cache.get_ldap.return_value = self.TEST_USER_LDAP
         mock_get_retry_on_transient = MagicMock(
             side_effect=Exception("Simulated Redis pipeline error")
         )
@@ -536,6 +584,21 @@ class TestMicrosoftChatMessageUtil(IsolatedAsyncioTestCase):
 
         mock_get_retry_on_transient.assert_called_once_with(self.mock_pipeline.execute)
 
+    @patch("backend.utils.microsoft_chat_message_util.rebuild_daily_counts")
+    def test_rebuild_daily_counts(self, mock_rebuild):
+        mock_rebuild.return_value = 2
+
+        result = self.microsoft_chat_message_util.rebuild_daily_counts()
+
+        self.assertEqual(result, 2)
+        kwargs = mock_rebuild.call_args.kwargs
+        self.assertEqual(kwargs["index_key_pattern"], "microsoft:chat:created:*")
+        self.assertEqual(kwargs["rollup_key_template"], MICROSOFT_CHAT_DAILY_COUNT_KEY)
+        self.assertEqual(kwargs["ready_key"], MICROSOFT_CHAT_DAILY_COUNT_READY_KEY)
+        self.assertEqual(
+            kwargs["field_from_index_key"]("microsoft:chat:created:foo"), "foo"
+        )
+
 
 if __name__ == "__main__":
     main()
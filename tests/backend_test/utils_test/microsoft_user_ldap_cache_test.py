@@ -0,0 +1,118 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, main
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.utils.microsoft_user_ldap_cache import MicrosoftUserLdapCache
+
+USER_LDAP_KEY = "microsoft:user_ldap"
+EXTERNAL_USERS_KEY = "microsoft:user_external"
+
+
+class TestMicrosoftUserLdapCache(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.logger = MagicMock()
+        self.redis_client = MagicMock()
+        self.lookup_pipeline = MagicMock()
+        self.write_pipeline = MagicMock()
+        self.redis_client.pipeline.side_effect = [
+            self.lookup_pipeline,
+            self.write_pipeline,
+        ]
+        self.microsoft_service = MagicMock()
+        self.microsoft_service.get_ldap_by_id = AsyncMock()
+        self.microsoft_service.list_all_id_ldap_mapping = AsyncMock()
+        self.retry_utils = MagicMock()
+        self.retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        self.cache = MicrosoftUserLdapCache(
+            logger=self.logger,
+            redis_client=self.redis_client,
+            microsoft_service=self.microsoft_service,
+            retry_utils=self.retry_utils,
+            external_ttl_seconds=60,
+        )
+
+    async def test_redis_hit_skips_graph(self):
+        self.lookup_pipeline.execute.return_value = ["alice", False]
+
+        self.assertEqual(await self.cache.get_ldap("id-1"), "alice")
+
+        self.lookup_pipeline.hget.assert_called_once_with(USER_LDAP_KEY, "id-1")
+        self.lookup_pipeline.hexists.assert_called_once_with(EXTERNAL_USERS_KEY, "id-1")
+        self.microsoft_service.get_ldap_by_id.assert_not_awaited()
+
+    async def test_external_hit_skips_graph(self):
+        self.lookup_pipeline.execute.return_value = [None, True]
+
+        self.assertIsNone(await self.cache.get_ldap("guest"))
+
+        self.microsoft_service.get_ldap_by_id.assert_not_awaited()
+
+    async def test_miss_loads_from_graph_and_stores_result(self):
+        self.lookup_pipeline.execute.return_value = [None, False]
+        self.microsoft_service.get_ldap_by_id.return_value = "bob"
+
+        self.assertEqual(await self.cache.get_ldap("id-2"), "bob")
+
+        self.microsoft_service.get_ldap_by_id.assert_awaited_once_with("id-2")
+        self.write_pipeline.hset.assert_called_once_with(USER_LDAP_KEY, "id-2", "bob")
+        self.write_pipeline.expire.assert_not_called()
+
+    async def test_unknown_user_is_stored_as_external(self):
+        self.lookup_pipeline.execute.return_value = [None, False]
+        self.microsoft_service.get_ldap_by_id.return_value = None
+
+        self.assertIsNone(await self.cache.get_ldap("guest"))
+
+        self.write_pipeline.hset.assert_called_once_with(
+            EXTERNAL_USERS_KEY, "guest", ""
+        )
+        self.write_pipeline.expire.assert_called_once_with(
+            EXTERNAL_USERS_KEY, 60, nx=True
+        )
+
+    async def test_concurrent_misses_share_one_graph_call(self):
+        self.redis_client.pipeline.side_effect = None
+        self.redis_client.pipeline.return_value = self.lookup_pipeline
+        self.lookup_pipeline.execute.return_value = [None, False]
+
+        async def slow_lookup(user_id):
+            await asyncio.sleep(0.01)
+            return "carol"
+
+        self.microsoft_service.get_ldap_by_id.side_effect = slow_lookup
+
+        results = await asyncio.gather(*(self.cache.get_ldap("id-3") for _ in range(5)))
+
+        self.assertEqual(results, ["carol"] * 5)
+        self.microsoft_service.get_ldap_by_id.assert_awaited_once_with("id-3")
+        self.assertEqual(self.cache._in_flight, {})
+
+    async def test_refresh_replaces_directory(self):
+        self.microsoft_service.list_all_id_ldap_mapping.return_value = {
+            "id-1": "alice",
+            "id-2": "bob",
+        }
+
+        self.assertEqual(await self.cache.refresh(), 2)
+
+        self.lookup_pipeline.delete.assert_called_once_with(
+            USER_LDAP_KEY, EXTERNAL_USERS_KEY
+        )
+        self.lookup_pipeline.hset.assert_called_once_with(
+            USER_LDAP_KEY, mapping={"id-1": "alice", "id-2": "bob"}
+        )
+        self.lookup_pipeline.execute.assert_called_once()
+
+    async def test_empty_refresh_keeps_directory(self):
+        self.microsoft_service.list_all_id_ldap_mapping.return_value = {}
+
+        self.assertEqual(await self.cache.refresh(), 0)
+
+        self.redis_client.pipeline.assert_not_called()
+        self.logger.warning.assert_called_once()
+
+
+if __name__ == "__main__":
+    main()
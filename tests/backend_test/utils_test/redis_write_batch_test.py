@@ -0,0 +1,112 @@
+from unittest import TestCase, main
+from unittest.mock import MagicMock, patch
+
+from backend.utils.redis_write_batch import RedisWriteBatch
+from backend.utils.retry_utils import RetryUtils
+
+
+class TestRedisWriteBatch(TestCase):
+    def setUp(self):
+        self.redis_client = MagicMock()
+        self.pipeline = self.redis_client.pipeline.return_value
+        self.retry_utils = MagicMock()
+        self.retry_utils.get_retry_on_transient.side_effect = (
+            lambda func, *args, **kwargs: func(*args, **kwargs)
+        )
+        self.batch = RedisWriteBatch(self.redis_client, self.retry_utils)
+
+    def test_flush_replays_committed_commands_in_order(self):
+        first = self.batch.stage()
+        first.zadd("index", {"m1": 1.0})
+        first.eval("script", 1, "key", "arg")
+        second = self.batch.stage()
+        second.set("m2", "{}", ex=60)
+        self.batch.commit(first, "ack-1")
+        self.batch.commit(second, "ack-2")
+
+        self.batch.flush()
+
+        self.redis_client.pipeline.assert_called_once()
+        self.assertEqual(
+            self.pipeline.method_calls,
+            [
+                ("zadd", ("index", {"m1": 1.0}), {}),
+                ("eval", ("script", 1, "key", "arg"), {}),
+                ("set", ("m2", "{}"), {"ex": 60}),
+                ("execute", (), {}),
+            ],
+        )
+        self.assertEqual(self.batch.written, ["ack-1", "ack-2"])
+
+    def test_uncommitted_commands_are_discarded(self):
+        staged = self.batch.stage()
+        staged.set("failed", "x")
+
+        self.batch.flush()
+
+        self.redis_client.pipeline.assert_not_called()
+        self.assertEqual(self.batch.written, [])
+
+    def test_commit_without_commands_is_written_without_round_trip(self):
+        self.batch.commit(self.batch.stage(), "ack-1")
+
+        self.batch.flush()
+
+        self.redis_client.pipeline.assert_not_called()
+        self.assertEqual(self.batch.written, ["ack-1"])
+
+    def test_flush_failure_marks_tokens_failed(self):
+        self.pipeline.execute.side_effect = ConnectionError("redis down")
+        staged = self.batch.stage()
+        staged.set("k", "v")
+        self.batch.commit(staged, "ack-1")
+
+        with self.assertRaises(ConnectionError):
+            self.batch.flush()
+
+        self.assertEqual(self.batch.failed, ["ack-1"])
+        self.assertEqual(self.batch.written, [])
+
+    @patch("tenacity.nap.time.sleep")
+    def test_flush_retries_on_a_fresh_pipeline(self, _sleep):
+        """A retried flush re-queues the commands on a new pipeline, since
+        redis-py resets a pipeline's command stack after execute."""
+        failing = MagicMock()
+        failing.execute.side_effect = ConnectionError("connection reset")
+        succeeding = MagicMock()
+        succeeding.execute.return_value = [True]
+        self.redis_client.pipeline.side_effect = [failing, succeeding]
+        batch = RedisWriteBatch(self.redis_client, RetryUtils())
+        staged = batch.stage()
+        staged.set("k", "v")
+        batch.commit(staged, "ack-1")
+
+        batch.flush()
+
+        self.assertEqual(self.redis_client.pipeline.call_count, 2)
+        failing.set.assert_called_once_with("k", "v")
+        succeeding.set.assert_called_once_with("k", "v")
+        succeeding.execute.assert_called_once_with()
+        self.assertEqual(batch.written, ["ack-1"])
+        self.assertEqual(batch.failed, [])
+
+    def test_flush_batch_writes_earlier_messages_only(self):
+        earlier = self.batch.stage()
+        earlier.set("created", "x")
+        self.batch.commit(earlier, "ack-1")
+        current = self.batch.stage()
+        current.set("updated", "y")
+
+        current.flush_batch()
+
+        self.pipeline.set.assert_called_once_with("created", "x")
+        self.assertEqual(current.commands, [("set", ("updated", "y"), {})])
+        self.assertEqual(self.batch.written, ["ack-1"])
+
+    def test_staged_pipeline_cannot_be_executed(self):
+        with self.assertRaises(TypeError):
+            self.batch.stage().execute()
+
+
+if __name__ == "__main__":
+    main()